@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+---
+id: SCRIPT-0092
+type: script
+owner: platform-team
+status: active
+maturity: 1
+last_validated: 2026-10-18
+test:
+  runner: pytest
+  command: "pytest -q tests/unit/test_answer_cache.py"
+  evidence: declared
+dry_run:
+  supported: true
+risk_profile:
+  production_impact: low
+  security_risk: low
+  coupling_risk: low
+relates_to:
+  - PRD-0008-governance-rag-pipeline
+  - SCRIPT-0080-llm-synthesis
+  - SCRIPT-0086-query-cache
+---
+Purpose: Persistent cache of synthesized answers (SQLite).
+
+The same governance questions are asked repeatedly, and each synthesis is a
+full LLM call. Answers are keyed by the normalized question, the ordered
+context chunk ids with a digest of each chunk's text, and the provider,
+model and temperature. A hit therefore needs the same question, the same
+context and the same model settings. Because the key covers chunk content,
+a rebuilt index only invalidates answers whose context actually changed.
+
+Entries expire after ttl_seconds, and the least recently used entries are
+evicted beyond max_entries. `gov-rag query --synthesize --no-cache`
+bypasses the cache.
+
+Usage:
+    python -m scripts.rag.answer_cache stats
+    python -m scripts.rag.answer_cache clear
+
+Example:
+    >>> from scripts.rag.answer_cache import AnswerCache
+    >>> from scripts.rag.llm_synthesis import RAGSynthesizer
+    >>> synthesizer = RAGSynthesizer(cache=AnswerCache())
+    >>> synthesizer.synthesize("What is TDD?")  # LLM call
+    >>> synthesizer.synthesize("what is  TDD?")  # served from the cache
+"""
+
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Sequence, Union
+import hashlib
+import json
+import sqlite3
+import time
+
+from scripts.rag.indexer import DEFAULT_PERSIST_DIR
+from scripts.rag.query_cache import normalize_query
+
+
+DEFAULT_ANSWER_CACHE_PATH = Path(DEFAULT_PERSIST_DIR) / "answer_cache.db"
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600.0
+DEFAULT_MAX_ENTRIES = 2000
+
+ANSWER_CACHE_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    key TEXT PRIMARY KEY,
+    question TEXT NOT NULL,
+    provider TEXT NOT NULL,
+    model TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    last_used REAL NOT NULL,
+    result TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS answers_last_used ON answers (last_used);
+"""
+
+
+def _text_digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def answer_key(
+    question: str,
+    results: Sequence[Any],
+    provider: str,
+    model: Optional[str],
+    temperature: float,
+) -> str:
+    """
+    Cache key for a synthesis request.
+
+    Args:
+        question: User question (normalized for case and whitespace).
+        results: Context chunks in prompt order (id and text are used).
+        provider: LLM provider name.
+        model: Model name.
+        temperature: Sampling temperature.
+    """
+    payload = {
+        "version": ANSWER_CACHE_VERSION,
+        "question": normalize_query(question),
+        "context": [[r.id, _text_digest(r.text)] for r in results],
+        "provider": provider,
+        "model": model,
+        "temperature": temperature,
+    }
+    encoded = json.dumps(payload, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class AnswerCache:
+    """
+    SQLite-backed TTL + LRU cache of synthesized answers.
+
+    Attributes:
+        path: Database file (None keeps the cache in memory).
+        ttl_seconds: Lifetime of a cached answer.
+        max_entries: Maximum cached answers; least recently used are evicted.
+        hits: Lookups served from the cache.
+        misses: Lookups that required an LLM call.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = DEFAULT_ANSWER_CACHE_PATH,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = Path(path) if path else None
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._clock = clock
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        # The query server shares one cache across handler threads; its
+        # request lock serialises access.
+        self._conn = sqlite3.connect(
+            str(self.path) if self.path else ":memory:", check_same_thread=False
+        )
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached SynthesisResult fields, or None on a miss."""
+        now = self._clock()
+        row = self._conn.execute(
+            "SELECT result, expires_at FROM answers WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None or row[1] <= now:
+            if row is not None:
+                with self._conn:
+                    self._conn.execute("DELETE FROM answers WHERE key = ?", (key,))
+            self.misses += 1
+            return None
+        with self._conn:
+            self._conn.execute(
+                "UPDATE answers SET last_used = ? WHERE key = ?", (now, key)
+            )
+        self.hits += 1
+        return json.loads(row[0])
+
+    def put(
+        self,
+        key: str,
+        result: Dict[str, Any],
+        question: str = "",
+        provider: str = "",
+        model: Optional[str] = None,
+    ) -> None:
+        """Store SynthesisResult fields under key and evict if over capacity."""
+        now = self._clock()
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO answers "
+                "(key, question, provider, model, created_at, expires_at, "
+                "last_used, result) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    question,
+                    provider,
+                    model or "",
+                    now,
+                    now + self.ttl_seconds,
+                    now,
+                    json.dumps(result, default=str),
+                ),
+            )
+            self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        self._conn.execute("DELETE FROM answers WHERE expires_at <= ?", (now,))
+        count = self._conn.execute("SELECT COUNT(*) FROM answers").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM answers WHERE key IN "
+                "(SELECT key FROM answers ORDER BY last_used LIMIT ?)",
+                (excess,),
+            )
+            self.evictions += excess
+
+    def clear(self) -> int:
+        """Drop every cached answer; returns the number removed."""
+        with self._conn:
+            return self._conn.execute("DELETE FROM answers").rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and the number of stored answers."""
+        lookups = self.hits + self.misses
+        entries = self._conn.execute("SELECT COUNT(*) FROM answers").fetchone()[0]
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": entries,
+            "path": str(self.path) if self.path else None,
+        }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Inspect or clear the answer cache")
+    parser.add_argument("command", choices=["stats", "clear"])
+    parser.add_argument("--path", default=str(DEFAULT_ANSWER_CACHE_PATH))
+    args = parser.parse_args()
+
+    cache = AnswerCache(args.path)
+    if args.command == "clear":
+        print(f"Removed {cache.clear()} answers")
+    print(json.dumps(cache.stats(), indent=2))
+    cache.close()
@@ -0,0 +1,517 @@
+#!/usr/bin/env python3
+"""
+---
+id: SCRIPT-0094
+type: script
+owner: platform-team
+status: active
+maturity: 1
+last_validated: 2026-10-18
+test:
+  runner: pytest
+  command: "pytest -q tests/unit/test_benchmark.py"
+  evidence: declared
+dry_run:
+  supported: true
+risk_profile:
+  production_impact: low
+  security_risk: low
+  coupling_risk: medium
+relates_to:
+  - PRD-0008-governance-rag-pipeline
+  - GOV-0017-tdd-and-determinism
+  - SCRIPT-0078-index-build
+  - SCRIPT-0079-hybrid-retriever
+---
+Purpose: Retrieval latency and quality benchmark on synthetic corpora.
+
+RAGAS measures answer quality on the real docs, but nothing tracks how
+indexing and retrieval scale. For each corpus size this benchmark:
+
+1. Generates a deterministic synthetic governance corpus (frontmatter ids,
+   relates_to edges, one chunk per section) in a temporary root.
+2. Times build_index_report with the mock embedding function, so no
+   model download or GPU is needed.
+3. Times GovernanceRetriever.query and HybridRetriever.query (graph
+   expansion over the in-process LocalGraphStore) for generated queries,
+   reporting p50/p95/mean latency.
+4. Scores recall@k. Each query is built from one section's distinctive
+   terms, and a hit means that section's document appears in the top k.
+5. Records peak RSS and on-disk store size.
+
+The JSON report is keyed by corpus size and records the git commit, so
+reports from different commits can be compared. --baseline compares
+against an earlier report and exits 1 on a latency or recall regression.
+
+Usage:
+    python -m scripts.rag.benchmark --sizes 1000,10000
+    python -m scripts.rag.benchmark --baseline reports/benchmark_baseline.json
+"""
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None
+
+
+DEFAULT_SIZES = (1000, 10000)
+DEFAULT_QUERY_COUNT = 50
+DEFAULT_TOP_K = 5
+DEFAULT_SECTIONS_PER_DOC = 10
+DEFAULT_OUTPUT_PATH = Path("reports/benchmark_retrieval.json")
+# Relative slowdown (or recall drop) tolerated before --baseline fails
+DEFAULT_MAX_REGRESSION = 0.25
+BENCHMARK_EMBEDDING_MODEL = "mock"
+REPORT_VERSION = 1
+
+_DOC_TYPES = ("GOV", "ADR", "PRD", "RB")
+_TOPIC_TERMS = (
+    "access",
+    "audit",
+    "backup",
+    "budget",
+    "catalog",
+    "certificate",
+    "change",
+    "cluster",
+    "compliance",
+    "cost",
+    "coverage",
+    "deployment",
+    "drift",
+    "encryption",
+    "evidence",
+    "exception",
+    "incident",
+    "ingress",
+    "inventory",
+    "lifecycle",
+    "logging",
+    "migration",
+    "monitoring",
+    "network",
+    "ownership",
+    "patching",
+    "pipeline",
+    "policy",
+    "quota",
+    "recovery",
+    "registry",
+    "release",
+    "retention",
+    "review",
+    "rollback",
+    "rotation",
+    "runbook",
+    "scanning",
+    "secret",
+    "standard",
+    "tagging",
+    "testing",
+)
+_CONSONANTS = "bcdfghklmnprstvz"
+_VOWELS = "aeiou"
+
+
+@dataclass
+class SyntheticCorpus:
+    """
+    Generated corpus and the queries used to score it.
+
+    Attributes:
+        root: Repository root containing docs/.
+        documents: Number of generated markdown files.
+        chunks: Expected chunk count (one per section).
+        queries: Query text mapped to the doc id that answers it.
+    """
+
+    root: Path
+    documents: int
+    chunks: int
+    queries: Dict[str, str] = field(default_factory=dict)
+
+
+def _pseudo_word(rng: random.Random, syllables: int = 3) -> str:
+    return "".join(
+        rng.choice(_CONSONANTS) + rng.choice(_VOWELS) for _ in range(syllables)
+    )
+
+
+def _doc_id(index: int) -> str:
+    return f"{_DOC_TYPES[index % len(_DOC_TYPES)]}-{index:05d}"
+
+
+def generate_corpus(
+    root: Path,
+    chunks: int,
+    sections_per_doc: int = DEFAULT_SECTIONS_PER_DOC,
+    query_count: int = DEFAULT_QUERY_COUNT,
+    seed: int = 0,
+) -> SyntheticCorpus:
+    """
+    Write a deterministic synthetic governance corpus under root/docs.
+
+    Each section mixes common governance vocabulary with three pseudo-words
+    that are unique to it, so every section has a well-defined answer for
+    a query built from its terms.
+
+    Args:
+        root: Directory to write into (treated as the repository root).
+        chunks: Approximate total chunk count (rounded up to whole docs).
+        sections_per_doc: Sections (chunks) per document.
+        query_count: Queries to sample from the generated sections.
+        seed: Random seed; the same inputs always produce the same corpus.
+    """
+    rng = random.Random(seed)
+    documents = max(1, -(-chunks // sections_per_doc))
+    docs_dir = root / "docs" / "synthetic"
+    docs_dir.mkdir(parents=True, exist_ok=True)
+
+    sections: List[tuple] = []
+    for index in range(documents):
+        doc_id = _doc_id(index)
+        related = sorted(
+            {_doc_id(rng.randrange(documents)) for _ in range(2)} - {doc_id}
+        )
+        lines = [
+            "---",
+            f"id: {doc_id}",
+            "type: governance",
+            "status: active",
+            "owner: platform-team",
+            "relates_to:",
+            *(f"  - {other}" for other in related),
+            "---",
+            "",
+        ]
+        for number in range(sections_per_doc):
+            topic = rng.sample(_TOPIC_TERMS, 4)
+            unique = [_pseudo_word(rng) for _ in range(3)]
+            lines += [
+                f"## {topic[0].title()} {number}",
+                "",
+                f"Teams must apply {topic[0]} and {topic[1]} controls to every "
+                f"{unique[0]} workload. The {unique[1]} {topic[2]} owner records "
+                f"{topic[3]} evidence before the {unique[2]} review closes.",
+                "",
+            ]
+            sections.append((doc_id, topic, unique))
+        (docs_dir / f"{doc_id}.md").write_text("\n".join(lines))
+
+    queries: Dict[str, str] = {}
+    for doc_id, topic, unique in rng.sample(sections, min(query_count, len(sections))):
+        queries[f"Which {topic[0]} controls apply to {unique[0]} {unique[1]}?"] = doc_id
+    return SyntheticCorpus(
+        root=root,
+        documents=documents,
+        chunks=documents * sections_per_doc,
+        queries=queries,
+    )
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile (pct in 0-100) of values; 0.0 when empty."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def latency_stats(seconds: Sequence[float]) -> Dict[str, float]:
+    """p50/p95/mean/max latency in milliseconds."""
+    if not seconds:
+        return {"count": 0, "p50_ms": 0.0, "p95_ms": 0.0, "mean_ms": 0.0, "max_ms": 0.0}
+    return {
+        "count": len(seconds),
+        "p50_ms": round(percentile(seconds, 50) * 1000, 3),
+        "p95_ms": round(percentile(seconds, 95) * 1000, 3),
+        "mean_ms": round(sum(seconds) / len(seconds) * 1000, 3),
+        "max_ms": round(max(seconds) * 1000, 3),
+    }
+
+
+def time_queries(
+    query: Callable[[str], List[Any]], queries: Dict[str, str], top_k: int
+) -> Dict[str, Any]:
+    """
+    Time query() for each question and score recall@k by doc id.
+
+    Returns:
+        latency_stats() fields plus recall_at_k.
+    """
+    seconds: List[float] = []
+    hits = 0
+    for text, expected in queries.items():
+        started = time.perf_counter()
+        results = query(text)
+        seconds.append(time.perf_counter() - started)
+        doc_ids = [(r.metadata or {}).get("doc_id") for r in results[:top_k]]
+        hits += expected in doc_ids
+    return {
+        **latency_stats(seconds),
+        "recall_at_k": round(hits / len(queries), 4) if queries else 0.0,
+    }
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MiB (None if unknown)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+def _dir_bytes(path: Path) -> int:
+    return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+
+
+@contextmanager
+def _without_neo4j() -> Iterator[None]:
+    """Keep builds off an external Neo4j so timings stay local."""
+    saved = {k: os.environ.pop(k) for k in list(os.environ) if k.startswith("NEO4J_")}
+    try:
+        yield
+    finally:
+        os.environ.update(saved)
+
+
+def benchmark_size(
+    chunks: int,
+    workdir: Path,
+    query_count: int = DEFAULT_QUERY_COUNT,
+    top_k: int = DEFAULT_TOP_K,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """
+    Build and query one synthetic corpus.
+
+    Args:
+        chunks: Target corpus size in chunks.
+        workdir: Scratch directory (corpus and store are written inside).
+        query_count: Queries timed per retriever.
+        top_k: Results per query and the k in recall@k.
+        seed: Corpus seed.
+
+    Returns:
+        Report section for this size.
+    """
+    from scripts.rag.graph_store import GRAPH_STORE_FILENAME, LocalGraphStore
+    from scripts.rag.hybrid_retriever import HybridRetriever
+    from scripts.rag.index_build import build_index_report
+    from scripts.rag.retriever import GovernanceRetriever
+
+    corpus = generate_corpus(workdir, chunks, query_count=query_count, seed=seed)
+    store_dir = workdir / ".chroma"
+
+    with _without_neo4j():
+        started = time.perf_counter()
+        build = build_index_report(
+            root=workdir,
+            metadata_path=workdir / "reports" / "index_metadata.json",
+            persist_dir=str(store_dir),
+            embedding_model=BENCHMARK_EMBEDDING_MODEL,
+            full_rebuild=True,
+            embedding_cache_dir=None,
+        )
+        build_seconds = time.perf_counter() - started
+
+    retriever = GovernanceRetriever(
+        persist_dir=str(store_dir),
+        embedding_model=BENCHMARK_EMBEDDING_MODEL,
+        usage_log_path=None,
+    )
+    hybrid = HybridRetriever(
+        vector_retriever=retriever,
+        graph_client=LocalGraphStore(store_dir / GRAPH_STORE_FILENAME),
+    )
+    # Warm-up: load the lexical index and graph outside the timed loop
+    retriever.query("warm up", top_k=top_k)
+
+    vector = time_queries(
+        lambda q: retriever.query(q, top_k=top_k), corpus.queries, top_k
+    )
+    graph = time_queries(lambda q: hybrid.query(q, top_k=top_k), corpus.queries, top_k)
+    hybrid.close()
+
+    return {
+        "chunks": corpus.chunks,
+        "documents": corpus.documents,
+        "chunks_indexed": build["chunks"],
+        "build": {
+            "seconds": round(build_seconds, 3),
+            "chunks_per_second": round(build["chunks"] / build_seconds, 1)
+            if build_seconds
+            else 0.0,
+            "batches": build["batches"],
+        },
+        "query": vector,
+        "hybrid_query": graph,
+        "memory": {
+            "peak_rss_mb": peak_rss_mb(),
+            "store_mb": round(_dir_bytes(store_dir) / (1024 * 1024), 2),
+        },
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+def run_benchmark(
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    query_count: int = DEFAULT_QUERY_COUNT,
+    top_k: int = DEFAULT_TOP_K,
+    seed: int = 0,
+    workdir: Optional[Path] = None,
+) -> Dict[str, Any]:
+    """
+    Benchmark every corpus size and return the full report.
+
+    Each size is built in its own scratch directory, removed afterwards
+    unless workdir is given.
+    """
+    results: Dict[str, Any] = {}
+    for size in sizes:
+        print(f"Benchmarking {size} chunks...")
+        scratch = Path(tempfile.mkdtemp(prefix="rag-bench-", dir=workdir))
+        try:
+            results[str(size)] = benchmark_size(
+                size, scratch, query_count=query_count, top_k=top_k, seed=seed
+            )
+        finally:
+            if workdir is None:
+                shutil.rmtree(scratch, ignore_errors=True)
+        section = results[str(size)]
+        print(
+            f"  build {section['build']['seconds']:.1f}s, "
+            f"query p95 {section['query']['p95_ms']:.1f}ms, "
+            f"hybrid p95 {section['hybrid_query']['p95_ms']:.1f}ms, "
+            f"recall@{top_k} {section['query']['recall_at_k']:.2f}"
+        )
+    return {
+        "version": REPORT_VERSION,
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "embedding_model": BENCHMARK_EMBEDDING_MODEL,
+        "query_count": query_count,
+        "top_k": top_k,
+        "seed": seed,
+        "sizes": results,
+    }
+
+
+def compare_reports(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    max_regression: float = DEFAULT_MAX_REGRESSION,
+) -> List[str]:
+    """
+    List regressions of current against baseline for sizes in both.
+
+    Build time and p95 latencies regress when they grow by more than
+    max_regression (relative); recall@k regresses when it drops by more
+    than max_regression (absolute).
+    """
+    regressions: List[str] = []
+    for size, now in current.get("sizes", {}).items():
+        before = baseline.get("sizes", {}).get(size)
+        if not before:
+            continue
+        timings = [
+            ("build.seconds", before["build"]["seconds"], now["build"]["seconds"]),
+            ("query.p95_ms", before["query"]["p95_ms"], now["query"]["p95_ms"]),
+            (
+                "hybrid_query.p95_ms",
+                before["hybrid_query"]["p95_ms"],
+                now["hybrid_query"]["p95_ms"],
+            ),
+        ]
+        for name, old, new in timings:
+            if old and new > old * (1 + max_regression):
+                regressions.append(f"{size} chunks: {name} {old} -> {new}")
+        for name in ("query", "hybrid_query"):
+            old = before[name]["recall_at_k"]
+            new = now[name]["recall_at_k"]
+            if new < old - max_regression:
+                regressions.append(f"{size} chunks: {name}.recall_at_k {old} -> {new}")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Benchmark RAG indexing and retrieval on synthetic corpora"
+    )
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(s) for s in DEFAULT_SIZES),
+        help="Comma-separated corpus sizes in chunks (default: 1000,10000)",
+    )
+    parser.add_argument("--queries", type=int, default=DEFAULT_QUERY_COUNT)
+    parser.add_argument("--top-k", type=int, default=DEFAULT_TOP_K)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT_PATH)
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=None,
+        help="Earlier report to compare against; exit 1 on regression",
+    )
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=DEFAULT_MAX_REGRESSION,
+        help="Tolerated relative slowdown / absolute recall drop (default: 0.25)",
+    )
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    report = run_benchmark(
+        sizes, query_count=args.queries, top_k=args.top_k, seed=args.seed
+    )
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2, sort_keys=True))
+    print(f"Report written to {args.output}")
+
+    if args.baseline:
+        regressions = compare_reports(
+            json.loads(args.baseline.read_text()), report, args.max_regression
+        )
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+        print(f"No regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
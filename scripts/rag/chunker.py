@@ -35,6 +35,13 @@ Features:
 - MarkdownNodeParser: Header-based chunking for structured documents
 - SentenceWindowNodeParser: Context-preserving chunks with surrounding sentences
 - Parser instance reuse for performance optimization
+- Native chunker: a dependency-free single pass that reproduces
+  MarkdownNodeParser splits and metadata exactly (golden-tested), without
+  building LlamaIndex Document/TextNode objects. Select it with
+  chunk_document(doc, chunker="native") or `index_build --chunker native`.
+- Chunk links: link_chunks() records prev/next/parent chunk ids so context
+  can be expanded at query time by id (see context_window) instead of
+  storing neighbouring text in every chunk's metadata.
 
 Example:
     >>> from scripts.rag.chunker import chunk_document
@@ -46,15 +53,21 @@ Example:
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, Any, List, Optional
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
+import re
 
+from scripts.rag.lazy_imports import LazyModule
 from scripts.rag.loader import (
     GovernanceDocument,
+    flatten_metadata,
     to_llama_document,
+    llama_core,
     LLAMA_INDEX_AVAILABLE,
 )
 
-if LLAMA_INDEX_AVAILABLE:
+node_parser = LazyModule("llama_index.core.node_parser")
+
+if TYPE_CHECKING:
     from llama_index.core import Document as LlamaDocument
     from llama_index.core.node_parser import (
         MarkdownNodeParser,
@@ -73,6 +86,26 @@ _SENTENCE_WINDOW_PARSER: Optional["SentenceWindowNodeParser"] = None
 # Default configuration for SentenceWindowNodeParser
 DEFAULT_WINDOW_SIZE = 3  # Sentences before and after
 DEFAULT_WINDOW_METADATA_KEY = "surrounding_context"
+# SentenceWindowNodeParser's copy of the chunk text
+ORIGINAL_TEXT_METADATA_KEY = "original_text"
+
+# Chunk link metadata ("" when there is no such chunk)
+PREV_CHUNK_KEY = "prev_chunk_id"
+NEXT_CHUNK_KEY = "next_chunk_id"
+PARENT_CHUNK_KEY = "parent_chunk_id"
+# Sentences each side to restore at query time (compact sentence windows)
+CONTEXT_WINDOW_KEY = "context_window"
+
+# Chunker implementations selectable by chunk_document / index_build
+CHUNKER_LLAMAINDEX = "llamaindex"
+CHUNKER_NATIVE = "native"
+CHUNKER_SENTENCE_WINDOW = "sentence-window"
+CHUNKERS = (CHUNKER_LLAMAINDEX, CHUNKER_NATIVE, CHUNKER_SENTENCE_WINDOW)
+DEFAULT_CHUNKER = CHUNKER_LLAMAINDEX
+
+# Same header rule and path separator as MarkdownNodeParser
+_HEADER_RE = re.compile(r"^(#+)\s(.*)")
+_HEADER_PATH_SEPARATOR = "/"
 
 
 def _get_markdown_parser() -> "MarkdownNodeParser":
@@ -84,7 +117,7 @@ def _get_markdown_parser() -> "MarkdownNodeParser":
     """
     global _MARKDOWN_PARSER
     if _MARKDOWN_PARSER is None:
-        _MARKDOWN_PARSER = MarkdownNodeParser.from_defaults(
+        _MARKDOWN_PARSER = node_parser.MarkdownNodeParser.from_defaults(
             include_metadata=True,
             include_prev_next_rel=True,
         )
@@ -110,7 +143,7 @@ def _get_sentence_window_parser(
         _SENTENCE_WINDOW_PARSER is None
         or _SENTENCE_WINDOW_PARSER.window_size != window_size
     ):
-        _SENTENCE_WINDOW_PARSER = SentenceWindowNodeParser.from_defaults(
+        _SENTENCE_WINDOW_PARSER = node_parser.SentenceWindowNodeParser.from_defaults(
             window_size=window_size,
             window_metadata_key=DEFAULT_WINDOW_METADATA_KEY,
             include_metadata=True,
@@ -133,6 +166,46 @@ class Chunk:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+def make_chunk_id(doc_id: str, chunk_index: int) -> str:
+    """Stored id of a chunk: {doc_id}_{chunk_index}."""
+    return f"{doc_id}_{chunk_index}"
+
+
+def link_chunks(chunks: List[Chunk]) -> List[Chunk]:
+    """
+    Record neighbour and parent chunk ids in each chunk's metadata.
+
+    prev/next point at the adjacent chunks of the same document; parent
+    points at the nearest preceding chunk with a shallower header (the
+    enclosing section). Ids use make_chunk_id, so they match the ids the
+    indexer stores. Chunks are updated in place.
+
+    Args:
+        chunks: Chunks of one document, in order.
+
+    Returns:
+        The same list, for chaining.
+    """
+    ids = [
+        make_chunk_id(c.metadata.get("doc_id", ""), c.metadata.get("chunk_index", i))
+        for i, c in enumerate(chunks)
+    ]
+    # (header_level, id) of the open sections, outermost first
+    sections: List[tuple[int, str]] = []
+    for i, chunk in enumerate(chunks):
+        level = chunk.metadata.get("header_level", 0)
+        metadata = chunk.metadata
+        metadata[PREV_CHUNK_KEY] = ids[i - 1] if i > 0 else ""
+        metadata[NEXT_CHUNK_KEY] = ids[i + 1] if i + 1 < len(chunks) else ""
+        if level:
+            while sections and sections[-1][0] >= level:
+                sections.pop()
+        metadata[PARENT_CHUNK_KEY] = sections[-1][1] if sections else ""
+        if level:
+            sections.append((level, ids[i]))
+    return chunks
+
+
 def _node_to_chunk(node: "TextNode", chunk_index: int) -> Chunk:
     """
     Convert a LlamaIndex TextNode to our Chunk dataclass.
@@ -149,10 +222,20 @@ def _node_to_chunk(node: "TextNode", chunk_index: int) -> Chunk:
     """
     metadata = dict(node.metadata)
     metadata["chunk_index"] = chunk_index
+    _add_section_metadata(node.text, metadata)
+    return Chunk(text=node.text, metadata=metadata)
+
 
+def _add_section_metadata(text: str, metadata: Dict[str, Any]) -> None:
+    """
+    Set header_level and section from a chunk's first line (in place).
+
+    Shared by the LlamaIndex and native chunkers so both label sections
+    identically.
+    """
     # Extract section name from the text content's first line
     # LlamaIndex's header_path shows parent hierarchy, not current section
-    text = node.text.strip()
+    text = text.strip()
     first_line = text.split("\n")[0] if text else ""
 
     # Determine header level and section name from text content
@@ -180,8 +263,6 @@ def _node_to_chunk(node: "TextNode", chunk_index: int) -> Chunk:
     if DEFAULT_WINDOW_METADATA_KEY in metadata:
         metadata["has_context_window"] = True
 
-    return Chunk(text=node.text, metadata=metadata)
-
 
 def chunk_with_llamaindex(doc: "LlamaDocument") -> List[Chunk]:
     """
@@ -218,6 +299,7 @@ def chunk_with_llamaindex(doc: "LlamaDocument") -> List[Chunk]:
 def chunk_with_sentence_window(
     doc: "LlamaDocument",
     window_size: int = DEFAULT_WINDOW_SIZE,
+    inline_context: bool = True,
 ) -> List[Chunk]:
     """
     Chunk a LlamaIndex Document using SentenceWindowNodeParser.
@@ -228,9 +310,16 @@ def chunk_with_sentence_window(
     The 'surrounding_context' metadata field contains sentences before and after
     each chunk, allowing the retriever to use expanded context for answers.
 
+    With inline_context=False the window text is not stored. Chunks are
+    linked (link_chunks) and record context_window=window_size instead, and
+    context_window.expand_context rebuilds the same window at query time.
+    That stores each sentence once rather than about 2 * window_size + 1
+    times.
+
     Args:
         doc: LlamaIndex Document to chunk.
         window_size: Number of sentences to include before/after (default: 3).
+        inline_context: Store the window text in each chunk's metadata.
 
     Returns:
         List of Chunk objects with context window metadata.
@@ -251,7 +340,14 @@ def chunk_with_sentence_window(
     parser = _get_sentence_window_parser(window_size)
     nodes = parser.get_nodes_from_documents([doc])
 
-    return [_node_to_chunk(node, idx) for idx, node in enumerate(nodes)]
+    chunks = [_node_to_chunk(node, idx) for idx, node in enumerate(nodes)]
+    if inline_context:
+        return chunks
+    for chunk in chunks:
+        chunk.metadata.pop(DEFAULT_WINDOW_METADATA_KEY, None)
+        chunk.metadata.pop(ORIGINAL_TEXT_METADATA_KEY, None)
+        chunk.metadata[CONTEXT_WINDOW_KEY] = window_size
+    return link_chunks(chunks)
 
 
 def chunk_markdown(content: str, base_metadata: Dict[str, Any]) -> List[Chunk]:
@@ -282,7 +378,7 @@ def chunk_markdown(content: str, base_metadata: Dict[str, Any]) -> List[Chunk]:
         )
 
     # Create a LlamaIndex Document with the base metadata
-    doc = LlamaDocument(text=content, metadata=base_metadata)
+    doc = llama_core.Document(text=content, metadata=base_metadata)
 
     # Use singleton MarkdownNodeParser
     parser = _get_markdown_parser()
@@ -291,15 +387,86 @@ def chunk_markdown(content: str, base_metadata: Dict[str, Any]) -> List[Chunk]:
     return [_node_to_chunk(node, idx) for idx, node in enumerate(nodes)]
 
 
-def chunk_document(doc: GovernanceDocument) -> List[Chunk]:
+def chunk_markdown_native(content: str, base_metadata: Dict[str, Any]) -> List[Chunk]:
+    """
+    Split markdown on headers in one pass, without LlamaIndex.
+
+    Reproduces MarkdownNodeParser exactly: every header (any level) outside
+    a fenced code block starts a chunk, chunk text is the stripped section
+    including its header line, and header_path lists the enclosing headers.
+    Metadata matches chunk_markdown (header_path, chunk_index, header_level,
+    section).
+
+    Args:
+        content: Markdown content to chunk.
+        base_metadata: Metadata to inherit for all chunks.
+
+    Returns:
+        List of Chunk objects.
+
+    Example:
+        >>> chunks = chunk_markdown_native("## A\\nContent A\\n\\n## B\\nContent B", {})
+        >>> [c.metadata["section"] for c in chunks]
+        ['A', 'B']
+    """
+    if not content or not content.strip():
+        return []
+
+    separator = _HEADER_PATH_SEPARATOR
+    chunks: List[Chunk] = []
+    header_stack: List[tuple[int, str]] = []
+    section: List[str] = []
+    code_block = False
+
+    def emit() -> None:
+        text = "\n".join(section).strip()
+        if not text:
+            return
+        parents = separator.join(h[1] for h in header_stack[:-1])
+        metadata = dict(base_metadata)
+        metadata["header_path"] = (
+            separator + parents + separator if parents else separator
+        )
+        metadata["chunk_index"] = len(chunks)
+        _add_section_metadata(text, metadata)
+        chunks.append(Chunk(text=text, metadata=metadata))
+
+    for line in content.split("\n"):
+        if line.lstrip().startswith("```"):
+            code_block = not code_block
+        elif not code_block and line.startswith("#"):
+            match = _HEADER_RE.match(line)
+            if match:
+                emit()
+                level = len(match.group(1))
+                title = match.group(2)
+                while header_stack and header_stack[-1][0] >= level:
+                    header_stack.pop()
+                header_stack.append((level, title))
+                section = ["#" * level + " " + title]
+                continue
+        section.append(line)
+    emit()
+    return chunks
+
+
+def chunk_document(
+    doc: GovernanceDocument, chunker: str = DEFAULT_CHUNKER
+) -> List[Chunk]:
     """
     Chunk a GovernanceDocument into sections using LlamaIndex.
 
     Converts to LlamaIndex Document, chunks with MarkdownNodeParser,
-    and returns Chunk objects with inherited metadata.
+    and returns Chunk objects with inherited metadata. With
+    chunker="native" the same chunks are produced by
+    chunk_markdown_native, and llama-index is not needed.
+
+    chunker="sentence-window" produces compact sentence-window chunks
+    (chunk_document_with_context with inline_context=False).
 
     Args:
         doc: GovernanceDocument to chunk.
+        chunker: "llamaindex" (default), "native" or "sentence-window".
 
     Returns:
         List of Chunk objects with inherited document metadata.
@@ -311,6 +478,13 @@ def chunk_document(doc: GovernanceDocument) -> List[Chunk]:
         >>> chunks[0].metadata.get("doc_id") is not None
         True
     """
+    if chunker == CHUNKER_NATIVE:
+        return chunk_markdown_native(doc.content, flatten_metadata(doc))
+    if chunker == CHUNKER_SENTENCE_WINDOW:
+        return chunk_document_with_context(doc, inline_context=False)
+    if chunker != CHUNKER_LLAMAINDEX:
+        raise ValueError(f"Unknown chunker: {chunker!r} (expected one of {CHUNKERS})")
+
     if not LLAMA_INDEX_AVAILABLE:
         raise ImportError(
             "llama-index is not installed. Install with: pip install llama-index"
@@ -355,6 +529,7 @@ def get_nodes_from_documents(docs: List["LlamaDocument"]) -> List["TextNode"]:
 def chunk_document_with_context(
     doc: GovernanceDocument,
     window_size: int = DEFAULT_WINDOW_SIZE,
+    inline_context: bool = True,
 ) -> List[Chunk]:
     """
     Chunk a GovernanceDocument with surrounding sentence context.
@@ -366,6 +541,8 @@ def chunk_document_with_context(
     Args:
         doc: GovernanceDocument to chunk.
         window_size: Number of sentences to include before/after (default: 3).
+        inline_context: Store window text in metadata (False: link chunks
+            and expand at query time, see chunk_with_sentence_window).
 
     Returns:
         List of Chunk objects with context window metadata.
@@ -386,4 +563,4 @@ def chunk_document_with_context(
     llama_doc = to_llama_document(doc)
 
     # Chunk with SentenceWindowNodeParser
-    return chunk_with_sentence_window(llama_doc, window_size)
+    return chunk_with_sentence_window(llama_doc, window_size, inline_context)
@@ -42,14 +42,36 @@ Example:
 
     >>> # Query with filters
     >>> python -m scripts.rag.cli query "testing" --filter doc_type=governance
+
+    >>> # Several predicates, list membership and date ranges
+    >>> python -m scripts.rag.cli query "retrieval" \
+    ...     --filter "relates_to=ADR-0186; effective_date>=2026-01-01"
+
+    >>> # Run many queries as batched requests
+    >>> python -m scripts.rag.cli query --batch-file tests/ragas/questions.json
+
+    >>> # Keep models and indexes warm; later queries use the server
+    >>> python -m scripts.rag.cli serve
+
+    >>> # Synthesized answers stream as they are generated (text format)
+    >>> python -m scripts.rag.cli query "What is TDD?" --synthesize
+
+    >>> # Show where the time went (embedding, search, graph, LLM, ...)
+    >>> python -m scripts.rag.cli query "What is TDD?" --synthesize --timings
 """
 
 import argparse
+import itertools
 import json
 import sys
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
+from scripts.rag import timing
+from scripts.rag.metadata_index import parse_filters
+from scripts.rag.query_cache import DEFAULT_QUERY_CACHE_PATH, QueryCache
 from scripts.rag.retriever import GovernanceRetriever, RetrievalResult, format_citation
 
 
@@ -94,7 +116,10 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
         "--filter",
         type=str,
         default=None,
-        help="Metadata filter in key=value format",
+        help=(
+            "Metadata filter: key=value, key!=value, key>=value, key in a,b; "
+            "separate predicates with ';' (list fields match by membership)"
+        ),
     )
     query_parser.add_argument(
         "--format",
@@ -119,6 +144,29 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
         action="store_true",
         help="Exclude citations from output",
     )
+    query_parser.add_argument(
+        "--batch-file",
+        type=str,
+        default=None,
+        help="Run every query in a file (one per line, or a JSON list / "
+        '{"questions": [...]}) as batched requests',
+    )
+    query_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the query result and synthesized answer caches",
+    )
+    query_parser.add_argument(
+        "--no-server",
+        action="store_true",
+        help="Do not use a running query server",
+    )
+    query_parser.add_argument(
+        "--socket",
+        type=str,
+        default=None,
+        help="Query server socket (default: $RAG_QUERY_SOCKET or .chroma/query.sock)",
+    )
     query_parser.add_argument(
         "--hybrid",
         action="store_true",
@@ -142,28 +190,98 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
         default=None,
         help="Model name for synthesis (provider-specific)",
     )
+    query_parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Print per-stage timings to stderr (runs without the query server)",
+    )
+    query_parser.add_argument(
+        "--no-stream",
+        action="store_true",
+        help="Print the synthesized answer only once it is complete",
+    )
+
+    # Serve command
+    serve_parser = subparsers.add_parser(
+        "serve", help="Run a query server that keeps models and indexes warm"
+    )
+    serve_parser.add_argument(
+        "--socket",
+        type=str,
+        default=None,
+        help="Socket path (default: $RAG_QUERY_SOCKET or .chroma/query.sock)",
+    )
+    serve_parser.add_argument(
+        "--no-warm-up",
+        action="store_true",
+        help="Skip loading the default collection at startup",
+    )
 
     return parser.parse_args(args)
 
 
-def parse_filter_string(filter_string: Optional[str]) -> Optional[Dict[str, str]]:
+def parse_filter_string(filter_string: Optional[str]) -> Optional[Dict[str, Any]]:
     """
     Parse a filter string into a dictionary.
 
     Args:
-        filter_string: Filter in "key=value" format.
+        filter_string: Filter in "key=value" format, or several
+            ";"-separated predicates (see metadata_index.parse_filters).
 
     Returns:
-        Dictionary with filter key-value pairs, or None.
+        Where filter dictionary, or None.
+
+    Raises:
+        ValueError: If a predicate cannot be parsed.
     """
-    if not filter_string:
-        return None
+    return parse_filters(filter_string)
 
-    if "=" not in filter_string:
-        return None
 
-    key, value = filter_string.split("=", 1)
-    return {key.strip(): value.strip()}
+def load_batch_queries(path: str) -> List[str]:
+    """
+    Load queries for batch mode.
+
+    Args:
+        path: JSON file (list or {"questions": [...]}) or text file with one
+            query per line ('#' lines are ignored).
+
+    Returns:
+        List of query strings.
+    """
+    content = Path(path).read_text()
+    if path.endswith(".json"):
+        data = json.loads(content)
+        if isinstance(data, dict):
+            data = data.get("questions", [])
+        return [str(q) for q in data]
+    return [
+        line.strip()
+        for line in content.splitlines()
+        if line.strip() and not line.lstrip().startswith("#")
+    ]
+
+
+def run_query_batch(
+    queries: List[str],
+    retriever: Optional[GovernanceRetriever] = None,
+    top_k: int = 5,
+    filters: Optional[Dict[str, Any]] = None,
+) -> List[List[RetrievalResult]]:
+    """
+    Execute many retrieval queries with batched round trips.
+
+    Args:
+        queries: Search query strings.
+        retriever: GovernanceRetriever instance. If None, creates one.
+        top_k: Number of results per query.
+        filters: Metadata filters applied to every query.
+
+    Returns:
+        One list of RetrievalResult objects per query.
+    """
+    if retriever is None:
+        retriever = GovernanceRetriever(usage_log_path=None)
+    return retriever.query_many(queries, top_k=top_k, filters=filters)
 
 
 def run_query(
@@ -196,6 +314,62 @@ def run_query(
     return retriever.query(query, top_k=top_k, filters=filters)
 
 
+def _result_to_dict(result: RetrievalResult, include_citations: bool) -> Dict[str, Any]:
+    """Convert a result to a JSON-serializable dict."""
+    item = {
+        "id": result.id,
+        "text": result.text,
+        "metadata": result.metadata,
+        "score": result.score,
+    }
+    if include_citations:
+        item["citation"] = format_citation(result)
+    return item
+
+
+def format_batch_results(
+    queries: List[str],
+    batches: List[List[RetrievalResult]],
+    format_type: OutputFormat = OutputFormat.TEXT,
+    include_citations: bool = True,
+) -> str:
+    """
+    Format batch-mode results, grouped per query.
+
+    Args:
+        queries: Query strings in input order.
+        batches: Results per query.
+        format_type: Output format (TEXT or JSON).
+        include_citations: Whether to include citations.
+
+    Returns:
+        Formatted string output.
+    """
+    if format_type == OutputFormat.JSON:
+        return json.dumps(
+            {
+                "queries": [
+                    {
+                        "query": query,
+                        "results": [
+                            _result_to_dict(r, include_citations) for r in results
+                        ],
+                        "count": len(results),
+                    }
+                    for query, results in zip(queries, batches)
+                ],
+                "count": len(queries),
+            },
+            indent=2,
+        )
+
+    sections = []
+    for i, (query, results) in enumerate(zip(queries, batches), 1):
+        sections.append(f"=== Query {i}: {query} ===")
+        sections.append(format_results(results, format_type, include_citations))
+    return "\n".join(sections)
+
+
 def format_results(
     results: List[RetrievalResult],
     format_type: OutputFormat = OutputFormat.TEXT,
@@ -218,17 +392,7 @@ def format_results(
         return "No results found."
 
     if format_type == OutputFormat.JSON:
-        json_results = []
-        for result in results:
-            item = {
-                "id": result.id,
-                "text": result.text,
-                "metadata": result.metadata,
-                "score": result.score,
-            }
-            if include_citations:
-                item["citation"] = format_citation(result)
-            json_results.append(item)
+        json_results = [_result_to_dict(r, include_citations) for r in results]
 
         return json.dumps(
             {"results": json_results, "count": len(json_results)}, indent=2
@@ -249,6 +413,282 @@ def format_results(
     return "\n".join(lines)
 
 
+def _run_batch_mode(
+    parsed: argparse.Namespace,
+    filters: Optional[Dict[str, Any]],
+    retriever_kwargs: Dict[str, Any],
+    output_format: OutputFormat,
+) -> int:
+    """Run --batch-file queries through the batched retrieval API."""
+    try:
+        queries = load_batch_queries(parsed.batch_file)
+    except (OSError, ValueError) as e:
+        print(f"Error: Failed to read batch file: {e}", file=sys.stderr)
+        return 1
+    if parsed.synthesize:
+        print("Warning: --synthesize is ignored in batch mode.", file=sys.stderr)
+
+    try:
+        if parsed.hybrid:
+            from scripts.rag.hybrid_retriever import HybridRetriever
+
+            retriever = HybridRetriever(
+                vector_retriever=GovernanceRetriever(
+                    cache=retriever_kwargs.get("cache")
+                )
+            )
+            hybrid_batches = retriever.query_many(
+                queries, top_k=parsed.top_k, filters=filters
+            )
+            retriever.close()
+            batches = [
+                [
+                    RetrievalResult(
+                        id=r.id, text=r.text, metadata=r.metadata, score=r.score
+                    )
+                    for r in results
+                ]
+                for results in hybrid_batches
+            ]
+        else:
+            retriever = GovernanceRetriever(**retriever_kwargs)
+            batches = run_query_batch(
+                queries, retriever=retriever, top_k=parsed.top_k, filters=filters
+            )
+    except Exception as e:
+        print(f"Error: Batch query failed: {e}", file=sys.stderr)
+        return 1
+
+    _print_batch(parsed, queries, batches, output_format)
+    return 0
+
+
+def _print_batch(
+    parsed: argparse.Namespace,
+    queries: List[str],
+    batches: List[List[RetrievalResult]],
+    output_format: OutputFormat,
+) -> None:
+    """Print batch-mode results (and verbose info)."""
+    if parsed.verbose:
+        print(f"Queries: {len(queries)}", file=sys.stderr)
+        print(f"Top-K: {parsed.top_k}", file=sys.stderr)
+        print("---", file=sys.stderr)
+
+    print(
+        format_batch_results(
+            queries,
+            batches,
+            format_type=output_format,
+            include_citations=not parsed.no_citations,
+        )
+    )
+
+
+def _format_sources(result: Any) -> str:
+    """Sources and model trailer printed after a synthesized answer."""
+    docs = len(result.source_docs)
+    output = f"---\nSources ({result.context_chunks} chunks from {docs} docs):\n"
+    for citation in result.citations[:5]:  # Limit citations shown
+        output += f"  - {citation}\n"
+    output += f"\nModel: {result.model}"
+    return output
+
+
+def _print_synthesis_info(parsed: argparse.Namespace, result: Any) -> None:
+    if parsed.verbose:
+        print(f"Query: {parsed.query}", file=sys.stderr)
+        print(f"Model: {result.model}", file=sys.stderr)
+        print(f"Context chunks: {result.context_chunks}", file=sys.stderr)
+        print("---", file=sys.stderr)
+
+
+def _print_synthesis(
+    parsed: argparse.Namespace, result: Any, output_format: OutputFormat
+) -> None:
+    """Print a synthesized answer (SynthesisResult or equivalent)."""
+    if output_format == OutputFormat.JSON:
+        output = json.dumps(
+            {
+                "answer": result.answer,
+                "citations": result.citations,
+                "model": result.model,
+                "context_chunks": result.context_chunks,
+                "source_docs": result.source_docs,
+            },
+            indent=2,
+        )
+    else:
+        output = f"{result.answer}\n\n{_format_sources(result)}"
+
+    _print_synthesis_info(parsed, result)
+    print(output)
+
+
+def _print_synthesis_stream(parsed: argparse.Namespace, events: Iterable[Any]) -> int:
+    """
+    Print answer text as it arrives, then the sources trailer.
+
+    Args:
+        events: Text fragments (str) followed by one SynthesisResult
+            (or equivalent), as yielded by RAGSynthesizer.synthesize_stream.
+
+    Returns:
+        Exit code (1 if the stream ended without a final result).
+    """
+    result = None
+    for event in events:
+        if isinstance(event, str):
+            sys.stdout.write(event)
+            sys.stdout.flush()
+        else:
+            result = event
+    if result is None:
+        print("\n\nError: Synthesis stream ended unexpectedly.", file=sys.stderr)
+        return 1
+    _print_synthesis_info(parsed, result)
+    print(f"\n\n{_format_sources(result)}")
+    return 0
+
+
+def _stream_synthesis(parsed: argparse.Namespace, output_format: OutputFormat) -> bool:
+    """Stream synthesized answers only for interactive text output."""
+    return output_format == OutputFormat.TEXT and not parsed.no_stream
+
+
+def _print_results(
+    parsed: argparse.Namespace,
+    results: List[RetrievalResult],
+    filters: Optional[Dict[str, Any]],
+    output_format: OutputFormat,
+) -> None:
+    """Print retrieval results (and verbose info)."""
+    include_citations = not parsed.no_citations
+    output = format_results(
+        results,
+        format_type=output_format,
+        include_citations=include_citations,
+    )
+
+    # Print verbose info if requested
+    if parsed.verbose:
+        print(f"Query: {parsed.query}", file=sys.stderr)
+        print(f"Top-K: {parsed.top_k}", file=sys.stderr)
+        if filters:
+            print(f"Filters: {filters}", file=sys.stderr)
+        print(f"Results: {len(results)}", file=sys.stderr)
+        print("---", file=sys.stderr)
+
+    print(output)
+
+
+def _server_events(responses: Iterable[Dict[str, Any]]) -> Iterator[Any]:
+    """Translate streamed server responses into synthesize_stream events."""
+    for response in responses:
+        if "token" in response:
+            yield response["token"]
+        elif response.get("ok"):
+            yield SimpleNamespace(**response["synthesis"])
+        else:
+            error = response.get("error")
+            print(f"\nError: Synthesis failed: {error}", file=sys.stderr)
+            return
+
+
+def _run_via_server(
+    parsed: argparse.Namespace,
+    filters: Optional[Dict[str, Any]],
+    output_format: OutputFormat,
+) -> Optional[int]:
+    """
+    Answer the command through a running query server.
+
+    Returns:
+        Exit code, or None when no server is reachable (run locally).
+    """
+    from scripts.rag.query_server import request_server, stream_server
+
+    options = {
+        "top_k": parsed.top_k,
+        "filters": filters,
+        "hybrid": parsed.hybrid,
+        "collection": parsed.collection,
+        "no_cache": parsed.no_cache,
+    }
+
+    if parsed.batch_file:
+        try:
+            queries = load_batch_queries(parsed.batch_file)
+        except (OSError, ValueError):
+            return None  # Local path reports the error
+        response = request_server(
+            {"op": "batch", "queries": queries, **options}, parsed.socket
+        )
+        if response is None:
+            return None
+        if not response.get("ok"):
+            print(
+                f"Error: Batch query failed: {response.get('error')}", file=sys.stderr
+            )
+            return 1
+        if parsed.synthesize:
+            print("Warning: --synthesize is ignored in batch mode.", file=sys.stderr)
+        batches = [
+            [RetrievalResult(**r) for r in results] for results in response["batches"]
+        ]
+        _print_batch(parsed, queries, batches, output_format)
+        return 0
+
+    if parsed.synthesize:
+        provider = parsed.provider or "ollama"
+        request = {
+            "op": "synthesize",
+            "query": parsed.query,
+            "top_k": parsed.top_k,
+            "provider": provider,
+            "model": parsed.model,
+            "no_cache": parsed.no_cache,
+        }
+        if _stream_synthesis(parsed, output_format):
+            responses = stream_server({**request, "stream": True}, parsed.socket)
+            response = next(responses, None) if responses is not None else None
+        else:
+            responses = None
+            response = request_server(request, parsed.socket)
+        if response is None:
+            return None
+        if response.get("ok") and responses is not None:
+            return _print_synthesis_stream(
+                parsed, _server_events(itertools.chain([response], responses))
+            )
+        if response.get("ok"):
+            _print_synthesis(
+                parsed, SimpleNamespace(**response["synthesis"]), output_format
+            )
+            return 0
+        if not response.get("unavailable"):
+            print(f"Error: Synthesis failed: {response.get('error')}", file=sys.stderr)
+            return 1
+        print(
+            f"Warning: {provider} not available: {response.get('error')}",
+            file=sys.stderr,
+        )
+        print("Falling back to raw retrieval...", file=sys.stderr)
+        parsed.synthesize = False
+
+    response = request_server(
+        {"op": "query", "query": parsed.query, **options}, parsed.socket
+    )
+    if response is None:
+        return None
+    if not response.get("ok"):
+        print(f"Error: Query failed: {response.get('error')}", file=sys.stderr)
+        return 1
+    results = [RetrievalResult(**r) for r in response["results"]]
+    _print_results(parsed, results, filters, output_format)
+    return 0
+
+
 def main(args: Optional[List[str]] = None) -> int:
     """
     Main CLI entry point.
@@ -264,11 +704,16 @@ def main(args: Optional[List[str]] = None) -> int:
     except SystemExit as e:
         return e.code if isinstance(e.code, int) else 1
 
+    if parsed.command == "serve":
+        from scripts.rag.query_server import serve
+
+        return serve(parsed.socket, warm_up=not parsed.no_warm_up)
+
     if parsed.command != "query":
         print("Error: Unknown command. Use 'query' subcommand.", file=sys.stderr)
         return 1
 
-    if not parsed.query:
+    if not parsed.query and not parsed.batch_file:
         print("Error: Query argument is required.", file=sys.stderr)
         return 1
 
@@ -280,11 +725,50 @@ def main(args: Optional[List[str]] = None) -> int:
         return 1
 
     # Parse filters
-    filters = parse_filter_string(parsed.filter)
+    try:
+        filters = parse_filter_string(parsed.filter)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if parsed.timings:
+        # Stages are timed in this process, so the query server is skipped
+        timing.set_enabled(True)
+        with timing.trace("cli_query") as run:
+            exit_code = _run_local(parsed, filters, output_format)
+        print(timing.format_summary(run), file=sys.stderr)
+        return exit_code
+
+    # A running query server answers without paying cold-start cost
+    if not parsed.no_server:
+        exit_code = _run_via_server(parsed, filters, output_format)
+        if exit_code is not None:
+            return exit_code
+
+    return _run_local(parsed, filters, output_format)
+
+
+def _run_local(
+    parsed: argparse.Namespace,
+    filters: Optional[Dict[str, Any]],
+    output_format: OutputFormat,
+) -> int:
+    """Answer the command in this process."""
+    # Repeat queries are served from a cache invalidated on index rebuilds
+    retriever_kwargs: Dict[str, Any] = {"usage_log_path": None}
+    if parsed.collection:
+        retriever_kwargs["collection_name"] = parsed.collection
+    if not parsed.no_cache:
+        retriever_kwargs["cache"] = QueryCache(persist_path=DEFAULT_QUERY_CACHE_PATH)
+
+    # Batch mode: one multi-query round trip per batch instead of per query
+    if parsed.batch_file:
+        return _run_batch_mode(parsed, filters, retriever_kwargs, output_format)
 
     # Handle synthesize mode (includes hybrid by default)
     if parsed.synthesize:
         try:
+            from scripts.rag.answer_cache import AnswerCache
             from scripts.rag.llm_synthesis import RAGSynthesizer, check_provider_status
 
             # Determine provider
@@ -301,7 +785,24 @@ def main(args: Optional[List[str]] = None) -> int:
                 parsed.synthesize = False
             else:
                 model = parsed.model or provider_info.get("default_model")
-                synthesizer = RAGSynthesizer(provider=provider, model=model)
+                synthesizer = RAGSynthesizer(
+                    provider=provider,
+                    model=model,
+                    cache=None if parsed.no_cache else AnswerCache(),
+                )
+
+                if _stream_synthesis(parsed, output_format):
+                    try:
+                        return _print_synthesis_stream(
+                            parsed,
+                            synthesizer.synthesize_stream(
+                                question=parsed.query,
+                                top_k=parsed.top_k,
+                                expand_graph=True,
+                            ),
+                        )
+                    finally:
+                        synthesizer.close()
 
                 result = synthesizer.synthesize(
                     question=parsed.query,
@@ -310,30 +811,7 @@ def main(args: Optional[List[str]] = None) -> int:
                 )
                 synthesizer.close()
 
-                if output_format == OutputFormat.JSON:
-                    output = json.dumps(
-                        {
-                            "answer": result.answer,
-                            "citations": result.citations,
-                            "model": result.model,
-                            "context_chunks": result.context_chunks,
-                            "source_docs": result.source_docs,
-                        },
-                        indent=2,
-                    )
-                else:
-                    output = f"{result.answer}\n\n---\nSources ({result.context_chunks} chunks from {len(result.source_docs)} docs):\n"
-                    for citation in result.citations[:5]:  # Limit citations shown
-                        output += f"  - {citation}\n"
-                    output += f"\nModel: {result.model}"
-
-                if parsed.verbose:
-                    print(f"Query: {parsed.query}", file=sys.stderr)
-                    print(f"Model: {result.model}", file=sys.stderr)
-                    print(f"Context chunks: {result.context_chunks}", file=sys.stderr)
-                    print("---", file=sys.stderr)
-
-                print(output)
+                _print_synthesis(parsed, result, output_format)
                 return 0
 
         except ImportError as e:
@@ -346,7 +824,11 @@ def main(args: Optional[List[str]] = None) -> int:
         try:
             from scripts.rag.hybrid_retriever import HybridRetriever
 
-            retriever = HybridRetriever()
+            retriever = HybridRetriever(
+                vector_retriever=GovernanceRetriever(
+                    cache=retriever_kwargs.get("cache")
+                )
+            )
             results = retriever.query(
                 query_text=parsed.query,
                 top_k=parsed.top_k,
@@ -370,13 +852,13 @@ def main(args: Optional[List[str]] = None) -> int:
             print(f"Warning: Hybrid retrieval not available: {e}", file=sys.stderr)
             print("Falling back to vector-only retrieval...", file=sys.stderr)
             parsed.hybrid = False
+        except ValueError as e:
+            print(f"Error: Query failed: {e}", file=sys.stderr)
+            return 1
 
     # Standard vector-only retrieval
     if not parsed.hybrid and not parsed.synthesize:
         try:
-            retriever_kwargs = {"usage_log_path": None}
-            if parsed.collection:
-                retriever_kwargs["collection_name"] = parsed.collection
             retriever = GovernanceRetriever(**retriever_kwargs)
         except Exception as e:
             print(f"Error: Failed to initialize retriever: {e}", file=sys.stderr)
@@ -394,23 +876,7 @@ def main(args: Optional[List[str]] = None) -> int:
             return 1
 
     # Format output for non-synthesis modes
-    include_citations = not parsed.no_citations
-    output = format_results(
-        converted_results,
-        format_type=output_format,
-        include_citations=include_citations,
-    )
-
-    # Print verbose info if requested
-    if parsed.verbose:
-        print(f"Query: {parsed.query}", file=sys.stderr)
-        print(f"Top-K: {parsed.top_k}", file=sys.stderr)
-        if filters:
-            print(f"Filters: {filters}", file=sys.stderr)
-        print(f"Results: {len(converted_results)}", file=sys.stderr)
-        print("---", file=sys.stderr)
-
-    print(output)
+    _print_results(parsed, converted_results, filters, output_format)
     return 0
 
 
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+---
+id: SCRIPT-0091
+type: script
+owner: platform-team
+status: active
+maturity: 1
+last_validated: 2026-10-18
+test:
+  runner: pytest
+  command: "pytest -q tests/unit/test_context_packer.py"
+  evidence: declared
+dry_run:
+  supported: true
+risk_profile:
+  production_impact: low
+  security_risk: low
+  coupling_risk: low
+relates_to:
+  - PRD-0008-governance-rag-pipeline
+  - SCRIPT-0080-llm-synthesis
+  - SCRIPT-0088-lexical-index
+---
+Purpose: Fit retrieved chunks into a per-provider LLM token budget.
+
+Retrieval (especially graph expansion) can return whole sections that
+overflow a small local model's context window and inflate API cost. The
+packer:
+
+1. Drops duplicate and overlapping chunks from the same doc and section.
+2. Walks chunks in score order (lower distance first).
+3. Trims oversized chunks to their most query-relevant sentences.
+4. Stops adding text once the token budget is spent.
+
+Token counts are estimated (about four characters per token), which is
+close enough for budgeting without a provider-specific tokenizer.
+
+Example:
+    >>> from scripts.rag.context_packer import pack_context
+    >>> packed = pack_context(results, "What are TDD requirements?", 2000)
+    >>> packed.tokens <= 2000
+    True
+"""
+
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, Optional, Sequence
+import math
+import os
+import re
+
+from scripts.rag.lexical_index import tokenize
+
+
+# Context budgets (estimated tokens) leave room for the system prompt, the
+# question and the answer inside each provider's typical context window.
+DEFAULT_CONTEXT_BUDGETS: Dict[str, int] = {
+    "ollama": 2500,
+    "claude": 8000,
+    "openai": 8000,
+}
+DEFAULT_CONTEXT_BUDGET = 4000
+CONTEXT_BUDGET_ENV_VAR = "RAG_CONTEXT_TOKENS"
+
+# Estimated characters per token for English prose and markdown
+CHARS_PER_TOKEN = 4
+# One chunk may use at most this share of the budget before it is trimmed
+MAX_CHUNK_SHARE = 0.5
+# Never trim a chunk below this many tokens; skip it instead
+MIN_CHUNK_TOKENS = 48
+# Token-set overlap above which two chunks of one section count as duplicates
+DUPLICATE_OVERLAP = 0.8
+
+CHUNK_SEPARATOR = "\n\n---\n\n"
+TRIM_MARKER = "..."
+
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9`*\[(])")
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of text (about four characters per token)."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN) if text else 0
+
+
+def context_budget(provider: Optional[str] = None) -> int:
+    """Token budget for a provider; $RAG_CONTEXT_TOKENS overrides all."""
+    override = os.getenv(CONTEXT_BUDGET_ENV_VAR)
+    if override:
+        try:
+            return max(0, int(override))
+        except ValueError:
+            pass
+    return DEFAULT_CONTEXT_BUDGETS.get((provider or "").lower(), DEFAULT_CONTEXT_BUDGET)
+
+
+def split_sentences(text: str) -> List[str]:
+    """
+    Split chunk text into sentence-sized units.
+
+    Lines are kept separate so headings, list items and table rows stay
+    intact; fenced code blocks are kept whole.
+    """
+    units: List[str] = []
+    fence: List[str] = []
+    for line in text.splitlines():
+        if fence:
+            fence.append(line)
+            if line.strip().startswith("```"):
+                units.append("\n".join(fence))
+                fence = []
+            continue
+        if line.strip().startswith("```"):
+            fence = [line]
+            continue
+        if line.strip():
+            units.extend(part for part in _SENTENCE_BREAK.split(line) if part)
+    if fence:
+        units.append("\n".join(fence))
+    return units
+
+
+def trim_to_relevant(text: str, query: str, max_tokens: int) -> str:
+    """
+    Keep the sentences that best match the query, within max_tokens.
+
+    Sentences are ranked by the number of distinct query terms they contain
+    (earlier sentences win ties) and emitted in their original order, with
+    "..." marking each gap. Text already within budget is returned as is.
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    sentences = split_sentences(text)
+    terms = set(tokenize(query))
+    ranked = sorted(
+        range(len(sentences)),
+        key=lambda i: (-len(terms.intersection(tokenize(sentences[i]))), i),
+    )
+    chosen: List[int] = []
+    used = 1  # Trailing marker
+    for i in ranked:
+        # Sentence, its line break and a possible gap marker before it
+        cost = estimate_tokens(sentences[i]) + 2
+        if used + cost > max_tokens:
+            continue
+        chosen.append(i)
+        used += cost
+    if not chosen:
+        keep = max(0, max_tokens * CHARS_PER_TOKEN - len(TRIM_MARKER))
+        return text[:keep] + TRIM_MARKER
+    parts: List[str] = []
+    previous = -1
+    for i in sorted(chosen):
+        if i != previous + 1:
+            parts.append(TRIM_MARKER)
+        parts.append(sentences[i])
+        previous = i
+    if previous != len(sentences) - 1:
+        parts.append(TRIM_MARKER)
+    return "\n".join(parts)
+
+
+def chunk_header(index: int, metadata: Dict[str, Any]) -> str:
+    """Header line that introduces a chunk in the LLM context."""
+    header = f"[{index}] {metadata.get('doc_id', 'Unknown')}"
+    if metadata.get("section"):
+        header += f" - {metadata['section']}"
+    if metadata.get("file_path"):
+        header += f" ({metadata['file_path']})"
+    return header
+
+
+def _overlap(a: set, b: set) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / min(len(a), len(b))
+
+
+def deduplicate(results: Sequence[Any]) -> List[Any]:
+    """
+    Drop repeated chunk ids and near-duplicate text within a doc section.
+
+    Results are assumed to be in preference order; the first of each
+    duplicate group is kept.
+    """
+    kept: List[Any] = []
+    seen_ids = set()
+    sections: Dict[tuple, List[set]] = {}
+    for result in results:
+        if result.id in seen_ids:
+            continue
+        metadata = result.metadata or {}
+        key = (metadata.get("doc_id"), metadata.get("section"))
+        terms = set(tokenize(result.text))
+        previous = sections.setdefault(key, [])
+        if any(_overlap(terms, other) >= DUPLICATE_OVERLAP for other in previous):
+            continue
+        seen_ids.add(result.id)
+        previous.append(terms)
+        kept.append(result)
+    return kept
+
+
+@dataclass
+class PackedContext:
+    """
+    Chunks selected for the LLM prompt.
+
+    Attributes:
+        results: Chunks in prompt order, with text trimmed where needed.
+        tokens: Estimated tokens of the formatted context.
+        budget: Token budget the context was packed into.
+        dropped: Ids of chunks left out (duplicates or over budget).
+        trimmed: Ids of chunks that were shortened.
+    """
+
+    results: List[Any]
+    tokens: int
+    budget: int
+    dropped: List[str] = field(default_factory=list)
+    trimmed: List[str] = field(default_factory=list)
+
+
+def pack_context(
+    results: Sequence[Any],
+    query: str,
+    max_tokens: int,
+    max_chunk_tokens: Optional[int] = None,
+) -> PackedContext:
+    """
+    Select and trim chunks so the formatted context fits max_tokens.
+
+    Args:
+        results: RetrievalResult or HybridResult objects (lower score is
+            better).
+        query: User question, used to pick relevant sentences.
+        max_tokens: Token budget for the whole context block.
+        max_chunk_tokens: Per-chunk cap before trimming (default: half the
+            budget).
+
+    Returns:
+        PackedContext; results keep their type with only text replaced.
+    """
+    ordered = sorted(results, key=lambda r: r.score)
+    unique = deduplicate(ordered)
+    unique_ids = {r.id for r in unique}
+    dropped = [r.id for r in ordered if r.id not in unique_ids]
+    if max_chunk_tokens is None:
+        max_chunk_tokens = max(MIN_CHUNK_TOKENS, int(max_tokens * MAX_CHUNK_SHARE))
+
+    packed: List[Any] = []
+    trimmed: List[str] = []
+    used = 0
+    for result in unique:
+        separator = estimate_tokens(CHUNK_SEPARATOR) if packed else 0
+        header = estimate_tokens(chunk_header(len(packed) + 1, result.metadata)) + 1
+        available = min(max_chunk_tokens, max_tokens - used - separator - header)
+        if available < MIN_CHUNK_TOKENS and estimate_tokens(result.text) > available:
+            dropped.append(result.id)
+            continue
+        text = trim_to_relevant(result.text, query, available)
+        if text != result.text:
+            trimmed.append(result.id)
+            result = replace(result, text=text)
+        packed.append(result)
+        used += separator + header + estimate_tokens(text)
+    return PackedContext(
+        results=packed,
+        tokens=used,
+        budget=max_tokens,
+        dropped=dropped,
+        trimmed=trimmed,
+    )
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+---
+id: SCRIPT-0097
+type: script
+owner: platform-team
+status: active
+maturity: 1
+last_validated: 2026-10-18
+test:
+  runner: pytest
+  command: "pytest -q tests/unit/test_context_window.py"
+  evidence: declared
+dry_run:
+  supported: true
+risk_profile:
+  production_impact: low
+  security_risk: low
+  coupling_risk: low
+relates_to:
+  - PRD-0008-governance-rag-pipeline
+  - SCRIPT-0071-chunker
+  - SCRIPT-0080-llm-synthesis
+  - SCRIPT-0091-context-packer
+---
+Purpose: Expand retrieved chunks with their neighbours at query time.
+
+Stored chunks carry prev_chunk_id, next_chunk_id and parent_chunk_id
+(chunker.link_chunks) rather than copies of the surrounding text. This
+module follows those links with batched id lookups (one collection.get per
+step outward) and rebuilds the context around each hit:
+
+- Compact sentence-window chunks (context_window=N in their metadata) get
+  the N sentences either side, the same window SentenceWindowNodeParser
+  would have stored inline.
+- Section chunks can be widened by an explicit window and/or prefixed with
+  their parent section.
+
+Example:
+    >>> from scripts.rag.context_window import collection_fetcher, expand_context
+    >>> fetch = collection_fetcher(retriever.collection)
+    >>> expanded = expand_context(results, fetch)
+    >>> expanded[0].metadata["context_ids"]
+    ['GOV-0017-tdd-and-determinism_1', 'GOV-0017-tdd-and-determinism_2', ...]
+"""
+
+from dataclasses import replace
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from scripts.rag.chunker import (
+    CONTEXT_WINDOW_KEY,
+    NEXT_CHUNK_KEY,
+    PARENT_CHUNK_KEY,
+    PREV_CHUNK_KEY,
+)
+
+
+# id -> (text, metadata)
+ChunkRecord = Tuple[str, Dict[str, Any]]
+Fetcher = Callable[[List[str]], Dict[str, ChunkRecord]]
+
+# Joins sentence chunks as SentenceWindowNodeParser builds its window
+SENTENCE_SEPARATOR = " "
+SECTION_SEPARATOR = "\n\n"
+CONTEXT_IDS_KEY = "context_ids"
+
+
+def collection_fetcher(collection: Any) -> Fetcher:
+    """
+    Look up chunks by id in a ChromaDB collection.
+
+    Args:
+        collection: ChromaDB collection (or anything with a compatible get).
+
+    Returns:
+        Function mapping a list of ids to {id: (text, metadata)}; ids that
+        are not stored are left out.
+    """
+
+    def fetch(ids: List[str]) -> Dict[str, ChunkRecord]:
+        if not ids:
+            return {}
+        found = collection.get(ids=ids, include=["documents", "metadatas"])
+        return {
+            chunk_id: (text or "", metadata or {})
+            for chunk_id, text, metadata in zip(
+                found.get("ids") or [],
+                found.get("documents") or [],
+                found.get("metadatas") or [],
+            )
+        }
+
+    return fetch
+
+
+def _window(metadata: Dict[str, Any], window: Optional[int]) -> int:
+    if CONTEXT_IDS_KEY in metadata:
+        return 0  # already expanded
+    if window is not None:
+        return window
+    try:
+        return int(metadata.get(CONTEXT_WINDOW_KEY) or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _fetch_missing(
+    ids: Iterable[str], known: Dict[str, ChunkRecord], fetch: Fetcher
+) -> None:
+    missing = sorted({i for i in ids if i and i not in known})
+    if missing:
+        known.update(fetch(missing))
+
+
+def expand_context(
+    results: Sequence[Any],
+    fetch: Fetcher,
+    window: Optional[int] = None,
+    include_parent: bool = False,
+) -> List[Any]:
+    """
+    Replace each result's text with the text of its context window.
+
+    Args:
+        results: RetrievalResult or HybridResult objects with link metadata.
+        fetch: Id lookup, e.g. collection_fetcher(collection).
+        window: Chunks to add each side. None uses each chunk's own
+            context_window (compact sentence windows); section chunks
+            without one are left as they are.
+        include_parent: Prefix the parent section when it is not already
+            inside the window.
+
+    Returns:
+        New results (same type) in the same order. Expanded results list
+        the chunk ids they cover in metadata["context_ids"]. Results
+        without links, whose neighbours are not stored, or that were
+        already expanded are returned unchanged.
+    """
+    known: Dict[str, ChunkRecord] = {r.id: (r.text, r.metadata or {}) for r in results}
+    windows = [_window(r.metadata or {}, window) for r in results]
+    before: List[List[str]] = [[] for _ in results]
+    after: List[List[str]] = [[] for _ in results]
+
+    # Walk outward one step per round, fetching every result's next
+    # neighbours in a single batch.
+    for step in range(max(windows, default=0)):
+        wanted: List[Tuple[List[str], str]] = []
+        for i, result in enumerate(results):
+            if step >= windows[i]:
+                continue
+            for chain, key in (
+                (before[i], PREV_CHUNK_KEY),
+                (after[i], NEXT_CHUNK_KEY),
+            ):
+                if len(chain) != step:
+                    continue  # stopped at a missing neighbour or document edge
+                edge = chain[-1] if chain else result.id
+                neighbour = known[edge][1].get(key) or ""
+                if neighbour:
+                    wanted.append((chain, neighbour))
+        if not wanted:
+            break
+        _fetch_missing((chunk_id for _, chunk_id in wanted), known, fetch)
+        for chain, chunk_id in wanted:
+            if chunk_id in known:
+                chain.append(chunk_id)
+
+    if include_parent:
+        _fetch_missing(
+            ((r.metadata or {}).get(PARENT_CHUNK_KEY) or "" for r in results),
+            known,
+            fetch,
+        )
+
+    expanded: List[Any] = []
+    for i, result in enumerate(results):
+        metadata = result.metadata or {}
+        ids = list(reversed(before[i])) + [result.id] + after[i]
+        parent = metadata.get(PARENT_CHUNK_KEY) or ""
+        if (
+            include_parent
+            and CONTEXT_IDS_KEY not in metadata
+            and parent in known
+            and parent not in ids
+        ):
+            ids.insert(0, parent)
+        if len(ids) == 1:
+            expanded.append(result)
+            continue
+        separator = (
+            SENTENCE_SEPARATOR
+            if metadata.get(CONTEXT_WINDOW_KEY)
+            else SECTION_SEPARATOR
+        )
+        text = separator.join(
+            result.text if chunk_id == result.id else known[chunk_id][0]
+            for chunk_id in ids
+        )
+        expanded.append(
+            replace(result, text=text, metadata={**metadata, CONTEXT_IDS_KEY: ids})
+        )
+    return expanded
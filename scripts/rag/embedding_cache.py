@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+"""
+---
+id: SCRIPT-0085
+type: script
+owner: platform-team
+status: active
+maturity: 1
+last_validated: 2026-10-18
+test:
+  runner: pytest
+  command: "pytest -q tests/unit/test_embedding_cache.py"
+  evidence: declared
+dry_run:
+  supported: true
+risk_profile:
+  production_impact: low
+  security_risk: low
+  coupling_risk: low
+relates_to:
+  - PRD-0008-governance-rag-pipeline
+  - GOV-0017-tdd-and-determinism
+  - SCRIPT-0072-indexer
+---
+Purpose: Persistent embedding cache keyed by model and chunk text digest.
+
+Stores embeddings in a memory-mapped float32 matrix plus a JSON hash index,
+one pair per embedding model. CachedEmbeddingFunction wraps any ChromaDB
+embedding function so that indexing and retrieval only call the model for
+texts it has not embedded before.
+
+The cache assumes a single writer (index_build or one query process);
+concurrent readers are safe because the index file is replaced atomically.
+Eviction compacts into a new vectors file that only the new index names,
+so a crash at any point leaves an index that matches its vectors. Lookups
+update LRU ticks in memory only; they are persisted with the next write.
+
+Example:
+    >>> from scripts.rag.embedding_cache import EmbeddingCache
+    >>> cache = EmbeddingCache(".embedding_cache", "all-MiniLM-L6-v2")
+    >>> cache.get_many(["hello"])
+    [None]
+
+Usage:
+    python -m scripts.rag.embedding_cache stats
+    python -m scripts.rag.embedding_cache prune --max-entries 50000
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+import hashlib
+import json
+import os
+import re
+
+from scripts.rag.lazy_imports import LazyModule
+
+# Imported when the first cache opens; the cache is disabled without numpy
+np = LazyModule("numpy", "Install with: pip install numpy")
+
+
+DEFAULT_EMBEDDING_CACHE_DIR = ".embedding_cache"
+DEFAULT_MAX_ENTRIES = 200_000
+
+CACHE_VERSION = 1
+_INDEX_FILENAME = "index.json"
+_VECTORS_FILENAME = "vectors.f32"
+_MIN_CAPACITY = 1024
+
+
+def text_digest(model_name: str, text: str) -> str:
+    """Cache key for a text embedded by a given model."""
+    return hashlib.sha256(f"{model_name}\0{text}".encode("utf-8")).hexdigest()
+
+
+def _model_slug(model_name: str) -> str:
+    """Filesystem-safe directory name for a model."""
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", model_name) or "default"
+
+
+class EmbeddingCache:
+    """
+    On-disk embedding cache for a single embedding model.
+
+    Attributes:
+        cache_dir: Root cache directory (one subdirectory per model).
+        model_name: Embedding model the vectors belong to.
+        max_entries: Entries kept on save; least recently used are evicted.
+        hits: Lookups served from the cache in this process.
+        misses: Lookups that required the model in this process.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path],
+        model_name: str,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        if not np:
+            raise ImportError("numpy is not installed. Install with: pip install numpy")
+        self.cache_dir = Path(cache_dir)
+        self.model_name = model_name
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._dir = self.cache_dir / _model_slug(model_name)
+        self._rows: Dict[str, List[int]] = {}  # key -> [row, last_access_tick]
+        self._dim: Optional[int] = None
+        self._capacity = 0
+        self._tick = 0
+        self._generation = 0
+        self._vectors_name = _VECTORS_FILENAME
+        self._stale: List[Path] = []  # superseded vectors, removed after save
+        self._lifetime = {"hits": 0, "misses": 0}
+        self._matrix = None
+        self._dirty = False
+        self._load()
+
+    # -- persistence -------------------------------------------------------
+
+    @property
+    def _index_path(self) -> Path:
+        return self._dir / _INDEX_FILENAME
+
+    @property
+    def _vectors_path(self) -> Path:
+        return self._dir / self._vectors_name
+
+    def _load(self) -> None:
+        if not self._index_path.exists():
+            return
+        try:
+            data = json.loads(self._index_path.read_text())
+        except (OSError, ValueError):
+            return
+        if data.get("version") != CACHE_VERSION or data.get("model") != self.model_name:
+            return
+        self._vectors_name = data.get("vectors", _VECTORS_FILENAME)
+        self._generation = data.get("generation", 0)
+        if not self._vectors_path.exists():
+            self._vectors_name = _VECTORS_FILENAME
+            self._generation = 0
+            return
+        self._dim = data["dim"]
+        self._capacity = data["capacity"]
+        self._tick = data.get("tick", 0)
+        self._rows = {k: list(v) for k, v in data.get("rows", {}).items()}
+        self._lifetime = data.get("lifetime", self._lifetime)
+        self._matrix = np.memmap(
+            self._vectors_path,
+            dtype=np.float32,
+            mode="r+",
+            shape=(self._capacity, self._dim),
+        )
+
+    def save(self) -> None:
+        """Flush vectors, evict over-limit entries and write the index."""
+        if not self._dirty:
+            return
+        if len(self._rows) > self.max_entries:
+            self.evict(self.max_entries)
+        if self._matrix is not None:
+            self._matrix.flush()
+        self._dir.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "version": CACHE_VERSION,
+            "model": self.model_name,
+            "dim": self._dim,
+            "capacity": self._capacity,
+            "tick": self._tick,
+            "generation": self._generation,
+            "vectors": self._vectors_name,
+            "lifetime": self._lifetime,
+            "rows": self._rows,
+        }
+        tmp_path = self._index_path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(payload, sort_keys=True))
+        os.replace(tmp_path, self._index_path)
+        self._dirty = False
+        # Only now does no index point at the superseded vectors
+        for path in self._stale:
+            if path != self._vectors_path and path.exists():
+                path.unlink()
+        self._stale = []
+
+    def _resize(self, capacity: int) -> None:
+        """Rewrite the matrix with a new capacity, keeping rows in order."""
+        self._dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._vectors_path.with_suffix(".f32.tmp")
+        resized = np.memmap(
+            tmp_path, dtype=np.float32, mode="w+", shape=(capacity, self._dim)
+        )
+        if self._matrix is not None:
+            used = min(len(self._rows), capacity)
+            resized[:used] = self._matrix[:used]
+        resized.flush()
+        del resized
+        self._matrix = None
+        os.replace(tmp_path, self._vectors_path)
+        self._capacity = capacity
+        self._matrix = np.memmap(
+            self._vectors_path,
+            dtype=np.float32,
+            mode="r+",
+            shape=(capacity, self._dim),
+        )
+
+    # -- lookups -----------------------------------------------------------
+
+    def get_many(self, texts: Sequence[str]) -> List[Optional[Any]]:
+        """
+        Look up embeddings for texts.
+
+        Returns:
+            List aligned with texts; None marks a miss.
+        """
+        found: List[Optional[Any]] = []
+        for text in texts:
+            entry = self._rows.get(text_digest(self.model_name, text))
+            if entry is None:
+                self.misses += 1
+                found.append(None)
+                continue
+            self.hits += 1
+            self._tick += 1
+            entry[1] = self._tick
+            found.append(np.array(self._matrix[entry[0]]))
+        self._lifetime["hits"] += sum(1 for f in found if f is not None)
+        self._lifetime["misses"] += sum(1 for f in found if f is None)
+        # Ticks and counters ride along with the next write; a lookup alone
+        # does not rewrite the index.
+        return found
+
+    def put_many(self, texts: Sequence[str], vectors: Sequence[Any]) -> None:
+        """Store embeddings for texts (existing keys are overwritten)."""
+        for text, vector in zip(texts, vectors):
+            vector = np.asarray(vector, dtype=np.float32).reshape(-1)
+            if self._dim is None:
+                self._dim = int(vector.shape[0])
+            if vector.shape[0] != self._dim:
+                continue
+            key = text_digest(self.model_name, text)
+            entry = self._rows.get(key)
+            if entry is None:
+                if len(self._rows) >= self._capacity:
+                    self._resize(max(_MIN_CAPACITY, self._capacity * 2))
+                entry = [len(self._rows), 0]
+                self._rows[key] = entry
+            self._tick += 1
+            entry[1] = self._tick
+            self._matrix[entry[0]] = vector
+            self._dirty = True
+
+    # -- maintenance -------------------------------------------------------
+
+    def evict(self, max_entries: int) -> int:
+        """
+        Keep only the max_entries most recently used embeddings.
+
+        Kept vectors are compacted into a new vectors file; the current
+        file (still named by the on-disk index) is removed by the next save.
+
+        Returns:
+            Number of evicted entries.
+        """
+        if len(self._rows) <= max_entries:
+            return 0
+        ordered = sorted(self._rows.items(), key=lambda item: -item[1][1])
+        keep = ordered[:max_entries]
+        evicted = len(self._rows) - len(keep)
+
+        self._generation += 1
+        name = f"vectors.{self._generation}.f32"
+        capacity = max(_MIN_CAPACITY, len(keep))
+        compacted = np.memmap(
+            self._dir / name, dtype=np.float32, mode="w+", shape=(capacity, self._dim)
+        )
+        if keep:
+            compacted[: len(keep)] = self._matrix[[entry[0] for _, entry in keep]]
+        compacted.flush()
+        del compacted
+
+        self._stale.append(self._vectors_path)
+        self._matrix = None
+        self._vectors_name = name
+        self._capacity = capacity
+        self._matrix = np.memmap(
+            self._vectors_path,
+            dtype=np.float32,
+            mode="r+",
+            shape=(capacity, self._dim),
+        )
+        self._rows = {
+            key: [new_row, entry[1]] for new_row, (key, entry) in enumerate(keep)
+        }
+        self._dirty = True
+        return evicted
+
+    def clear(self) -> None:
+        """Drop every cached embedding for this model."""
+        self._rows = {}
+        self._matrix = None
+        self._capacity = 0
+        for path in [self._index_path, self._vectors_path, *self._stale]:
+            if path.exists():
+                path.unlink()
+        self._vectors_name = _VECTORS_FILENAME
+        self._generation = 0
+        self._stale = []
+        self._dirty = False
+
+    def stats(self) -> Dict[str, Any]:
+        """Return size and hit/miss counters."""
+        return {
+            "model": self.model_name,
+            "entries": len(self._rows),
+            "capacity": self._capacity,
+            "dim": self._dim,
+            "bytes": self._capacity * (self._dim or 0) * 4,
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "lifetime_hits": self._lifetime["hits"],
+            "lifetime_misses": self._lifetime["misses"],
+        }
+
+
+class CachedEmbeddingFunction:
+    """
+    ChromaDB embedding function that consults an EmbeddingCache first.
+
+    Name and config are delegated to the wrapped function, so collections
+    persisted with the wrapper reopen with the underlying model.
+    """
+
+    def __init__(self, inner: Any, cache: EmbeddingCache):
+        self.inner = inner
+        self.cache = cache
+
+    def name(self) -> str:
+        return self.inner.name()
+
+    def is_legacy(self) -> bool:
+        return self.inner.is_legacy()
+
+    def default_space(self) -> str:
+        return self.inner.default_space()
+
+    def supported_spaces(self) -> set:
+        return self.inner.supported_spaces()
+
+    def get_config(self) -> dict:
+        return self.inner.get_config()
+
+    def __call__(self, input):
+        texts = [t if isinstance(t, str) else str(t) for t in input]
+        vectors = self.cache.get_many(texts)
+        missing = [i for i, v in enumerate(vectors) if v is None]
+        if missing:
+            computed = self.inner([texts[i] for i in missing])
+            self.cache.put_many([texts[i] for i in missing], computed)
+            for i, vector in zip(missing, computed):
+                vectors[i] = np.asarray(vector, dtype=np.float32)
+            self.cache.save()
+        return vectors
+
+    def embed_documents(self, texts):
+        return self.__call__(texts)
+
+    def embed_query(self, input):
+        if isinstance(input, list):
+            return self.__call__(input)
+        return self.__call__([input])
+
+
+def cache_stats(
+    cache_dir: Union[str, Path] = DEFAULT_EMBEDDING_CACHE_DIR,
+) -> List[Dict]:
+    """Return stats for every model cached under cache_dir."""
+    root = Path(cache_dir)
+    results = []
+    if not root.exists():
+        return results
+    for index_path in sorted(root.glob(f"*/{_INDEX_FILENAME}")):
+        try:
+            model = json.loads(index_path.read_text()).get("model")
+        except (OSError, ValueError):
+            continue
+        if model:
+            results.append(EmbeddingCache(root, model).stats())
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Inspect or prune the embedding cache")
+    parser.add_argument("command", choices=["stats", "prune"])
+    parser.add_argument("--cache-dir", default=DEFAULT_EMBEDDING_CACHE_DIR)
+    parser.add_argument("--max-entries", type=int, default=DEFAULT_MAX_ENTRIES)
+    args = parser.parse_args()
+
+    if args.command == "prune":
+        for entry in cache_stats(args.cache_dir):
+            cache = EmbeddingCache(args.cache_dir, entry["model"], args.max_entries)
+            evicted = cache.evict(args.max_entries)
+            cache.save()
+            print(f"{entry['model']}: evicted {evicted}")
+    print(json.dumps(cache_stats(args.cache_dir), indent=2))
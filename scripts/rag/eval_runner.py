@@ -0,0 +1,519 @@
+#!/usr/bin/env python3
+"""
+---
+id: SCRIPT-0093
+type: script
+owner: platform-team
+status: active
+maturity: 1
+last_validated: 2026-10-18
+test:
+  runner: pytest
+  command: "pytest -q tests/unit/test_eval_runner.py"
+  evidence: declared
+dry_run:
+  supported: true
+risk_profile:
+  production_impact: low
+  security_risk: low
+  coupling_risk: medium
+relates_to:
+  - PRD-0008-governance-rag-pipeline
+  - GOV-0017-tdd-and-determinism
+  - SCRIPT-0080-llm-synthesis
+---
+Purpose: Concurrent, resumable RAGAS evaluation runner.
+
+ragas_evaluate.run_evaluation retrieves every context, then answers, then
+scores the whole set in one blocking step. This runner evaluates each
+question as its own retrieve -> answer -> score pipeline. A thread pool
+runs up to `concurrency` questions at once, so LLM generation and judge
+calls for different questions overlap. Wall time drops roughly by the
+concurrency factor.
+
+- Retrieval is serialised with a lock; it is fast and local, and the
+  retriever's query cache is not thread-safe.
+- A shared rate limiter spaces question starts to respect provider quotas
+  (--max-per-minute).
+- Each finished question is appended to a JSONL checkpoint in reports/.
+  Re-running the same command skips questions already checkpointed with
+  the same settings, so an interrupted run resumes where it stopped.
+
+Answers are synthesized by RAGSynthesizer (--answer-provider) from the
+packed context that is also scored, or use the ragas_evaluate baseline
+(first context) when no answer provider is given.
+
+Usage:
+    python -m scripts.rag.eval_runner --concurrency 8 --provider openai
+    python -m scripts.rag.eval_runner --answer-provider ollama --skip-llm
+    python -m scripts.rag.eval_runner --fresh  # ignore the checkpoint
+"""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import json
+import threading
+import time
+
+from scripts.rag.ragas_evaluate import (
+    _create_llm_for_ragas,
+    compute_retrieval_metrics,
+    generate_answers_simple,
+    load_questions,
+)
+
+
+DEFAULT_CONCURRENCY = 4
+DEFAULT_CHECKPOINT_PATH = Path("reports/ragas_checkpoint.jsonl")
+DEFAULT_OUTPUT_PATH = Path("reports/ragas_metrics.json")
+RAGAS_METRICS = ("faithfulness", "answer_relevancy")
+
+
+@dataclass
+class EvalConfig:
+    """
+    Settings that determine a question's result (the checkpoint signature).
+
+    Attributes:
+        top_k: Contexts retrieved per question.
+        provider: Judge LLM provider for RAGAS metrics.
+        model: Judge model (provider default if None).
+        answer_provider: RAGSynthesizer provider; None uses the baseline
+            first-context answer.
+        answer_model: RAGSynthesizer model (provider default if None).
+        score: Run LLM-judged RAGAS metrics.
+    """
+
+    top_k: int = 5
+    provider: str = "openai"
+    model: Optional[str] = None
+    answer_provider: Optional[str] = None
+    answer_model: Optional[str] = None
+    score: bool = True
+
+    def signature(self) -> str:
+        return json.dumps(asdict(self), sort_keys=True)
+
+
+@dataclass
+class QuestionResult:
+    """Outcome of one question's pipeline."""
+
+    question: str
+    answer: str = ""
+    contexts: List[str] = field(default_factory=list)
+    scores: Dict[str, Optional[float]] = field(default_factory=dict)
+    error: Optional[str] = None
+    seconds: float = 0.0
+
+
+class RateLimiter:
+    """
+    Thread-safe limiter that spaces acquisitions evenly.
+
+    Attributes:
+        per_minute: Maximum acquisitions per minute (None: unlimited).
+    """
+
+    def __init__(
+        self,
+        per_minute: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.per_minute = per_minute
+        self._interval = 60.0 / per_minute if per_minute else 0.0
+        self._clock = clock
+        self._sleep = sleep
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Block until the next slot; returns the seconds waited."""
+        if not self._interval:
+            return 0.0
+        with self._lock:
+            now = self._clock()
+            slot = max(now, self._next)
+            self._next = slot + self._interval
+        wait = slot - now
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+
+class Checkpoint:
+    """
+    Append-only JSONL record of finished questions.
+
+    Records carry the EvalConfig signature; records written with other
+    settings are ignored on load.
+    """
+
+    def __init__(self, path: Optional[Path], signature: str):
+        self.path = Path(path) if path else None
+        self.signature = signature
+        self._lock = threading.Lock()
+
+    def load(self) -> Dict[str, QuestionResult]:
+        """Return finished questions from earlier runs with these settings."""
+        done: Dict[str, QuestionResult] = {}
+        if self.path is None or not self.path.exists():
+            return done
+        for line in self.path.read_text().splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # Torn write from an interrupted run
+            if record.pop("signature", None) != self.signature:
+                continue
+            result = QuestionResult(**record)
+            if result.error is None:
+                done[result.question] = result
+        return done
+
+    def append(self, result: QuestionResult) -> None:
+        if self.path is None:
+            return
+        line = json.dumps({"signature": self.signature, **asdict(result)})
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a") as handle:
+                handle.write(line + "\n")
+
+    def clear(self) -> None:
+        if self.path is not None and self.path.exists():
+            self.path.unlink()
+
+
+def _metric_value(result: Any, name: str) -> Optional[float]:
+    """Read one metric from a RAGAS result (scalar or per-row list)."""
+    try:
+        value = result[name]
+    except (KeyError, TypeError):
+        return None
+    if isinstance(value, (list, tuple)):
+        value = value[0] if value else None
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def score_with_ragas(
+    question: str, answer: str, contexts: List[str], llm: Any
+) -> Dict[str, Optional[float]]:
+    """
+    Score one question with RAGAS faithfulness and answer relevancy.
+
+    Raises:
+        ImportError: If ragas or datasets is not installed.
+    """
+    from datasets import Dataset
+    from ragas import evaluate
+    from ragas.metrics import answer_relevancy, faithfulness
+
+    dataset = Dataset.from_dict(
+        {
+            "user_input": [question],
+            "response": [answer],
+            "retrieved_contexts": [contexts],
+        }
+    )
+    result = evaluate(dataset, metrics=[faithfulness, answer_relevancy], llm=llm)
+    return {name: _metric_value(result, name) for name in RAGAS_METRICS}
+
+
+class EvaluationRunner:
+    """
+    Runs per-question retrieve -> answer -> score pipelines concurrently.
+
+    Stage callables may be injected (tests, custom pipelines); by default
+    they are built from the config on first use.
+
+    Attributes:
+        config: Evaluation settings.
+        concurrency: Maximum questions in flight.
+        rate_limiter: Spaces question starts.
+        checkpoint: Finished-question log used for resuming.
+    """
+
+    def __init__(
+        self,
+        config: EvalConfig,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        max_per_minute: Optional[float] = None,
+        checkpoint_path: Optional[Path] = DEFAULT_CHECKPOINT_PATH,
+        retrieve: Optional[Callable[[str], Tuple[List[Any], List[str]]]] = None,
+        answer: Optional[Callable[[str, List[Any], List[str]], str]] = None,
+        score: Optional[Callable[[str, str, List[str]], Dict[str, Any]]] = None,
+    ):
+        self.config = config
+        self.concurrency = max(1, concurrency)
+        self.rate_limiter = RateLimiter(max_per_minute)
+        self.checkpoint = Checkpoint(checkpoint_path, config.signature())
+        self._retrieve = retrieve
+        self._answer = answer
+        self._score = score
+        self._retrieve_lock = threading.Lock()
+        self._setup_lock = threading.Lock()
+        self._synthesizer = None
+        self._retriever = None
+        self._judge = None
+
+    # -- default stages ----------------------------------------------------
+
+    def _get_synthesizer(self):
+        with self._setup_lock:
+            if self._synthesizer is None:
+                from scripts.rag.llm_synthesis import RAGSynthesizer
+
+                self._synthesizer = RAGSynthesizer(
+                    provider=self.config.answer_provider or "ollama",
+                    model=self.config.answer_model,
+                )
+            return self._synthesizer
+
+    def _get_retriever(self):
+        with self._setup_lock:
+            if self._retriever is None:
+                from scripts.rag.hybrid_retriever import HybridRetriever
+
+                self._retriever = HybridRetriever()
+            return self._retriever
+
+    def _default_retrieve(self, question: str) -> Tuple[List[Any], List[str]]:
+        # Without an answer provider no LLM is needed, so skip the synthesizer
+        with self._retrieve_lock:
+            if self.config.answer_provider is None:
+                results = self._get_retriever().query(question, top_k=self.config.top_k)
+            else:
+                results = self._get_synthesizer().retrieve_context(
+                    question, top_k=self.config.top_k
+                )
+        return results, [r.text for r in results]
+
+    def _default_answer(
+        self, question: str, results: List[Any], contexts: List[str]
+    ) -> str:
+        if self.config.answer_provider is None:
+            return generate_answers_simple([question], [contexts])[0]
+        # results are already expanded and packed by retrieve_context
+        synthesizer = self._get_synthesizer()
+        return synthesizer.synthesize(question, results=results, packed=True).answer
+
+    def _default_score(
+        self, question: str, answer: str, contexts: List[str]
+    ) -> Dict[str, Optional[float]]:
+        if not self.config.score:
+            return {}
+        with self._setup_lock:
+            if self._judge is None:
+                self._judge = _create_llm_for_ragas(
+                    self.config.provider, self.config.model
+                )
+        if self._judge is None:
+            raise RuntimeError(
+                f"Could not create LLM for provider: {self.config.provider}"
+            )
+        return score_with_ragas(question, answer, contexts, self._judge)
+
+    # -- pipeline ----------------------------------------------------------
+
+    def evaluate_question(self, question: str) -> QuestionResult:
+        """Run one question through retrieve, answer and score."""
+        started = time.monotonic()
+        result = QuestionResult(question=question)
+        try:
+            results, result.contexts = (self._retrieve or self._default_retrieve)(
+                question
+            )
+            self.rate_limiter.acquire()
+            result.answer = (self._answer or self._default_answer)(
+                question, results, result.contexts
+            )
+            result.scores = (self._score or self._default_score)(
+                question, result.answer, result.contexts
+            )
+        except Exception as exc:
+            result.error = f"{type(exc).__name__}: {exc}"
+        result.seconds = round(time.monotonic() - started, 3)
+        return result
+
+    def run(
+        self, questions: Sequence[str], resume: bool = True
+    ) -> List[QuestionResult]:
+        """
+        Evaluate questions concurrently, skipping checkpointed ones.
+
+        Returns:
+            Results in question order. A KeyboardInterrupt cancels pending
+            questions; finished ones are already checkpointed.
+        """
+        if not resume:
+            self.checkpoint.clear()
+        done = self.checkpoint.load()
+        pending = [q for q in dict.fromkeys(questions) if q not in done]
+        if done:
+            print(f"Resuming: {len(questions) - len(pending)} questions checkpointed")
+
+        executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        try:
+            futures = {
+                executor.submit(self.evaluate_question, question): question
+                for question in pending
+            }
+            for count, future in enumerate(as_completed(futures), 1):
+                result = future.result()
+                done[result.question] = result
+                self.checkpoint.append(result)
+                status = "error" if result.error else f"{result.seconds:.1f}s"
+                print(f"[{count}/{len(pending)}] {status} {result.question[:60]}")
+        except KeyboardInterrupt:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+        return [done[q] for q in questions if q in done]
+
+    def close(self) -> None:
+        if self._synthesizer is not None:
+            self._synthesizer.close()
+        if self._retriever is not None:
+            self._retriever.close()
+
+
+def summarize(
+    results: Sequence[QuestionResult], config: EvalConfig, elapsed: float
+) -> Dict[str, Any]:
+    """Build the ragas_metrics.json payload from per-question results."""
+    questions = [r.question for r in results]
+    basic_metrics = compute_retrieval_metrics(questions, [r.contexts for r in results])
+    errors = [r for r in results if r.error]
+    ragas_metrics: Dict[str, Any] = {}
+    if config.score:
+        ragas_metrics = {"provider": config.provider, "model": config.model}
+        for name in RAGAS_METRICS:
+            values = [r.scores.get(name) for r in results]
+            values = [v for v in values if v is not None]
+            ragas_metrics[name] = sum(values) / len(values) if values else None
+        if errors:
+            ragas_metrics["error"] = f"{len(errors)} questions failed"
+    return {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "question_count": len(results),
+        "top_k": config.top_k,
+        "provider": config.provider if config.score else None,
+        "model": config.model if config.score else None,
+        "answer_provider": config.answer_provider,
+        "basic_metrics": basic_metrics,
+        "ragas_metrics": ragas_metrics,
+        "runner": {
+            "elapsed_seconds": round(elapsed, 3),
+            "question_seconds": round(sum(r.seconds for r in results), 3),
+            "errors": len(errors),
+        },
+        "status": "completed" if not errors else "partial",
+    }
+
+
+def run_concurrent_evaluation(
+    questions_path: Path = Path("tests/ragas/questions.json"),
+    output_path: Path = DEFAULT_OUTPUT_PATH,
+    config: Optional[EvalConfig] = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    max_per_minute: Optional[float] = None,
+    checkpoint_path: Optional[Path] = DEFAULT_CHECKPOINT_PATH,
+    resume: bool = True,
+) -> Dict[str, Any]:
+    """
+    Evaluate a question set concurrently and write the metrics report.
+
+    Returns:
+        The report written to output_path.
+    """
+    config = config or EvalConfig()
+    questions = load_questions(questions_path)
+    print(f"Loaded {len(questions)} questions (concurrency {concurrency})")
+
+    runner = EvaluationRunner(
+        config,
+        concurrency=concurrency,
+        max_per_minute=max_per_minute,
+        checkpoint_path=checkpoint_path,
+    )
+    started = time.monotonic()
+    try:
+        results = runner.run(questions, resume=resume)
+    finally:
+        runner.close()
+    report = summarize(results, config, time.monotonic() - started)
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(report, indent=2, sort_keys=True))
+    print(f"Results written to {output_path}")
+    return report
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run RAGAS evaluation concurrently")
+    parser.add_argument(
+        "--questions", type=Path, default=Path("tests/ragas/questions.json")
+    )
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT_PATH)
+    parser.add_argument("--checkpoint", type=Path, default=DEFAULT_CHECKPOINT_PATH)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Questions evaluated in parallel (default: {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--max-per-minute",
+        type=float,
+        default=None,
+        help="Start at most this many questions per minute",
+    )
+    parser.add_argument(
+        "--provider",
+        choices=["openai", "ollama", "claude"],
+        default="openai",
+        help="Judge LLM provider for RAGAS metrics (default: openai)",
+    )
+    parser.add_argument("--model", default=None, help="Judge model")
+    parser.add_argument(
+        "--answer-provider",
+        choices=["openai", "ollama", "claude"],
+        default=None,
+        help="Synthesize answers with RAGSynthesizer (default: first context)",
+    )
+    parser.add_argument("--answer-model", default=None)
+    parser.add_argument(
+        "--skip-llm", action="store_true", help="Skip LLM-judged RAGAS metrics"
+    )
+    parser.add_argument(
+        "--fresh", action="store_true", help="Discard the checkpoint and start over"
+    )
+    args = parser.parse_args()
+
+    run_concurrent_evaluation(
+        questions_path=args.questions,
+        output_path=args.output,
+        config=EvalConfig(
+            top_k=args.top_k,
+            provider=args.provider,
+            model=args.model,
+            answer_provider=args.answer_provider,
+            answer_model=args.answer_model,
+            score=not args.skip_llm,
+        ),
+        concurrency=args.concurrency,
+        max_per_minute=args.max_per_minute,
+        checkpoint_path=args.checkpoint,
+        resume=not args.fresh,
+    )
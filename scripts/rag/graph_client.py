@@ -28,15 +28,46 @@ SKIP-TDD: Requires Neo4j; tested via test_graph_ingest.py integration.
 Provides a minimal client for upserting document nodes and relates_to edges.
 Graphiti is expected to share the same Neo4j backend in Phase 1+, but Phase 0
 ingestion uses direct Neo4j operations.
+
+Bulk writes (upsert_documents, relate_documents_bulk) send batched UNWIND
+statements in explicit write transactions over a single session.
+
+Reads go through read(), which borrows a session from the driver's bounded
+connection pool, runs a managed read transaction with a timeout, and
+returns plain dicts.
 """
 
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, List, Tuple
+import re
+
+from scripts.rag.lazy_imports import LazyModule
+
+# Imported when the first client is created; falsy when neo4j is missing
+neo4j = LazyModule("neo4j", "Install with: pip install neo4j")
+
+
+# Default read timeout (seconds) for graph traversal queries
+DEFAULT_QUERY_TIMEOUT = 5.0
+
+# Rows sent per UNWIND statement during bulk writes
+DEFAULT_WRITE_BATCH_SIZE = 1000
 
-try:
-    from neo4j import GraphDatabase
-except ImportError:
-    GraphDatabase = None  # Allow import without neo4j for testing
+_REL_TYPE_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def _check_rel_type(rel_type: str) -> str:
+    """Reject relationship type names that cannot be safely interpolated."""
+    if not _REL_TYPE_PATTERN.match(rel_type):
+        raise ValueError(f"Invalid relationship type: {rel_type!r}")
+    return rel_type
+
+
+def _rel_type_filter(rel_types: Optional[Iterable[str]]) -> str:
+    """Build a Cypher relationship type filter, rejecting unsafe names."""
+    if not rel_types:
+        return ""
+    return ":" + "|".join(_check_rel_type(rel_type) for rel_type in rel_types)
 
 
 @dataclass
@@ -47,6 +78,9 @@ class GraphClientConfig:
     user: str
     password: str
     database: Optional[str] = None
+    max_connection_pool_size: int = 50
+    connection_acquisition_timeout: float = 10.0
+    query_timeout: float = DEFAULT_QUERY_TIMEOUT
 
 
 class Neo4jGraphClient:
@@ -59,11 +93,14 @@ class Neo4jGraphClient:
     """
 
     def __init__(self, config: GraphClientConfig):
-        if GraphDatabase is None:
+        if not neo4j:
             raise ImportError("neo4j is not installed. Install with: pip install neo4j")
         self._config = config
-        self._driver = GraphDatabase.driver(
-            config.uri, auth=(config.user, config.password)
+        self._driver = neo4j.GraphDatabase.driver(
+            config.uri,
+            auth=(config.user, config.password),
+            max_connection_pool_size=config.max_connection_pool_size,
+            connection_acquisition_timeout=config.connection_acquisition_timeout,
         )
 
     def close(self) -> None:
@@ -104,6 +141,90 @@ class Neo4jGraphClient:
         params = {"src": src_id, "dst": dst_id}
         self._run(query, params)
 
+    def upsert_documents(
+        self,
+        documents: Iterable[Dict[str, Any]],
+        batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+    ) -> int:
+        """
+        Upsert many document nodes with batched UNWIND statements.
+
+        Args:
+            documents: Node properties; each must include "id".
+            batch_size: Rows per statement.
+
+        Returns:
+            Number of documents sent.
+        """
+        rows = [
+            {"id": props["id"], "props": props}
+            for props in documents
+            if props.get("id")
+        ]
+        query = (
+            "UNWIND $rows AS row "
+            "MERGE (d:Document {id: row.id}) "
+            "SET d += row.props"
+        )
+        self._write_batches([(query, rows)], batch_size)
+        return len(rows)
+
+    def relate_documents_bulk(
+        self,
+        edges: Iterable[Tuple[str, str, str]],
+        batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+    ) -> Dict[str, int]:
+        """
+        Create many relationships, one UNWIND statement per relationship type.
+
+        Args:
+            edges: (src_id, dst_id, rel_type) tuples; duplicates are sent once.
+            batch_size: Rows per statement.
+
+        Returns:
+            Dict mapping relationship type to number of distinct edges sent.
+        """
+        by_type: Dict[str, List[Dict[str, str]]] = {}
+        seen = set()
+        for src_id, dst_id, rel_type in edges:
+            if not src_id or not dst_id or (src_id, dst_id, rel_type) in seen:
+                continue
+            seen.add((src_id, dst_id, rel_type))
+            by_type.setdefault(_check_rel_type(rel_type), []).append(
+                {"src": src_id, "dst": dst_id}
+            )
+        statements = [
+            (
+                "UNWIND $rows AS row "
+                "MERGE (a:Document {id: row.src}) "
+                "MERGE (b:Document {id: row.dst}) "
+                f"MERGE (a)-[:{rel_type}]->(b)",
+                rows,
+            )
+            for rel_type, rows in sorted(by_type.items())
+        ]
+        self._write_batches(statements, batch_size)
+        return {rel_type: len(rows) for rel_type, rows in by_type.items()}
+
+    def _write_batches(
+        self, statements: List[Tuple[str, List[Dict[str, Any]]]], batch_size: int
+    ) -> None:
+        """Run UNWIND statements in explicit write transactions on one session."""
+        batches = [
+            (query, rows[start : start + batch_size])
+            for query, rows in statements
+            for start in range(0, len(rows), max(1, batch_size))
+        ]
+        if not batches:
+            return
+
+        def work(tx, query, rows):
+            tx.run(query, {"rows": rows}).consume()
+
+        with self._session() as session:
+            for query, rows in batches:
+                session.execute_write(work, query, rows)
+
     def _run(self, query: str, params: Dict[str, Any]) -> None:
         """Execute a Cypher query with optional database selection."""
         if self._config.database:
@@ -113,10 +234,109 @@ class Neo4jGraphClient:
             with self._driver.session() as session:
                 session.run(query, params)
 
+    def _session(self, read: bool = False):
+        """Borrow a pooled session, honouring database selection."""
+        kwargs: Dict[str, Any] = {}
+        if self._config.database:
+            kwargs["database"] = self._config.database
+        if read and neo4j.loaded:
+            kwargs["default_access_mode"] = neo4j.READ_ACCESS
+        return self._driver.session(**kwargs)
+
+    def read(
+        self,
+        query: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Run a read-only query in a managed transaction.
+
+        Args:
+            query: Cypher query.
+            params: Query parameters.
+            timeout: Server-side timeout in seconds (default: config).
+
+        Returns:
+            Records as dicts.
+        """
+        timeout = self._config.query_timeout if timeout is None else timeout
+
+        def work(tx):
+            return [record.data() for record in tx.run(query, params or {})]
+
+        if neo4j.loaded and timeout:
+            work = neo4j.unit_of_work(timeout=timeout)(work)
+        with self._session(read=True) as session:
+            return session.execute_read(work)
+
+    def neighbors(
+        self,
+        doc_ids: Iterable[str],
+        rel_types: Optional[Iterable[str]] = None,
+        limit_per_source: Optional[int] = None,
+        exclude: Optional[Iterable[str]] = None,
+        weights: Optional[Dict[str, float]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, List[Tuple[str, str]]]:
+        """
+        Return one-hop neighbours for many documents in a single query.
+
+        Edges are undirected. Per source, neighbours are ordered by
+        relationship weight (highest first) and id, then capped.
+
+        Args:
+            doc_ids: Source document ids.
+            rel_types: Relationship types to follow. Default: all.
+            limit_per_source: Maximum neighbours per source document.
+            exclude: Document ids never returned as neighbours.
+            weights: Relationship type weights used for ordering.
+            timeout: Query timeout in seconds.
+
+        Returns:
+            Mapping of source id to [(neighbour id, relationship type)].
+        """
+        doc_ids = sorted(set(doc_ids))
+        if not doc_ids:
+            return {}
+        rel_filter = _rel_type_filter(rel_types)
+        query = f"""
+        UNWIND $doc_ids AS src_id
+        MATCH (src:Document {{id: src_id}})-[r{rel_filter}]-(related:Document)
+        WHERE NOT related.id IN $exclude
+        WITH src_id, related.id AS related_id, type(r) AS rel_type,
+             coalesce($weights[type(r)], 1.0) AS weight
+        ORDER BY src_id, weight DESC, related_id, rel_type
+        WITH src_id, collect({{id: related_id, type: rel_type}}) AS edges
+        RETURN src_id AS source,
+               CASE WHEN $limit IS NULL THEN edges ELSE edges[0..$limit] END AS related
+        """
+        params = {
+            "doc_ids": doc_ids,
+            "exclude": sorted(set(exclude or [])),
+            "weights": dict(weights or {}),
+            "limit": limit_per_source,
+        }
+        neighbours: Dict[str, List[Tuple[str, str]]] = {}
+        for record in self.read(query, params, timeout=timeout):
+            neighbours[record["source"]] = [
+                (edge["id"], edge["type"]) for edge in record["related"]
+            ]
+        return neighbours
+
+    def relationship_counts(self) -> Dict[str, int]:
+        """Return the number of edges per relationship type."""
+        return {
+            record["type"]: record["count"]
+            for record in self.read(
+                "MATCH ()-[r]->() RETURN type(r) AS type, count(r) AS count"
+            )
+        }
+
     def health_check(self) -> Dict[str, Any]:
         """Check connection to Neo4j and return server info."""
         try:
-            with self._driver.session() as session:
+            with self._session(read=True) as session:
                 result = session.run("RETURN 1 AS ok")
                 result.single()
             info = self._driver.get_server_info()
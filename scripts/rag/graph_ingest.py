@@ -25,10 +25,12 @@ relates_to:
 Purpose: Graph ingestion for governance documents (Neo4j).
 
 Takes GovernanceDocument objects and upserts document nodes plus
-RELATES_TO edges into Neo4j via graph_client.
+RELATES_TO edges into Neo4j via graph_client, using batched UNWIND writes.
+Without Neo4j credentials, run_ingestion writes the in-process graph store
+(scripts/rag/graph_store.py) instead.
 """
 
-from typing import Iterable, Dict, Any, List
+from typing import Iterable, Dict, Any, List, Optional, Tuple
 
 from scripts.rag.loader import GovernanceDocument
 
@@ -71,9 +73,14 @@ def ingest_documents(
     """
     Ingest governance documents into the graph.
 
+    Nodes and edges are collected first and written with the client's bulk
+    methods, so ingestion takes a handful of round trips regardless of
+    corpus size.
+
     Args:
         documents: Iterable of GovernanceDocument objects.
-        graph_client: Graph client with upsert_document and relate_documents methods.
+        graph_client: Graph client with upsert_documents and
+            relate_documents_bulk methods.
 
     Returns:
         Dict with counts: documents, and each relationship type.
@@ -82,39 +89,55 @@ def ingest_documents(
     for rel_type in RELATIONSHIP_FIELDS.values():
         counts[rel_type] = 0
 
+    nodes: List[Dict[str, Any]] = []
+    edges: List[Tuple[str, str, str]] = []
     for doc in documents:
         props = _document_props(doc)
         doc_id = props.get("id")
         if not doc_id:
             continue
 
-        graph_client.upsert_document(doc_id, props)
+        nodes.append(props)
 
         # Extract all relationship types from frontmatter
         for field_name, rel_type in RELATIONSHIP_FIELDS.items():
             targets = _normalize_list(doc.metadata.get(field_name))
             for target_id in targets:
-                graph_client.relate_documents(doc_id, target_id, rel_type)
+                edges.append((doc_id, target_id, rel_type))
                 counts[rel_type] += 1
 
         counts["documents"] += 1
 
+    # Nodes first so edge MERGEs attach to fully populated documents
+    if nodes:
+        graph_client.upsert_documents(nodes)
+    if edges:
+        graph_client.relate_documents_bulk(edges)
+
     return counts
 
 
-def run_ingestion(source_dirs: List[str] = None) -> Dict[str, Any]:
+def run_ingestion(
+    source_dirs: List[str] = None, local_path: Optional[str] = None
+) -> Dict[str, Any]:
     """
     Run graph ingestion from governance documents.
 
+    Uses Neo4j when NEO4J_PASSWORD is set, otherwise (or when local_path is
+    given) rebuilds the in-process graph store.
+
     Args:
         source_dirs: List of directories to scan. Defaults to PRD-0008 scope.
+        local_path: Graph store file (default: .chroma/graph.json).
 
     Returns:
         Ingestion statistics.
     """
+    import os
     from pathlib import Path
     from scripts.rag.loader import load_governance_documents
     from scripts.rag.graph_client import create_client_from_env
+    from scripts.rag.graph_store import DEFAULT_GRAPH_STORE_PATH, LocalGraphStore
 
     # Default scope aligned with scope.py ALLOWLIST_PREFIXES
     if source_dirs is None:
@@ -141,16 +164,21 @@ def run_ingestion(source_dirs: List[str] = None) -> Dict[str, Any]:
     errors = []
     print(f"Total: {len(docs)} documents ({len(errors)} errors)")
 
-    print("Connecting to Neo4j...")
-    client = create_client_from_env()
+    if local_path or not os.environ.get("NEO4J_PASSWORD"):
+        print("Using local graph store...")
+        client = LocalGraphStore(local_path or DEFAULT_GRAPH_STORE_PATH)
+        client.clear()
+    else:
+        print("Connecting to Neo4j...")
+        client = create_client_from_env()
     health = client.health_check()
     print(
-        f"Neo4j status: {health['status']} ({health.get('server_version', 'unknown')})"
+        f"Graph status: {health['status']} ({health.get('server_version', 'unknown')})"
     )
 
     if health["status"] != "healthy":
         client.close()
-        return {"status": "failed", "error": "Neo4j not healthy"}
+        return {"status": "failed", "error": "Graph backend not healthy"}
 
     print("Ingesting documents into graph...")
     counts = ingest_documents(docs, client)
@@ -165,11 +193,7 @@ def run_ingestion(source_dirs: List[str] = None) -> Dict[str, Any]:
         total_rels += rel_count
 
     # Verify counts from database
-    with client._driver.session() as session:
-        result = session.run(
-            "MATCH ()-[r]->() RETURN type(r) AS type, count(r) AS count"
-        )
-        db_counts = {record["type"]: record["count"] for record in result}
+    db_counts = client.relationship_counts()
 
     client.close()
 
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+---
+id: SCRIPT-0087
+type: script
+owner: platform-team
+status: active
+maturity: 1
+last_validated: 2026-10-18
+test:
+  runner: pytest
+  command: "pytest -q tests/unit/test_graph_store.py"
+  evidence: declared
+dry_run:
+  supported: true
+risk_profile:
+  production_impact: low
+  security_risk: low
+  coupling_risk: low
+relates_to:
+  - PRD-0008-governance-rag-pipeline
+  - GOV-0017-tdd-and-determinism
+  - SCRIPT-0074-graph-client
+  - SCRIPT-0079-hybrid-retriever
+---
+Purpose: In-process document graph, a drop-in alternative to Neo4j.
+
+LocalGraphStore keeps document nodes and typed edges in an adjacency index
+and implements the Neo4jGraphClient methods used by graph_ingest and
+hybrid_retriever (upsert_document(s), relate_documents(_bulk), neighbors,
+health_check, close). Graph-augmented retrieval therefore works in CI and
+locally without an external service.
+
+The graph is persisted as a compact JSON file inside the vector store
+directory (.chroma/graph.json): node ids are stored once and edges as
+integer triples. index_build keeps it up to date incrementally.
+
+Example:
+    >>> from scripts.rag.graph_store import LocalGraphStore
+    >>> store = LocalGraphStore()
+    >>> store.relate_documents("GOV-0017", "ADR-0182", "RELATES_TO")
+    >>> store.neighbors(["ADR-0182"])
+    {'ADR-0182': [('GOV-0017', 'RELATES_TO')]}
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+import json
+import os
+
+from scripts.rag.indexer import DEFAULT_PERSIST_DIR
+
+
+GRAPH_STORE_FILENAME = "graph.json"
+GRAPH_STORE_VERSION = 1
+DEFAULT_GRAPH_STORE_PATH = Path(DEFAULT_PERSIST_DIR) / GRAPH_STORE_FILENAME
+
+Edge = Tuple[str, str, str]  # (src_id, dst_id, rel_type)
+
+
+class LocalGraphStore:
+    """
+    Adjacency-index document graph with optional JSON persistence.
+
+    Edges are directed as written (src -[TYPE]-> dst) but neighbour lookups
+    are undirected, matching Neo4jGraphClient.neighbors.
+
+    Attributes:
+        path: JSON file the graph is loaded from and saved to (optional).
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        self.path = Path(path) if path else None
+        self._nodes: Dict[str, Dict[str, Any]] = {}
+        self._edges: Set[Edge] = set()
+        self._adjacency: Dict[str, Set[Tuple[str, str]]] = {}
+        self._dirty = False
+        if self.path is not None:
+            self._load()
+
+    # -- persistence -------------------------------------------------------
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return
+        if data.get("version") != GRAPH_STORE_VERSION:
+            return
+        ids = [node_id for node_id, _ in data.get("nodes", [])]
+        self._nodes = {node_id: props for node_id, props in data.get("nodes", [])}
+        rel_types = data.get("rel_types", [])
+        for src, dst, rel in data.get("edges", []):
+            self._add_edge((ids[src], ids[dst], rel_types[rel]))
+
+    def save(self) -> None:
+        """Write the graph to path, if configured and modified."""
+        if self.path is None or not self._dirty:
+            return
+        ids = sorted(self._nodes)
+        positions = {node_id: i for i, node_id in enumerate(ids)}
+        rel_types = sorted({rel for _, _, rel in self._edges})
+        rel_positions = {rel: i for i, rel in enumerate(rel_types)}
+        payload = {
+            "version": GRAPH_STORE_VERSION,
+            "nodes": [[node_id, self._nodes[node_id]] for node_id in ids],
+            "rel_types": rel_types,
+            "edges": [
+                [positions[src], positions[dst], rel_positions[rel]]
+                for src, dst, rel in sorted(self._edges)
+            ],
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".json.tmp")
+        tmp_path.write_text(
+            json.dumps(payload, separators=(",", ":"), sort_keys=True, default=str)
+        )
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+    def close(self) -> None:
+        """Persist pending changes (mirrors Neo4jGraphClient.close)."""
+        self.save()
+
+    # -- writes ------------------------------------------------------------
+
+    def _add_edge(self, edge: Edge) -> None:
+        src, dst, rel_type = edge
+        self._nodes.setdefault(src, {"id": src})
+        self._nodes.setdefault(dst, {"id": dst})
+        self._edges.add(edge)
+        self._adjacency.setdefault(src, set()).add((dst, rel_type))
+        self._adjacency.setdefault(dst, set()).add((src, rel_type))
+
+    def upsert_document(self, doc_id: str, props: Dict[str, Any]) -> None:
+        """Create or update a document node."""
+        if not doc_id:
+            return
+        node = self._nodes.setdefault(doc_id, {"id": doc_id})
+        node.update({key: value for key, value in props.items() if value is not None})
+        self._dirty = True
+
+    def upsert_documents(self, documents: Iterable[Dict[str, Any]]) -> int:
+        """Upsert many document nodes; each must include "id"."""
+        count = 0
+        for props in documents:
+            if props.get("id"):
+                self.upsert_document(props["id"], props)
+                count += 1
+        return count
+
+    def relate_documents(self, src_id: str, dst_id: str, rel_type: str) -> None:
+        """Create a relationship between two documents."""
+        if not src_id or not dst_id:
+            return
+        self._add_edge((src_id, dst_id, rel_type))
+        self._dirty = True
+
+    def relate_documents_bulk(self, edges: Iterable[Edge]) -> Dict[str, int]:
+        """Create many relationships; returns distinct edges per type."""
+        counts: Dict[str, int] = {}
+        for edge in set(edges):
+            if edge[0] and edge[1]:
+                self.relate_documents(*edge)
+                counts[edge[2]] = counts.get(edge[2], 0) + 1
+        return counts
+
+    def remove_document(self, doc_id: str) -> None:
+        """
+        Drop a document's properties and outgoing edges.
+
+        Incoming edges belong to other documents' frontmatter, so the node
+        is kept as a stub while anything still points at it.
+        """
+        for dst, rel_type in list(self._adjacency.get(doc_id, ())):
+            if (doc_id, dst, rel_type) not in self._edges:
+                continue
+            self._edges.discard((doc_id, dst, rel_type))
+            if (dst, doc_id, rel_type) not in self._edges:
+                self._adjacency[dst].discard((doc_id, rel_type))
+                self._adjacency[doc_id].discard((dst, rel_type))
+        if self._adjacency.get(doc_id):
+            self._nodes[doc_id] = {"id": doc_id}
+        else:
+            self._nodes.pop(doc_id, None)
+            self._adjacency.pop(doc_id, None)
+        self._dirty = True
+
+    def clear(self) -> None:
+        """Drop every node and edge."""
+        self._nodes.clear()
+        self._edges.clear()
+        self._adjacency.clear()
+        self._dirty = True
+
+    # -- reads -------------------------------------------------------------
+
+    def neighbors(
+        self,
+        doc_ids: Iterable[str],
+        rel_types: Optional[Iterable[str]] = None,
+        limit_per_source: Optional[int] = None,
+        exclude: Optional[Iterable[str]] = None,
+        weights: Optional[Dict[str, float]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, List[Tuple[str, str]]]:
+        """
+        Return one-hop neighbours for many documents.
+
+        Same contract as Neo4jGraphClient.neighbors; timeout is accepted for
+        interface compatibility and ignored.
+        """
+        allowed = set(rel_types) if rel_types else None
+        excluded = set(exclude or ())
+        weights = weights or {}
+        result: Dict[str, List[Tuple[str, str]]] = {}
+        for src in sorted(set(doc_ids)):
+            edges = [
+                (related, rel_type)
+                for related, rel_type in self._adjacency.get(src, ())
+                if related not in excluded and (allowed is None or rel_type in allowed)
+            ]
+            if not edges:
+                continue
+            edges.sort(key=lambda e: (-weights.get(e[1], 1.0), e[0], e[1]))
+            if limit_per_source is not None:
+                edges = edges[:limit_per_source]
+            result[src] = edges
+        return result
+
+    def relationship_counts(self) -> Dict[str, int]:
+        """Return the number of edges per relationship type."""
+        counts: Dict[str, int] = {}
+        for _, _, rel_type in self._edges:
+            counts[rel_type] = counts.get(rel_type, 0) + 1
+        return counts
+
+    def health_check(self) -> Dict[str, Any]:
+        """Report store status in the Neo4jGraphClient.health_check shape."""
+        return {
+            "status": "healthy",
+            "backend": "local",
+            "server_version": "local",
+            "documents": len(self._nodes),
+            "relationships": len(self._edges),
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """Return node and edge counts."""
+        return {
+            "documents": len(self._nodes),
+            "relationships": len(self._edges),
+            "path": str(self.path) if self.path else None,
+        }
+
+
+def load_graph_store(
+    path: Optional[Union[str, Path]] = DEFAULT_GRAPH_STORE_PATH,
+) -> Optional[LocalGraphStore]:
+    """Load a persisted graph store, or return None if none has been built."""
+    if not path or not Path(path).exists():
+        return None
+    return LocalGraphStore(path)
@@ -26,20 +26,29 @@ relates_to:
 Purpose: Hybrid retriever combining vector similarity + graph traversal.
 
 Queries ChromaDB for semantic matches, then expands results using
-Neo4j graph relationships (RELATES_TO, SUPERSEDES, etc.).
+graph relationships (RELATES_TO, SUPERSEDES, etc.) from Neo4j when
+NEO4J_URI/NEO4J_PASSWORD are set, or from the local graph store
+(graph.json in the vector retriever's persist_dir, override with
+RAG_GRAPH_STORE_PATH) otherwise.
 
 Phase 1 implementation per PRD-0008.
 """
 
 import os
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import List, Optional, Dict, Any, Set
 
+from scripts.rag import timing
 from scripts.rag.retriever import (
     GovernanceRetriever,
     RetrievalResult,
     format_citation,
     log_usage,
+    _collection_space,
+    _distance,
+    _embed_query,
+    _parse_query_row,
     DEFAULT_TOP_K,
 )
 
@@ -48,6 +57,24 @@ try:
 except ImportError:
     Neo4jGraphClient = None
 
+from scripts.rag.graph_store import GRAPH_STORE_FILENAME, load_graph_store
+from scripts.rag.indexer import DEFAULT_PERSIST_DIR
+
+
+# Graph traversal bounds
+DEFAULT_MAX_FANOUT = 10  # Neighbours kept per document per hop
+DEFAULT_MAX_EXPANDED = 50  # Documents discovered per query
+DEFAULT_HOP_DECAY = 0.5  # Path weight multiplier for each hop after the first
+DEFAULT_GRAPH_PENALTY = 0.5  # Score penalty for graph-only chunks at weight 1.0
+
+# Relationship type weights: higher means a stronger signal of relevance
+DEFAULT_REL_WEIGHTS = {
+    "RELATES_TO": 1.0,
+    "DEPENDS_ON": 1.0,
+    "SUPERSEDED_BY": 1.0,
+    "SUPERSEDES": 0.8,
+}
+
 
 @dataclass
 class HybridResult:
@@ -61,18 +88,120 @@ class HybridResult:
     related_docs: List[str] = field(default_factory=list)
 
 
-def _graph_client_from_env() -> Optional["Neo4jGraphClient"]:
-    """Create graph client if env vars are set."""
-    if Neo4jGraphClient is None:
-        return None
+def _graph_client_from_env(persist_dir: Optional[str] = None) -> Optional[Any]:
+    """
+    Create Neo4j client if env vars are set, else load the local graph store
+    that index_build wrote next to the vector store in persist_dir.
+    """
     uri = os.getenv("NEO4J_URI")
     password = os.getenv("NEO4J_PASSWORD")
-    if not uri or not password:
-        return None
-    try:
-        return create_client_from_env()
-    except Exception:
-        return None
+    if Neo4jGraphClient is not None and uri and password:
+        try:
+            return create_client_from_env()
+        except Exception:
+            pass
+    default_path = Path(persist_dir or DEFAULT_PERSIST_DIR) / GRAPH_STORE_FILENAME
+    return load_graph_store(os.getenv("RAG_GRAPH_STORE_PATH", default_path))
+
+
+@dataclass
+class GraphExpansion:
+    """
+    Documents reached by a bounded graph traversal.
+
+    Attributes:
+        related: Seed doc_id -> doc_ids reached from it (in discovery order).
+        weights: Reached doc_id -> best path weight (edge weights multiplied
+            along the path, decayed per extra hop).
+    """
+
+    related: Dict[str, List[str]] = field(default_factory=dict)
+    weights: Dict[str, float] = field(default_factory=dict)
+
+
+def expand_via_graph_weighted(
+    doc_ids: Set[str],
+    graph_client: "Neo4jGraphClient",
+    max_depth: int = 1,
+    rel_types: Optional[List[str]] = None,
+    max_fanout: int = DEFAULT_MAX_FANOUT,
+    max_expanded: int = DEFAULT_MAX_EXPANDED,
+    rel_weights: Optional[Dict[str, float]] = None,
+    timeout: Optional[float] = None,
+) -> GraphExpansion:
+    """
+    Breadth-first graph expansion with per-hop bounds.
+
+    Each hop is one batched neighbours query for the whole frontier, capped
+    at max_fanout neighbours per document (highest-weight relationships
+    first); traversal stops after max_depth hops or once max_expanded
+    documents have been discovered. If a hop fails or times out, documents
+    found by earlier hops are kept.
+
+    Args:
+        doc_ids: Set of document IDs to expand from.
+        graph_client: Graph client providing neighbors().
+        max_depth: How many hops to traverse (default: 1).
+        rel_types: Relationship types to follow. Default: all.
+        max_fanout: Neighbours kept per document per hop.
+        max_expanded: Maximum documents discovered in total.
+        rel_weights: Relationship type weights (default: DEFAULT_REL_WEIGHTS).
+        timeout: Per-hop query timeout in seconds (default: client config).
+
+    Returns:
+        GraphExpansion with reached documents and their path weights.
+    """
+    expansion = GraphExpansion()
+    if not doc_ids or graph_client is None or max_depth < 1:
+        return expansion
+
+    weights_by_type = DEFAULT_REL_WEIGHTS if rel_weights is None else rel_weights
+    seeds = set(doc_ids)
+    path_weight: Dict[str, float] = {doc_id: 1.0 for doc_id in seeds}
+    origins: Dict[str, Set[str]] = {doc_id: {doc_id} for doc_id in seeds}
+    frontier = sorted(seeds)
+
+    for hop in range(1, max_depth + 1):
+        try:
+            edges = graph_client.neighbors(
+                frontier,
+                rel_types=rel_types,
+                limit_per_source=max_fanout,
+                exclude=[] if hop == 1 else sorted(path_weight),
+                weights=weights_by_type,
+                timeout=timeout,
+            )
+        except Exception:
+            break  # Keep what earlier hops found
+
+        decay = 1.0 if hop == 1 else DEFAULT_HOP_DECAY
+        next_frontier: List[str] = []
+        for src in frontier:
+            for related, rel_type in edges.get(src, []):
+                rel_weight = weights_by_type.get(rel_type, 1.0)
+                if rel_weight <= 0:
+                    continue  # Zero weight disables a relationship type
+                if related not in seeds:
+                    if related not in path_weight:
+                        if len(path_weight) - len(seeds) >= max_expanded:
+                            continue
+                        path_weight[related] = 0.0
+                        origins[related] = set()
+                        next_frontier.append(related)
+                    weight = path_weight[src] * rel_weight * decay
+                    path_weight[related] = max(path_weight[related], weight)
+                    origins[related] |= origins[src]
+                    expansion.weights[related] = path_weight[related]
+                for origin in sorted(origins[src]):
+                    reached = expansion.related.setdefault(origin, [])
+                    if related != origin and related not in reached:
+                        reached.append(related)
+
+        frontier = sorted(next_frontier)
+        if not frontier:
+            break
+
+    return expansion
 
 
 def expand_via_graph(
@@ -80,80 +209,116 @@ def expand_via_graph(
     graph_client: "Neo4jGraphClient",
     max_depth: int = 1,
     rel_types: Optional[List[str]] = None,
+    max_fanout: int = DEFAULT_MAX_FANOUT,
+    max_expanded: int = DEFAULT_MAX_EXPANDED,
+    rel_weights: Optional[Dict[str, float]] = None,
+    timeout: Optional[float] = None,
 ) -> Dict[str, List[str]]:
     """
     Expand document IDs via graph relationships.
 
+    See expand_via_graph_weighted for traversal bounds.
+
     Args:
         doc_ids: Set of document IDs to expand from.
-        graph_client: Neo4j graph client.
+        graph_client: Graph client providing neighbors().
         max_depth: How many hops to traverse (default: 1).
         rel_types: Relationship types to follow. Default: all.
+        max_fanout: Neighbours kept per document per hop.
+        max_expanded: Maximum documents discovered in total.
+        rel_weights: Relationship type weights.
+        timeout: Per-hop query timeout in seconds.
 
     Returns:
         Dict mapping source doc_id to list of related doc_ids.
     """
-    if not doc_ids or graph_client is None:
-        return {}
-
-    # Build Cypher query
-    rel_filter = ""
-    if rel_types:
-        rel_filter = ":" + "|".join(rel_types)
-
-    query = f"""
-    MATCH (src:Document)-[r{rel_filter}]-(related:Document)
-    WHERE src.id IN $doc_ids
-    RETURN src.id AS source, collect(DISTINCT related.id) AS related
-    """
-
-    expanded = {}
-    try:
-        with graph_client._driver.session() as session:
-            result = session.run(query, {"doc_ids": list(doc_ids)})
-            for record in result:
-                expanded[record["source"]] = record["related"]
-    except Exception:
-        pass
-
-    return expanded
+    return expand_via_graph_weighted(
+        doc_ids,
+        graph_client,
+        max_depth=max_depth,
+        rel_types=rel_types,
+        max_fanout=max_fanout,
+        max_expanded=max_expanded,
+        rel_weights=rel_weights,
+        timeout=timeout,
+    ).related
 
 
 def fetch_chunks_for_docs(
     doc_ids: List[str],
     retriever: GovernanceRetriever,
     top_k_per_doc: int = 2,
+    query_text: Optional[str] = None,
+    query_embedding: Optional[List[float]] = None,
 ) -> List[RetrievalResult]:
     """
-    Fetch chunks for specific document IDs from vector store.
+    Fetch the best chunks for specific document IDs.
+
+    All chunks of the documents are loaded with a single ``collection.get``
+    on a ``doc_id $in`` filter and re-scored locally against the query
+    embedding, so every document gets its own top_k_per_doc. The query is
+    embedded once (query_embedding, else the retriever's or collection's
+    embedding function); only if no embedding is available does it fall
+    back to one filtered vector query per document.
 
     Args:
         doc_ids: List of document IDs to fetch.
         retriever: GovernanceRetriever instance.
         top_k_per_doc: Max chunks per document.
+        query_text: Query the chunks are ranked against.
+        query_embedding: Precomputed embedding of query_text.
 
     Returns:
-        List of RetrievalResult objects.
+        List of RetrievalResult objects, grouped in doc_ids order.
     """
-    results = []
-    seen_ids = set()
-
-    for doc_id in doc_ids:
-        try:
-            # Query with doc_id filter
-            chunks = retriever.query(
-                query_text=doc_id,  # Use doc_id as query for relevant chunks
-                top_k=top_k_per_doc,
-                filters={"doc_id": doc_id},
+    doc_ids = list(dict.fromkeys(doc_ids))
+    if not doc_ids:
+        return []
+
+    collection = retriever.collection
+    text = query_text or " ".join(doc_ids)
+    if query_embedding is None:
+        query_embedding = _embed_query(retriever, text)
+    where = {"doc_id": {"$in": doc_ids}} if len(doc_ids) > 1 else {"doc_id": doc_ids[0]}
+    candidates: List[RetrievalResult] = []
+    try:
+        if query_embedding is not None:
+            found = collection.get(
+                where=where, include=["documents", "metadatas", "embeddings"]
             )
-            for chunk in chunks:
-                if chunk.id not in seen_ids:
-                    seen_ids.add(chunk.id)
-                    results.append(chunk)
-        except Exception:
-            continue
+            space = _collection_space(collection)
+            ids = found.get("ids") or []
+            documents = found.get("documents")
+            metadatas = found.get("metadatas")
+            embeddings = found.get("embeddings")
+            for i, chunk_id in enumerate(ids):
+                candidates.append(
+                    RetrievalResult(
+                        id=chunk_id,
+                        text=documents[i],
+                        metadata=metadatas[i] or {},
+                        score=float(_distance(query_embedding, embeddings[i], space)),
+                    )
+                )
+        else:
+            # Per-document queries keep each document's quota
+            for doc_id in doc_ids:
+                found = collection.query(
+                    query_texts=[text],
+                    n_results=top_k_per_doc,
+                    where={"doc_id": doc_id},
+                )
+                candidates.extend(_parse_query_row(found, 0))
+    except Exception:
+        return []
+
+    by_doc: Dict[str, List[RetrievalResult]] = {}
+    for candidate in sorted(candidates, key=lambda r: r.score):
+        bucket = by_doc.setdefault(candidate.metadata.get("doc_id"), [])
+        if len(bucket) < top_k_per_doc:
+            bucket.append(candidate)
 
-    return results
+    return [chunk for doc_id in doc_ids for chunk in by_doc.get(doc_id, [])]
 
 
 @dataclass
@@ -164,27 +329,38 @@ class HybridRetriever:
     Flow:
     1. Query ChromaDB for top-k semantically similar chunks
     2. Extract unique doc_ids from results
-    3. Query Neo4j for related documents (1-hop)
+    3. Query Neo4j for related documents (bounded, up to expand_depth hops)
     4. Fetch chunks for related documents
     5. Merge and rank all results
 
     Attributes:
         vector_retriever: GovernanceRetriever for vector search.
-        graph_client: Optional Neo4j client for graph expansion.
+        graph_client: Optional graph client (Neo4j or LocalGraphStore).
         expand_depth: Graph traversal depth (default: 1).
         rel_types: Relationship types to follow (default: all).
+        max_fanout: Neighbours kept per document per hop.
+        max_expanded: Maximum documents discovered per query.
+        rel_weights: Relationship type weights (default: DEFAULT_REL_WEIGHTS).
+        graph_timeout: Per-hop graph query timeout in seconds.
     """
 
     vector_retriever: GovernanceRetriever = field(default_factory=GovernanceRetriever)
     graph_client: Optional[Any] = None
     expand_depth: int = 1
     rel_types: Optional[List[str]] = None
+    max_fanout: int = DEFAULT_MAX_FANOUT
+    max_expanded: int = DEFAULT_MAX_EXPANDED
+    rel_weights: Optional[Dict[str, float]] = None
+    graph_timeout: Optional[float] = None
     _auto_close_graph: bool = field(default=False, repr=False)
 
     def __post_init__(self):
         """Initialize graph client if not provided."""
         if self.graph_client is None:
-            self.graph_client = _graph_client_from_env()
+            persist_dir = getattr(self.vector_retriever, "persist_dir", None)
+            self.graph_client = _graph_client_from_env(
+                persist_dir if isinstance(persist_dir, (str, Path)) else None
+            )
             if self.graph_client is not None:
                 self._auto_close_graph = True
 
@@ -215,13 +391,61 @@ class HybridRetriever:
         Returns:
             List of HybridResult objects, ranked by relevance.
         """
-        # Step 1: Vector search
-        vector_results = self.vector_retriever.query(
-            query_text=query_text,
-            top_k=top_k,
-            filters=filters,
+        with timing.trace("hybrid_query"):
+            # Step 1: Vector search
+            vector_results = self.vector_retriever.query(
+                query_text=query_text,
+                top_k=top_k,
+                filters=filters,
+            )
+            return self._merge_graph_results(
+                query_text, vector_results, top_k, filters, expand_graph, graph_top_k
+            )
+
+    def query_many(
+        self,
+        query_texts: List[str],
+        top_k: int = DEFAULT_TOP_K,
+        filters: Optional[Dict[str, Any]] = None,
+        expand_graph: bool = True,
+        graph_top_k: int = 3,
+    ) -> List[List[HybridResult]]:
+        """
+        Execute hybrid queries for many questions.
+
+        Vector search runs as batched multi-query requests; graph expansion
+        then runs per question.
+
+        Args:
+            query_texts: Search query strings.
+            top_k: Number of vector results per query.
+            filters: Optional metadata filters for vector search.
+            expand_graph: Whether to expand via graph (default: True).
+            graph_top_k: Max results from graph expansion per source doc.
+
+        Returns:
+            One list of HybridResult objects per query, in input order.
+        """
+        vector_batches = self.vector_retriever.query_many(
+            query_texts, top_k=top_k, filters=filters
         )
+        return [
+            self._merge_graph_results(
+                query_text, vector_results, top_k, filters, expand_graph, graph_top_k
+            )
+            for query_text, vector_results in zip(query_texts, vector_batches)
+        ]
 
+    def _merge_graph_results(
+        self,
+        query_text: str,
+        vector_results: List[RetrievalResult],
+        top_k: int,
+        filters: Optional[Dict[str, Any]],
+        expand_graph: bool,
+        graph_top_k: int,
+    ) -> List[HybridResult]:
+        """Expand vector results via the graph, then merge and rank them."""
         # Convert to HybridResult
         hybrid_results = []
         seen_chunks = set()
@@ -249,32 +473,43 @@ class HybridRetriever:
                     doc_ids.add(doc_id)
 
             # Expand via graph
-            expanded = expand_via_graph(
-                doc_ids=doc_ids,
-                graph_client=self.graph_client,
-                max_depth=self.expand_depth,
-                rel_types=self.rel_types,
-            )
+            with timing.span("graph_expand"):
+                expansion = expand_via_graph_weighted(
+                    doc_ids=doc_ids,
+                    graph_client=self.graph_client,
+                    max_depth=self.expand_depth,
+                    rel_types=self.rel_types,
+                    max_fanout=self.max_fanout,
+                    max_expanded=self.max_expanded,
+                    rel_weights=self.rel_weights,
+                    timeout=self.graph_timeout,
+                )
 
-            # Collect all related doc_ids
-            related_doc_ids = set()
-            for source_id, related in expanded.items():
-                related_doc_ids.update(related)
-                # Update source results with related docs
+            # Update source results with related docs
+            for source_id, related in expansion.related.items():
                 for hr in hybrid_results:
                     if hr.metadata.get("doc_id") == source_id:
                         hr.related_docs = related
 
-            # Remove doc_ids we already have
-            new_doc_ids = related_doc_ids - doc_ids
+            # Strongest new documents first (weights exclude source doc_ids)
+            new_doc_ids = sorted(
+                expansion.weights, key=lambda d: (-expansion.weights[d], d)
+            )
 
             # Fetch chunks for new related documents
             if new_doc_ids:
-                graph_chunks = fetch_chunks_for_docs(
-                    doc_ids=list(new_doc_ids)[: graph_top_k * len(doc_ids)],
-                    retriever=self.vector_retriever,
-                    top_k_per_doc=2,
-                )
+                with timing.span("embed_query"):
+                    query_embeddings = self.vector_retriever.embed_queries([query_text])
+                with timing.span("fetch_chunks"):
+                    graph_chunks = fetch_chunks_for_docs(
+                        doc_ids=new_doc_ids[: graph_top_k * len(doc_ids)],
+                        retriever=self.vector_retriever,
+                        top_k_per_doc=2,
+                        query_text=query_text,
+                        query_embedding=(
+                            query_embeddings[0] if query_embeddings else None
+                        ),
+                    )
 
                 # Add graph-sourced results
                 for chunk in graph_chunks:
@@ -285,8 +520,10 @@ class HybridRetriever:
                                 id=chunk.id,
                                 text=chunk.text,
                                 metadata=chunk.metadata,
+                                # Penalty for graph-only, larger for weaker paths
                                 score=chunk.score
-                                + 0.5,  # Slight penalty for graph-only
+                                + DEFAULT_GRAPH_PENALTY
+                                / expansion.weights[chunk.metadata.get("doc_id")],
                                 source="graph",
                                 related_docs=[],
                             )
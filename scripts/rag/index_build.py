@@ -22,19 +22,83 @@ relates_to:
   - GOV-0017-tdd-and-determinism
 ---
 Purpose: End-to-end index build (ingest → chunk → index → graph).
+
+Builds are incremental: a content-hash manifest stored next to the vector
+store records every indexed file and chunk, so only changed files are
+re-chunked and re-embedded, and chunks of removed or renamed files are
+deleted. Switching the embedding model or --chunker clears the store and
+rebuilds it. Pass --full-rebuild to ignore the manifest.
+
+Embeddings are cached on disk by model and chunk text digest
+(.embedding_cache), so even a full rebuild or a wiped store only calls
+the embedding model for text it has never seen.
+
+A local document graph (.chroma/graph.json), a BM25 lexical index
+(.chroma/lexical_index.json.gz) and a metadata index
+(.chroma/metadata_index.json.gz) are updated alongside the vector store,
+so hybrid retrieval works without Neo4j, exact identifiers are
+searchable and metadata filters narrow candidates before vector search;
+Neo4j ingestion still runs when NEO4J_* credentials are set.
+
+Loading and chunking fan out across a process pool (--workers); results
+are consumed in input order by a single writer, so output stays
+deterministic per GOV-0017. --chunker native swaps MarkdownNodeParser for
+the single-pass native chunker (identical chunks, no llama-index objects);
+--chunker sentence-window indexes compact sentence windows. Every stored
+chunk records prev/next/parent chunk ids for query-time context expansion.
+
+--vector-backend flat writes vectors to a NumPy store (.chroma/flat/)
+instead of ChromaDB; --vector-dtype float16/int8 shrinks it further.
 """
 
 import os
 import json
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import List, Optional, Tuple, Dict, Any
+from typing import Iterator, List, Optional, Tuple, Dict, Any
 
 from scripts.rag.loader import load_governance_document, GovernanceDocument
-from scripts.rag.chunker import chunk_document
-from scripts.rag.indexer import GovernanceIndex
-from scripts.rag.scope import filter_paths
+from scripts.rag.chunker import (
+    CHUNKERS,
+    DEFAULT_CHUNKER,
+    Chunk,
+    chunk_document,
+    link_chunks,
+)
+from scripts.rag.indexer import (
+    DEFAULT_EMBEDDING_MODEL,
+    DEFAULT_PERSIST_DIR,
+    GovernanceIndex,
+    _generate_chunk_id,
+)
+from scripts.rag.embedding_cache import DEFAULT_EMBEDDING_CACHE_DIR
+from scripts.rag.index_manifest import (
+    MANIFEST_FILENAME,
+    FileRecord,
+    IndexManifest,
+    diff_manifest,
+    hash_chunk,
+    hash_paths,
+    load_manifest,
+    relative_key,
+    write_manifest,
+)
+from scripts.rag.scope import walk_allowed
+from scripts.rag.vector_store import (
+    DEFAULT_VECTOR_DTYPE,
+    VECTOR_BACKENDS,
+    VECTOR_DTYPES,
+)
 from scripts.rag.graph_ingest import ingest_documents
 from scripts.rag.graph_client import GraphClientConfig, Neo4jGraphClient
+from scripts.rag.graph_store import GRAPH_STORE_FILENAME, LocalGraphStore
+from scripts.rag.lexical_index import LEXICAL_INDEX_FILENAME, LexicalIndex
+from scripts.rag.metadata_index import (
+    METADATA_INDEX_FILENAME,
+    MetadataIndex,
+    document_fields,
+)
 from scripts.rag.index_metadata import build_index_metadata, write_index_metadata
 
 
@@ -42,14 +106,28 @@ def _repo_root() -> Path:
     return Path(__file__).resolve().parents[2]
 
 
+def _resolve_persist_dir(root: Path, persist_dir: Optional[str]) -> Path:
+    """Resolve the vector store directory relative to the repo root."""
+    path = Path(persist_dir or DEFAULT_PERSIST_DIR)
+    return path if path.is_absolute() else root / path
+
+
+def _resolve_cache_dir(root: Path, cache_dir: Optional[str]) -> Optional[str]:
+    """Resolve the embedding cache directory; None disables the cache."""
+    if not cache_dir:
+        return None
+    path = Path(cache_dir)
+    return str(path if path.is_absolute() else root / path)
+
+
 def collect_markdown_paths(root: Optional[Path] = None) -> List[Path]:
     """
-    Collect markdown files under repo root and filter by scope.
+    Collect in-scope markdown files under repo root.
+
+    Out-of-scope and denied directories are pruned during the walk.
     """
     root = root or _repo_root()
-    candidates = list(root.rglob("*.md"))
-    allowed = filter_paths(candidates)
-    return sorted(allowed)
+    return sorted(walk_allowed(root))
 
 
 def load_documents(
@@ -66,6 +144,55 @@ def load_documents(
     return docs, errors
 
 
+def _chunk(doc: GovernanceDocument, chunker: str) -> List[Chunk]:
+    """Chunk a document and link neighbouring/parent chunk ids."""
+    return link_chunks(chunk_document(doc, chunker))
+
+
+def _load_and_chunk(
+    path: Path, chunker: str = DEFAULT_CHUNKER
+) -> Tuple[Optional[GovernanceDocument], List[Chunk], Optional[Dict[str, Any]]]:
+    """Load and chunk one file (process-pool worker)."""
+    try:
+        doc = load_governance_document(path)
+    except Exception as exc:
+        return None, [], {"path": str(path), "error": str(exc)}
+    return doc, _chunk(doc, chunker), None
+
+
+def iter_document_chunks(
+    paths: List[Path], workers: int = 1, chunker: str = DEFAULT_CHUNKER
+) -> Iterator[
+    Tuple[Optional[GovernanceDocument], List[Chunk], Optional[Dict[str, Any]]]
+]:
+    """
+    Load and chunk documents, optionally across a process pool.
+
+    Results are yielded in input order regardless of worker count, so the
+    single consumer sees a deterministic stream.
+
+    Args:
+        paths: Files to load.
+        workers: Worker processes. 1 runs in-process.
+        chunker: Chunker implementation (see chunker.CHUNKERS).
+
+    Yields:
+        Tuples of (document, chunks, error); document is None on error.
+    """
+    if workers <= 1 or len(paths) < 2:
+        docs, errors = load_documents(paths)
+        for error in errors:
+            yield None, [], error
+        for doc in docs:
+            yield doc, _chunk(doc, chunker), None
+        return
+
+    chunksize = max(1, len(paths) // (workers * 4))
+    worker = partial(_load_and_chunk, chunker=chunker)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(worker, paths, chunksize=chunksize)
+
+
 def write_index_errors(path: Path, errors: List[Dict[str, Any]]) -> None:
     """
     Write ingestion errors to a JSON artifact for visibility.
@@ -88,28 +215,169 @@ def _graph_client_from_env() -> Optional[Neo4jGraphClient]:
     return Neo4jGraphClient(config)
 
 
-def build_index(
-    root: Optional[Path] = None, metadata_path: Optional[Path] = None
-) -> int:
+def build_index_report(
+    root: Optional[Path] = None,
+    metadata_path: Optional[Path] = None,
+    persist_dir: Optional[str] = None,
+    embedding_model: Optional[str] = DEFAULT_EMBEDDING_MODEL,
+    full_rebuild: bool = False,
+    workers: int = 1,
+    embedding_cache_dir: Optional[str] = DEFAULT_EMBEDDING_CACHE_DIR,
+    chunker: str = DEFAULT_CHUNKER,
+    backend: Optional[str] = None,
+    vector_dtype: str = DEFAULT_VECTOR_DTYPE,
+) -> Dict[str, Any]:
     """
-    Build vector index and ingest graph edges from governance docs.
+    Incrementally build the vector index and ingest graph edges.
+
+    Only files whose content hash differs from the manifest are loaded and
+    chunked; within those files, only chunks whose hash changed are
+    re-embedded. Chunks of removed files are deleted.
+
+    Args:
+        root: Repository root. Defaults to this checkout.
+        metadata_path: Output path for index metadata JSON.
+        persist_dir: Vector store directory (relative paths resolve
+            against root).
+        embedding_model: Embedding model for the collection.
+        full_rebuild: Clear the collection and ignore the manifest.
+        workers: Processes used to load and chunk changed files.
+        embedding_cache_dir: Embedding cache directory (relative paths
+            resolve against root); None disables the cache.
+        chunker: Chunker implementation (see chunker.CHUNKERS;
+            "llamaindex" and "native" produce identical chunks).
+        backend: Vector backend, "chroma" or "flat" (default:
+            RAG_VECTOR_BACKEND, else chroma).
+        vector_dtype: Storage dtype for the flat backend.
 
     Returns:
-        Number of documents indexed.
+        Dict with build statistics.
     """
     root = root or _repo_root()
+    store_dir = _resolve_persist_dir(root, persist_dir)
+    manifest_path = store_dir / MANIFEST_FILENAME
+    graph_path = store_dir / GRAPH_STORE_FILENAME
+    lexical_path = store_dir / LEXICAL_INDEX_FILENAME
+    metadata_index_path = store_dir / METADATA_INDEX_FILENAME
+
     paths = collect_markdown_paths(root)
-    docs, errors = load_documents(paths)
+    hashes, errors = hash_paths(paths, root)
+    paths_by_key = {relative_key(p, root): p for p in paths}
+
+    index = GovernanceIndex(
+        persist_dir=str(store_dir),
+        embedding_model=embedding_model,
+        embedding_cache_dir=_resolve_cache_dir(root, embedding_cache_dir),
+        backend=backend,
+        vector_dtype=vector_dtype,
+    )
+    manifest = IndexManifest() if full_rebuild else load_manifest(manifest_path)
+    reset = full_rebuild or (
+        bool(manifest.files)
+        and (manifest.embedding_model != embedding_model or manifest.chunker != chunker)
+    )
+    if not reset and manifest.files and index.count() == 0:
+        # Store was wiped but the manifest survived; rebuild everything.
+        manifest = IndexManifest()
+    if reset:
+        index.clear()
+        manifest = IndexManifest()
+    incremental = bool(manifest.files)
+
+    diff = diff_manifest(manifest, hashes)
+
+    # The local graph, lexical and metadata indexes are rebuilt on full
+    # builds or when they are missing.
+    graph_store = LocalGraphStore(graph_path)
+    rebuild_graph = not incremental or not graph_path.exists()
+    if rebuild_graph:
+        graph_store.clear()
+    lexical = LexicalIndex(lexical_path)
+    rebuild_lexical = not incremental or not lexical_path.exists()
+    if rebuild_lexical:
+        lexical.clear()
+    metadata_index = MetadataIndex(metadata_index_path)
+    rebuild_metadata = not incremental or not metadata_index_path.exists()
+    if rebuild_metadata:
+        metadata_index.clear()
+
+    # Chunks currently stored for files that are about to be replaced.
+    previous: Dict[str, str] = {}
+    for key in diff.removed + diff.modified:
+        previous.update(manifest.files[key].chunks)
+        if manifest.files[key].doc_id:
+            graph_store.remove_document(manifest.files[key].doc_id)
+            metadata_index.remove([manifest.files[key].doc_id])
+        del manifest.files[key]
 
-    index = GovernanceIndex()
-    chunk_count = 0
-    for doc in docs:
-        chunks = chunk_document(doc)
-        chunk_count += index.add(chunks)
+    docs: List[GovernanceDocument] = []
+    pending: List[Chunk] = []
+    current_ids = set()
+    lexical_texts: Dict[str, str] = {}
+    changed_paths = [paths_by_key[k] for k in diff.changed]
+    for doc, chunks, error in iter_document_chunks(
+        changed_paths, workers=workers, chunker=chunker
+    ):
+        if error is not None:
+            errors.append(error)
+            continue
+        docs.append(doc)
+        key = relative_key(doc.source_path, root)
+        record = FileRecord(
+            content_hash=hashes.get(key, ""),
+            doc_id=str(doc.metadata.get("id") or ""),
+        )
+        for position, chunk in enumerate(chunks):
+            chunk_id = _generate_chunk_id(chunk, position)
+            chunk_hash = hash_chunk(chunk)
+            record.chunks[chunk_id] = chunk_hash
+            current_ids.add(chunk_id)
+            lexical_texts[chunk_id] = chunk.text
+            if previous.get(chunk_id) != chunk_hash:
+                pending.append(chunk)
+        metadata_index.add(record.doc_id, document_fields(doc), record.chunks)
+        manifest.files[key] = record
+
+    # Changed chunks are upserted in place; only vanished ids need deleting.
+    to_delete = sorted(cid for cid in previous if cid not in current_ids)
+    deleted = index.delete(to_delete) if to_delete else 0
+    chunk_count = index.add(pending) if pending else 0
+
+    manifest.embedding_model = embedding_model
+    manifest.chunker = chunker
+    write_manifest(manifest_path, manifest)
+
+    graph_docs = list(docs)
+    if (rebuild_graph or rebuild_lexical or rebuild_metadata) and diff.unchanged:
+        unchanged_paths = [paths_by_key[k] for k in diff.unchanged]
+        for doc, chunks, error in iter_document_chunks(
+            unchanged_paths, workers, chunker
+        ):
+            if error is not None:
+                continue
+            if rebuild_graph:
+                graph_docs.append(doc)
+            if rebuild_lexical:
+                for position, chunk in enumerate(chunks):
+                    lexical_texts[_generate_chunk_id(chunk, position)] = chunk.text
+            if rebuild_metadata:
+                metadata_index.add(
+                    str(doc.metadata.get("id") or ""),
+                    document_fields(doc),
+                    (_generate_chunk_id(c, i) for i, c in enumerate(chunks)),
+                )
+    ingest_documents(graph_docs, graph_store)
+    graph_store.save()
+
+    lexical.remove(previous)
+    lexical.add(lexical_texts)
+    lexical.save()
+    metadata_index.save()
 
+    graph_count = 0
     graph_client = _graph_client_from_env()
     if graph_client is not None:
-        ingest_documents(docs, graph_client)
+        graph_count = ingest_documents(docs, graph_client).get("documents", 0)
         graph_client.close()
 
     if errors:
@@ -117,14 +385,129 @@ def build_index(
         write_index_errors(error_path, errors)
 
     meta_path = metadata_path or (root / "reports" / "index_metadata.json")
-    write_index_metadata(meta_path, build_index_metadata(document_count=len(docs)))
+    write_index_metadata(
+        meta_path,
+        build_index_metadata(
+            document_count=len(manifest.files),
+            incremental=incremental,
+            changed_files=diff.changed,
+            removed_files=diff.removed,
+        ),
+    )
 
-    return chunk_count
+    cache = getattr(getattr(index, "embedding_function", None), "cache", None)
+    return {
+        "documents": len(manifest.files),
+        "documents_loaded": len(docs),
+        "chunks": chunk_count,
+        "chunks_deleted": deleted,
+        "batches": len(getattr(index, "batch_stats", [])),
+        "changed_files": len(diff.changed),
+        "removed_files": len(diff.removed),
+        "unchanged_files": len(diff.unchanged),
+        "incremental": incremental,
+        "graph_documents": graph_count,
+        "graph_store": graph_store.stats(),
+        "lexical_index": lexical.stats(),
+        "metadata_index": metadata_index.stats(),
+        "embedding_cache": cache.stats() if cache is not None else None,
+        "errors": len(errors),
+    }
+
+
+def build_index(
+    root: Optional[Path] = None,
+    metadata_path: Optional[Path] = None,
+    persist_dir: Optional[str] = None,
+    full_rebuild: bool = False,
+    workers: int = 1,
+    embedding_cache_dir: Optional[str] = DEFAULT_EMBEDDING_CACHE_DIR,
+    chunker: str = DEFAULT_CHUNKER,
+    backend: Optional[str] = None,
+    vector_dtype: str = DEFAULT_VECTOR_DTYPE,
+) -> int:
+    """
+    Build vector index and ingest graph edges from governance docs.
+
+    Returns:
+        Number of chunks written (added or updated) by this build.
+    """
+    report = build_index_report(
+        root=root,
+        metadata_path=metadata_path,
+        persist_dir=persist_dir,
+        full_rebuild=full_rebuild,
+        workers=workers,
+        embedding_cache_dir=embedding_cache_dir,
+        chunker=chunker,
+        backend=backend,
+        vector_dtype=vector_dtype,
+    )
+    return report["chunks"]
 
 
 if __name__ == "__main__":
+    import argparse
     from collections import Counter
 
+    parser = argparse.ArgumentParser(description="Build the governance RAG index")
+    parser.add_argument(
+        "--persist-dir",
+        type=str,
+        default=None,
+        help=f"Vector store directory (default: {DEFAULT_PERSIST_DIR})",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="Path for index metadata JSON (default: reports/index_metadata.json)",
+    )
+    parser.add_argument(
+        "--full-rebuild",
+        action="store_true",
+        help="Ignore the manifest and re-embed every document",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Processes for loading and chunking (default: CPU count; 1 = serial)",
+    )
+    parser.add_argument(
+        "--embedding-cache-dir",
+        type=str,
+        default=DEFAULT_EMBEDDING_CACHE_DIR,
+        help=f"Embedding cache directory (default: {DEFAULT_EMBEDDING_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--no-embedding-cache",
+        action="store_true",
+        help="Always call the embedding model",
+    )
+    parser.add_argument(
+        "--chunker",
+        choices=CHUNKERS,
+        default=DEFAULT_CHUNKER,
+        help=(
+            "Markdown chunker (native: same chunks, no llama-index needed; "
+            "sentence-window: sentence chunks expanded at query time)"
+        ),
+    )
+    parser.add_argument(
+        "--vector-backend",
+        choices=VECTOR_BACKENDS,
+        default=None,
+        help="Vector store backend (default: $RAG_VECTOR_BACKEND, else chroma)",
+    )
+    parser.add_argument(
+        "--vector-dtype",
+        choices=VECTOR_DTYPES,
+        default=DEFAULT_VECTOR_DTYPE,
+        help="Vector dtype for the flat backend (default: float32)",
+    )
+    args = parser.parse_args()
+
     print("Building governance RAG index...")
     print("Collecting markdown files...")
 
@@ -147,45 +530,47 @@ if __name__ == "__main__":
         print(f"  {d}: {c}")
     print("-" * 30)
 
-    print("\nLoading and chunking documents...")
-    docs, errors = load_documents(paths)
-
-    index = GovernanceIndex()
-    chunk_count = 0
-    for doc in docs:
-        chunks = chunk_document(doc)
-        chunk_count += index.add(chunks)
-
-    print(f"Indexed {len(docs)} documents → {chunk_count} chunks")
-
-    graph_client = _graph_client_from_env()
-    graph_count = 0
-    if graph_client is not None:
-        print("Ingesting into Neo4j graph...")
-        graph_count = ingest_documents(docs, graph_client)
-        graph_client.close()
-        print(f"Graph: {graph_count} documents ingested")
-    else:
-        print("Graph: skipped (NEO4J_* env vars not set)")
-
-    if errors:
-        error_path = root / "reports" / "index_errors.json"
-        write_index_errors(error_path, errors)
-        print(f"Errors: {len(errors)} (see reports/index_errors.json)")
-
-    meta_path = root / "reports" / "index_metadata.json"
-    write_index_metadata(meta_path, build_index_metadata(document_count=len(docs)))
+    print(f"\nLoading and chunking changed documents ({args.workers} workers)...")
+    report = build_index_report(
+        root=root,
+        metadata_path=args.output,
+        persist_dir=args.persist_dir,
+        full_rebuild=args.full_rebuild,
+        workers=args.workers,
+        embedding_cache_dir=None
+        if args.no_embedding_cache
+        else args.embedding_cache_dir,
+        chunker=args.chunker,
+        backend=args.vector_backend,
+        vector_dtype=args.vector_dtype,
+    )
 
+    mode = "incremental" if report["incremental"] else "full"
     print(
-        "\n"
-        + json.dumps(
-            {
-                "status": "success",
-                "documents": len(docs),
-                "chunks": chunk_count,
-                "graph_documents": graph_count,
-                "errors": len(errors),
-            },
-            indent=2,
-        )
+        f"Indexed ({mode}) {report['changed_files']} changed, "
+        f"{report['removed_files']} removed, {report['unchanged_files']} unchanged "
+        f"→ {report['chunks']} chunks written, {report['chunks_deleted']} deleted"
+    )
+    print(f"Graph: {report['graph_documents']} documents ingested")
+    print(
+        f"Local graph: {report['graph_store']['documents']} documents, "
+        f"{report['graph_store']['relationships']} relationships"
+    )
+    print(
+        f"Lexical index: {report['lexical_index']['chunks']} chunks, "
+        f"{report['lexical_index']['terms']} terms"
     )
+    print(
+        f"Metadata index: {report['metadata_index']['documents']} documents, "
+        f"{report['metadata_index']['fields']} fields"
+    )
+    if report["embedding_cache"]:
+        cache_stats = report["embedding_cache"]
+        print(
+            f"Embedding cache: {cache_stats['hits']} hits, "
+            f"{cache_stats['misses']} misses, {cache_stats['entries']} entries"
+        )
+    if report["errors"]:
+        print(f"Errors: {report['errors']} (see reports/index_errors.json)")
+
+    print("\n" + json.dumps({"status": "success", **report}, indent=2))
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+---
+id: SCRIPT-0084
+type: script
+owner: platform-team
+status: active
+maturity: 1
+last_validated: 2026-10-18
+test:
+  runner: pytest
+  command: "pytest -q tests/unit/test_index_manifest.py"
+  evidence: declared
+dry_run:
+  supported: true
+risk_profile:
+  production_impact: low
+  security_risk: low
+  coupling_risk: low
+relates_to:
+  - PRD-0008-governance-rag-pipeline
+  - GOV-0017-tdd-and-determinism
+  - SCRIPT-0078-index-build
+---
+Purpose: Content-hash manifest for incremental RAG index builds.
+
+Records a content hash per source file and per chunk so that index_build
+only re-chunks and re-embeds files that changed since the last build, and
+deletes chunks belonging to files that were removed or renamed.
+
+The manifest lives inside the vector store directory, so wiping the store
+also wipes the manifest and forces a full rebuild.
+
+Example:
+    >>> from scripts.rag.index_manifest import load_manifest, diff_manifest
+    >>> manifest = load_manifest(Path(".chroma/index_manifest.json"))
+    >>> diff = diff_manifest(manifest, {"docs/GOV-0017.md": "ab12..."})
+    >>> diff.changed
+    ['docs/GOV-0017.md']
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+import hashlib
+import json
+
+from scripts.rag.chunker import Chunk
+from scripts.rag.indexer import _DateTimeEncoder, _flatten_metadata
+
+
+MANIFEST_FILENAME = "index_manifest.json"
+MANIFEST_VERSION = 2
+
+
+@dataclass
+class FileRecord:
+    """
+    Manifest entry for a single source file.
+
+    Attributes:
+        content_hash: SHA-256 of the raw file bytes.
+        doc_id: Document id from frontmatter (may be empty).
+        chunks: Mapping of chunk id to chunk content hash.
+    """
+
+    content_hash: str
+    doc_id: str = ""
+    chunks: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class IndexManifest:
+    """
+    Snapshot of what is currently stored in the vector index.
+
+    Attributes:
+        embedding_model: Embedding model used to build the index.
+        chunker: Chunker implementation used to build the index.
+        files: Mapping of repo-relative path to FileRecord.
+    """
+
+    embedding_model: Optional[str] = None
+    chunker: Optional[str] = None
+    files: Dict[str, FileRecord] = field(default_factory=dict)
+
+
+@dataclass
+class ManifestDiff:
+    """Difference between a manifest and the current source tree."""
+
+    added: List[str] = field(default_factory=list)
+    modified: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+
+    @property
+    def changed(self) -> List[str]:
+        """Paths that need to be (re)loaded and chunked."""
+        return sorted(self.added + self.modified)
+
+
+def hash_bytes(data: bytes) -> str:
+    """Return the hex SHA-256 digest of raw bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_file(path: Union[str, Path]) -> str:
+    """Return the hex SHA-256 digest of a file's contents."""
+    return hash_bytes(Path(path).read_bytes())
+
+
+def hash_chunk(chunk: Chunk) -> str:
+    """
+    Hash a chunk's text and metadata.
+
+    Metadata is included so frontmatter-only edits still refresh the
+    stored chunk metadata.
+    """
+    payload = json.dumps(
+        {"text": chunk.text, "metadata": _flatten_metadata(chunk.metadata)},
+        sort_keys=True,
+        cls=_DateTimeEncoder,
+    )
+    return hash_bytes(payload.encode("utf-8"))
+
+
+def hash_paths(
+    paths: Iterable[Path], root: Path
+) -> Tuple[Dict[str, str], List[Dict[str, str]]]:
+    """
+    Hash source files keyed by their repo-relative path.
+
+    Args:
+        paths: Files to hash.
+        root: Repository root used to relativize keys.
+
+    Returns:
+        Tuple of (hashes, errors). Unreadable files are reported as errors.
+    """
+    hashes: Dict[str, str] = {}
+    errors: List[Dict[str, str]] = []
+    for path in paths:
+        try:
+            hashes[relative_key(path, root)] = hash_file(path)
+        except OSError as exc:
+            errors.append({"path": str(path), "error": str(exc)})
+    return hashes, errors
+
+
+def relative_key(path: Union[str, Path], root: Path) -> str:
+    """Return a stable, repo-relative POSIX key for a path."""
+    path = Path(path)
+    try:
+        return path.resolve().relative_to(root.resolve()).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def diff_manifest(manifest: IndexManifest, current: Dict[str, str]) -> ManifestDiff:
+    """
+    Compare manifest records against current file hashes.
+
+    Args:
+        manifest: Previously written manifest.
+        current: Mapping of repo-relative path to content hash.
+
+    Returns:
+        ManifestDiff with sorted path lists.
+    """
+    diff = ManifestDiff()
+    for key in sorted(current):
+        record = manifest.files.get(key)
+        if record is None:
+            diff.added.append(key)
+        elif record.content_hash != current[key]:
+            diff.modified.append(key)
+        else:
+            diff.unchanged.append(key)
+    diff.removed = sorted(set(manifest.files) - set(current))
+    return diff
+
+
+def load_manifest(path: Path) -> IndexManifest:
+    """
+    Load a manifest from disk.
+
+    Missing, unreadable, or version-mismatched manifests yield an empty
+    manifest, which makes the next build a full rebuild.
+    """
+    if not path.exists():
+        return IndexManifest()
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return IndexManifest()
+    if data.get("version") != MANIFEST_VERSION:
+        return IndexManifest()
+    files = {
+        key: FileRecord(
+            content_hash=entry.get("content_hash", ""),
+            doc_id=entry.get("doc_id", ""),
+            chunks=dict(entry.get("chunks", {})),
+        )
+        for key, entry in data.get("files", {}).items()
+    }
+    return IndexManifest(
+        embedding_model=data.get("embedding_model"),
+        chunker=data.get("chunker"),
+        files=files,
+    )
+
+
+def write_manifest(path: Path, manifest: IndexManifest) -> None:
+    """Write the manifest as deterministic JSON."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "version": MANIFEST_VERSION,
+        "embedding_model": manifest.embedding_model,
+        "chunker": manifest.chunker,
+        "files": {
+            key: {
+                "content_hash": record.content_hash,
+                "doc_id": record.doc_id,
+                "chunks": record.chunks,
+            }
+            for key, record in manifest.files.items()
+        },
+    }
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True))
@@ -24,19 +24,25 @@ relates_to:
 Purpose: Index metadata artifact writer.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import json
 import subprocess
 
 
+DEFAULT_INDEX_METADATA_PATH = Path("reports/index_metadata.json")
+
+
 @dataclass
 class IndexMetadata:
     source_sha: str
     generated_at: str
     document_count: int
+    incremental: bool = False
+    changed_files: List[str] = field(default_factory=list)
+    removed_files: List[str] = field(default_factory=list)
 
 
 def _get_source_sha() -> str:
@@ -54,13 +60,22 @@ def _get_source_sha() -> str:
 
 
 def build_index_metadata(
-    document_count: int, source_sha: Optional[str] = None
+    document_count: int,
+    source_sha: Optional[str] = None,
+    incremental: bool = False,
+    changed_files: Optional[List[str]] = None,
+    removed_files: Optional[List[str]] = None,
 ) -> IndexMetadata:
     """Create index metadata with current timestamp."""
     sha = source_sha or _get_source_sha()
     generated_at = datetime.now(timezone.utc).isoformat()
     return IndexMetadata(
-        source_sha=sha, generated_at=generated_at, document_count=document_count
+        source_sha=sha,
+        generated_at=generated_at,
+        document_count=document_count,
+        incremental=incremental,
+        changed_files=sorted(changed_files or []),
+        removed_files=sorted(removed_files or []),
     )
 
 
@@ -71,5 +86,18 @@ def write_index_metadata(path: Path, metadata: IndexMetadata) -> None:
         "source_sha": metadata.source_sha,
         "generated_at": metadata.generated_at,
         "document_count": metadata.document_count,
+        "incremental": metadata.incremental,
+        "changed_files": metadata.changed_files,
+        "removed_files": metadata.removed_files,
     }
     path.write_text(json.dumps(payload, indent=2, sort_keys=True))
+
+
+def read_index_metadata(
+    path: Path = DEFAULT_INDEX_METADATA_PATH,
+) -> Optional[Dict[str, Any]]:
+    """Read the index metadata artifact, or return None if unavailable."""
+    try:
+        return json.loads(Path(path).read_text())
+    except (OSError, ValueError):
+        return None
@@ -43,17 +43,25 @@ Example:
     6
 """
 
+from contextlib import nullcontext
 from dataclasses import dataclass, field
-from typing import List, Optional, Any, Dict
+from typing import Callable, Iterable, Iterator, List, Optional, Any, Dict, Tuple
 from datetime import date, datetime
 import json
+import time
 
-try:
-    import chromadb
-except ImportError:
-    chromadb = None  # Allow import without chromadb for testing
+from scripts.rag.chunker import Chunk, make_chunk_id
+from scripts.rag.embedding_cache import CachedEmbeddingFunction, EmbeddingCache
+from scripts.rag.lazy_imports import LazyModule
+from scripts.rag.vector_store import (
+    BACKEND_FLAT,
+    DEFAULT_VECTOR_DTYPE,
+    FlatVectorClient,
+    resolve_backend,
+)
 
-from scripts.rag.chunker import Chunk
+# Imported on first use; falsy when chromadb is not installed
+chromadb = LazyModule("chromadb", "Install with: pip install chromadb")
 
 
 # Default collection name for governance documents
@@ -65,6 +73,46 @@ DEFAULT_PERSIST_DIR = ".chroma"
 # Default embedding model (explicit for Phase 0 alignment)
 DEFAULT_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
 
+# Upsert batch limits: flush when either bound is reached
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_MAX_BATCH_BYTES = 4 * 1024 * 1024
+
+
+@dataclass
+class BatchStats:
+    """
+    Timing and size for one flushed upsert batch.
+
+    Attributes:
+        batch_index: Zero-based batch number within the call.
+        count: Chunks in the batch.
+        bytes: Approximate payload size (text + metadata).
+        seconds: Wall time of the upsert call (includes embedding).
+        indexed: Cumulative chunks indexed after this batch.
+    """
+
+    batch_index: int
+    count: int
+    bytes: int
+    seconds: float
+    indexed: int
+
+
+class IndexBatchError(RuntimeError):
+    """
+    Raised when an upsert batch fails.
+
+    Upserts are idempotent, so callers can re-run the same stream, or pass
+    ``start_at=error.indexed`` to skip chunks already written.
+    """
+
+    def __init__(self, batch_index: int, indexed: int, cause: Exception):
+        super().__init__(
+            f"Upsert batch {batch_index} failed after {indexed} chunks: {cause}"
+        )
+        self.batch_index = batch_index
+        self.indexed = indexed
+
 
 class _MockEmbeddingFunction:
     """
@@ -125,40 +173,69 @@ class _MockEmbeddingFunction:
         return self.__call__([input])
 
 
-def _get_embedding_function(model_name: Optional[str]):
+def _get_embedding_function(model_name: Optional[str], cache_dir: Optional[str] = None):
     """
     Build a ChromaDB embedding function if a model name is provided.
 
+    When cache_dir is set, the function is wrapped so previously embedded
+    texts are served from the on-disk embedding cache.
+
     Returns None to use ChromaDB defaults.
     """
     if not model_name:
         return None
     if model_name == "mock":
-        return _MockEmbeddingFunction()
-    try:
-        from chromadb.utils import embedding_functions
-    except Exception:
-        return None
-    try:
-        return embedding_functions.SentenceTransformerEmbeddingFunction(
-            model_name=model_name
-        )
-    except Exception:
-        return None
-
-
-def _get_client(persist_dir: Optional[str] = None, in_memory: bool = False):
+        embedding_function = _MockEmbeddingFunction()
+    else:
+        try:
+            from chromadb.utils import embedding_functions
+        except Exception:
+            return None
+        try:
+            embedding_function = (
+                embedding_functions.SentenceTransformerEmbeddingFunction(
+                    model_name=model_name
+                )
+            )
+        except Exception:
+            return None
+    if cache_dir:
+        try:
+            cache = EmbeddingCache(cache_dir, model_name)
+        except ImportError:
+            return embedding_function
+        return CachedEmbeddingFunction(embedding_function, cache)
+    return embedding_function
+
+
+def _get_client(
+    persist_dir: Optional[str] = None,
+    in_memory: bool = False,
+    backend: Optional[str] = None,
+    vector_dtype: str = DEFAULT_VECTOR_DTYPE,
+    embedding_model: Optional[str] = None,
+):
     """
-    Get a ChromaDB client.
+    Get a ChromaDB client (or the flat NumPy stand-in).
 
     Args:
         persist_dir: Directory for persistent storage. If None, uses DEFAULT_PERSIST_DIR.
         in_memory: If True, use in-memory client (for testing).
+        backend: "chroma" or "flat" (default: RAG_VECTOR_BACKEND, else chroma).
+        vector_dtype: Storage dtype for flat collections.
+        embedding_model: Model name recorded by flat collections.
 
     Returns:
-        ChromaDB client instance.
+        ChromaDB client instance, or a FlatVectorClient.
     """
-    if chromadb is None:
+    if resolve_backend(backend) == BACKEND_FLAT:
+        return FlatVectorClient(
+            None if in_memory else (persist_dir or DEFAULT_PERSIST_DIR),
+            dtype=vector_dtype,
+            embedding_model=embedding_model,
+        )
+
+    if not chromadb:
         raise ImportError(
             "chromadb is not installed. Install with: pip install chromadb"
         )
@@ -220,7 +297,7 @@ def _generate_chunk_id(chunk: Chunk, index: int) -> str:
     """
     doc_id = chunk.metadata.get("doc_id", f"doc_{index}")
     chunk_index = chunk.metadata.get("chunk_index", index)
-    return f"{doc_id}_{chunk_index}"
+    return make_chunk_id(doc_id, chunk_index)
 
 
 def create_collection(
@@ -228,6 +305,7 @@ def create_collection(
     persist_dir: Optional[str] = None,
     in_memory: bool = False,
     embedding_model: Optional[str] = DEFAULT_EMBEDDING_MODEL,
+    embedding_cache_dir: Optional[str] = None,
 ):
     """
     Create or get a ChromaDB collection.
@@ -236,6 +314,7 @@ def create_collection(
         name: Collection name. Defaults to 'governance_docs'.
         persist_dir: Directory for persistent storage.
         in_memory: If True, use in-memory storage (for testing).
+        embedding_cache_dir: Optional embedding cache directory.
 
     Returns:
         ChromaDB collection.
@@ -246,7 +325,7 @@ def create_collection(
         'my_docs'
     """
     client = _get_client(persist_dir=persist_dir, in_memory=in_memory)
-    embedding_function = _get_embedding_function(embedding_model)
+    embedding_function = _get_embedding_function(embedding_model, embedding_cache_dir)
     if embedding_function is None:
         return client.get_or_create_collection(name=name)
     return client.get_or_create_collection(
@@ -294,63 +373,148 @@ def delete_collection(
     client.delete_collection(name=name)
 
 
+def _payload_bytes(text: str, metadata: Dict[str, Any]) -> int:
+    """Approximate the serialized size of one chunk."""
+    size = len(text.encode("utf-8"))
+    for key, value in metadata.items():
+        size += len(key) + len(str(value))
+    return size
+
+
+def iter_batches(
+    chunks: Iterable[Chunk],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+    start_at: int = 0,
+) -> Iterator[Tuple[List[str], List[str], List[Dict[str, Any]], int]]:
+    """
+    Group a chunk stream into size-bounded batches.
+
+    A batch is flushed when it reaches batch_size chunks or max_batch_bytes,
+    or when a chunk id repeats within the batch (ChromaDB rejects duplicate
+    ids in a single call; the later chunk wins, as with sequential upserts).
+
+    Args:
+        chunks: Iterable of Chunk objects (consumed lazily).
+        batch_size: Maximum chunks per batch.
+        max_batch_bytes: Maximum approximate payload bytes per batch.
+        start_at: Number of leading chunks to skip (for resuming).
+
+    Yields:
+        Tuples of (ids, documents, metadatas, approx_bytes).
+    """
+    ids: List[str] = []
+    documents: List[str] = []
+    metadatas: List[Dict[str, Any]] = []
+    seen = set()
+    size = 0
+
+    for i, chunk in enumerate(chunks):
+        if i < start_at:
+            continue
+        chunk_id = _generate_chunk_id(chunk, i)
+        metadata = _flatten_metadata(chunk.metadata)
+        chunk_bytes = _payload_bytes(chunk.text, metadata)
+        if ids and (
+            len(ids) >= batch_size
+            or size + chunk_bytes > max_batch_bytes
+            or chunk_id in seen
+        ):
+            yield ids, documents, metadatas, size
+            ids, documents, metadatas, seen, size = [], [], [], set(), 0
+        ids.append(chunk_id)
+        documents.append(chunk.text)
+        metadatas.append(metadata)
+        seen.add(chunk_id)
+        size += chunk_bytes
+
+    if ids:
+        yield ids, documents, metadatas, size
+
+
 def index_chunks(
-    chunks: List[Chunk],
+    chunks: Iterable[Chunk],
     collection=None,
     collection_name: str = DEFAULT_COLLECTION_NAME,
     persist_dir: Optional[str] = None,
     in_memory: bool = False,
     embedding_model: Optional[str] = DEFAULT_EMBEDDING_MODEL,
+    embedding_cache_dir: Optional[str] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+    start_at: int = 0,
+    on_batch: Optional[Callable[[BatchStats], None]] = None,
 ) -> int:
     """
-    Index chunks into a ChromaDB collection.
+    Stream chunks into a ChromaDB collection with batched upserts.
+
+    Chunks are consumed lazily and flushed in batches bounded by count and
+    bytes, so peak memory stays flat regardless of corpus size. Upsert
+    semantics make re-runs idempotent.
 
     Args:
-        chunks: List of Chunk objects to index.
+        chunks: Iterable of Chunk objects to index.
         collection: Optional existing collection. If None, creates/gets one.
         collection_name: Name for the collection if creating new.
         persist_dir: Directory for persistent storage.
         in_memory: If True, use in-memory storage.
+        embedding_cache_dir: Optional embedding cache directory.
+        batch_size: Maximum chunks per upsert call.
+        max_batch_bytes: Maximum approximate payload bytes per upsert call.
+        start_at: Skip this many leading chunks (resume after a failure).
+        on_batch: Optional callback receiving BatchStats after each flush.
 
     Returns:
         Number of chunks indexed.
 
+    Raises:
+        IndexBatchError: If an upsert fails; carries the resume offset.
+
     Example:
-        >>> from scripts.rag.chunker import Chunk
+        >>> from scripts.rag.chunker import Chunk, make_chunk_id
         >>> chunks = [Chunk(text="Hello", metadata={"doc_id": "DOC-1", "chunk_index": 0})]
         >>> count = index_chunks(chunks)
         >>> count
         1
     """
-    if not chunks:
-        return 0
-
-    if collection is None:
-        collection = create_collection(
-            name=collection_name,
-            persist_dir=persist_dir,
-            in_memory=in_memory,
-            embedding_model=embedding_model,
-        )
-
-    # Prepare data for ChromaDB
-    ids = []
-    documents = []
-    metadatas = []
+    indexed = 0
+    batches = iter_batches(
+        chunks,
+        batch_size=batch_size,
+        max_batch_bytes=max_batch_bytes,
+        start_at=start_at,
+    )
 
-    for i, chunk in enumerate(chunks):
-        ids.append(_generate_chunk_id(chunk, i))
-        documents.append(chunk.text)
-        metadatas.append(_flatten_metadata(chunk.metadata))
+    for batch_index, (ids, documents, metadatas, size) in enumerate(batches):
+        if collection is None:
+            collection = create_collection(
+                name=collection_name,
+                persist_dir=persist_dir,
+                in_memory=in_memory,
+                embedding_model=embedding_model,
+                embedding_cache_dir=embedding_cache_dir,
+            )
 
-    # Add to collection
-    collection.add(
-        ids=ids,
-        documents=documents,
-        metadatas=metadatas,
-    )
+        started = time.perf_counter()
+        try:
+            collection.upsert(ids=ids, documents=documents, metadatas=metadatas)
+        except Exception as exc:
+            raise IndexBatchError(batch_index, start_at + indexed, exc) from exc
+        elapsed = time.perf_counter() - started
+
+        indexed += len(ids)
+        if on_batch is not None:
+            on_batch(
+                BatchStats(
+                    batch_index=batch_index,
+                    count=len(ids),
+                    bytes=size,
+                    seconds=elapsed,
+                    indexed=start_at + indexed,
+                )
+            )
 
-    return len(chunks)
+    return indexed
 
 
 @dataclass
@@ -365,6 +529,12 @@ class GovernanceIndex:
         collection_name: Name of the ChromaDB collection.
         persist_dir: Directory for persistent storage.
         in_memory: Whether to use in-memory storage.
+        embedding_cache_dir: Optional embedding cache directory; unchanged
+            chunk texts are not re-embedded when set.
+        backend: Vector backend, "chroma" or "flat" (default:
+            RAG_VECTOR_BACKEND, else chroma).
+        vector_dtype: Storage dtype for the flat backend (float32, float16
+            or int8).
         collection: The underlying ChromaDB collection.
 
     Example:
@@ -379,7 +549,14 @@ class GovernanceIndex:
     persist_dir: Optional[str] = None
     in_memory: bool = False
     embedding_model: Optional[str] = DEFAULT_EMBEDDING_MODEL
+    embedding_cache_dir: Optional[str] = None
+    batch_size: int = DEFAULT_BATCH_SIZE
+    max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES
+    backend: Optional[str] = None
+    vector_dtype: str = DEFAULT_VECTOR_DTYPE
     collection: Any = field(default=None, init=False)
+    embedding_function: Any = field(default=None, init=False, repr=False)
+    batch_stats: List[BatchStats] = field(default_factory=list, init=False)
     _client: Any = field(default=None, init=False, repr=False)
 
     def __post_init__(self):
@@ -387,32 +564,61 @@ class GovernanceIndex:
         self._client = _get_client(
             persist_dir=self.persist_dir,
             in_memory=self.in_memory,
+            backend=self.backend,
+            vector_dtype=self.vector_dtype,
+            embedding_model=self.embedding_model,
         )
-        embedding_function = _get_embedding_function(self.embedding_model)
-        if embedding_function is None:
+        self.embedding_function = _get_embedding_function(
+            self.embedding_model, self.embedding_cache_dir
+        )
+        if self.embedding_function is None:
             self.collection = self._client.get_or_create_collection(
                 name=self.collection_name
             )
         else:
             self.collection = self._client.get_or_create_collection(
-                name=self.collection_name, embedding_function=embedding_function
+                name=self.collection_name,
+                embedding_function=self.embedding_function,
             )
 
-    def add(self, chunks: List[Chunk]) -> int:
+    def add(self, chunks: Iterable[Chunk]) -> int:
         """
-        Add chunks to the index.
+        Upsert chunks into the index in size-bounded batches.
+
+        Per-batch timings are appended to ``batch_stats``. A flat store is
+        written once after the last batch.
 
         Args:
-            chunks: List of Chunk objects to index.
+            chunks: Iterable of Chunk objects to index.
 
         Returns:
-            Number of chunks added.
+            Number of chunks added or updated.
         """
-        return index_chunks(
-            chunks,
-            collection=self.collection,
-            embedding_model=self.embedding_model,
-        )
+        deferred_save = getattr(self.collection, "deferred_save", None)
+        with deferred_save() if deferred_save is not None else nullcontext():
+            return index_chunks(
+                chunks,
+                collection=self.collection,
+                embedding_model=self.embedding_model,
+                batch_size=self.batch_size,
+                max_batch_bytes=self.max_batch_bytes,
+                on_batch=self.batch_stats.append,
+            )
+
+    def delete(self, ids: List[str]) -> int:
+        """
+        Delete chunks from the index by id.
+
+        Args:
+            ids: Chunk ids to delete.
+
+        Returns:
+            Number of ids submitted for deletion.
+        """
+        if not ids:
+            return 0
+        self.collection.delete(ids=list(ids))
+        return len(ids)
 
     def count(self) -> int:
         """
@@ -430,6 +636,12 @@ class GovernanceIndex:
         Deletes and recreates the collection.
         """
         self._client.delete_collection(name=self.collection_name)
-        self.collection = self._client.get_or_create_collection(
-            name=self.collection_name
-        )
+        if self.embedding_function is None:
+            self.collection = self._client.get_or_create_collection(
+                name=self.collection_name
+            )
+        else:
+            self.collection = self._client.get_or_create_collection(
+                name=self.collection_name,
+                embedding_function=self.embedding_function,
+            )
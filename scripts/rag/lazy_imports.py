@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+---
+id: SCRIPT-0090
+type: script
+owner: platform-team
+status: active
+maturity: 1
+last_validated: 2026-10-18
+test:
+  runner: pytest
+  command: "pytest -q tests/unit/test_lazy_imports.py"
+  evidence: declared
+dry_run:
+  supported: true
+risk_profile:
+  production_impact: low
+  security_risk: low
+  coupling_risk: low
+relates_to:
+  - PRD-0008-governance-rag-pipeline
+  - SCRIPT-0076-cli
+---
+Purpose: Import heavy optional dependencies on first use.
+
+chromadb, llama-index, the langchain providers, neo4j and numpy together
+cost seconds of import time. RAG modules bind them to LazyModule proxies
+instead, so `gov-rag --help` or a query answered by the daemon never loads
+them. Availability checks use importlib.util.find_spec and do not import
+the package.
+
+A proxy is truthy when the module can be imported, so the existing
+`if chromadb is None` guards become `if not chromadb`; tests that patch the
+module attribute with a MagicMock (truthy) or None (falsy) keep working.
+
+The import-time benchmark runs `python -X importtime` for each entry point
+in a fresh interpreter and fails when an entry point exceeds its budget or
+pulls in a heavy dependency eagerly.
+
+Usage:
+    python -m scripts.rag.lazy_imports            # table, exit 1 on breach
+    python -m scripts.rag.lazy_imports --json
+
+Example:
+    >>> from scripts.rag.lazy_imports import LazyModule
+    >>> json = LazyModule("json")
+    >>> bool(json)
+    True
+    >>> json.dumps([1])
+    '[1]'
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import importlib
+import importlib.util
+import subprocess
+import sys
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Cumulative import-time budget (milliseconds) per entry point. Measured at
+# roughly 20-120ms on a single-CPU runner; budgets leave room for slower CI
+# machines but fail long before an eager chromadb/llama-index import (~2.5s).
+IMPORT_BUDGETS_MS: Dict[str, int] = {
+    "scripts.rag.cli": 600,
+    "scripts.rag.query_server": 600,
+    "scripts.rag.retriever": 500,
+    "scripts.rag.hybrid_retriever": 500,
+    "scripts.rag.llm_synthesis": 600,
+    "scripts.rag.index_build": 600,
+    "scripts.rag.graph_ingest": 400,
+    "scripts.rag.chunker": 300,
+    "scripts.rag.loader": 300,
+}
+
+# Packages that must only be imported on first use
+HEAVY_MODULES = (
+    "chromadb",
+    "llama_index.core",
+    "langchain_core",
+    "langchain_ollama",
+    "langchain_anthropic",
+    "langchain_openai",
+    "neo4j",
+    "numpy",
+    "sentence_transformers",
+)
+
+
+def module_available(name: str) -> bool:
+    """Return True if a module can be found without importing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        # Parent package missing, or a stub in sys.modules without a spec
+        return False
+
+
+class LazyModule:
+    """
+    Proxy for a module that is imported on first attribute access.
+
+    Attributes:
+        name: Dotted module name.
+        install_hint: Appended to the ImportError raised when it is missing.
+    """
+
+    def __init__(self, name: str, install_hint: Optional[str] = None):
+        self.name = name
+        self.install_hint = install_hint
+        self._module: Optional[ModuleType] = None
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<LazyModule {self.name!r} ({state})>"
+
+    def __bool__(self) -> bool:
+        return self._module is not None or module_available(self.name)
+
+    @property
+    def loaded(self) -> bool:
+        """True once the module has been imported."""
+        return self._module is not None
+
+    def load(self) -> ModuleType:
+        """
+        Import the module (once) and return it.
+
+        Raises:
+            ImportError: If the module is not installed.
+        """
+        if self._module is None:
+            try:
+                self._module = importlib.import_module(self.name)
+            except ImportError as exc:
+                hint = f". {self.install_hint}" if self.install_hint else ""
+                raise ImportError(f"{self.name} is not installed{hint}") from exc
+        return self._module
+
+    def __getattr__(self, attr: str) -> Any:
+        # Only called for attributes not set in __init__
+        if attr.startswith("__") and attr.endswith("__"):
+            raise AttributeError(attr)
+        return getattr(self.load(), attr)
+
+
+@dataclass
+class ImportProfile:
+    """
+    Import cost of one entry point in a fresh interpreter.
+
+    Attributes:
+        module: Entry point module name.
+        total_ms: Cumulative import time of the entry point.
+        modules: Cumulative milliseconds per imported module.
+        budget_ms: Allowed total_ms (None: unbudgeted).
+    """
+
+    module: str
+    total_ms: float
+    modules: Dict[str, float] = field(default_factory=dict)
+    budget_ms: Optional[int] = None
+
+    @property
+    def heavy_imports(self) -> List[str]:
+        """Heavy dependencies imported eagerly by this entry point."""
+        return [name for name in HEAVY_MODULES if name in self.modules]
+
+    @property
+    def ok(self) -> bool:
+        """Within budget and free of eager heavy imports."""
+        within_budget = self.budget_ms is None or self.total_ms <= self.budget_ms
+        return within_budget and not self.heavy_imports
+
+    def slowest(self, count: int = 5) -> List[Tuple[str, float]]:
+        """Most expensive imported modules, excluding the entry point."""
+        ranked = sorted(
+            (item for item in self.modules.items() if item[0] != self.module),
+            key=lambda item: -item[1],
+        )
+        return ranked[:count]
+
+
+def parse_importtime(output: str) -> Dict[str, float]:
+    """
+    Parse `-X importtime` stderr into cumulative milliseconds per module.
+
+    A module imported more than once keeps its largest cumulative time.
+    """
+    modules: Dict[str, float] = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            cumulative_us = int(parts[1])
+        except ValueError:
+            continue  # Header line
+        name = parts[2].strip()
+        modules[name] = max(modules.get(name, 0.0), cumulative_us / 1000.0)
+    return modules
+
+
+def measure_import_time(
+    module: str, runs: int = 3, python: str = sys.executable
+) -> ImportProfile:
+    """
+    Import a module in fresh interpreters and keep the fastest run.
+
+    Raises:
+        RuntimeError: If the module fails to import.
+    """
+    best: Optional[Dict[str, float]] = None
+    for _ in range(max(1, runs)):
+        proc = subprocess.run(
+            [python, "-X", "importtime", "-c", f"import {module}"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(f"import {module} failed:\n{proc.stderr[-2000:]}")
+        modules = parse_importtime(proc.stderr)
+        if best is None or modules.get(module, 0.0) < best.get(module, 0.0):
+            best = modules
+    return ImportProfile(
+        module=module,
+        total_ms=best.get(module, 0.0),
+        modules=best,
+        budget_ms=IMPORT_BUDGETS_MS.get(module),
+    )
+
+
+def check_import_budgets(
+    modules: Optional[Sequence[str]] = None, runs: int = 3
+) -> List[ImportProfile]:
+    """Profile each entry point (default: every budgeted module)."""
+    return [
+        measure_import_time(module, runs=runs)
+        for module in (modules or sorted(IMPORT_BUDGETS_MS))
+    ]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Print import costs per entry point; exit 1 if any budget is broken."""
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Check RAG import-time budgets")
+    parser.add_argument("modules", nargs="*", help="Entry points (default: all)")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--json", action="store_true", help="Output JSON")
+    args = parser.parse_args(argv)
+
+    profiles = check_import_budgets(args.modules, runs=args.runs)
+    if args.json:
+        print(
+            json.dumps(
+                [
+                    {
+                        "module": p.module,
+                        "total_ms": round(p.total_ms, 1),
+                        "budget_ms": p.budget_ms,
+                        "heavy_imports": p.heavy_imports,
+                        "ok": p.ok,
+                    }
+                    for p in profiles
+                ],
+                indent=2,
+            )
+        )
+    else:
+        for p in profiles:
+            budget = f"{p.budget_ms}ms" if p.budget_ms is not None else "-"
+            status = "ok" if p.ok else "OVER"
+            print(f"{status:4} {p.module:32} {p.total_ms:8.1f}ms  budget {budget}")
+            if not p.ok:
+                if p.heavy_imports:
+                    print(f"     eager imports: {', '.join(p.heavy_imports)}")
+                for name, ms in p.slowest():
+                    print(f"     {ms:8.1f}ms  {name}")
+    return 0 if all(p.ok for p in profiles) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+---
+id: SCRIPT-0088
+type: script
+owner: platform-team
+status: active
+maturity: 1
+last_validated: 2026-10-18
+test:
+  runner: pytest
+  command: "pytest -q tests/unit/test_lexical_index.py"
+  evidence: declared
+dry_run:
+  supported: true
+risk_profile:
+  production_impact: low
+  security_risk: low
+  coupling_risk: low
+relates_to:
+  - PRD-0008-governance-rag-pipeline
+  - GOV-0017-tdd-and-determinism
+  - SCRIPT-0073-retriever
+  - SCRIPT-0078-index-build
+---
+Purpose: BM25 inverted index over chunk text, fused with vector search.
+
+Governance queries are full of exact identifiers (GOV-0017, ADR-0186,
+aws_s3_bucket) that embeddings rank poorly. The tokenizer keeps such
+identifiers whole (and also indexes their parts), BM25 scores exact
+matches, and reciprocal_rank_fusion merges the lexical ranking with the
+vector ranking.
+
+index_build maintains the index next to the vector store
+(.chroma/lexical_index.json.gz); GovernanceRetriever loads it lazily on
+the first query.
+
+Example:
+    >>> from scripts.rag.lexical_index import LexicalIndex
+    >>> index = LexicalIndex()
+    >>> index.add({"GOV-0017_0": "GOV-0017 requires tests first."})
+    >>> index.search("gov-0017")[0][0]
+    'GOV-0017_0'
+"""
+
+from pathlib import Path
+from typing import (
+    Collection,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+import gzip
+import json
+import math
+import os
+import re
+
+from scripts.rag.indexer import DEFAULT_PERSIST_DIR
+
+
+LEXICAL_INDEX_FILENAME = "lexical_index.json.gz"
+LEXICAL_INDEX_VERSION = 1
+DEFAULT_LEXICAL_INDEX_PATH = Path(DEFAULT_PERSIST_DIR) / LEXICAL_INDEX_FILENAME
+
+# BM25 parameters (Robertson/Sparck Jones defaults)
+DEFAULT_K1 = 1.2
+DEFAULT_B = 0.75
+
+# Reciprocal-rank fusion constant (Cormack et al., 2009)
+DEFAULT_RRF_K = 60
+
+# Identifiers such as GOV-0017, aws_s3_bucket or v1.2 stay one token
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:[-_./][a-z0-9]+)*")
+_PART_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase tokens; compound identifiers also yield their parts."""
+    tokens: List[str] = []
+    for match in _TOKEN_PATTERN.finditer(text.lower()):
+        token = match.group(0)
+        tokens.append(token)
+        parts = _PART_PATTERN.findall(token)
+        if len(parts) > 1:
+            tokens.extend(parts)
+    return tokens
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[str]],
+    k: int = DEFAULT_RRF_K,
+    weights: Optional[Sequence[float]] = None,
+) -> List[Tuple[str, float]]:
+    """
+    Fuse ranked id lists with reciprocal-rank fusion.
+
+    Args:
+        rankings: Ranked id lists (best first).
+        k: RRF constant; larger values flatten rank differences.
+        weights: Optional weight per ranking (default: 1.0 each).
+
+    Returns:
+        (id, score) pairs ordered best first. Scores are RRF sums scaled to
+        (0, 1]: 1 means ranked first by every list. They are rank scores,
+        not distances, so callers keep the vector distance for comparisons.
+    """
+    weights = list(weights) if weights is not None else [1.0] * len(rankings)
+    fused: Dict[str, float] = {}
+    for ranking, weight in zip(rankings, weights):
+        for rank, item_id in enumerate(ranking):
+            fused[item_id] = fused.get(item_id, 0.0) + weight / (k + rank + 1)
+    ideal = sum(weights) / (k + 1) or 1.0
+    ordered = sorted(fused.items(), key=lambda item: (-item[1], item[0]))
+    return [(item_id, score / ideal) for item_id, score in ordered]
+
+
+class LexicalIndex:
+    """
+    In-memory BM25 index keyed by chunk id.
+
+    Attributes:
+        path: Gzipped JSON file the index is loaded from and saved to.
+        k1: BM25 term-frequency saturation.
+        b: BM25 length normalisation.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        k1: float = DEFAULT_K1,
+        b: float = DEFAULT_B,
+    ):
+        self.path = Path(path) if path else None
+        self.k1 = k1
+        self.b = b
+        self._postings: Dict[str, Dict[str, int]] = {}  # term -> {chunk_id: tf}
+        self._lengths: Dict[str, int] = {}  # chunk_id -> token count
+        self._total_length = 0
+        self._dirty = False
+        if self.path is not None:
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    # -- persistence -------------------------------------------------------
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            with gzip.open(self.path, "rt", encoding="utf-8") as handle:
+                data = json.load(handle)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != LEXICAL_INDEX_VERSION:
+            return
+        ids = data["ids"]
+        self._lengths = dict(zip(ids, data["lengths"]))
+        self._total_length = sum(self._lengths.values())
+        for term, flat in data["postings"].items():
+            self._postings[term] = {
+                ids[flat[i]]: flat[i + 1] for i in range(0, len(flat), 2)
+            }
+
+    def save(self) -> None:
+        """Write the index to path, if configured and modified."""
+        if self.path is None or not self._dirty:
+            return
+        ids = sorted(self._lengths)
+        positions = {chunk_id: i for i, chunk_id in enumerate(ids)}
+        postings = {}
+        for term in sorted(self._postings):
+            flat: List[int] = []
+            for chunk_id, tf in sorted(self._postings[term].items()):
+                flat.extend((positions[chunk_id], tf))
+            postings[term] = flat
+        payload = {
+            "version": LEXICAL_INDEX_VERSION,
+            "ids": ids,
+            "lengths": [self._lengths[chunk_id] for chunk_id in ids],
+            "postings": postings,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as handle:
+            json.dump(payload, handle, separators=(",", ":"))
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+    # -- updates -----------------------------------------------------------
+
+    def add(self, texts: Dict[str, str]) -> None:
+        """Index chunk texts by id, replacing existing entries."""
+        self.remove([chunk_id for chunk_id in texts if chunk_id in self._lengths])
+        for chunk_id, text in texts.items():
+            tokens = tokenize(text)
+            counts: Dict[str, int] = {}
+            for token in tokens:
+                counts[token] = counts.get(token, 0) + 1
+            for term, tf in counts.items():
+                self._postings.setdefault(term, {})[chunk_id] = tf
+            self._lengths[chunk_id] = len(tokens)
+            self._total_length += len(tokens)
+        self._dirty = True
+
+    def remove(self, ids: Iterable[str]) -> int:
+        """Remove chunks by id; returns the number removed."""
+        removed = {chunk_id for chunk_id in ids if chunk_id in self._lengths}
+        if not removed:
+            return 0
+        for term in list(self._postings):
+            entries = self._postings[term]
+            for chunk_id in removed.intersection(entries):
+                del entries[chunk_id]
+            if not entries:
+                del self._postings[term]
+        for chunk_id in removed:
+            self._total_length -= self._lengths.pop(chunk_id)
+        self._dirty = True
+        return len(removed)
+
+    def clear(self) -> None:
+        """Drop every indexed chunk."""
+        self._postings.clear()
+        self._lengths.clear()
+        self._total_length = 0
+        self._dirty = True
+
+    # -- search ------------------------------------------------------------
+
+    def search(
+        self,
+        query: str,
+        top_k: int = 5,
+        ids: Optional[Collection[str]] = None,
+    ) -> List[Tuple[str, float]]:
+        """
+        Rank chunks for a query with BM25.
+
+        Args:
+            query: Query text.
+            top_k: Number of hits to return.
+            ids: Optional candidate chunk ids; other chunks are not scored.
+
+        Returns:
+            (chunk_id, score) pairs, highest score first.
+        """
+        count = len(self._lengths)
+        if not count:
+            return []
+        avg_length = self._total_length / count or 1.0
+        scores: Dict[str, float] = {}
+        for term in set(tokenize(query)):
+            entries = self._postings.get(term)
+            if not entries:
+                continue
+            idf = math.log(1 + (count - len(entries) + 0.5) / (len(entries) + 0.5))
+            for chunk_id, tf in entries.items():
+                if ids is not None and chunk_id not in ids:
+                    continue
+                norm = self.k1 * (
+                    1 - self.b + self.b * self._lengths[chunk_id] / avg_length
+                )
+                scores[chunk_id] = scores.get(chunk_id, 0.0) + idf * (
+                    tf * (self.k1 + 1) / (tf + norm)
+                )
+        ordered = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return ordered[:top_k]
+
+    def stats(self) -> Dict[str, int]:
+        """Return chunk and vocabulary counts."""
+        return {"chunks": len(self._lengths), "terms": len(self._postings)}
+
+
+def load_lexical_index(
+    path: Optional[Union[str, Path]] = DEFAULT_LEXICAL_INDEX_PATH,
+) -> Optional[LexicalIndex]:
+    """Load a persisted lexical index, or return None if none has been built."""
+    if not path or not Path(path).exists():
+        return None
+    return LexicalIndex(path)
@@ -31,56 +31,50 @@ Supports:
 
 Phase 1 implementation per PRD-0008.
 
+RAGSynthesizer.synthesize_stream yields answer text as the provider emits
+it (LangChain .stream), then a final SynthesisResult with citations, so
+the CLI can print progressively instead of waiting for the full answer.
+
 Example:
     >>> from scripts.rag.llm_synthesis import synthesize_answer
     >>> answer = synthesize_answer("What are TDD requirements?", provider="ollama")
     >>> answer = synthesize_answer("What are TDD requirements?", provider="claude")
     >>> answer = synthesize_answer("What are TDD requirements?", provider="openai")
+    >>> from scripts.rag.llm_synthesis import RAGSynthesizer
+    >>> for event in RAGSynthesizer().synthesize_stream("What is TDD?"):
+    ...     print(event if isinstance(event, str) else "", end="")
 """
 
 import os
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from enum import Enum
-from typing import List, Optional, Dict, Any, Union
-
-# LangChain imports
-try:
-    from langchain_core.prompts import ChatPromptTemplate
-
-    LANGCHAIN_CORE_AVAILABLE = True
-except ImportError:
-    LANGCHAIN_CORE_AVAILABLE = False
-    ChatPromptTemplate = None
-
-# Ollama
-try:
-    from langchain_ollama import ChatOllama
-
-    OLLAMA_AVAILABLE = True
-except ImportError:
-    OLLAMA_AVAILABLE = False
-    ChatOllama = None
-
-# Claude/Anthropic
-try:
-    from langchain_anthropic import ChatAnthropic
-
-    ANTHROPIC_AVAILABLE = True
-except ImportError:
-    ANTHROPIC_AVAILABLE = False
-    ChatAnthropic = None
-
-# OpenAI
-try:
-    from langchain_openai import ChatOpenAI
+from typing import Iterator, List, Optional, Dict, Any, Tuple, Union
+
+from scripts.rag import timing
+from scripts.rag.answer_cache import AnswerCache, answer_key
+from scripts.rag.context_packer import (
+    CHUNK_SEPARATOR,
+    chunk_header,
+    context_budget,
+    pack_context,
+)
+from scripts.rag.context_window import collection_fetcher, expand_context
+from scripts.rag.hybrid_retriever import HybridRetriever, HybridResult
+from scripts.rag.lazy_imports import LazyModule, module_available
+from scripts.rag.query_cache import QueryCache
+from scripts.rag.retriever import GovernanceRetriever, RetrievalResult, format_citation
 
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
-    ChatOpenAI = None
+# LangChain packages are imported when a chain or chat model is first built;
+# the *_AVAILABLE flags only check that they are installed.
+langchain_prompts = LazyModule("langchain_core.prompts")
+langchain_ollama = LazyModule("langchain_ollama")
+langchain_anthropic = LazyModule("langchain_anthropic")
+langchain_openai = LazyModule("langchain_openai")
 
-from scripts.rag.hybrid_retriever import HybridRetriever, HybridResult
-from scripts.rag.retriever import RetrievalResult, format_citation
+LANGCHAIN_CORE_AVAILABLE = module_available("langchain_core")
+OLLAMA_AVAILABLE = module_available("langchain_ollama")
+ANTHROPIC_AVAILABLE = module_available("langchain_anthropic")
+OPENAI_AVAILABLE = module_available("langchain_openai")
 
 
 class LLMProvider(Enum):
@@ -140,31 +134,10 @@ def _check_ollama_available() -> bool:
 
 def _format_context(results: List[Union[HybridResult, RetrievalResult]]) -> str:
     """Format retrieval results as context for LLM."""
-    context_parts = []
-
-    for i, result in enumerate(results, 1):
-        # Get metadata
-        if isinstance(result, HybridResult):
-            metadata = result.metadata
-            text = result.text
-        else:
-            metadata = result.metadata
-            text = result.text
-
-        doc_id = metadata.get("doc_id", "Unknown")
-        section = metadata.get("section", "")
-        file_path = metadata.get("file_path", "")
-
-        # Format chunk
-        header = f"[{i}] {doc_id}"
-        if section:
-            header += f" - {section}"
-        if file_path:
-            header += f" ({file_path})"
-
-        context_parts.append(f"{header}\n{text}")
-
-    return "\n\n---\n\n".join(context_parts)
+    return CHUNK_SEPARATOR.join(
+        f"{chunk_header(i, result.metadata)}\n{result.text}"
+        for i, result in enumerate(results, 1)
+    )
 
 
 def _format_citations(results: List[Union[HybridResult, RetrievalResult]]) -> str:
@@ -194,6 +167,48 @@ def _format_citations(results: List[Union[HybridResult, RetrievalResult]]) -> st
     return "\n".join(f"- {c}" for c in citations)
 
 
+def _result_citations(
+    results: List[Union[HybridResult, RetrievalResult]],
+) -> List[str]:
+    """One citation per retrieved chunk, in retrieval order."""
+    return [
+        format_citation(
+            RetrievalResult(id=r.id, text=r.text, metadata=r.metadata, score=r.score)
+        )
+        for r in results
+    ]
+
+
+def _source_docs(results: List[Union[HybridResult, RetrievalResult]]) -> List[str]:
+    """Distinct doc_ids in first-seen order."""
+    source_docs = []
+    seen_docs = set()
+    for r in results:
+        doc_id = r.metadata.get("doc_id")
+        if doc_id and doc_id not in seen_docs:
+            seen_docs.add(doc_id)
+            source_docs.append(doc_id)
+    return source_docs
+
+
+def _message_text(message: Any) -> str:
+    """
+    Text of a chat model message or streamed chunk.
+
+    Anthropic models may return a list of content blocks instead of a string.
+    """
+    content = getattr(message, "content", message)
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return "".join(
+            block if isinstance(block, str) else block.get("text", "")
+            for block in content
+            if isinstance(block, (str, dict))
+        )
+    return str(content or "")
+
+
 @dataclass
 class SynthesisResult:
     """Result from LLM synthesis."""
@@ -226,7 +241,7 @@ def _create_llm(
         if not OLLAMA_AVAILABLE:
             return None
         try:
-            return ChatOllama(
+            return langchain_ollama.ChatOllama(
                 model=model,
                 base_url=base_url or DEFAULT_OLLAMA_URL,
                 temperature=temperature,
@@ -241,7 +256,7 @@ def _create_llm(
         if not api_key:
             return None
         try:
-            return ChatAnthropic(
+            return langchain_anthropic.ChatAnthropic(
                 model=model,
                 temperature=temperature,
                 api_key=api_key,
@@ -256,7 +271,7 @@ def _create_llm(
         if not api_key:
             return None
         try:
-            return ChatOpenAI(
+            return langchain_openai.ChatOpenAI(
                 model=model,
                 temperature=temperature,
                 api_key=api_key,
@@ -278,6 +293,14 @@ class RAGSynthesizer:
         base_url: Ollama server URL (only for Ollama provider).
         temperature: LLM temperature (default: 0.1 for factual responses).
         retriever: HybridRetriever for context retrieval.
+        context_tokens: Token budget for retrieved context (default: per
+            provider, see context_packer.DEFAULT_CONTEXT_BUDGETS).
+        cache: Optional AnswerCache; repeat questions over the same context
+            and model settings skip the LLM call.
+        context_window: Neighbouring chunks added each side of a hit before
+            packing (default: each chunk's own context_window, which only
+            compact sentence-window chunks set).
+        parent_context: Also prefix each hit with its parent section.
     """
 
     provider: str = DEFAULT_PROVIDER
@@ -285,12 +308,18 @@ class RAGSynthesizer:
     base_url: str = DEFAULT_OLLAMA_URL
     temperature: float = 0.1
     retriever: Optional[HybridRetriever] = None
+    context_tokens: Optional[int] = None
+    cache: Optional[AnswerCache] = None
+    context_window: Optional[int] = None
+    parent_context: bool = False
     _llm: Any = field(default=None, init=False, repr=False)
 
     def __post_init__(self):
         """Initialize LLM and retriever."""
         if self.retriever is None:
-            self.retriever = HybridRetriever()
+            self.retriever = HybridRetriever(
+                vector_retriever=GovernanceRetriever(cache=QueryCache())
+            )
 
         # Set default model based on provider if not specified
         if self.model is None:
@@ -318,33 +347,73 @@ class RAGSynthesizer:
         # For API-based providers, having a valid LLM means we have an API key
         return True
 
-    def synthesize(
+    def _retrieve(
         self,
         question: str,
-        results: Optional[List[Union[HybridResult, RetrievalResult]]] = None,
-        top_k: int = 5,
-        expand_graph: bool = True,
-    ) -> SynthesisResult:
+        results: Optional[List[Union[HybridResult, RetrievalResult]]],
+        top_k: int,
+        expand_graph: bool,
+        packed: bool = False,
+    ) -> List[Union[HybridResult, RetrievalResult]]:
         """
-        Synthesize an answer from retrieved chunks.
-
-        Args:
-            question: User's question.
-            results: Pre-fetched retrieval results. If None, fetches via retriever.
-            top_k: Number of chunks to retrieve (if results not provided).
-            expand_graph: Whether to use graph expansion.
+        Return pre-fetched or retrieved results packed into the context budget.
 
-        Returns:
-            SynthesisResult with answer, citations, and metadata.
+        Hits are first widened with linked neighbour chunks (see
+        context_window), then duplicate chunks are dropped and long ones
+        trimmed to the sentences most relevant to the question (see
+        context_packer). packed=True returns pre-fetched results as they
+        are (e.g. the output of retrieve_context).
         """
-        # Fetch results if not provided
         if results is None:
-            results = self.retriever.query(
-                query_text=question,
-                top_k=top_k,
-                expand_graph=expand_graph,
-            )
+            with timing.span("retrieve"):
+                results = self.retriever.query(
+                    query_text=question,
+                    top_k=top_k,
+                    expand_graph=expand_graph,
+                )
+        elif packed:
+            return results
+        if not results:
+            return results
+        with timing.span("expand_context"):
+            results = self._expand(results)
+        budget = self.context_tokens
+        if budget is None:
+            budget = context_budget(self.provider)
+        with timing.span("pack_context"):
+            return pack_context(results, question, budget).results
+
+    def _expand(
+        self, results: List[Union[HybridResult, RetrievalResult]]
+    ) -> List[Union[HybridResult, RetrievalResult]]:
+        """Add linked neighbour/parent chunks, fetched by id from the index."""
+        vector_retriever = getattr(self.retriever, "vector_retriever", self.retriever)
+        collection = getattr(vector_retriever, "collection", None)
+        if collection is None:
+            return results
+        return expand_context(
+            results,
+            collection_fetcher(collection),
+            window=self.context_window,
+            include_parent=self.parent_context,
+        )
 
+    def retrieve_context(
+        self, question: str, top_k: int = 5, expand_graph: bool = True
+    ) -> List[Union[HybridResult, RetrievalResult]]:
+        """
+        Retrieve and pack the context synthesize() would send to the LLM.
+
+        Pass the returned results to synthesize(results=..., packed=True)
+        to answer from exactly this context (e.g. when evaluating
+        faithfulness) without expanding and packing it a second time.
+        """
+        return self._retrieve(question, None, top_k, expand_graph)
+
+    def _fallback(
+        self, results: List[Union[HybridResult, RetrievalResult]]
+    ) -> Optional[SynthesisResult]:
+        """Answer without the LLM when there is no context or no model."""
         if not results:
             return SynthesisResult(
                 answer="I couldn't find any relevant information to answer your question.",
@@ -353,77 +422,185 @@ class RAGSynthesizer:
                 context_chunks=0,
                 source_docs=[],
             )
-
-        # Format context
-        context = _format_context(results)
-
-        # Extract source docs
-        source_docs = []
-        seen_docs = set()
-        for r in results:
-            doc_id = r.metadata.get("doc_id")
-            if doc_id and doc_id not in seen_docs:
-                seen_docs.add(doc_id)
-                source_docs.append(doc_id)
-
-        # If LLM not available, return formatted context
         if not self.is_available():
+            context = _format_context(results)
             return SynthesisResult(
                 answer=f"[LLM not available - raw context]\n\n{context}",
-                citations=[
-                    format_citation(
-                        RetrievalResult(
-                            id=r.id, text=r.text, metadata=r.metadata, score=r.score
-                        )
-                    )
-                    for r in results
-                ],
+                citations=_result_citations(results),
                 model="none",
                 context_chunks=len(results),
-                source_docs=source_docs,
+                source_docs=_source_docs(results),
+            )
+        return None
+
+    def _result(
+        self, answer: str, results: List[Union[HybridResult, RetrievalResult]]
+    ) -> SynthesisResult:
+        return SynthesisResult(
+            answer=answer,
+            citations=_result_citations(results),
+            model=self.model,
+            context_chunks=len(results),
+            source_docs=_source_docs(results),
+        )
+
+    def _cache_lookup(
+        self, question: str, results: List[Union[HybridResult, RetrievalResult]]
+    ) -> Tuple[Optional[str], Optional[SynthesisResult]]:
+        """Return (cache key, cached result or None); no key without a cache."""
+        if self.cache is None:
+            return None, None
+        with timing.span("answer_cache"):
+            key = answer_key(
+                question, results, self.provider, self.model, self.temperature
+            )
+            cached = self.cache.get(key)
+        return key, SynthesisResult(**cached) if cached is not None else None
+
+    def _cache_store(
+        self, key: Optional[str], question: str, result: SynthesisResult
+    ) -> None:
+        if self.cache is not None and key is not None:
+            self.cache.put(
+                key,
+                asdict(result),
+                question=question,
+                provider=self.provider,
+                model=self.model,
             )
 
-        # Build prompt
-        prompt = ChatPromptTemplate.from_messages(
+    def _build_chain(self):
+        """Compose the RAG prompt with the provider's chat model."""
+        prompt = langchain_prompts.ChatPromptTemplate.from_messages(
             [
                 ("system", SYSTEM_PROMPT),
                 ("human", RAG_PROMPT_TEMPLATE),
             ]
         )
+        return prompt | self._llm
 
-        # Generate response
-        try:
-            chain = prompt | self._llm
-            response = chain.invoke(
-                {
-                    "context": context,
-                    "question": question,
-                }
-            )
-            answer = response.content
-        except Exception as e:
-            answer = f"Error generating response: {e}\n\nContext:\n{context}"
+    def synthesize(
+        self,
+        question: str,
+        results: Optional[List[Union[HybridResult, RetrievalResult]]] = None,
+        top_k: int = 5,
+        expand_graph: bool = True,
+        packed: bool = False,
+    ) -> SynthesisResult:
+        """
+        Synthesize an answer from retrieved chunks.
 
-        # Extract citations
-        citations = []
-        for r in results:
-            rr = RetrievalResult(
-                id=r.id, text=r.text, metadata=r.metadata, score=r.score
-            )
-            citations.append(format_citation(rr))
+        Args:
+            question: User's question.
+            results: Pre-fetched retrieval results. If None, fetches via retriever.
+            top_k: Number of chunks to retrieve (if results not provided).
+            expand_graph: Whether to use graph expansion.
+            packed: results already come from retrieve_context; use them
+                as the context without expanding or packing again.
 
-        return SynthesisResult(
-            answer=answer,
-            citations=citations,
-            model=self.model,
-            context_chunks=len(results),
-            source_docs=source_docs,
-        )
+        Returns:
+            SynthesisResult with answer, citations, and metadata.
+        """
+        with timing.trace("synthesize", provider=self.provider):
+            results = self._retrieve(question, results, top_k, expand_graph, packed)
+            fallback = self._fallback(results)
+            if fallback is not None:
+                return fallback
+            key, cached = self._cache_lookup(question, results)
+            if cached is not None:
+                return cached
+
+            with timing.span("prompt_build"):
+                context = _format_context(results)
+
+            # Generate response
+            try:
+                with timing.span("llm", model=self.model):
+                    response = self._build_chain().invoke(
+                        {
+                            "context": context,
+                            "question": question,
+                        }
+                    )
+                answer = _message_text(response)
+            except Exception as e:
+                answer = f"Error generating response: {e}\n\nContext:\n{context}"
+                key = None  # Never cache failures
+
+            result = self._result(answer, results)
+            self._cache_store(key, question, result)
+            return result
+
+    def synthesize_stream(
+        self,
+        question: str,
+        results: Optional[List[Union[HybridResult, RetrievalResult]]] = None,
+        top_k: int = 5,
+        expand_graph: bool = True,
+        packed: bool = False,
+    ) -> Iterator[Union[str, SynthesisResult]]:
+        """
+        Synthesize an answer, yielding text as the provider generates it.
+
+        Takes the same arguments as synthesize(). Yields answer text
+        fragments (str) followed by exactly one SynthesisResult whose
+        answer is the concatenated text, with citations and source docs.
+        Without context or an available LLM the whole fallback answer is
+        yielded as a single fragment.
+        """
+        # A generator must not hold a context variable across yields, so the
+        # trace is only activated around the synchronous stages.
+        run = timing.begin("synthesize_stream")
+        try:
+            with timing.activate(run):
+                results = self._retrieve(question, results, top_k, expand_graph, packed)
+                fallback = self._fallback(results)
+                if fallback is None:
+                    key, fallback = self._cache_lookup(question, results)
+            if fallback is not None:
+                yield fallback.answer
+                yield fallback
+                return
+
+            with timing.activate(run):
+                with timing.span("prompt_build"):
+                    context = _format_context(results)
+            parts: List[str] = []
+            recorder = run or timing.current()
+            started = recorder.elapsed() if recorder is not None else 0.0
+            try:
+                chain = self._build_chain()
+                for chunk in chain.stream({"context": context, "question": question}):
+                    text = _message_text(chunk)
+                    if text:
+                        if not parts and recorder is not None:
+                            recorder.record("llm_first_token", started)
+                        parts.append(text)
+                        yield text
+            except Exception as e:
+                if parts:
+                    error = f"\n\n[Response interrupted: {e}]"
+                else:
+                    error = f"Error generating response: {e}\n\nContext:\n{context}"
+                parts.append(error)
+                key = None  # Never cache failures
+                yield error
+            if recorder is not None:
+                recorder.record("llm", started, model=self.model)
+
+            result = self._result("".join(parts), results)
+            self._cache_store(key, question, result)
+            yield result
+        finally:
+            if run is not None:
+                run.finish()
 
     def close(self):
-        """Close retriever resources."""
+        """Close retriever and answer cache resources."""
         if self.retriever is not None:
             self.retriever.close()
+        if self.cache is not None:
+            self.cache.close()
 
 
 def synthesize_answer(
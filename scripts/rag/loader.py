@@ -38,18 +38,19 @@ Example:
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Any, Union, List
+from typing import TYPE_CHECKING, Dict, Any, Union, List
 import re
 
 import yaml
 
-try:
-    from llama_index.core import Document as LlamaDocument
+from scripts.rag.lazy_imports import LazyModule, module_available
+
+# Imported on first use; llama_index.core dominates CLI startup time
+llama_core = LazyModule("llama_index.core", "Install with: pip install llama-index")
+LLAMA_INDEX_AVAILABLE = module_available("llama_index.core")
 
-    LLAMA_INDEX_AVAILABLE = True
-except ImportError:
-    LLAMA_INDEX_AVAILABLE = False
-    LlamaDocument = None
+if TYPE_CHECKING:
+    from llama_index.core import Document as LlamaDocument
 
 
 @dataclass
@@ -68,6 +69,9 @@ class GovernanceDocument:
     source_path: Union[str, Path] = ""
 
 
+# libyaml-backed loader when available: identical output, several times faster
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 # Regex pattern for YAML frontmatter (between --- delimiters)
 FRONTMATTER_PATTERN = re.compile(r"^---\s*\n(.*?)\n---\s*\n?", re.DOTALL | re.MULTILINE)
 
@@ -101,7 +105,7 @@ def extract_frontmatter(content: str) -> tuple[Dict[str, Any], str]:
     remaining_content = content[match.end() :]
 
     try:
-        metadata = yaml.safe_load(frontmatter_yaml)
+        metadata = yaml.load(frontmatter_yaml, Loader=_YAML_LOADER)
         if metadata is None:
             metadata = {}
     except yaml.YAMLError:
@@ -151,6 +155,35 @@ def load_governance_document(path: Union[str, Path]) -> GovernanceDocument:
     )
 
 
+def flatten_metadata(doc: GovernanceDocument) -> Dict[str, Any]:
+    """
+    Flatten document metadata for vector store compatibility.
+
+    Lists become strings, None becomes "", and the standard doc_id,
+    doc_title and doc_type fields expected downstream are added.
+
+    Args:
+        doc: GovernanceDocument whose frontmatter to flatten.
+
+    Returns:
+        New metadata dict (the document is not modified).
+    """
+    flat_metadata: Dict[str, Any] = {}
+    for key, value in doc.metadata.items():
+        if isinstance(value, list):
+            flat_metadata[key] = str(value)
+        elif value is None:
+            flat_metadata[key] = ""
+        else:
+            flat_metadata[key] = value
+
+    # Add standard fields expected by downstream components
+    flat_metadata["doc_id"] = doc.metadata.get("id", "")
+    flat_metadata["doc_title"] = doc.metadata.get("title", "")
+    flat_metadata["doc_type"] = doc.metadata.get("type", "")
+    return flat_metadata
+
+
 def to_llama_document(doc: GovernanceDocument) -> "LlamaDocument":
     """
     Convert a GovernanceDocument to a LlamaIndex Document.
@@ -178,24 +211,9 @@ def to_llama_document(doc: GovernanceDocument) -> "LlamaDocument":
             "llama-index is not installed. Install with: pip install llama-index"
         )
 
-    # Flatten metadata for vector store compatibility
-    flat_metadata = {}
-    for key, value in doc.metadata.items():
-        if isinstance(value, list):
-            flat_metadata[key] = str(value)
-        elif value is None:
-            flat_metadata[key] = ""
-        else:
-            flat_metadata[key] = value
-
-    # Add standard fields expected by downstream components
-    flat_metadata["doc_id"] = doc.metadata.get("id", "")
-    flat_metadata["doc_title"] = doc.metadata.get("title", "")
-    flat_metadata["doc_type"] = doc.metadata.get("type", "")
-
-    return LlamaDocument(
+    return llama_core.Document(
         text=doc.content,
-        metadata=flat_metadata,
+        metadata=flatten_metadata(doc),
         doc_id=doc.metadata.get("id", str(doc.source_path)),
     )
 
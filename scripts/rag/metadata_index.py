@@ -0,0 +1,561 @@
+#!/usr/bin/env python3
+"""
+---
+id: SCRIPT-0099
+type: script
+owner: platform-team
+status: active
+maturity: 1
+last_validated: 2026-10-18
+test:
+  runner: pytest
+  command: "pytest -q tests/unit/test_metadata_index.py"
+  evidence: declared
+dry_run:
+  supported: true
+risk_profile:
+  production_impact: low
+  security_risk: low
+  coupling_risk: low
+relates_to:
+  - PRD-0008-governance-rag-pipeline
+  - SCRIPT-0073-retriever
+  - SCRIPT-0078-index-build
+  - SCRIPT-0088-lexical-index
+---
+Purpose: Inverted index over document metadata and a filter compiler.
+
+Chunk metadata in the vector store is flat: list fields such as
+relates_to, tags and dependencies are stored as str(list), so "chunks of
+documents that relate to ADR-0186" cannot be expressed as a where filter.
+This index keeps the frontmatter structured instead:
+
+    field -> value -> doc_ids     (list fields: one entry per item)
+    doc_id -> chunk_ids
+
+Values are normalized to strings (dates as ISO 8601, booleans as
+true/false, nested mappings as dotted keys such as reliability.maturity),
+and slug values like ADR-0186-llamaindex-retrieval-layer are also indexed
+under their id (ADR-0186).
+
+Filters use the ChromaDB where syntax, extended for metadata:
+
+    {"relates_to": "ADR-0186"}                    list membership
+    {"relates_to": {"$contains": "ADR-0186"}}     same, explicitly
+    {"type": {"$in": ["policy", "governance"]}}
+    {"effective_date": {"$gte": "2026-01-01"}}    ISO date range
+    {"$and": [...]}, {"$or": [...]}
+
+compile_filter resolves every predicate on an indexed field to a
+candidate doc_id set before vector scoring; the rest (chunk-level fields
+such as section) stay in the where clause passed to the vector store.
+Without an index, filters pass through unchanged.
+
+index_build maintains the index next to the vector store
+(.chroma/metadata_index.json.gz); GovernanceRetriever loads it lazily on
+the first filtered query.
+
+Example:
+    >>> from scripts.rag.metadata_index import compile_filter, parse_filters
+    >>> filters = parse_filters("relates_to=ADR-0186; effective_date>=2026-01-01")
+    >>> compiled = compile_filter(filters, index)
+    >>> compiled.where
+    {'doc_id': {'$in': ['GOV-0017-tdd-and-determinism', ...]}}
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+import gzip
+import json
+import os
+import re
+
+from scripts.rag.indexer import DEFAULT_PERSIST_DIR
+from scripts.rag.loader import GovernanceDocument
+
+
+METADATA_INDEX_FILENAME = "metadata_index.json.gz"
+METADATA_INDEX_VERSION = 1
+DEFAULT_METADATA_INDEX_PATH = Path(DEFAULT_PERSIST_DIR) / METADATA_INDEX_FILENAME
+
+DOC_ID_KEY = "doc_id"
+
+# Governance ids at the start of a slug: ADR-0186-llamaindex-... -> ADR-0186
+_ID_PREFIX_PATTERN = re.compile(r"^([A-Z]+-\d+)-")
+
+_MEMBERSHIP_OPS = ("$eq", "$contains", "$in")
+_NEGATED_OPS = {"$ne": "$eq", "$nin": "$in"}
+_RANGE_OPS = ("$gt", "$gte", "$lt", "$lte")
+_FILTER_OPS = _MEMBERSHIP_OPS + tuple(_NEGATED_OPS) + _RANGE_OPS
+# Operators ChromaDB cannot evaluate on flattened metadata
+_INDEX_ONLY_OPS = ("$contains",)
+
+# key=value, key!=value, key>=value, key in a,b, key not in a,b
+_EXPRESSION_PATTERN = re.compile(
+    r"^\s*([\w.\-]+)\s*(!=|>=|<=|=|>|<|\s+not\s+in\s+|\s+in\s+)\s*(.*?)\s*$",
+    re.IGNORECASE,
+)
+_EXPRESSION_OPS = {
+    "!=": "$ne",
+    ">=": "$gte",
+    "<=": "$lte",
+    ">": "$gt",
+    "<": "$lt",
+    "in": "$in",
+    "not in": "$nin",
+}
+_NUMBER_PATTERN = re.compile(r"-?\d+(\.\d+)?")
+
+
+def normalize_value(value: Any) -> str:
+    """String form under which a metadata value is indexed and matched."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value).strip()
+
+
+def _variants(value: str) -> List[str]:
+    match = _ID_PREFIX_PATTERN.match(value)
+    return [value, match.group(1)] if match else [value]
+
+
+def document_fields(doc: GovernanceDocument) -> Dict[str, List[str]]:
+    """
+    Structured, normalized metadata of a document for the index.
+
+    Args:
+        doc: Loaded governance document.
+
+    Returns:
+        {field: [values]} including the doc_id, doc_title and doc_type
+        fields that flatten_metadata adds to every chunk.
+    """
+    fields: Dict[str, List[str]] = {}
+
+    def visit(field: str, value: Any) -> None:
+        if isinstance(value, dict):
+            for key, item in value.items():
+                visit(f"{field}.{key}", item)
+        elif isinstance(value, (list, tuple, set)):
+            for item in value:
+                visit(field, item)
+        elif value is not None and value != "":
+            values = fields.setdefault(field, [])
+            for variant in _variants(normalize_value(value)):
+                if variant not in values:
+                    values.append(variant)
+
+    for key, value in doc.metadata.items():
+        visit(str(key), value)
+    for field, key in (("doc_id", "id"), ("doc_title", "title"), ("doc_type", "type")):
+        fields.pop(field, None)
+        visit(field, doc.metadata.get(key))
+    return fields
+
+
+def _sort_key(value: Any) -> Tuple[int, Any]:
+    """Numbers compare numerically, everything else (ISO dates) as text."""
+    text = normalize_value(value)
+    if _NUMBER_PATTERN.fullmatch(text):
+        return (0, float(text))
+    return (1, text)
+
+
+def _in_range(value: str, op: str, operand: Any) -> bool:
+    left, right = _sort_key(value), _sort_key(operand)
+    if left[0] != right[0]:
+        return False
+    if op == "$gt":
+        return left > right
+    if op == "$gte":
+        return left >= right
+    if op == "$lt":
+        return left < right
+    return left <= right
+
+
+class MetadataIndex:
+    """
+    Inverted index from document metadata values to doc ids and chunk ids.
+
+    Attributes:
+        path: Gzipped JSON file the index is loaded from and saved to.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        self.path = Path(path) if path else None
+        self._documents: Dict[str, Dict[str, List[str]]] = {}  # doc -> fields
+        self._chunks: Dict[str, List[str]] = {}  # doc_id -> chunk ids
+        self._postings: Dict[str, Dict[str, Set[str]]] = {}  # field -> value -> docs
+        self._dirty = False
+        if self.path is not None:
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    # -- persistence -------------------------------------------------------
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            with gzip.open(self.path, "rt", encoding="utf-8") as handle:
+                data = json.load(handle)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != METADATA_INDEX_VERSION:
+            return
+        for doc_id, entry in data["documents"].items():
+            self._insert(doc_id, entry["fields"], entry["chunks"])
+
+    def save(self) -> None:
+        """Write the index to path, if configured and modified."""
+        if self.path is None or not self._dirty:
+            return
+        payload = {
+            "version": METADATA_INDEX_VERSION,
+            "documents": {
+                doc_id: {
+                    "fields": self._documents[doc_id],
+                    "chunks": self._chunks[doc_id],
+                }
+                for doc_id in sorted(self._documents)
+            },
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as handle:
+            json.dump(payload, handle, separators=(",", ":"), sort_keys=True)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+    # -- updates -----------------------------------------------------------
+
+    def _insert(
+        self, doc_id: str, fields: Dict[str, List[str]], chunk_ids: List[str]
+    ) -> None:
+        self._documents[doc_id] = fields
+        self._chunks[doc_id] = chunk_ids
+        for field, values in fields.items():
+            postings = self._postings.setdefault(field, {})
+            for value in values:
+                postings.setdefault(value, set()).add(doc_id)
+
+    def add(
+        self,
+        doc_id: str,
+        fields: Dict[str, List[str]],
+        chunk_ids: Iterable[str],
+    ) -> None:
+        """Index a document's fields and chunk ids, replacing any entry."""
+        if not doc_id:
+            return
+        self.remove([doc_id])
+        self._insert(
+            doc_id,
+            {field: list(values) for field, values in fields.items()},
+            list(chunk_ids),
+        )
+        self._dirty = True
+
+    def remove(self, doc_ids: Iterable[str]) -> int:
+        """Remove documents by id; returns the number removed."""
+        removed = 0
+        for doc_id in set(doc_ids):
+            fields = self._documents.pop(doc_id, None)
+            if fields is None:
+                continue
+            del self._chunks[doc_id]
+            for field, values in fields.items():
+                postings = self._postings[field]
+                for value in values:
+                    postings[value].discard(doc_id)
+                    if not postings[value]:
+                        del postings[value]
+                if not postings:
+                    del self._postings[field]
+            removed += 1
+        if removed:
+            self._dirty = True
+        return removed
+
+    def clear(self) -> None:
+        """Drop every indexed document."""
+        self._documents.clear()
+        self._chunks.clear()
+        self._postings.clear()
+        self._dirty = True
+
+    # -- lookups -----------------------------------------------------------
+
+    def has_field(self, field: str) -> bool:
+        """True if any indexed document has the field."""
+        return field in self._postings
+
+    def doc_ids(self) -> Set[str]:
+        """Every indexed doc id."""
+        return set(self._documents)
+
+    def chunk_ids(self, doc_ids: Iterable[str]) -> Set[str]:
+        """Chunk ids of the given documents."""
+        return {
+            chunk_id for doc_id in doc_ids for chunk_id in self._chunks.get(doc_id, ())
+        }
+
+    def match(self, field: str, op: str, operand: Any) -> Set[str]:
+        """
+        Doc ids whose field satisfies one operator.
+
+        A document matches $eq/$contains/$in if any of its values does,
+        $ne/$nin if it has the field and none of its values does, and a
+        range if any value falls inside it. Documents without the field
+        never match, as in ChromaDB.
+
+        Raises:
+            ValueError: For an unknown operator or a non-list $in operand.
+        """
+        postings = self._postings.get(field, {})
+        if op in _NEGATED_OPS:
+            present: Set[str] = set().union(*postings.values())
+            return present - self.match(field, _NEGATED_OPS[op], operand)
+        if op in ("$eq", "$contains"):
+            return set(postings.get(normalize_value(operand), ()))
+        if op == "$in":
+            if not isinstance(operand, (list, tuple, set)):
+                raise ValueError(f"$in on {field!r} needs a list, got {operand!r}")
+            found: Set[str] = set()
+            for item in operand:
+                found |= postings.get(normalize_value(item), set())
+            return found
+        if op in _RANGE_OPS:
+            found = set()
+            for value, docs in postings.items():
+                if _in_range(value, op, operand):
+                    found |= docs
+            return found
+        raise ValueError(f"Unknown filter operator {op!r} (expected {_FILTER_OPS})")
+
+    def stats(self) -> Dict[str, int]:
+        """Return document, chunk and field counts."""
+        return {
+            "documents": len(self._documents),
+            "chunks": sum(len(chunks) for chunks in self._chunks.values()),
+            "fields": len(self._postings),
+        }
+
+
+def load_metadata_index(
+    path: Optional[Union[str, Path]] = DEFAULT_METADATA_INDEX_PATH,
+) -> Optional[MetadataIndex]:
+    """Load a persisted metadata index, or return None if none has been built."""
+    if not path or not Path(path).exists():
+        return None
+    return MetadataIndex(path)
+
+
+# -- filters ----------------------------------------------------------------
+
+
+def _clauses(filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Split a where filter into single-key clauses that must all hold."""
+    clauses: List[Dict[str, Any]] = []
+    for key, value in filters.items():
+        if key == "$and":
+            for item in value:
+                clauses.extend(_clauses(item))
+        else:
+            clauses.append({key: value})
+    return clauses
+
+
+def _conditions(condition: Any) -> List[Tuple[str, Any]]:
+    if isinstance(condition, dict):
+        return list(condition.items())
+    return [("$eq", condition)]
+
+
+def _resolve(clause: Dict[str, Any], index: MetadataIndex) -> Optional[Set[str]]:
+    """Doc ids matching a clause, or None if the index cannot answer it."""
+    [(key, value)] = clause.items()
+    if key == "$or":
+        found: Set[str] = set()
+        for item in value:
+            docs = _resolve_all(_clauses(item), index)
+            if docs is None:
+                return None
+            found |= docs
+        return found
+    if not index.has_field(key):
+        return None  # chunk-level field (section, chunk_index, ...)
+    docs: Optional[Set[str]] = None
+    for op, operand in _conditions(value):
+        matched = index.match(key, op, operand)
+        docs = matched if docs is None else docs & matched
+    return docs if docs is not None else set()
+
+
+def _resolve_all(
+    clauses: List[Dict[str, Any]], index: MetadataIndex
+) -> Optional[Set[str]]:
+    docs: Optional[Set[str]] = None
+    for clause in clauses:
+        matched = _resolve(clause, index)
+        if matched is None:
+            return None
+        docs = matched if docs is None else docs & matched
+    return docs
+
+
+def _check_native(filters: Dict[str, Any]) -> None:
+    """Reject operators that only the metadata index can evaluate."""
+    for key, value in filters.items():
+        if key in ("$and", "$or"):
+            for item in value:
+                _check_native(item)
+            continue
+        for op, operand in _conditions(value):
+            numeric = isinstance(operand, (int, float)) and not isinstance(
+                operand, bool
+            )
+            if op in _INDEX_ONLY_OPS or (op in _RANGE_OPS and not numeric):
+                raise ValueError(
+                    f"Filter {key} {op} {operand!r} needs the metadata index; "
+                    "run scripts/rag/index_build.py to build it"
+                )
+
+
+def _combine(clauses: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    if not clauses:
+        return None
+    if len(clauses) == 1:
+        return clauses[0]
+    return {"$and": clauses}
+
+
+@dataclass
+class CompiledFilter:
+    """
+    A filter split into an index-resolved candidate set and a residual.
+
+    Attributes:
+        where: ChromaDB where filter to pass to the vector store (None:
+            unfiltered).
+        doc_ids: Candidate doc ids from the metadata index (None: not
+            restricted by the index).
+        chunk_ids: Candidate chunk ids for doc_ids (None: unrestricted).
+    """
+
+    where: Optional[Dict[str, Any]] = None
+    doc_ids: Optional[Set[str]] = None
+    chunk_ids: Optional[Set[str]] = None
+
+    @property
+    def empty(self) -> bool:
+        """True if no chunk can match; vector search can be skipped."""
+        return self.doc_ids is not None and not self.doc_ids
+
+
+def compile_filter(
+    filters: Optional[Dict[str, Any]], index: Optional[MetadataIndex] = None
+) -> CompiledFilter:
+    """
+    Resolve document-level predicates against the metadata index.
+
+    Clauses on indexed fields become one doc_id $in condition; clauses on
+    other fields are kept as they are and ANDed with it.
+
+    Args:
+        filters: ChromaDB-style where filter (see module docstring).
+        index: Metadata index; None passes filters through unchanged.
+
+    Returns:
+        CompiledFilter for the vector store.
+
+    Raises:
+        ValueError: If filters use $contains or a non-numeric range and no
+            index can resolve them, or use an unknown operator.
+    """
+    if not filters:
+        return CompiledFilter()
+    if index is None or not len(index):
+        _check_native(filters)
+        return CompiledFilter(where=filters)
+
+    docs: Optional[Set[str]] = None
+    residual: List[Dict[str, Any]] = []
+    for clause in _clauses(filters):
+        matched = _resolve(clause, index)
+        if matched is None:
+            residual.append(clause)
+        else:
+            docs = matched if docs is None else docs & matched
+    if docs is None:
+        _check_native(filters)
+        return CompiledFilter(where=filters)
+    if not docs:
+        return CompiledFilter(doc_ids=set(), chunk_ids=set())
+    _check_native({"$and": residual})
+    if docs != index.doc_ids():
+        ordered = sorted(docs)
+        residual.insert(
+            0,
+            {DOC_ID_KEY: ordered[0]}
+            if len(ordered) == 1
+            else {DOC_ID_KEY: {"$in": ordered}},
+        )
+    return CompiledFilter(
+        where=_combine(residual), doc_ids=docs, chunk_ids=index.chunk_ids(docs)
+    )
+
+
+def _coerce(text: str) -> Any:
+    if _NUMBER_PATTERN.fullmatch(text):
+        return float(text) if "." in text else int(text)
+    return text
+
+
+def parse_filters(text: Optional[str]) -> Optional[Dict[str, Any]]:
+    """
+    Parse "; "-separated filter expressions into a where filter.
+
+    Supported forms: key=value, key!=value, key>value, key>=value,
+    key<value, key<=value, key in a,b and key not in a,b. key=value keeps
+    the value as a string; comparison operands that look like numbers are
+    converted.
+
+    Args:
+        text: e.g. "relates_to=ADR-0186; effective_date>=2026-01-01".
+
+    Returns:
+        Where filter, or None if text is empty or a single string without
+        any operator.
+
+    Raises:
+        ValueError: If an expression cannot be parsed.
+    """
+    if not text:
+        return None
+    expressions = [e for e in text.split(";") if e.strip()]
+    if len(expressions) == 1 and not _EXPRESSION_PATTERN.match(expressions[0]):
+        if not re.search(r"[=<>]|\sin\s", expressions[0], re.IGNORECASE):
+            return None
+    clauses: List[Dict[str, Any]] = []
+    for expression in expressions:
+        match = _EXPRESSION_PATTERN.match(expression)
+        if not match:
+            raise ValueError(f"Invalid filter expression: {expression.strip()!r}")
+        key, symbol, value = match.groups()
+        symbol = " ".join(symbol.lower().split())
+        if symbol == "=":
+            clauses.append({key: value})
+        elif symbol in ("in", "not in"):
+            items = [item.strip() for item in value.split(",") if item.strip()]
+            clauses.append({key: {_EXPRESSION_OPS[symbol]: items}})
+        else:
+            clauses.append({key: {_EXPRESSION_OPS[symbol]: _coerce(value)}})
+    return _combine(clauses)
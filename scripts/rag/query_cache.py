@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+---
+id: SCRIPT-0086
+type: script
+owner: platform-team
+status: active
+maturity: 1
+last_validated: 2026-10-18
+test:
+  runner: pytest
+  command: "pytest -q tests/unit/test_query_cache.py"
+  evidence: declared
+dry_run:
+  supported: true
+risk_profile:
+  production_impact: low
+  security_risk: low
+  coupling_risk: low
+relates_to:
+  - PRD-0008-governance-rag-pipeline
+  - GOV-0017-tdd-and-determinism
+  - SCRIPT-0073-retriever
+---
+Purpose: LRU + TTL cache for retrieval results and query embeddings.
+
+Entries are keyed by normalized query text, top_k, filters and the index
+source_sha. The cache watches the index artifacts inside the vector store
+directory (the build manifest, chroma.sqlite3 and flat store.json files)
+and drops every entry when any of them changes, so a rebuilt index never
+serves stale results. GovernanceRetriever points the cache at its
+persist_dir; until an index artifact can be read the cache is bypassed.
+
+An optional persist_path keeps results across processes (e.g. repeated CLI
+invocations); the file is discarded when the index artifacts differ.
+
+Example:
+    >>> from scripts.rag.query_cache import QueryCache
+    >>> from scripts.rag.retriever import GovernanceRetriever
+    >>> retriever = GovernanceRetriever(cache=QueryCache())
+    >>> retriever.query("What is TDD?")  # miss
+    >>> retriever.query("what is  TDD?")  # hit
+    >>> retriever.cache.stats()["hits"]
+    1
+"""
+
+from collections import OrderedDict
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+import json
+import os
+import time
+
+from scripts.rag.index_manifest import MANIFEST_FILENAME
+from scripts.rag.index_metadata import DEFAULT_INDEX_METADATA_PATH, read_index_metadata
+from scripts.rag.indexer import DEFAULT_PERSIST_DIR
+from scripts.rag.retriever import RetrievalResult
+
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_TTL_SECONDS = 900.0
+DEFAULT_QUERY_CACHE_PATH = Path(DEFAULT_PERSIST_DIR) / "query_cache.json"
+
+CACHE_VERSION = 2
+
+# Files whose stat signature identifies the index build in a persist dir
+_INDEX_ARTIFACTS = (MANIFEST_FILENAME, "chroma.sqlite3", "flat/*/store.json")
+
+Signature = Tuple[Tuple[str, int, int], ...]
+
+
+def normalize_query(text: str) -> str:
+    """Collapse whitespace and case so trivially different queries share a key."""
+    return " ".join(text.split()).casefold()
+
+
+def _filters_key(filters: Optional[Dict[str, Any]]) -> str:
+    return json.dumps(filters or {}, sort_keys=True, default=str)
+
+
+class QueryCache:
+    """
+    In-memory LRU + TTL cache for GovernanceRetriever.
+
+    Attributes:
+        max_entries: Maximum cached result sets (and query embeddings).
+        ttl_seconds: Lifetime of a cached entry.
+        index_dir: Vector store directory whose artifacts are watched for
+            invalidation (set by GovernanceRetriever when left as None).
+        metadata_path: Index metadata artifact that provides source_sha.
+        persist_path: Optional JSON file used to share results across runs.
+        hits: Result lookups served from the cache.
+        misses: Result lookups that went to the vector store.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        index_dir: Optional[Union[str, Path]] = None,
+        metadata_path: Optional[Union[str, Path]] = DEFAULT_INDEX_METADATA_PATH,
+        persist_path: Optional[Union[str, Path]] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.index_dir = Path(index_dir) if index_dir else None
+        self.metadata_path = Path(metadata_path) if metadata_path else None
+        self.persist_path = Path(persist_path) if persist_path else None
+        self.hits = 0
+        self.misses = 0
+        self.embedding_hits = 0
+        self.embedding_misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._clock = clock
+        self._results: "OrderedDict[Tuple, Tuple[float, List[RetrievalResult]]]" = (
+            OrderedDict()
+        )
+        self._embeddings: "OrderedDict[str, Tuple[float, List[float]]]" = OrderedDict()
+        self._signature: Optional[Signature] = None
+        self._source_sha = "unknown"
+        self._check_index()
+        self._load()
+
+    # -- invalidation ------------------------------------------------------
+
+    def watch(self, index_dir: Union[str, Path]) -> None:
+        """Watch the index artifacts in index_dir and load persisted entries."""
+        self.index_dir = Path(index_dir)
+        self._check_index()
+        self._load()
+
+    def _index_signature(self) -> Optional[Signature]:
+        if self.index_dir is None:
+            return None
+        signature = []
+        for pattern in _INDEX_ARTIFACTS:
+            for path in sorted(self.index_dir.glob(pattern)):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                name = path.relative_to(self.index_dir).as_posix()
+                signature.append((name, stat.st_mtime_ns, stat.st_size))
+        return tuple(signature) or None
+
+    @property
+    def enabled(self) -> bool:
+        """False while no index artifact can be read; lookups then bypass."""
+        return self._signature is not None
+
+    def _check_index(self) -> None:
+        """Drop all entries if the index artifacts changed."""
+        signature = self._index_signature()
+        if signature == self._signature:
+            return
+        if self._signature is not None or self._results:
+            self.invalidations += 1
+        self._signature = signature
+        self._results.clear()
+        self._embeddings.clear()
+        metadata = (
+            read_index_metadata(self.metadata_path)
+            if signature and self.metadata_path
+            else None
+        )
+        self._source_sha = (metadata or {}).get("source_sha") or "unknown"
+
+    @property
+    def source_sha(self) -> str:
+        """source_sha of the index the cached entries belong to."""
+        return self._source_sha
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._results.clear()
+        self._embeddings.clear()
+        if self.persist_path is not None and self.persist_path.exists():
+            self.persist_path.unlink()
+
+    # -- results -----------------------------------------------------------
+
+    def key(
+        self, query: str, top_k: int, filters: Optional[Dict[str, Any]] = None
+    ) -> Tuple:
+        """Cache key for a retrieval request."""
+        return (normalize_query(query), top_k, _filters_key(filters), self._source_sha)
+
+    def get(
+        self, query: str, top_k: int, filters: Optional[Dict[str, Any]] = None
+    ) -> Optional[List[RetrievalResult]]:
+        """Return cached results, or None on a miss."""
+        self._check_index()
+        if not self.enabled:
+            self.misses += 1
+            return None
+        key = self.key(query, top_k, filters)
+        entry = self._results.get(key)
+        if entry is None or entry[0] <= self._clock():
+            if entry is not None:
+                del self._results[key]
+            self.misses += 1
+            return None
+        self._results.move_to_end(key)
+        self.hits += 1
+        return list(entry[1])
+
+    def put(
+        self,
+        query: str,
+        top_k: int,
+        filters: Optional[Dict[str, Any]],
+        results: List[RetrievalResult],
+        save: bool = True,
+    ) -> None:
+        """Store results for a retrieval request (save=False defers persisting)."""
+        self._check_index()
+        if not self.enabled:
+            return
+        key = self.key(query, top_k, filters)
+        self._results[key] = (self._clock() + self.ttl_seconds, list(results))
+        self._results.move_to_end(key)
+        self._evict(self._results)
+        if save:
+            self.save()
+
+    # -- query embeddings --------------------------------------------------
+
+    def embed(self, query: str, embedding_function: Callable) -> List[float]:
+        """Return the query embedding, calling embedding_function on a miss."""
+        return self.embed_many([query], embedding_function)[0]
+
+    def embed_many(
+        self, queries: List[str], embedding_function: Callable
+    ) -> List[Optional[List[float]]]:
+        """
+        Return embeddings for queries, embedding all misses in one call.
+
+        Blank queries yield None.
+        """
+        self._check_index()
+        if not self.enabled:
+            texts = [q for q in queries if q and q.strip()]
+            computed = iter(embedding_function(texts) if texts else [])
+            return [
+                [float(value) for value in next(computed)]
+                if query and query.strip()
+                else None
+                for query in queries
+            ]
+        now = self._clock()
+        vectors: List[Optional[List[float]]] = [None] * len(queries)
+        missing: Dict[str, List[int]] = {}
+        for i, query in enumerate(queries):
+            if not query or not query.strip():
+                continue
+            key = normalize_query(query)
+            entry = self._embeddings.get(key)
+            if entry is not None and entry[0] > now:
+                self._embeddings.move_to_end(key)
+                self.embedding_hits += 1
+                vectors[i] = entry[1]
+            else:
+                missing.setdefault(key, []).append(i)
+        if missing:
+            self.embedding_misses += len(missing)
+            texts = [queries[positions[0]] for positions in missing.values()]
+            computed = embedding_function(texts)
+            for (key, positions), vector in zip(missing.items(), computed):
+                vector = [float(value) for value in vector]
+                self._embeddings[key] = (now + self.ttl_seconds, vector)
+                for i in positions:
+                    vectors[i] = vector
+            self._evict(self._embeddings)
+        return vectors
+
+    def _evict(self, entries: OrderedDict) -> None:
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+            self.evictions += 1
+
+    # -- persistence -------------------------------------------------------
+
+    def _load(self) -> None:
+        if (
+            self.persist_path is None
+            or not self.enabled
+            or not self.persist_path.exists()
+        ):
+            return
+        try:
+            data = json.loads(self.persist_path.read_text())
+        except (OSError, ValueError):
+            return
+        if data.get("version") != CACHE_VERSION or data.get("signature") != [
+            list(item) for item in self._signature
+        ]:
+            return
+        now = self._clock()
+        for item in data.get("entries", []):
+            if item["expires_at"] <= now:
+                continue
+            results = [RetrievalResult(**result) for result in item["results"]]
+            self._results[tuple(item["key"])] = (item["expires_at"], results)
+        self._evict(self._results)
+
+    def save(self) -> None:
+        """Persist results to persist_path, if configured."""
+        if self.persist_path is None or not self.enabled:
+            return
+        payload = {
+            "version": CACHE_VERSION,
+            "signature": [list(item) for item in self._signature],
+            "entries": [
+                {
+                    "key": list(key),
+                    "expires_at": expires_at,
+                    "results": [asdict(result) for result in results],
+                }
+                for key, (expires_at, results) in self._results.items()
+            ],
+        }
+        try:
+            self.persist_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.persist_path.with_suffix(".json.tmp")
+            tmp_path.write_text(json.dumps(payload, default=str))
+            os.replace(tmp_path, self.persist_path)
+        except OSError:
+            pass  # Persistence is best-effort; the in-memory cache still works
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current sizes."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "embedding_hits": self.embedding_hits,
+            "embedding_misses": self.embedding_misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "enabled": self.enabled,
+            "entries": len(self._results),
+            "source_sha": self._source_sha,
+        }
@@ -0,0 +1,505 @@
+#!/usr/bin/env python3
+"""
+---
+id: SCRIPT-0089
+type: script
+owner: platform-team
+status: active
+maturity: 1
+last_validated: 2026-10-18
+test:
+  runner: pytest
+  command: "pytest -q tests/unit/test_query_server.py"
+  evidence: declared
+dry_run:
+  supported: false
+risk_profile:
+  production_impact: low
+  security_risk: low
+  coupling_risk: medium
+relates_to:
+  - PRD-0008-governance-rag-pipeline
+  - SCRIPT-0076-cli
+  - SCRIPT-0073-retriever
+  - SCRIPT-0079-hybrid-retriever
+---
+Purpose: Long-lived query daemon that keeps the RAG stack warm.
+
+A one-shot `gov-rag query` pays for importing chromadb, loading the
+embedding model, opening the PersistentClient and (with --synthesize)
+building the LLM chain before a millisecond lookup. The daemon keeps
+retrievers, the hybrid retriever and synthesizers alive and answers
+newline-delimited JSON requests over a unix socket; cli.main uses it
+transparently when the socket is present.
+
+Warm objects are dropped when reports/index_metadata.json changes, so a
+rebuilt index is picked up without restarting the daemon.
+
+Usage:
+    python -m scripts.rag.cli serve                 # foreground daemon
+    python -m scripts.rag.cli query "What is TDD?"  # uses the daemon
+    python -m scripts.rag.cli query "..." --no-server
+
+Protocol (one JSON object per line, one response line per request):
+    {"op": "query", "query": "...", "top_k": 5, "filters": {...},
+     "hybrid": false, "collection": null, "no_cache": false}
+    {"op": "batch", "queries": [...], ...same options...}
+    {"op": "synthesize", "query": "...", "top_k": 5, "provider": "ollama",
+     "no_cache": false}
+    {"op": "ping"} / {"op": "shutdown"}
+
+A synthesize request with "stream": true is answered with one
+{"ok": true, "token": "..."} line per text fragment followed by a final
+{"ok": true, "synthesis": {...}} line.
+"""
+
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+
+from scripts.rag.index_metadata import DEFAULT_INDEX_METADATA_PATH
+from scripts.rag.indexer import DEFAULT_PERSIST_DIR
+
+
+DEFAULT_SOCKET_PATH = Path(DEFAULT_PERSIST_DIR) / "query.sock"
+SOCKET_ENV_VAR = "RAG_QUERY_SOCKET"
+# Synthesis can wait on a remote LLM; connecting to a dead socket fails fast
+DEFAULT_CLIENT_TIMEOUT = 300.0
+
+
+def resolve_socket_path(socket_path: Optional[Union[str, Path]] = None) -> Path:
+    """Socket path from the argument, $RAG_QUERY_SOCKET, or the default."""
+    return Path(socket_path or os.getenv(SOCKET_ENV_VAR) or DEFAULT_SOCKET_PATH)
+
+
+def _result_to_wire(result: Any) -> Dict[str, Any]:
+    return {
+        "id": result.id,
+        "text": result.text,
+        "metadata": result.metadata,
+        "score": result.score,
+    }
+
+
+@dataclass
+class _WarmSynthesizer:
+    """A warm synthesizer, its lock, and the requests currently using it."""
+
+    synthesizer: Any
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    users: int = 0
+    retired: bool = False
+
+
+class QueryService:
+    """
+    Warm retrieval state shared by all daemon connections.
+
+    Requests are serialised with a lock; the daemon serves one developer
+    or script at a time, and the retrievers are not documented as
+    thread-safe. Each synthesizer has its own lock, taken only after the
+    service lock is released, so a long LLM call (or stream) does not
+    block queries.
+    """
+
+    def __init__(
+        self,
+        metadata_path: Optional[Union[str, Path]] = DEFAULT_INDEX_METADATA_PATH,
+    ):
+        self.metadata_path = Path(metadata_path) if metadata_path else None
+        self.requests = 0
+        self.reloads = 0
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+        self._signature: Optional[Tuple[int, int]] = None
+        self._retrievers: Dict[Tuple[Optional[str], bool], Any] = {}
+        self._hybrid: Dict[bool, Any] = {}
+        self._synthesizers: Dict[Tuple[str, Optional[str], bool], _WarmSynthesizer] = {}
+        self._check_index()
+
+    # -- warm objects ------------------------------------------------------
+
+    def _check_index(self) -> None:
+        """Drop warm objects when the index metadata artifact changes."""
+        signature = None
+        if self.metadata_path is not None:
+            try:
+                stat = self.metadata_path.stat()
+                signature = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                signature = None
+        if signature != self._signature:
+            if self._signature is not None:
+                self.reloads += 1
+            self._signature = signature
+            self.reset()
+
+    def reset(self) -> None:
+        """Close and forget every warm retriever and synthesizer."""
+        for hybrid in self._hybrid.values():
+            hybrid.close()
+        for warm in self._synthesizers.values():
+            warm.retired = True
+            if not warm.users:  # in-use ones are closed by the last user
+                warm.synthesizer.close()
+        self._synthesizers.clear()
+        self._retrievers.clear()
+        self._hybrid.clear()
+
+    @staticmethod
+    def _cache(cached: bool):
+        from scripts.rag.query_cache import QueryCache
+
+        return QueryCache() if cached else None
+
+    def _retriever(self, collection: Optional[str], cached: bool):
+        key = (collection, cached)
+        if key not in self._retrievers:
+            from scripts.rag.retriever import GovernanceRetriever
+
+            kwargs: Dict[str, Any] = {"usage_log_path": None}
+            if collection:
+                kwargs["collection_name"] = collection
+            self._retrievers[key] = GovernanceRetriever(
+                cache=self._cache(cached), **kwargs
+            )
+        return self._retrievers[key]
+
+    def _hybrid_retriever(self, cached: bool):
+        if cached not in self._hybrid:
+            from scripts.rag.hybrid_retriever import HybridRetriever
+            from scripts.rag.retriever import GovernanceRetriever
+
+            self._hybrid[cached] = HybridRetriever(
+                vector_retriever=GovernanceRetriever(cache=self._cache(cached))
+            )
+        return self._hybrid[cached]
+
+    def _synthesizer(self, provider: str, model: Optional[str], cached: bool = True):
+        key = (provider, model, cached)
+        if key not in self._synthesizers:
+            from scripts.rag.answer_cache import AnswerCache
+            from scripts.rag.llm_synthesis import RAGSynthesizer, check_provider_status
+
+            status = check_provider_status(provider)
+            provider_info = status["providers"].get(provider, {})
+            if not provider_info.get("available"):
+                raise LookupError(provider_info.get("error", "unknown"))
+            self._synthesizers[key] = _WarmSynthesizer(
+                RAGSynthesizer(
+                    provider=provider,
+                    model=model or provider_info.get("default_model"),
+                    cache=AnswerCache() if cached else None,
+                )
+            )
+        return self._synthesizers[key]
+
+    def _open_synthesizer(self, request: Dict[str, Any]) -> "_WarmSynthesizer":
+        """
+        Return the warm synthesizer for a request, holding its lock.
+
+        The service lock is only held for the lookup; the synthesizer's own
+        lock is taken after it is released, so a queued synthesis never
+        blocks queries. The caller must pass the result to
+        _close_synthesizer when synthesis finishes.
+
+        Raises:
+            LookupError: If the provider is unavailable.
+        """
+        with self._lock:
+            self.requests += 1
+            self._check_index()
+            warm = self._synthesizer(
+                request.get("provider") or "ollama",
+                request.get("model"),
+                not request.get("no_cache", False),
+            )
+            warm.users += 1  # keeps reset() from closing it under us
+        warm.lock.acquire()
+        return warm
+
+    def _close_synthesizer(self, warm: "_WarmSynthesizer") -> None:
+        """Release a synthesizer; close it if reset() retired it meanwhile."""
+        warm.lock.release()
+        with self._lock:
+            warm.users -= 1
+            if warm.retired and not warm.users:
+                warm.synthesizer.close()
+
+    def warm_up(self) -> None:
+        """Open the default collection and load its embedding model."""
+        retriever = self._retriever(None, True)
+        try:
+            retriever.collection.query(query_texts=["warm up"], n_results=1)
+        except Exception:
+            pass  # Empty or missing collection; first real query reports it
+        retriever.lexical_index()
+        retriever.metadata_index()
+
+    # -- requests ----------------------------------------------------------
+
+    def _run_query(self, request: Dict[str, Any], queries: List[str]) -> List[List]:
+        top_k = int(request.get("top_k", 5))
+        filters = request.get("filters")
+        cached = not request.get("no_cache", False)
+        if request.get("hybrid"):
+            hybrid = self._hybrid_retriever(cached)
+            return hybrid.query_many(queries, top_k=top_k, filters=filters)
+        retriever = self._retriever(request.get("collection"), cached)
+        return retriever.query_many(queries, top_k=top_k, filters=filters)
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer one protocol request; errors are returned, not raised."""
+        op = request.get("op")
+        if op == "synthesize":
+            return self._handle_synthesize(request)
+        with self._lock:
+            self.requests += 1
+            if op == "ping":
+                return {
+                    "ok": True,
+                    "pid": os.getpid(),
+                    "requests": self.requests,
+                    "reloads": self.reloads,
+                    "uptime": round(time.time() - self.started_at, 3),
+                }
+            self._check_index()
+            try:
+                if op == "query":
+                    batches = self._run_query(request, [request["query"]])
+                    return {
+                        "ok": True,
+                        "results": [_result_to_wire(r) for r in batches[0]],
+                    }
+                if op == "batch":
+                    batches = self._run_query(request, list(request["queries"]))
+                    return {
+                        "ok": True,
+                        "batches": [
+                            [_result_to_wire(r) for r in results] for results in batches
+                        ],
+                    }
+            except Exception as exc:
+                return {"ok": False, "error": str(exc)}
+        return {"ok": False, "error": f"Unknown op: {op!r}"}
+
+    def _handle_synthesize(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            warm = self._open_synthesizer(request)
+        except LookupError as exc:
+            return {"ok": False, "unavailable": True, "error": str(exc)}
+        except Exception as exc:
+            return {"ok": False, "error": str(exc)}
+        try:
+            result = warm.synthesizer.synthesize(
+                question=request["query"],
+                top_k=int(request.get("top_k", 5)),
+                expand_graph=True,
+            )
+            return {"ok": True, "synthesis": asdict(result)}
+        except Exception as exc:
+            return {"ok": False, "error": str(exc)}
+        finally:
+            self._close_synthesizer(warm)
+
+    def handle_stream(self, request: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """
+        Answer a streaming synthesize request.
+
+        Yields one {"token": ...} response per text fragment, then a final
+        {"synthesis": ...} response (or a single error response). Only the
+        synthesizer's own lock is held while tokens are yielded.
+        """
+        try:
+            warm = self._open_synthesizer(request)
+        except LookupError as exc:
+            yield {"ok": False, "unavailable": True, "error": str(exc)}
+            return
+        except Exception as exc:
+            yield {"ok": False, "error": str(exc)}
+            return
+        try:
+            for event in warm.synthesizer.synthesize_stream(
+                question=request["query"],
+                top_k=int(request.get("top_k", 5)),
+                expand_graph=True,
+            ):
+                if isinstance(event, str):
+                    yield {"ok": True, "token": event}
+                else:
+                    yield {"ok": True, "synthesis": asdict(event)}
+        except Exception as exc:
+            yield {"ok": False, "error": str(exc)}
+        finally:
+            self._close_synthesizer(warm)
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Reads request lines and writes one response line per request."""
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except ValueError as exc:
+                response = {"ok": False, "error": f"Invalid JSON: {exc}"}
+            else:
+                if request.get("op") == "shutdown":
+                    self._send({"ok": True})
+                    threading.Thread(target=self.server.shutdown, daemon=True).start()
+                    return
+                if request.get("op") == "synthesize" and request.get("stream"):
+                    for response in self.server.service.handle_stream(request):
+                        self._send(response)
+                    continue
+                response = self.server.service.handle(request)
+            self._send(response)
+
+    def _send(self, response: Dict[str, Any]) -> None:
+        self.wfile.write((json.dumps(response, default=str) + "\n").encode("utf-8"))
+        self.wfile.flush()
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def request_server(
+    request: Dict[str, Any],
+    socket_path: Optional[Union[str, Path]] = None,
+    timeout: float = DEFAULT_CLIENT_TIMEOUT,
+) -> Optional[Dict[str, Any]]:
+    """
+    Send one request to a running daemon.
+
+    Returns:
+        The response dict, or None when no daemon is reachable.
+    """
+    path = resolve_socket_path(socket_path)
+    if not hasattr(socket, "AF_UNIX") or not path.exists():
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(path))
+            sock.sendall((json.dumps(request) + "\n").encode("utf-8"))
+            chunks = []
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                if chunk.endswith(b"\n"):
+                    break
+    except OSError:
+        return None
+    try:
+        return json.loads(b"".join(chunks))
+    except ValueError:
+        return None
+
+
+def stream_server(
+    request: Dict[str, Any],
+    socket_path: Optional[Union[str, Path]] = None,
+    timeout: float = DEFAULT_CLIENT_TIMEOUT,
+) -> Optional[Iterator[Dict[str, Any]]]:
+    """
+    Send a streaming request to a running daemon.
+
+    Returns:
+        An iterator over response dicts that ends after the first response
+        without a "token" key, or None when no daemon is reachable.
+    """
+    path = resolve_socket_path(socket_path)
+    if not hasattr(socket, "AF_UNIX") or not path.exists():
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(timeout)
+        sock.connect(str(path))
+        sock.sendall((json.dumps(request) + "\n").encode("utf-8"))
+    except OSError:
+        sock.close()
+        return None
+    return _read_stream(sock)
+
+
+def _read_stream(sock: socket.socket) -> Iterator[Dict[str, Any]]:
+    with sock, sock.makefile("rb") as stream:
+        try:
+            for line in stream:
+                try:
+                    response = json.loads(line)
+                except ValueError:
+                    return
+                yield response
+                if "token" not in response:
+                    return
+        except OSError:
+            return
+
+
+def create_server(
+    socket_path: Optional[Union[str, Path]] = None,
+    service: Optional[QueryService] = None,
+) -> _UnixServer:
+    """
+    Bind the daemon socket (replacing a stale one) without serving yet.
+
+    Raises:
+        RuntimeError: If another daemon already answers on the socket.
+    """
+    path = resolve_socket_path(socket_path)
+    if path.exists():
+        if request_server({"op": "ping"}, path, timeout=2.0) is not None:
+            raise RuntimeError(f"Query server already running on {path}")
+        path.unlink()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Create the socket owner-only (0600); a chmod after bind leaves a window
+    previous_umask = os.umask(0o177)
+    try:
+        server = _UnixServer(str(path), _Handler)
+    finally:
+        os.umask(previous_umask)
+    server.service = service or QueryService()
+    return server
+
+
+def serve(
+    socket_path: Optional[Union[str, Path]] = None,
+    warm_up: bool = True,
+) -> int:
+    """
+    Run the daemon in the foreground until interrupted or shut down.
+
+    Returns:
+        Exit code (0 on clean shutdown, 1 if a daemon is already running).
+    """
+    path = resolve_socket_path(socket_path)
+    try:
+        server = create_server(path)
+    except RuntimeError as exc:
+        print(f"Error: {exc}")
+        return 1
+    if warm_up:
+        server.service.warm_up()
+    print(f"Query server listening on {path} (pid {os.getpid()})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.service.reset()
+        if path.exists():
+            path.unlink()
+    return 0
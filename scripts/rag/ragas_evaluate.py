@@ -53,13 +53,9 @@ def retrieve_contexts(
     retriever: GovernanceRetriever,
     top_k: int = 5,
 ) -> List[List[str]]:
-    """Retrieve contexts for each question."""
-    all_contexts = []
-    for question in questions:
-        results = retriever.query(question, top_k=top_k)
-        contexts = [r.text for r in results]
-        all_contexts.append(contexts)
-    return all_contexts
+    """Retrieve contexts for all questions with batched queries."""
+    batches = retriever.query_many(questions, top_k=top_k)
+    return [[r.text for r in results] for results in batches]
 
 
 def generate_answers_simple(
@@ -27,7 +27,10 @@ Purpose: RAG Retriever for GoldenPath governance documents.
 Queries ChromaDB for similar chunks based on vector similarity.
 Returns ranked results with source citations for governance documents.
 
-Phase 0 uses ChromaDB's native query for vector search.
+Phase 0 uses ChromaDB's native query for vector search. When index_build
+has written a BM25 lexical index next to the store, GovernanceRetriever
+fuses lexical and vector rankings (reciprocal-rank fusion) so exact
+identifiers such as GOV-0017 rank first.
 Phase 1+ will add LlamaIndex QueryEngine for hybrid search.
 
 Per ADR-0186: Use LlamaIndex for retrieval with ChromaDB backend.
@@ -41,22 +44,46 @@ Example:
     True
 """
 
-from dataclasses import dataclass, field
-from typing import List, Optional, Any, Dict, Union
+from dataclasses import dataclass, field, replace
+from typing import List, Optional, Any, Dict, Set, Union
 from pathlib import Path
 from datetime import datetime, timezone
-import json
-
-try:
-    import chromadb
-except ImportError:
-    chromadb = None  # Allow import without chromadb for testing
-
-from scripts.rag.indexer import DEFAULT_COLLECTION_NAME, DEFAULT_PERSIST_DIR
+import math
+
+from scripts.rag import timing
+from scripts.rag.indexer import (
+    DEFAULT_COLLECTION_NAME,
+    DEFAULT_PERSIST_DIR,
+    _get_embedding_function,
+)
+from scripts.rag.lazy_imports import LazyModule
+from scripts.rag.lexical_index import (
+    LEXICAL_INDEX_FILENAME,
+    load_lexical_index,
+    reciprocal_rank_fusion,
+)
+from scripts.rag.metadata_index import (
+    METADATA_INDEX_FILENAME,
+    CompiledFilter,
+    compile_filter,
+    load_metadata_index,
+)
+from scripts.rag.usage_log import get_writer
+from scripts.rag.vector_store import (
+    BACKEND_FLAT,
+    FlatVectorClient,
+    FlatVectorStore,
+    resolve_backend,
+)
+
+# Imported on first use; falsy when chromadb is not installed
+chromadb = LazyModule("chromadb", "Install with: pip install chromadb")
 
 
 # Default number of results to return
 DEFAULT_TOP_K = 5
+# Maximum queries sent to ChromaDB in one multi-query request
+DEFAULT_QUERY_BATCH_SIZE = 64
 DEFAULT_USAGE_LOG = Path("reports/usage_log.jsonl")
 
 
@@ -78,18 +105,28 @@ class RetrievalResult:
     score: float
 
 
-def _get_client(persist_dir: Optional[str] = None, in_memory: bool = False):
+def _get_client(
+    persist_dir: Optional[str] = None,
+    in_memory: bool = False,
+    backend: Optional[str] = None,
+):
     """
-    Get a ChromaDB client.
+    Get a ChromaDB client (or the flat NumPy stand-in).
 
     Args:
         persist_dir: Directory for persistent storage. If None, uses DEFAULT_PERSIST_DIR.
         in_memory: If True, use in-memory client (for testing).
+        backend: "chroma" or "flat" (default: RAG_VECTOR_BACKEND, else chroma).
 
     Returns:
-        ChromaDB client instance.
+        ChromaDB client instance, or a FlatVectorClient.
     """
-    if chromadb is None:
+    if resolve_backend(backend) == BACKEND_FLAT:
+        return FlatVectorClient(
+            None if in_memory else (persist_dir or DEFAULT_PERSIST_DIR)
+        )
+
+    if not chromadb:
         raise ImportError(
             "chromadb is not installed. Install with: pip install chromadb"
         )
@@ -109,6 +146,8 @@ def retrieve(
     in_memory: bool = False,
     top_k: int = DEFAULT_TOP_K,
     filters: Optional[Dict[str, Any]] = None,
+    embedding_function: Any = None,
+    query_embedding: Optional[List[float]] = None,
 ) -> List[RetrievalResult]:
     """
     Retrieve similar chunks from ChromaDB.
@@ -121,6 +160,11 @@ def retrieve(
         in_memory: If True, use in-memory storage.
         top_k: Number of results to return (default: 5).
         filters: Optional metadata filters (e.g., {"doc_id": "GOV-0017"}).
+        embedding_function: Optional embedding function used to embed the
+            query locally (e.g. one backed by the embedding cache) instead
+            of the collection's own function.
+        query_embedding: Optional precomputed query embedding; takes
+            precedence over embedding_function.
 
     Returns:
         List of RetrievalResult objects ordered by relevance.
@@ -139,26 +183,41 @@ def retrieve(
         collection = client.get_collection(name=collection_name)
 
     # Build query parameters
-    query_params = {
-        "query_texts": [query],
-        "n_results": top_k,
-    }
+    query_params = {"n_results": top_k}
+    if query_embedding is not None:
+        query_params["query_embeddings"] = [list(query_embedding)]
+    elif embedding_function is not None:
+        with timing.span("embed_query"):
+            query_params["query_embeddings"] = [
+                [float(value) for value in embedding_function([query])[0]]
+            ]
+    else:
+        query_params["query_texts"] = [query]
 
     # Add filters if provided
     if filters:
         query_params["where"] = filters
 
     # Execute query
-    results = collection.query(**query_params)
+    with timing.span("vector_search"):
+        results = collection.query(**query_params)
+
+    return _parse_query_row(results, 0)
 
-    # Parse results
+
+def _parse_query_row(results: Dict[str, Any], row: int) -> List[RetrievalResult]:
+    """Convert one query row of a ChromaDB query response into results."""
     retrieval_results = []
 
-    # ChromaDB returns nested lists
-    ids = results.get("ids", [[]])[0]
-    documents = results.get("documents", [[]])[0]
-    metadatas = results.get("metadatas", [[]])[0]
-    distances = results.get("distances", [[]])[0]
+    # ChromaDB returns nested lists, one inner list per query
+    def column(name: str) -> List[Any]:
+        values = results.get(name) or []
+        return values[row] if row < len(values) and values[row] is not None else []
+
+    ids = column("ids")
+    documents = column("documents")
+    metadatas = column("metadatas")
+    distances = column("distances")
 
     for i, doc_id in enumerate(ids):
         if i < len(documents) and i < len(metadatas) and i < len(distances):
@@ -174,6 +233,144 @@ def retrieve(
     return retrieval_results
 
 
+def _collection_space(collection: Any) -> str:
+    """Distance space of a ChromaDB collection (defaults to l2)."""
+    metadata = getattr(collection, "metadata", None)
+    if isinstance(metadata, dict) and metadata.get("hnsw:space"):
+        return metadata["hnsw:space"]
+    configuration = getattr(collection, "configuration_json", None)
+    if isinstance(configuration, dict):
+        hnsw = configuration.get("hnsw") or {}
+        if isinstance(hnsw, dict) and hnsw.get("space"):
+            return hnsw["space"]
+    return "l2"
+
+
+def _distance(a: List[float], b: List[float], space: str) -> float:
+    """Distance between two embeddings using ChromaDB's definitions."""
+    if space == "cosine":
+        dot = sum(x * y for x, y in zip(a, b))
+        norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+        return 1.0 - (dot / norm if norm else 0.0)
+    if space == "ip":
+        return 1.0 - sum(x * y for x, y in zip(a, b))
+    return sum((x - y) ** 2 for x, y in zip(a, b))
+
+
+def _embed_query(
+    retriever: "GovernanceRetriever", query_text: str
+) -> Optional[List[float]]:
+    """
+    Embed a query once: with the retriever's local embedding function, else
+    with the collection's own (the one ChromaDB would use for query_texts).
+
+    Returns:
+        The embedding, or None if neither function is available.
+    """
+    return _embed_queries(retriever, [query_text])[0]
+
+
+def _embed_queries(
+    retriever: "GovernanceRetriever", query_texts: List[str]
+) -> List[Optional[List[float]]]:
+    """Batched _embed_query: one embedding call for all queries."""
+    try:
+        embeddings = retriever.embed_queries(query_texts)
+        if embeddings is None:
+            collection = retriever.collection
+            embed = getattr(collection, "_embedding_function", None) or getattr(
+                collection, "embedding_function", None
+            )
+            if not callable(embed):
+                return [None] * len(query_texts)
+            embeddings = embed(query_texts)
+    except Exception:
+        return [None] * len(query_texts)
+    return [
+        [float(value) for value in vector] if vector is not None else None
+        for vector in embeddings
+    ] or [None] * len(query_texts)
+
+
+def retrieve_batch(
+    queries: List[str],
+    collection=None,
+    collection_name: str = DEFAULT_COLLECTION_NAME,
+    persist_dir: Optional[str] = None,
+    in_memory: bool = False,
+    top_k: int = DEFAULT_TOP_K,
+    filters: Optional[Dict[str, Any]] = None,
+    embedding_function: Any = None,
+    query_embeddings: Optional[List[Optional[List[float]]]] = None,
+    batch_size: int = DEFAULT_QUERY_BATCH_SIZE,
+) -> List[List[RetrievalResult]]:
+    """
+    Retrieve similar chunks for many queries at once.
+
+    Queries are embedded in one call per batch and sent to ChromaDB as a
+    single multi-query request, then fanned back out in input order.
+
+    Args:
+        queries: Search query strings.
+        collection: Optional existing collection. If None, gets by name.
+        collection_name: Name of the collection to query.
+        persist_dir: Directory for persistent storage.
+        in_memory: If True, use in-memory storage.
+        top_k: Number of results per query.
+        filters: Optional metadata filters applied to every query.
+        embedding_function: Optional embedding function used to embed the
+            queries locally.
+        query_embeddings: Optional precomputed embeddings aligned with
+            queries; None entries are embedded as usual.
+        batch_size: Maximum queries per ChromaDB request.
+
+    Returns:
+        One list of RetrievalResult objects per query (empty for blank
+        queries).
+
+    Example:
+        >>> batches = retrieve_batch(["What is TDD?", "Who owns ADRs?"])
+        >>> len(batches)
+        2
+    """
+    outputs: List[List[RetrievalResult]] = [[] for _ in queries]
+    positions = [i for i, query in enumerate(queries) if query and query.strip()]
+    if not positions:
+        return outputs
+
+    if collection is None:
+        client = _get_client(persist_dir=persist_dir, in_memory=in_memory)
+        collection = client.get_collection(name=collection_name)
+
+    for start in range(0, len(positions), max(1, batch_size)):
+        batch = positions[start : start + max(1, batch_size)]
+        texts = [queries[i] for i in batch]
+        vectors = [query_embeddings[i] if query_embeddings else None for i in batch]
+
+        query_params: Dict[str, Any] = {"n_results": top_k}
+        missing = [j for j, vector in enumerate(vectors) if vector is None]
+        if missing and embedding_function is not None:
+            computed = embedding_function([texts[j] for j in missing])
+            for j, vector in zip(missing, computed):
+                vectors[j] = vector
+            missing = []
+        if not missing:
+            query_params["query_embeddings"] = [
+                [float(value) for value in vector] for vector in vectors
+            ]
+        else:
+            query_params["query_texts"] = texts
+
+        if filters:
+            query_params["where"] = filters
+
+        results = collection.query(**query_params)
+        for row, position in enumerate(batch):
+            outputs[position] = _parse_query_row(results, row)
+
+    return outputs
+
+
 def format_citation(result: RetrievalResult) -> str:
     """
     Format a retrieval result as a markdown citation.
@@ -215,6 +412,10 @@ def log_usage(
     """
     Append a usage log entry for a retrieval query.
 
+    Entries are buffered and appended in the background by a shared
+    UsageLogWriter (see scripts.rag.usage_log), which also rotates the log;
+    call usage_log.flush_all() to force pending entries to disk.
+
     Args:
         query: Query text.
         top_k: Number of results requested.
@@ -222,6 +423,9 @@ def log_usage(
         use_graph: Whether graph retrieval was enabled.
         path: File path for usage log (JSONL). If None, no logging.
         timestamp: Optional ISO timestamp override for determinism in tests.
+
+    While a timing trace is open (see scripts.rag.timing) the entry is
+    written when the trace finishes, with its per-stage "timings".
     """
     if path is None:
         return
@@ -233,10 +437,14 @@ def log_usage(
         "filters": filters or {},
         "use_graph": use_graph,
     }
-    log_path = Path(path)
-    log_path.parent.mkdir(parents=True, exist_ok=True)
-    with log_path.open("a", encoding="utf-8") as handle:
-        handle.write(json.dumps(entry, sort_keys=True) + "\n")
+    writer = get_writer(path)
+    run = timing.current()
+    if run is not None:
+        run.on_finish(
+            lambda finished: writer.write({**entry, "timings": finished.summary()})
+        )
+        return
+    writer.write(entry)
 
 
 @dataclass
@@ -251,6 +459,25 @@ class GovernanceRetriever:
         collection_name: Name of the ChromaDB collection.
         persist_dir: Directory for persistent storage.
         in_memory: Whether to use in-memory storage.
+        embedding_model: Optional model used to embed queries locally.
+        embedding_cache_dir: Optional embedding cache directory; repeated
+            queries skip the model when set (requires embedding_model).
+        cache: Optional QueryCache serving repeated queries from memory.
+            It watches the index artifacts in persist_dir unless given an
+            index_dir.
+        lexical_index_path: BM25 index fused with vector results. Defaults
+            to the file inside persist_dir when the collection is opened
+            from disk. Results come back in fused order, keep their vector
+            distance as score and carry metadata["fused_rank"].
+        use_lexical: Set False to disable lexical fusion.
+        metadata_index_path: Metadata index that resolves document-level
+            filters (list membership, $in, date ranges) to candidate
+            documents before vector search. Defaults to the file inside
+            persist_dir when the collection is opened from disk.
+        backend: Vector backend, "chroma" or "flat" (default:
+            RAG_VECTOR_BACKEND, else chroma). A flat store embeds queries
+            with the model recorded at build time unless embedding_model
+            is given.
         collection: The underlying ChromaDB collection.
 
     Example:
@@ -264,17 +491,56 @@ class GovernanceRetriever:
     persist_dir: Optional[str] = None
     in_memory: bool = False
     usage_log_path: Optional[Union[str, Path]] = DEFAULT_USAGE_LOG
+    embedding_model: Optional[str] = None
+    embedding_cache_dir: Optional[str] = None
+    cache: Any = None
+    lexical_index_path: Optional[Union[str, Path]] = None
+    use_lexical: bool = True
+    metadata_index_path: Optional[Union[str, Path]] = None
+    backend: Optional[str] = None
     collection: Any = field(default=None)
+    embedding_function: Any = field(default=None, init=False, repr=False)
     _client: Any = field(default=None, init=False, repr=False)
+    _lexical: Any = field(default=None, init=False, repr=False)
+    _lexical_loaded: bool = field(default=False, init=False, repr=False)
+    _metadata: Any = field(default=None, init=False, repr=False)
+    _metadata_loaded: bool = field(default=False, init=False, repr=False)
 
     def __post_init__(self):
         """Initialize the collection after dataclass init."""
+        self.embedding_function = _get_embedding_function(
+            self.embedding_model, self.embedding_cache_dir
+        )
+        if self.collection is None and not self.in_memory:
+            store_dir = Path(self.persist_dir or DEFAULT_PERSIST_DIR)
+            if self.lexical_index_path is None:
+                self.lexical_index_path = store_dir / LEXICAL_INDEX_FILENAME
+            if self.metadata_index_path is None:
+                self.metadata_index_path = store_dir / METADATA_INDEX_FILENAME
+            if self.cache is not None and self.cache.index_dir is None:
+                self.cache.watch(store_dir)
         if self.collection is None:
             self._client = _get_client(
                 persist_dir=self.persist_dir,
                 in_memory=self.in_memory,
+                backend=self.backend,
+            )
+            if self.embedding_function is None:
+                self.collection = self._client.get_collection(name=self.collection_name)
+            else:
+                self.collection = self._client.get_collection(
+                    name=self.collection_name,
+                    embedding_function=self.embedding_function,
+                )
+        if (
+            self.embedding_function is None
+            and isinstance(self.collection, FlatVectorStore)
+            and self.collection.embedding_model
+        ):
+            self.embedding_function = _get_embedding_function(
+                self.collection.embedding_model, self.embedding_cache_dir
             )
-            self.collection = self._client.get_collection(name=self.collection_name)
+            self.collection.embedding_function = self.embedding_function
 
     def query(
         self,
@@ -293,21 +559,260 @@ class GovernanceRetriever:
         Returns:
             List of RetrievalResult objects.
         """
-        results = retrieve(
-            query=query_text,
-            collection=self.collection,
-            top_k=top_k,
-            filters=filters,
-        )
-        log_usage(
-            query=query_text,
-            top_k=top_k,
-            filters=filters,
-            use_graph=False,
-            path=self.usage_log_path,
-        )
+        with timing.trace("query"):
+            results = None
+            if self.cache is not None:
+                with timing.span("query_cache"):
+                    results = self.cache.get(query_text, top_k, filters)
+            if results is None:
+                with timing.span("compile_filters"):
+                    compiled = self.compile_filters(filters)
+                results = []
+                if not compiled.empty:
+                    query_embedding = None
+                    if self.embedding_function is not None:
+                        with timing.span("embed_query"):
+                            query_embedding = self.embed_queries([query_text])[0]
+                    results = retrieve(
+                        query=query_text,
+                        collection=self.collection,
+                        top_k=top_k,
+                        filters=compiled.where,
+                        embedding_function=self.embedding_function,
+                        query_embedding=query_embedding,
+                    )
+                    with timing.span("lexical_fusion"):
+                        results = self._fuse_lexical(
+                            [query_text],
+                            [results],
+                            top_k,
+                            compiled.where,
+                            compiled.chunk_ids,
+                            [query_embedding],
+                        )[0]
+                if self.cache is not None:
+                    self.cache.put(query_text, top_k, filters, results)
+            log_usage(
+                query=query_text,
+                top_k=top_k,
+                filters=filters,
+                use_graph=False,
+                path=self.usage_log_path,
+            )
         return results
 
+    def lexical_index(self):
+        """Return the BM25 index, loading it on first use (None if absent)."""
+        if not self._lexical_loaded:
+            self._lexical_loaded = True
+            if self.use_lexical and self.lexical_index_path:
+                self._lexical = load_lexical_index(self.lexical_index_path)
+        return self._lexical
+
+    def metadata_index(self):
+        """Return the metadata index, loading it on first use (None if absent)."""
+        if not self._metadata_loaded:
+            self._metadata_loaded = True
+            if self.metadata_index_path:
+                self._metadata = load_metadata_index(self.metadata_index_path)
+        return self._metadata
+
+    def compile_filters(self, filters: Optional[Dict[str, Any]]) -> CompiledFilter:
+        """
+        Resolve filters against the metadata index (see compile_filter).
+
+        Raises:
+            ValueError: If filters need the metadata index and none is built.
+        """
+        if not filters:
+            return CompiledFilter()
+        return compile_filter(filters, self.metadata_index())
+
+    def _fuse_lexical(
+        self,
+        query_texts: List[str],
+        batches: List[List[RetrievalResult]],
+        top_k: int,
+        filters: Optional[Dict[str, Any]],
+        candidates: Optional[Set[str]] = None,
+        query_embeddings: Optional[List[Optional[List[float]]]] = None,
+    ) -> List[List[RetrievalResult]]:
+        """
+        Merge BM25 hits into vector results with reciprocal-rank fusion.
+
+        Lexical-only hits of every query are fetched in one collection.get
+        and scored against the query embeddings already computed for the
+        vector search (embedded here only when none were passed).
+        """
+        index = self.lexical_index()
+        if index is None:
+            return batches
+        hits = [
+            [chunk_id for chunk_id, _ in index.search(text, top_k, candidates)]
+            if text and text.strip()
+            else []
+            for text in query_texts
+        ]
+        missing: Dict[str, None] = {}  # ordered set across the batch
+        for query_hits, results in zip(hits, batches):
+            found = {result.id for result in results}
+            missing.update((h, None) for h in query_hits if h not in found)
+        rows: Dict[str, Any] = {}
+        if missing:
+            # Lexical-only hits: fetch text/metadata, honouring filters, and
+            # score them with the same vector distance as the vector hits.
+            fetched = self.collection.get(
+                ids=list(missing),
+                where=filters or None,
+                include=["documents", "metadatas", "embeddings"],
+            )
+            embeddings = fetched.get("embeddings")
+            for i, (chunk_id, text, metadata) in enumerate(
+                zip(
+                    fetched.get("ids") or [],
+                    fetched.get("documents") or [],
+                    fetched.get("metadatas") or [],
+                )
+            ):
+                embedding = embeddings[i] if embeddings is not None else None
+                rows[chunk_id] = (text, metadata or {}, embedding)
+        query_embeddings = list(query_embeddings or [None] * len(query_texts))
+        unembedded = [
+            i
+            for i, query_hits in enumerate(hits)
+            if query_embeddings[i] is None and any(h in rows for h in query_hits)
+        ]
+        if unembedded:
+            computed = _embed_queries(self, [query_texts[i] for i in unembedded])
+            for i, vector in zip(unembedded, computed):
+                query_embeddings[i] = vector
+        space = _collection_space(self.collection)
+
+        fused_batches = []
+        for i, (query_hits, results) in enumerate(zip(hits, batches)):
+            by_id = {result.id: result for result in results}
+            query_embedding = query_embeddings[i]
+            # Without embeddings they rank as the weakest vector hit
+            fallback = max((result.score for result in results), default=1.0)
+            for chunk_id in query_hits:
+                if chunk_id in by_id or chunk_id not in rows:
+                    continue
+                text, metadata, embedding = rows[chunk_id]
+                score = fallback
+                if query_embedding is not None and embedding is not None:
+                    score = float(_distance(query_embedding, embedding, space))
+                by_id[chunk_id] = RetrievalResult(
+                    id=chunk_id, text=text, metadata=metadata, score=score
+                )
+            if not query_hits:
+                fused_batches.append(results)
+                continue
+            fused = reciprocal_rank_fusion(
+                [
+                    [result.id for result in results],
+                    [h for h in query_hits if h in by_id],
+                ]
+            )
+            # Scores stay vector distances, comparable with graph and packed
+            # results; the fused order is recorded as metadata["fused_rank"].
+            fused_batches.append(
+                [
+                    replace(
+                        by_id[chunk_id],
+                        metadata={**by_id[chunk_id].metadata, "fused_rank": rank},
+                    )
+                    for rank, (chunk_id, _) in enumerate(fused[:top_k], start=1)
+                ]
+            )
+        return fused_batches
+
+    def embed_queries(self, query_texts: List[str]) -> Optional[List[List[float]]]:
+        """
+        Embed queries locally, reusing cached query embeddings.
+
+        Returns:
+            One embedding per query, or None when no local embedding
+            function is configured (ChromaDB embeds queries itself).
+        """
+        if self.embedding_function is None:
+            return None
+        if self.cache is not None:
+            return self.cache.embed_many(query_texts, self.embedding_function)
+        return [
+            [float(value) for value in vector]
+            for vector in self.embedding_function(query_texts)
+        ]
+
+    def query_many(
+        self,
+        query_texts: List[str],
+        top_k: int = DEFAULT_TOP_K,
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: int = DEFAULT_QUERY_BATCH_SIZE,
+    ) -> List[List[RetrievalResult]]:
+        """
+        Query the index for many questions with batched round trips.
+
+        Cached questions are answered from the cache; the rest are embedded
+        together and sent as multi-query ChromaDB requests.
+
+        Args:
+            query_texts: Search query strings.
+            top_k: Number of results per query.
+            filters: Optional metadata filters applied to every query.
+            batch_size: Maximum queries per ChromaDB request.
+
+        Returns:
+            One list of RetrievalResult objects per query, in input order.
+        """
+        outputs: List[Optional[List[RetrievalResult]]] = [None] * len(query_texts)
+        if self.cache is not None:
+            outputs = [self.cache.get(q, top_k, filters) for q in query_texts]
+        pending = [i for i, output in enumerate(outputs) if output is None]
+
+        compiled = self.compile_filters(filters) if pending else CompiledFilter()
+        if compiled.empty:
+            for i in pending:
+                outputs[i] = []
+            pending = []
+
+        if pending:
+            texts = [query_texts[i] for i in pending]
+            query_embeddings = self.embed_queries(texts)
+            fetched = retrieve_batch(
+                texts,
+                collection=self.collection,
+                top_k=top_k,
+                filters=compiled.where,
+                embedding_function=self.embedding_function,
+                query_embeddings=query_embeddings,
+                batch_size=batch_size,
+            )
+            fused = self._fuse_lexical(
+                texts,
+                fetched,
+                top_k,
+                compiled.where,
+                compiled.chunk_ids,
+                query_embeddings,
+            )
+            for i, results in zip(pending, fused):
+                outputs[i] = results
+                if self.cache is not None:
+                    self.cache.put(query_texts[i], top_k, filters, results, save=False)
+            if self.cache is not None:
+                self.cache.save()
+
+        for query_text in query_texts:
+            log_usage(
+                query=query_text,
+                top_k=top_k,
+                filters=filters,
+                use_graph=False,
+                path=self.usage_log_path,
+            )
+        return outputs
+
     def query_with_citations(
         self,
         query_text: str,
@@ -24,10 +24,18 @@ relates_to:
 Purpose: Scope filtering for governance-registry indexing.
 
 Enforces PRD-0008 allowlist and denylist rules for indexed paths.
+
+The rules are compiled once into a prefix trie (ScopeRules). walk_allowed()
+drives an os.scandir walk from the repo root with it: denied directories and
+directories that lead to no allowlisted prefix or file (.git, .chroma,
+apps/, envs/, ...) are never opened, so discovery cost tracks the size of the
+allowlisted tree rather than the whole checkout.
 """
 
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, List, Union
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Union
+import os
 
 
 # Allowlist paths (relative to repo root)
@@ -56,16 +64,113 @@ DENYLIST_PARTS = {
 }
 
 
-def _parts_match(path_parts: tuple[str, ...], prefix_parts: tuple[str, ...]) -> bool:
+@dataclass
+class _ScopeNode:
+    """
+    One directory level of the scope trie.
+
+    Attributes:
+        children: Next directory name -> node.
+        subtree: An allowlisted prefix ends here (everything below is allowed).
+        files: Allowlisted file names directly inside this directory.
+    """
+
+    children: Dict[str, "_ScopeNode"] = field(default_factory=dict)
+    subtree: bool = False
+    files: Set[str] = field(default_factory=set)
+
+
+class ScopeRules:
     """
-    Check whether prefix_parts appears as a contiguous slice in path_parts.
+    Allowlist/denylist rules compiled into a prefix trie.
+
+    Args:
+        prefixes: Allowlisted directory prefixes (relative to repo root).
+        files: Allowlisted individual files (relative to repo root).
+        deny: Path parts that are never indexed, at any depth.
     """
-    if not prefix_parts or len(prefix_parts) > len(path_parts):
+
+    def __init__(
+        self,
+        prefixes: Iterable[Path] = ALLOWLIST_PREFIXES,
+        files: Iterable[Path] = ALLOWLIST_FILES,
+        deny: Iterable[str] = DENYLIST_PARTS,
+    ):
+        self.root = _ScopeNode()
+        self.deny: FrozenSet[str] = frozenset(deny)
+        for prefix in prefixes:
+            self._insert(Path(prefix).parts).subtree = True
+        for allowed_file in files:
+            allowed_file = Path(allowed_file)
+            self._insert(allowed_file.parts[:-1]).files.add(allowed_file.name)
+
+    def _insert(self, parts: Iterable[str]) -> _ScopeNode:
+        node = self.root
+        for part in parts:
+            node = node.children.setdefault(part, _ScopeNode())
+        return node
+
+    def allows(self, path: Union[str, Path]) -> bool:
+        """
+        Check a path against the rules.
+
+        Rules may match at any depth, so absolute paths work without knowing
+        the repo root.
+        """
+        parts = Path(path).parts
+        if not self.deny.isdisjoint(parts):
+            return False
+        last = len(parts) - 1
+        for start in range(len(parts)):
+            node = self.root
+            for i in range(start, len(parts)):
+                if i == last and parts[i] in node.files:
+                    return True
+                node = node.children.get(parts[i])
+                if node is None:
+                    break
+                if node.subtree:
+                    return True
         return False
-    for i in range(0, len(path_parts) - len(prefix_parts) + 1):
-        if path_parts[i : i + len(prefix_parts)] == prefix_parts:
-            return True
-    return False
+
+    def walk(self, root: Union[str, Path], suffix: str = ".md") -> Iterator[Path]:
+        """
+        Lazily yield allowed files under root whose names end with suffix.
+
+        Rules are anchored at root. Only directories on a trie path are
+        opened; below an allowlisted prefix only the denylist is checked.
+        Symlinked directories are not followed (matching Path.rglob).
+        Unreadable directories are skipped.
+        """
+        # None marks a directory inside an allowlisted prefix
+        stack: List[tuple[str, Optional[_ScopeNode]]] = [(os.fspath(root), self.root)]
+        while stack:
+            directory, node = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            for entry in entries:
+                name = entry.name
+                if name in self.deny:
+                    continue
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                if is_dir:
+                    if node is None:
+                        stack.append((entry.path, None))
+                        continue
+                    child = node.children.get(name)
+                    if child is not None:
+                        stack.append((entry.path, None if child.subtree else child))
+                elif name.endswith(suffix) and (node is None or name in node.files):
+                    yield Path(entry.path)
+
+
+DEFAULT_SCOPE = ScopeRules()
 
 
 def is_allowed_path(path: Union[str, Path]) -> bool:
@@ -78,23 +183,7 @@ def is_allowed_path(path: Union[str, Path]) -> bool:
     Returns:
         True if path is allowed by allowlist and not denied.
     """
-    path = Path(path)
-    # Denylist by path parts (works for absolute + relative)
-    for part in path.parts:
-        if part in DENYLIST_PARTS:
-            return False
-
-    # Allowlist files (match by suffix parts)
-    for allowed_file in ALLOWLIST_FILES:
-        if tuple(path.parts[-len(allowed_file.parts) :]) == allowed_file.parts:
-            return True
-
-    # Allowlist prefixes (match contiguous parts anywhere in absolute path)
-    for prefix in ALLOWLIST_PREFIXES:
-        if _parts_match(path.parts, prefix.parts):
-            return True
-
-    return False
+    return DEFAULT_SCOPE.allows(path)
 
 
 def filter_paths(paths: Iterable[Union[str, Path]]) -> List[Path]:
@@ -113,3 +202,18 @@ def filter_paths(paths: Iterable[Union[str, Path]]) -> List[Path]:
         if is_allowed_path(path):
             allowed.append(path)
     return allowed
+
+
+def walk_allowed(root: Union[str, Path], suffix: str = ".md") -> Iterator[Path]:
+    """
+    Lazily yield allowed files under a repo root without visiting
+    denied or out-of-scope directories.
+
+    Args:
+        root: Repository root the allowlist is relative to.
+        suffix: File name suffix to collect.
+
+    Returns:
+        Iterator of Path objects (directory order, not sorted).
+    """
+    return DEFAULT_SCOPE.walk(root, suffix)
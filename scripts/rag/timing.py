@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+---
+id: SCRIPT-0095
+type: script
+owner: platform-team
+status: active
+maturity: 1
+last_validated: 2026-10-18
+test:
+  runner: pytest
+  command: "pytest -q tests/unit/test_timing.py"
+  evidence: declared
+dry_run:
+  supported: true
+risk_profile:
+  production_impact: low
+  security_risk: low
+  coupling_risk: low
+relates_to:
+  - PRD-0008-governance-rag-pipeline
+  - SCRIPT-0073-retriever
+  - SCRIPT-0079-hybrid-retriever
+  - SCRIPT-0080-llm-synthesis
+---
+Purpose: Span-style per-stage timing for retrieval and synthesis.
+
+Entry points (GovernanceRetriever.query, HybridRetriever.query,
+RAGSynthesizer.synthesize) open a trace, and each stage inside them
+(query embedding, vector search, lexical fusion, graph expansion, chunk
+fetch, context packing, prompt building, LLM call) runs in a span. Nested
+entry points join the outermost trace, so a synthesized query yields one
+breakdown covering retrieval and generation.
+
+Timing is off by default. When off, trace() and span() return a shared
+no-op after a single context-variable lookup. Enable it with
+RAG_TIMING=1, set_enabled(True) or `gov-rag query --timings`.
+
+While a trace is open, log_usage() defers its JSONL record until the trace
+finishes and adds a "timings" field:
+
+    {"total_ms": 812.4, "stages": {"vector_search": 9.1, "llm": 760.2, ...}}
+
+Stage times are summed per stage name; a stage includes the stages nested
+inside it. With RAG_TIMING_OTEL=1 and opentelemetry installed, finished
+traces are also exported as OpenTelemetry spans with their original start
+and end times.
+
+Example:
+    >>> from scripts.rag import timing
+    >>> timing.set_enabled(True)
+    >>> with timing.trace("query") as run:
+    ...     with timing.span("vector_search"):
+    ...         pass
+    >>> sorted(run.summary()["stages"])
+    ['vector_search']
+"""
+
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+import os
+import time
+
+from scripts.rag.lazy_imports import LazyModule
+
+# Only imported when a trace is exported
+otel_trace = LazyModule(
+    "opentelemetry.trace", "Install with: pip install opentelemetry-api"
+)
+
+
+TIMING_ENV_VAR = "RAG_TIMING"
+OTEL_ENV_VAR = "RAG_TIMING_OTEL"
+OTEL_TRACER_NAME = "scripts.rag"
+
+
+def _env_flag(name: str) -> bool:
+    return os.getenv(name, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+_enabled = _env_flag(TIMING_ENV_VAR)
+_otel = _env_flag(OTEL_ENV_VAR)
+_current: ContextVar[Optional["Trace"]] = ContextVar("rag_trace", default=None)
+
+
+def set_enabled(enabled: bool, otel: Optional[bool] = None) -> None:
+    """Turn timing on or off for this process (and OpenTelemetry export)."""
+    global _enabled, _otel
+    _enabled = enabled
+    if otel is not None:
+        _otel = otel
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def current() -> Optional["Trace"]:
+    """The trace open in this context, or None."""
+    return _current.get()
+
+
+@dataclass
+class Span:
+    """
+    One timed stage.
+
+    Attributes:
+        name: Stage name.
+        start: Seconds since the trace started.
+        end: Seconds since the trace started (None while open).
+        parent: Index of the enclosing span in Trace.spans (None at top).
+        attributes: Optional key/value details (exported to OpenTelemetry).
+    """
+
+    name: str
+    start: float
+    end: Optional[float] = None
+    parent: Optional[int] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration_ms(self) -> float:
+        return ((self.end if self.end is not None else self.start) - self.start) * 1000
+
+
+class _SpanContext:
+    __slots__ = ("_trace", "_name", "_attributes", "_index")
+
+    def __init__(self, run: "Trace", name: str, attributes: Dict[str, Any]):
+        self._trace = run
+        self._name = name
+        self._attributes = attributes
+        self._index = -1
+
+    def __enter__(self) -> "Trace":
+        self._index = self._trace.open(self._name, self._attributes)
+        return self._trace
+
+    def __exit__(self, *exc_info) -> bool:
+        self._trace.close(self._index)
+        return False
+
+
+class _NoopContext:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info) -> bool:
+        return False
+
+
+_NOOP = _NoopContext()
+
+
+class Trace:
+    """
+    Spans recorded for one request.
+
+    Attributes:
+        name: Name of the entry point that opened the trace.
+        spans: Recorded spans in start order.
+    """
+
+    def __init__(self, name: str, clock: Callable[[], float] = time.perf_counter):
+        self.name = name
+        self.spans: List[Span] = []
+        self._clock = clock
+        self._origin = clock()
+        self._wall_origin = time.time_ns()
+        self._stack: List[int] = []
+        self._finish_callbacks: List[Callable[["Trace"], None]] = []
+        self.total: Optional[float] = None
+
+    def elapsed(self) -> float:
+        """Seconds since the trace started."""
+        return self._clock() - self._origin
+
+    def open(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> int:
+        parent = self._stack[-1] if self._stack else None
+        self.spans.append(
+            Span(name, self.elapsed(), parent=parent, attributes=attributes or {})
+        )
+        self._stack.append(len(self.spans) - 1)
+        return len(self.spans) - 1
+
+    def close(self, index: int) -> None:
+        self.spans[index].end = self.elapsed()
+        if index in self._stack:
+            del self._stack[self._stack.index(index) :]
+
+    def span(self, name: str, **attributes: Any) -> _SpanContext:
+        return _SpanContext(self, name, attributes)
+
+    def record(self, name: str, start: float, **attributes: Any) -> None:
+        """Add a finished span that started at `start` (trace-relative seconds)."""
+        parent = self._stack[-1] if self._stack else None
+        self.spans.append(
+            Span(name, start, self.elapsed(), parent=parent, attributes=attributes)
+        )
+
+    def on_finish(self, callback: Callable[["Trace"], None]) -> None:
+        """Run callback(trace) when the trace finishes (e.g. deferred logs)."""
+        self._finish_callbacks.append(callback)
+
+    def summary(self) -> Dict[str, Any]:
+        """Total and per-stage milliseconds (summed by stage name)."""
+        stages: Dict[str, float] = {}
+        for item in self.spans:
+            stages[item.name] = stages.get(item.name, 0.0) + item.duration_ms
+        total = self.total if self.total is not None else self.elapsed()
+        return {
+            "total_ms": round(total * 1000, 3),
+            "stages": {name: round(ms, 3) for name, ms in stages.items()},
+        }
+
+    def finish(self) -> None:
+        """Close the trace, flush deferred callbacks and export if enabled."""
+        if self.total is not None:
+            return
+        self.total = self.elapsed()
+        for index in reversed(self._stack):
+            self.spans[index].end = self.total
+        self._stack.clear()
+        callbacks, self._finish_callbacks = self._finish_callbacks, []
+        for callback in callbacks:
+            callback(self)
+        if _otel:
+            export_otel(self)
+
+
+class _TraceContext:
+    __slots__ = ("_name", "_attributes", "_trace", "_token", "_span")
+
+    def __init__(self, name: str, attributes: Dict[str, Any]):
+        self._name = name
+        self._attributes = attributes
+        self._trace: Optional[Trace] = None
+        self._token = None
+        self._span: Optional[_SpanContext] = None
+
+    def __enter__(self) -> Trace:
+        outer = _current.get()
+        if outer is not None:
+            # Nested entry point: a span in the enclosing trace
+            self._span = outer.span(self._name, **self._attributes)
+            return self._span.__enter__()
+        self._trace = Trace(self._name)
+        self._token = _current.set(self._trace)
+        return self._trace
+
+    def __exit__(self, *exc_info) -> bool:
+        if self._span is not None:
+            return self._span.__exit__(*exc_info)
+        _current.reset(self._token)
+        self._trace.finish()
+        return False
+
+
+def trace(name: str, **attributes: Any):
+    """
+    Open a trace for an entry point, or a span if one is already open.
+
+    Yields the Trace, or None when timing is disabled.
+    """
+    if not _enabled and _current.get() is None:
+        return _NOOP
+    return _TraceContext(name, attributes)
+
+
+def span(name: str, **attributes: Any):
+    """Time a stage of the open trace; a no-op when there is none."""
+    run = _current.get()
+    if run is None:
+        return _NOOP
+    return _SpanContext(run, name, attributes)
+
+
+def begin(name: str) -> Optional[Trace]:
+    """
+    Start a trace that is not bound to the current context.
+
+    For generators, which must not hold a context variable across yields:
+    wrap synchronous segments in activate(run) and call run.finish() when
+    done. Returns None when timing is disabled or a trace is already open
+    (stages then join the open trace).
+    """
+    if not _enabled or _current.get() is not None:
+        return None
+    return Trace(name)
+
+
+class _Activate:
+    __slots__ = ("_trace", "_token")
+
+    def __init__(self, run: Trace):
+        self._trace = run
+        self._token = None
+
+    def __enter__(self) -> Trace:
+        self._token = _current.set(self._trace)
+        return self._trace
+
+    def __exit__(self, *exc_info) -> bool:
+        _current.reset(self._token)
+        return False
+
+
+def activate(run: Optional[Trace]):
+    """Make run the open trace for a block (no-op when run is None)."""
+    if run is None:
+        return _NOOP
+    return _Activate(run)
+
+
+def format_summary(run: Optional[Trace]) -> str:
+    """Human-readable stage breakdown, slowest first."""
+    if run is None:
+        return "Timing disabled"
+    summary = run.summary()
+    lines = [f"Timings ({run.name}): {summary['total_ms']:.1f} ms total"]
+    for name, ms in sorted(summary["stages"].items(), key=lambda item: -item[1]):
+        lines.append(f"  {name:<16} {ms:>10.1f} ms")
+    return "\n".join(lines)
+
+
+def export_otel(run: Trace) -> int:
+    """
+    Export a finished trace as OpenTelemetry spans.
+
+    The trace becomes the root span and each stage a child span with its
+    original start and end times. Returns the number of spans exported
+    (0 when opentelemetry is not installed).
+    """
+    if not otel_trace:
+        return 0
+    tracer = otel_trace.get_tracer(OTEL_TRACER_NAME)
+
+    def ns(offset: Optional[float]) -> int:
+        return run._wall_origin + int((offset or 0.0) * 1e9)
+
+    root = tracer.start_span(run.name, start_time=ns(0.0))
+    exported = [root]
+    for item in run.spans:
+        parent = root if item.parent is None else exported[item.parent + 1]
+        child = tracer.start_span(
+            item.name,
+            context=otel_trace.set_span_in_context(parent),
+            start_time=ns(item.start),
+            attributes={k: str(v) for k, v in item.attributes.items()},
+        )
+        exported.append(child)
+    for item, child in zip(run.spans, exported[1:]):
+        child.end(end_time=ns(item.end))
+    root.end(end_time=ns(run.total))
+    return len(exported)
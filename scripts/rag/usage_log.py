@@ -0,0 +1,516 @@
+#!/usr/bin/env python3
+"""
+---
+id: SCRIPT-0096
+type: script
+owner: platform-team
+status: active
+maturity: 1
+last_validated: 2026-10-18
+test:
+  runner: pytest
+  command: "pytest -q tests/unit/test_usage_log.py"
+  evidence: declared
+dry_run:
+  supported: true
+risk_profile:
+  production_impact: low
+  security_risk: low
+  coupling_risk: low
+relates_to:
+  - PRD-0008-governance-rag-pipeline
+  - SCRIPT-0073-retriever
+---
+Purpose: Buffered, rotating writer and summary for the retrieval usage log.
+
+retriever.log_usage used to open, append to and close the log on every
+query. Under bulk evaluation or a busy query server this serialised
+queries on file I/O, and the log grew without bound. UsageLogWriter instead:
+
+- Buffers records in memory and appends them from a background thread
+  every flush_interval seconds, when max_buffer records are pending, and
+  at interpreter exit.
+- Writes each flush as one O_APPEND write under an exclusive lock on
+  "<log>.lock", so several processes (CLI, query server, evaluation
+  runs) can share one log without interleaving lines.
+- Rotates the active file once it exceeds max_bytes or its first record
+  is older than max_age_seconds. Rotated segments are renamed to
+  "<stem>.<UTC timestamp>.jsonl" and, by default, gzipped; max_segments
+  bounds how many are kept.
+
+Usage:
+    python -m scripts.rag.usage_log summarize
+    python -m scripts.rag.usage_log summarize --since 2026-10-01 --json
+    python -m scripts.rag.usage_log rotate
+"""
+
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+import atexit
+import gzip
+import json
+import os
+import re
+import shutil
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows: in-process locking only
+    fcntl = None
+
+
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_MAX_AGE_SECONDS = 24 * 3600.0
+DEFAULT_FLUSH_INTERVAL = 1.0
+DEFAULT_MAX_BUFFER = 256
+DEFAULT_MAX_SEGMENTS = 30
+SEGMENT_TIME_FORMAT = "%Y%m%dT%H%M%SZ"
+_SEGMENT_NAME = re.compile(r"\.(\d{8}T\d{6}Z)(?:-(\d+))?\.")
+
+
+def _parse_ts(value: Any) -> Optional[float]:
+    """Epoch seconds for an ISO-8601 record timestamp (None if invalid)."""
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+class UsageLogWriter:
+    """
+    Background-buffered JSONL appender with size/time rotation.
+
+    Attributes:
+        path: Active log file.
+        max_bytes: Rotate once the active file reaches this size.
+        max_age_seconds: Rotate once the first record is this old.
+        flush_interval: Seconds between background flushes.
+        max_buffer: Pending records that trigger an early flush.
+        compress: Gzip rotated segments.
+        max_segments: Rotated segments kept (None keeps all).
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_age_seconds: Optional[float] = DEFAULT_MAX_AGE_SECONDS,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_buffer: int = DEFAULT_MAX_BUFFER,
+        compress: bool = True,
+        max_segments: Optional[int] = DEFAULT_MAX_SEGMENTS,
+        background: bool = True,
+    ):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self.compress = compress
+        self.max_segments = max_segments
+        self.written = 0
+        self.rotations = 0
+        self._buffer: List[str] = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._dir_ready = False
+        # (st_dev, st_ino) of the active file -> epoch of its first record
+        self._segment_start: Dict[Tuple[int, int], Optional[float]] = {}
+        self._thread: Optional[threading.Thread] = None
+        if background:
+            self._thread = threading.Thread(
+                target=self._run, name=f"usage-log:{self.path.name}", daemon=True
+            )
+            self._thread.start()
+
+    @property
+    def lock_path(self) -> Path:
+        return self.path.with_name(self.path.name + ".lock")
+
+    def write(self, entry: Dict[str, Any]) -> None:
+        """Queue one record; it is appended by the next flush."""
+        line = json.dumps(entry, sort_keys=True) + "\n"
+        with self._lock:
+            self._buffer.append(line)
+            pending = len(self._buffer)
+        if self._closed or self._thread is None:
+            self.flush()
+        elif pending >= self.max_buffer:
+            self._wake.set()
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except OSError:
+                pass  # Logging must never take down a query; retry next tick
+
+    def flush(self) -> int:
+        """Append pending records now; returns the number written."""
+        with self._flush_lock:
+            with self._lock:
+                lines, self._buffer = self._buffer, []
+            if not lines:
+                return 0
+            rotated: Optional[Path] = None
+            try:
+                if not self._dir_ready:
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    self._dir_ready = True
+                with self._file_lock():
+                    rotated = self._maybe_rotate()
+                    payload = "".join(lines).encode("utf-8")
+                    flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+                    fd = os.open(self.path, flags, 0o644)
+                    try:
+                        os.write(fd, payload)
+                    finally:
+                        os.close(fd)
+            except OSError:
+                # Requeue ahead of newer records; the next flush retries
+                with self._lock:
+                    self._buffer[:0] = lines
+                raise
+            self.written += len(lines)
+            if rotated is not None:
+                self._finish_rotation(rotated)
+            return len(lines)
+
+    def rotate(self) -> Optional[Path]:
+        """Flush, then rotate the active file regardless of size or age."""
+        self.flush()
+        if not self.path.exists():
+            return None
+        with self._file_lock():
+            rotated = self._rotate_active()
+        if rotated is not None:
+            return self._finish_rotation(rotated)
+        return None
+
+    def close(self) -> None:
+        """Stop the background thread and flush what is pending."""
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=self.flush_interval + 1)
+        try:
+            self.flush()
+        except OSError:
+            pass
+
+    def _file_lock(self):
+        return _FileLock(self.lock_path)
+
+    def _first_record_time(self, stat: os.stat_result) -> Optional[float]:
+        key = (stat.st_dev, stat.st_ino)
+        if key not in self._segment_start:
+            started = None
+            try:
+                with self.path.open("rb") as handle:
+                    first = handle.readline()
+                started = _parse_ts(json.loads(first).get("ts"))
+            except (OSError, ValueError, AttributeError):
+                pass
+            self._segment_start = {key: started or stat.st_mtime}
+        return self._segment_start[key]
+
+    def _maybe_rotate(self) -> Optional[Path]:
+        """Rotate the active file if it is too large or too old (lock held)."""
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        if stat.st_size == 0:
+            return None
+        too_big = stat.st_size >= self.max_bytes
+        too_old = False
+        if self.max_age_seconds is not None:
+            started = self._first_record_time(stat)
+            too_old = (
+                started is not None and time.time() - started >= self.max_age_seconds
+            )
+        if not (too_big or too_old):
+            return None
+        return self._rotate_active()
+
+    def _rotate_active(self) -> Optional[Path]:
+        stamp = datetime.now(timezone.utc).strftime(SEGMENT_TIME_FORMAT)
+        target = self.path.with_name(f"{self.path.stem}.{stamp}{self.path.suffix}")
+        counter = 1
+        while target.exists() or Path(f"{target}.gz").exists():
+            target = self.path.with_name(
+                f"{self.path.stem}.{stamp}-{counter}{self.path.suffix}"
+            )
+            counter += 1
+        try:
+            os.replace(self.path, target)
+        except FileNotFoundError:
+            return None  # Another process rotated it first
+        self.rotations += 1
+        return target
+
+    def _finish_rotation(self, rotated: Path) -> Path:
+        """Compress and prune outside the lock (other writers keep going)."""
+        final = rotated
+        if self.compress:
+            final = Path(f"{rotated}.gz")
+            with rotated.open("rb") as source, gzip.open(final, "wb") as target:
+                shutil.copyfileobj(source, target)
+            rotated.unlink()
+        if self.max_segments is not None:
+            segments = rotated_segments(self.path)
+            for old in segments[: max(0, len(segments) - self.max_segments)]:
+                old.unlink(missing_ok=True)
+        return final
+
+
+class _FileLock:
+    """Exclusive advisory lock shared by every process writing one log."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._fd: Optional[int] = None
+
+    def __enter__(self) -> "_FileLock":
+        if fcntl is not None:
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc_info) -> bool:
+        if self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+        return False
+
+
+_writers: Dict[Path, UsageLogWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def get_writer(path: Union[str, Path]) -> UsageLogWriter:
+    """Shared writer for a log path (created on first use, flushed at exit)."""
+    key = Path(os.path.abspath(path))
+    writer = _writers.get(key)
+    if writer is None:
+        with _writers_lock:
+            writer = _writers.get(key)
+            if writer is None:
+                writer = UsageLogWriter(key)
+                _writers[key] = writer
+    return writer
+
+
+def flush_all() -> None:
+    """Flush every shared writer (pending records reach disk now)."""
+    for writer in list(_writers.values()):
+        writer.flush()
+
+
+@atexit.register
+def close_all() -> None:
+    """Flush and stop every shared writer."""
+    with _writers_lock:
+        writers = list(_writers.values())
+        _writers.clear()
+    for writer in writers:
+        writer.close()
+
+
+def rotated_segments(path: Union[str, Path]) -> List[Path]:
+    """Rotated segments of a log, oldest first."""
+    path = Path(path)
+    pattern = f"{path.stem}.*{path.suffix}*"
+    segments = [
+        p
+        for p in path.parent.glob(pattern)
+        if p != path and not p.name.endswith(".lock")
+    ]
+    return sorted(segments, key=_segment_order)
+
+
+def _segment_order(path: Path) -> Tuple[str, int, str]:
+    """Sort key: rotation time, then collision counter."""
+    match = _SEGMENT_NAME.search(path.name)
+    if match is None:
+        return ("", 0, path.name)
+    return (match.group(1), int(match.group(2) or 0), path.name)
+
+
+def iter_records(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """Yield records from rotated segments (oldest first), then the active log."""
+    path = Path(path)
+    files = rotated_segments(path) + ([path] if path.exists() else [])
+    for file_path in files:
+        opener = gzip.open if file_path.suffix == ".gz" else open
+        try:
+            with opener(file_path, "rt", encoding="utf-8") as handle:
+                for line in handle:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # Torn line from a crashed writer
+                    if isinstance(record, dict):
+                        yield record
+        except (OSError, EOFError):
+            continue
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def _filter_terms(filters: Dict[str, Any]) -> Iterator[Tuple[str, str]]:
+    """Yield (key, term) per filter clause, flattening $and / $or."""
+    for key, value in filters.items():
+        if key in ("$and", "$or"):
+            for clause in value if isinstance(value, list) else []:
+                if isinstance(clause, dict):
+                    yield from _filter_terms(clause)
+        elif isinstance(value, dict):
+            for op, operand in value.items():
+                if op == "$eq":
+                    yield key, f"{key}={operand}"
+                else:
+                    yield key, f"{key} {op} {operand}"
+        else:
+            yield key, f"{key}={value}"
+
+
+def summarize(
+    path: Union[str, Path],
+    top: int = 10,
+    since: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Aggregate usage across the active log and its rotated segments.
+
+    Args:
+        path: Active log path.
+        top: Number of top queries and filters to report.
+        since: Only count records at or after this ISO timestamp.
+
+    Returns:
+        Totals, top normalized queries, filter key/value usage, graph usage,
+        top_k distribution and, when records carry timings, latency stats.
+    """
+    from scripts.rag.query_cache import normalize_query
+
+    cutoff = _parse_ts(since) if since else None
+    total = 0
+    graph = 0
+    filtered = 0
+    queries: Counter = Counter()
+    filter_keys: Counter = Counter()
+    filter_values: Counter = Counter()
+    top_ks: Counter = Counter()
+    latencies: List[float] = []
+    first: Optional[str] = None
+    last: Optional[str] = None
+    for record in iter_records(path):
+        if cutoff is not None:
+            ts = _parse_ts(record.get("ts"))
+            if ts is None or ts < cutoff:
+                continue
+        total += 1
+        first = first or record.get("ts")
+        last = record.get("ts") or last
+        queries[normalize_query(str(record.get("query", "")))] += 1
+        if record.get("use_graph"):
+            graph += 1
+        top_ks[str(record.get("top_k"))] += 1
+        filters = record.get("filters") or {}
+        filtered += bool(filters)
+        terms = list(_filter_terms(filters)) if isinstance(filters, dict) else []
+        filter_keys.update({key for key, _ in terms})
+        filter_values.update({term for _, term in terms})
+        timings = record.get("timings") or {}
+        if isinstance(timings.get("total_ms"), (int, float)):
+            latencies.append(float(timings["total_ms"]))
+
+    summary: Dict[str, Any] = {
+        "records": total,
+        "first_ts": first,
+        "last_ts": last,
+        "unique_queries": len(queries),
+        "top_queries": [
+            {"query": query, "count": count}
+            for query, count in queries.most_common(top)
+        ],
+        "filters": {
+            "records": filtered,
+            "keys": dict(filter_keys.most_common(top)),
+            "values": dict(filter_values.most_common(top)),
+        },
+        "graph": {
+            "records": graph,
+            "pct": round(100.0 * graph / total, 2) if total else 0.0,
+        },
+        "top_k": dict(top_ks),
+    }
+    if latencies:
+        summary["latency_ms"] = {
+            "count": len(latencies),
+            "p50": round(_percentile(latencies, 50), 3),
+            "p95": round(_percentile(latencies, 95), 3),
+            "max": round(max(latencies), 3),
+        }
+    return summary
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from scripts.rag.retriever import DEFAULT_USAGE_LOG
+
+    parser = argparse.ArgumentParser(description="Summarize or rotate the usage log")
+    parser.add_argument("command", choices=["summarize", "rotate"])
+    parser.add_argument("--path", type=Path, default=DEFAULT_USAGE_LOG)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--since", default=None, help="ISO timestamp lower bound")
+    parser.add_argument("--json", action="store_true", help="Print JSON")
+    args = parser.parse_args()
+
+    if args.command == "rotate":
+        writer = UsageLogWriter(args.path, background=False)
+        rotated = writer.rotate()
+        print(f"Rotated to {rotated}" if rotated else "Nothing to rotate")
+    else:
+        report = summarize(args.path, top=args.top, since=args.since)
+        if args.json:
+            print(json.dumps(report, indent=2))
+        else:
+            graph = report["graph"]
+            print(
+                f"Records: {report['records']} "
+                f"({report['first_ts']} .. {report['last_ts']})"
+            )
+            print(f"Graph retrieval: {graph['records']} ({graph['pct']}%)")
+            print("Top queries:")
+            for item in report["top_queries"]:
+                print(f"  {item['count']:>6}  {item['query']}")
+            print("Filters:")
+            for key, count in report["filters"]["values"].items():
+                print(f"  {count:>6}  {key}")
+            if "latency_ms" in report:
+                latency = report["latency_ms"]
+                print(f"Latency: p50 {latency['p50']} ms, p95 {latency['p95']} ms")
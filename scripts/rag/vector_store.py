@@ -0,0 +1,684 @@
+#!/usr/bin/env python3
+"""
+---
+id: SCRIPT-0098
+type: script
+owner: platform-team
+status: active
+maturity: 1
+last_validated: 2026-10-18
+test:
+  runner: pytest
+  command: "pytest -q tests/unit/test_vector_store.py"
+  evidence: declared
+dry_run:
+  supported: true
+risk_profile:
+  production_impact: low
+  security_risk: low
+  coupling_risk: medium
+relates_to:
+  - PRD-0008-governance-rag-pipeline
+  - SCRIPT-0072-indexer
+  - SCRIPT-0073-retriever
+---
+Purpose: Flat (brute-force) NumPy vector store, a drop-in for ChromaDB.
+
+The corpus is a few thousand chunks, so one exact matrix product beats
+ChromaDB's client start-up, SQLite layer and HNSW index. FlatVectorStore
+implements the collection methods the pipeline uses (upsert, delete, get,
+query, count) with ChromaDB's response shapes and where-filter semantics
+($eq, $ne, $gt, $gte, $lt, $lte, $in, $nin, $and, $or), and
+FlatVectorClient mirrors the client calls (get_or_create_collection,
+get_collection, delete_collection).
+
+Embeddings are L2-normalized and stored as a float32, float16 or int8
+(per-row scale) matrix. Distances are cosine distances, and the collection
+reports hnsw:space=cosine. A query is one matmul plus argpartition over the
+rows that pass the filter, so recall is exact.
+
+On disk a collection is a directory under the persist dir
+(.chroma/flat/<name>/):
+
+    store.json      name, dim, dtype, embedding model, count
+    vectors.npy     embedding matrix (memory-mapped on open)
+    scales.npy      per-row scales (int8 only)
+    columns.json    ids plus one value list per metadata key
+    documents.json  chunk texts (read on first use)
+
+Files are replaced atomically. Select the backend with
+RAG_VECTOR_BACKEND=flat, GovernanceIndex/GovernanceRetriever(backend="flat")
+or `index_build --vector-backend flat`.
+
+Example:
+    >>> from scripts.rag.vector_store import FlatVectorClient
+    >>> client = FlatVectorClient(".chroma")
+    >>> collection = client.get_or_create_collection("governance_docs", ef)
+    >>> collection.upsert(ids=["a"], documents=["TDD policy"], metadatas=[{}])
+    >>> collection.query(query_texts=["TDD"], n_results=1)["ids"]
+    [['a']]
+"""
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Union
+import json
+import os
+import shutil
+
+from scripts.rag.lazy_imports import LazyModule
+
+# Imported when the first store opens
+np = LazyModule("numpy", "Install with: pip install numpy")
+
+
+BACKEND_CHROMA = "chroma"
+BACKEND_FLAT = "flat"
+VECTOR_BACKENDS = (BACKEND_CHROMA, BACKEND_FLAT)
+VECTOR_BACKEND_ENV_VAR = "RAG_VECTOR_BACKEND"
+
+FLAT_STORE_DIRNAME = "flat"
+FLAT_STORE_VERSION = 1
+VECTOR_DTYPES = ("float32", "float16", "int8")
+DEFAULT_VECTOR_DTYPE = "float32"
+
+_STORE_FILE = "store.json"
+_VECTORS_FILE = "vectors.npy"
+_SCALES_FILE = "scales.npy"
+_COLUMNS_FILE = "columns.json"
+_DOCUMENTS_FILE = "documents.json"
+
+_DEFAULT_GET_INCLUDE = ("documents", "metadatas")
+_DEFAULT_QUERY_INCLUDE = ("documents", "metadatas", "distances")
+
+# In-memory collections, shared by every in-memory client in the process
+# (like chromadb.Client()).
+_EPHEMERAL: Dict[str, "FlatVectorStore"] = {}
+
+
+def resolve_backend(backend: Optional[str] = None) -> str:
+    """
+    Pick the vector backend: explicit argument, then RAG_VECTOR_BACKEND,
+    then ChromaDB.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+    """
+    name = (backend or os.getenv(VECTOR_BACKEND_ENV_VAR) or BACKEND_CHROMA).lower()
+    if name not in VECTOR_BACKENDS:
+        raise ValueError(
+            f"Unknown vector backend: {name!r} (expected one of {VECTOR_BACKENDS})"
+        )
+    return name
+
+
+# ---------------------------------------------------------------------------
+# Where filters
+# ---------------------------------------------------------------------------
+
+
+def _same_kind(a: Any, b: Any) -> bool:
+    # ChromaDB compares typed values: True is not 1 and "1" is not 1
+    return isinstance(a, bool) == isinstance(b, bool) and (
+        isinstance(a, str) == isinstance(b, str)
+    )
+
+
+def _equals(value: Any, target: Any) -> bool:
+    return _same_kind(value, target) and value == target
+
+
+def _compare(op: str, value: Any, target: Any) -> bool:
+    if value is None:
+        return False
+    if op == "$eq":
+        return _equals(value, target)
+    if op == "$ne":
+        return not _equals(value, target)
+    if op == "$in":
+        return any(_equals(value, t) for t in target)
+    if op == "$nin":
+        return not any(_equals(value, t) for t in target)
+    if isinstance(value, (bool, str)) or isinstance(target, (bool, str)):
+        return False
+    if op == "$gt":
+        return value > target
+    if op == "$gte":
+        return value >= target
+    if op == "$lt":
+        return value < target
+    if op == "$lte":
+        return value <= target
+    raise ValueError(f"Unsupported where operator: {op}")
+
+
+def _field_mask(column: Optional[List[Any]], condition: Any, size: int):
+    if column is None:
+        # Records without the key never match (same as ChromaDB)
+        return np.zeros(size, dtype=bool)
+    if isinstance(condition, dict):
+        if len(condition) != 1:
+            raise ValueError(f"Expected one operator per field, got {condition}")
+        op, target = next(iter(condition.items()))
+    else:
+        op, target = "$eq", condition
+    if op in ("$in", "$nin") and not isinstance(target, (list, tuple)):
+        raise ValueError(f"{op} expects a list, got {target!r}")
+    return np.fromiter(
+        (_compare(op, value, target) for value in column), dtype=bool, count=size
+    )
+
+
+def where_mask(where: Dict[str, Any], columns: Dict[str, List[Any]], size: int):
+    """
+    Evaluate a ChromaDB where filter over columnar metadata.
+
+    Args:
+        where: Filter, e.g. {"doc_id": {"$in": [...]}} or
+            {"$and": [{"doc_type": "adr"}, {"status": "active"}]}.
+        columns: Metadata key -> one value per row (None when absent).
+        size: Number of rows.
+
+    Returns:
+        Boolean NumPy array, True for rows that match.
+
+    Raises:
+        ValueError: On an unknown operator or malformed filter.
+    """
+    mask = np.ones(size, dtype=bool)
+    for key, condition in where.items():
+        if key in ("$and", "$or"):
+            if not isinstance(condition, list) or not condition:
+                raise ValueError(f"{key} expects a non-empty list of filters")
+            parts = [where_mask(part, columns, size) for part in condition]
+            combined = parts[0].copy()
+            for part in parts[1:]:
+                if key == "$and":
+                    combined &= part
+                else:
+                    combined |= part
+            mask &= combined
+        elif key.startswith("$"):
+            raise ValueError(f"Unsupported where operator: {key}")
+        else:
+            mask &= _field_mask(columns.get(key), condition, size)
+    return mask
+
+
+# ---------------------------------------------------------------------------
+# Storage helpers
+# ---------------------------------------------------------------------------
+
+
+def _write_json(path: Path, payload: Any) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(
+        json.dumps(payload, separators=(",", ":"), default=str), encoding="utf-8"
+    )
+    os.replace(tmp_path, path)
+
+
+def _write_array(path: Path, array) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as handle:
+        np.save(handle, array)
+    os.replace(tmp_path, path)
+
+
+def _normalize(vectors):
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if vectors.ndim == 1:
+        vectors = vectors.reshape(1, -1)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+class FlatVectorStore:
+    """
+    One collection of normalized embeddings searched by brute force.
+
+    Args:
+        name: Collection name.
+        path: Directory holding the collection files (None: in memory).
+        embedding_function: Embeds documents and query_texts (called with
+            a list of strings, like a ChromaDB embedding function).
+        dtype: Storage dtype for new vectors: float32, float16 or int8.
+            An existing store keeps the dtype it was written with.
+        embedding_model: Model name recorded with the store, so readers can
+            embed queries with the model the documents were embedded with.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        path: Optional[Union[str, Path]] = None,
+        embedding_function: Optional[Callable[[List[str]], Any]] = None,
+        dtype: str = DEFAULT_VECTOR_DTYPE,
+        embedding_model: Optional[str] = None,
+    ):
+        if dtype not in VECTOR_DTYPES:
+            raise ValueError(
+                f"Unknown vector dtype: {dtype!r} (expected one of {VECTOR_DTYPES})"
+            )
+        self.name = name
+        self.path = Path(path) if path is not None else None
+        self.embedding_function = embedding_function
+        self.metadata = {"hnsw:space": "cosine"}
+        self.dtype = dtype
+        self.embedding_model = embedding_model
+        self.dim = 0
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._columns: Dict[str, List[Any]] = {}
+        self._documents: Optional[List[str]] = []
+        self._vectors = None
+        self._scales = None
+        self._writable = True
+        self._autosave = True
+        self._load()
+
+    # -- persistence --------------------------------------------------------
+
+    def exists(self) -> bool:
+        """True if the collection has been written to path."""
+        return self.path is not None and (self.path / _STORE_FILE).exists()
+
+    def _load(self) -> None:
+        if not self.exists():
+            return
+        info = json.loads((self.path / _STORE_FILE).read_text(encoding="utf-8"))
+        self.dtype = info.get("dtype", DEFAULT_VECTOR_DTYPE)
+        self.dim = int(info.get("dim", 0))
+        self.embedding_model = self.embedding_model or info.get("embedding_model")
+        columns = json.loads((self.path / _COLUMNS_FILE).read_text(encoding="utf-8"))
+        self._ids = list(columns.get("ids") or [])
+        self._rows = {chunk_id: row for row, chunk_id in enumerate(self._ids)}
+        self._columns = columns.get("columns") or {}
+        # Matrix is memory-mapped and copied only on the first write.
+        # (LazyModule.load() is the loader itself, so go through the module.)
+        numpy = np.load()
+        self._vectors = numpy.load(self.path / _VECTORS_FILE, mmap_mode="r")
+        if self.dtype == "int8":
+            self._scales = numpy.load(self.path / _SCALES_FILE)
+        self._documents = None
+        self._writable = False
+
+    def save(self) -> None:
+        """Write the collection to path (no-op in memory)."""
+        if self.path is None:
+            return
+        self.path.mkdir(parents=True, exist_ok=True)
+        _write_array(self.path / _VECTORS_FILE, self._matrix())
+        if self.dtype == "int8":
+            _write_array(self.path / _SCALES_FILE, self._scales)
+        _write_json(
+            self.path / _COLUMNS_FILE, {"ids": self._ids, "columns": self._columns}
+        )
+        _write_json(self.path / _DOCUMENTS_FILE, self._texts())
+        # Written last: a store is only visible once it is complete
+        _write_json(
+            self.path / _STORE_FILE,
+            {
+                "version": FLAT_STORE_VERSION,
+                "name": self.name,
+                "dim": self.dim,
+                "dtype": self.dtype,
+                "embedding_model": self.embedding_model,
+                "count": len(self._ids),
+                "space": "cosine",
+            },
+        )
+
+    @contextmanager
+    def deferred_save(self) -> Iterator["FlatVectorStore"]:
+        """Batch several writes and save once at the end of the block."""
+        previous, self._autosave = self._autosave, False
+        try:
+            yield self
+        finally:
+            self._autosave = previous
+        if previous:
+            self.save()
+
+    def _changed(self) -> None:
+        if self._autosave:
+            self.save()
+
+    def _matrix(self):
+        if self._vectors is None:
+            storage = np.int8 if self.dtype == "int8" else getattr(np, self.dtype)
+            return np.zeros((0, self.dim), dtype=storage)
+        return self._vectors
+
+    def _texts(self) -> List[str]:
+        if self._documents is None:
+            self._documents = json.loads(
+                (self.path / _DOCUMENTS_FILE).read_text(encoding="utf-8")
+            )
+        return self._documents
+
+    def _make_writable(self) -> None:
+        if not self._writable:
+            self._vectors = np.array(self._matrix())
+            self._texts()
+            self._writable = True
+
+    # -- vectors ------------------------------------------------------------
+
+    def _quantize(self, vectors):
+        if self.dtype == "int8":
+            scales = np.abs(vectors).max(axis=1) / 127.0
+            scales[scales == 0] = 1.0
+            quantized = np.round(vectors / scales[:, None]).astype(np.int8)
+            return quantized, scales.astype(np.float32)
+        return vectors.astype(self.dtype), None
+
+    def _dequantize(self, rows):
+        vectors = np.asarray(self._matrix()[rows], dtype=np.float32)
+        if self.dtype == "int8":
+            vectors *= self._scales[rows][:, None]
+        return vectors
+
+    def _embed(self, texts: List[str]):
+        if self.embedding_function is None:
+            raise ValueError(
+                "FlatVectorStore needs an embedding_function or explicit embeddings"
+            )
+        return self.embedding_function(list(texts))
+
+    def _similarities(self, queries, rows):
+        matrix = self._matrix()
+        block = matrix if rows is None else matrix[rows]
+        if block.dtype != np.float32:
+            block = block.astype(np.float32)
+        sims = queries @ block.T
+        if self.dtype == "int8":
+            scales = self._scales if rows is None else self._scales[rows]
+            sims *= scales[None, :]
+        return sims
+
+    # -- metadata -----------------------------------------------------------
+
+    def _row_metadata(self, row: int) -> Dict[str, Any]:
+        return {
+            key: column[row]
+            for key, column in self._columns.items()
+            if column[row] is not None
+        }
+
+    def _select(self, ids: Optional[Sequence[str]], where: Optional[Dict[str, Any]]):
+        """Row indices for ids and/or where, in ids order (or store order)."""
+        if ids is not None:
+            rows = [self._rows[i] for i in dict.fromkeys(ids) if i in self._rows]
+            rows = np.asarray(rows, dtype=np.int64)
+        else:
+            rows = np.arange(len(self._ids), dtype=np.int64)
+        if where:
+            mask = where_mask(where, self._columns, len(self._ids))
+            rows = rows[mask[rows]]
+        return rows
+
+    # -- ChromaDB collection API -------------------------------------------
+
+    def count(self) -> int:
+        return len(self._ids)
+
+    def upsert(
+        self,
+        ids: Sequence[str],
+        documents: Optional[Sequence[str]] = None,
+        metadatas: Optional[Sequence[Optional[Dict[str, Any]]]] = None,
+        embeddings: Optional[Sequence[Sequence[float]]] = None,
+    ) -> None:
+        """Insert or replace records by id."""
+        ids = list(ids)
+        if not ids:
+            return
+        if len(set(ids)) != len(ids):
+            raise ValueError("Duplicate ids in upsert")
+        documents = list(documents) if documents is not None else [""] * len(ids)
+        metadatas = list(metadatas) if metadatas is not None else [None] * len(ids)
+        if embeddings is None:
+            embeddings = self._embed(documents)
+        vectors = _normalize(embeddings)
+        if not (len(documents) == len(metadatas) == len(vectors) == len(ids)):
+            raise ValueError("ids, documents, metadatas and embeddings must align")
+        if self.dim and vectors.shape[1] != self.dim:
+            raise ValueError(
+                f"Embedding dimension {vectors.shape[1]} does not match {self.dim}"
+            )
+        self._make_writable()
+        self.dim = vectors.shape[1]
+        quantized, scales = self._quantize(vectors)
+
+        start = len(self._ids)
+        rows: List[int] = []
+        added: List[str] = []
+        for chunk_id in ids:
+            row = self._rows.get(chunk_id)
+            if row is None:
+                row = start + len(added)
+                added.append(chunk_id)
+                self._rows[chunk_id] = row
+            rows.append(row)
+        if added:
+            self._grow(len(added), quantized.dtype)
+            self._ids.extend(added)
+
+        index = np.asarray(rows, dtype=np.int64)
+        self._vectors[index] = quantized
+        if scales is not None:
+            self._scales[index] = scales
+        for row, document, metadata in zip(rows, documents, metadatas):
+            self._documents[row] = document
+            metadata = metadata or {}
+            for key in metadata:
+                if key not in self._columns:
+                    self._columns[key] = [None] * len(self._ids)
+            for key, column in self._columns.items():
+                column[row] = metadata.get(key)
+        self._changed()
+
+    add = upsert
+
+    def _grow(self, count: int, dtype) -> None:
+        """Append count empty rows to every column."""
+        size = len(self._ids)
+        matrix = np.zeros((size + count, self.dim), dtype=dtype)
+        matrix[:size] = self._matrix()
+        self._vectors = matrix
+        if self.dtype == "int8":
+            scales = np.ones(size + count, dtype=np.float32)
+            if self._scales is not None:
+                scales[:size] = self._scales
+            self._scales = scales
+        for column in self._columns.values():
+            column.extend([None] * count)
+        self._documents.extend([""] * count)
+
+    def delete(
+        self,
+        ids: Optional[Sequence[str]] = None,
+        where: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Delete records by id and/or where filter."""
+        if ids is None and not where:
+            return
+        rows = self._select(ids, where)
+        if not len(rows):
+            return
+        self._make_writable()
+        keep = np.ones(len(self._ids), dtype=bool)
+        keep[rows] = False
+        kept = np.flatnonzero(keep)
+        self._vectors = self._vectors[kept]
+        if self._scales is not None:
+            self._scales = self._scales[kept]
+        self._ids = [self._ids[i] for i in kept]
+        self._documents = [self._documents[i] for i in kept]
+        self._columns = {
+            key: [column[i] for i in kept] for key, column in self._columns.items()
+        }
+        self._columns = {
+            key: column
+            for key, column in self._columns.items()
+            if any(value is not None for value in column)
+        }
+        self._rows = {chunk_id: row for row, chunk_id in enumerate(self._ids)}
+        self._changed()
+
+    def get(
+        self,
+        ids: Optional[Sequence[str]] = None,
+        where: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        include: Sequence[str] = _DEFAULT_GET_INCLUDE,
+    ) -> Dict[str, Any]:
+        """Fetch records by id and/or where filter (ChromaDB get shape)."""
+        rows = self._select(ids, where)
+        start = offset or 0
+        rows = rows[start : start + limit if limit is not None else None]
+        return {
+            "ids": [self._ids[r] for r in rows],
+            "documents": (
+                [self._texts()[r] for r in rows] if "documents" in include else None
+            ),
+            "metadatas": (
+                [self._row_metadata(r) for r in rows]
+                if "metadatas" in include
+                else None
+            ),
+            "embeddings": (
+                self._dequantize(rows).tolist() if "embeddings" in include else None
+            ),
+        }
+
+    def query(
+        self,
+        query_embeddings: Optional[Sequence[Sequence[float]]] = None,
+        query_texts: Optional[Sequence[str]] = None,
+        n_results: int = 10,
+        where: Optional[Dict[str, Any]] = None,
+        include: Sequence[str] = _DEFAULT_QUERY_INCLUDE,
+    ) -> Dict[str, Any]:
+        """
+        Exact top-k by cosine distance (ChromaDB query shape: one inner
+        list per query).
+        """
+        if query_embeddings is None:
+            if query_texts is None:
+                raise ValueError("query needs query_embeddings or query_texts")
+            query_embeddings = self._embed(list(query_texts))
+        queries = _normalize(query_embeddings)
+        response: Dict[str, List[Any]] = {
+            "ids": [],
+            "documents": [],
+            "metadatas": [],
+            "distances": [],
+            "embeddings": [],
+        }
+        rows = self._select(None, where) if where else None
+        size = len(self._ids) if rows is None else len(rows)
+        k = min(max(int(n_results), 0), size)
+        if k and self.dim and queries.shape[1] != self.dim:
+            raise ValueError(
+                f"Query dimension {queries.shape[1]} does not match {self.dim}"
+            )
+        sims = self._similarities(queries, rows) if k else None
+
+        for q in range(len(queries)):
+            if k:
+                row_sims = sims[q]
+                top = np.argpartition(-row_sims, k - 1)[:k]
+                top = top[np.argsort(-row_sims[top], kind="stable")]
+                distances = (1.0 - row_sims[top]).tolist()
+                hits = top if rows is None else rows[top]
+            else:
+                distances, hits = [], np.zeros(0, dtype=np.int64)
+            response["ids"].append([self._ids[r] for r in hits])
+            response["distances"].append(distances)
+            if "documents" in include:
+                response["documents"].append([self._texts()[r] for r in hits])
+            if "metadatas" in include:
+                response["metadatas"].append([self._row_metadata(r) for r in hits])
+            if "embeddings" in include:
+                response["embeddings"].append(self._dequantize(hits).tolist())
+        for key in ("documents", "metadatas", "embeddings"):
+            if key not in include:
+                response[key] = None
+        if "distances" not in include:
+            response["distances"] = None
+        return response
+
+
+class FlatVectorClient:
+    """
+    ChromaDB-client stand-in that opens FlatVectorStore collections.
+
+    Args:
+        path: Persist directory (collections live in <path>/flat/<name>);
+            None keeps collections in memory.
+        dtype: Storage dtype for newly written collections.
+        embedding_model: Model name recorded by collections this client
+            writes.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        dtype: str = DEFAULT_VECTOR_DTYPE,
+        embedding_model: Optional[str] = None,
+    ):
+        self.path = Path(path) / FLAT_STORE_DIRNAME if path is not None else None
+        self.dtype = dtype
+        self.embedding_model = embedding_model
+
+    def _open(self, name: str, embedding_function: Any) -> FlatVectorStore:
+        return FlatVectorStore(
+            name,
+            self._collection_path(name),
+            embedding_function,
+            self.dtype,
+            self.embedding_model,
+        )
+
+    def _collection_path(self, name: str) -> Optional[Path]:
+        return self.path / name if self.path is not None else None
+
+    def get_or_create_collection(
+        self, name: str, embedding_function: Any = None, **_: Any
+    ) -> FlatVectorStore:
+        if self.path is None:
+            store = _EPHEMERAL.get(name)
+            if store is None:
+                store = _EPHEMERAL[name] = self._open(name, embedding_function)
+            elif embedding_function is not None:
+                store.embedding_function = embedding_function
+            return store
+        return self._open(name, embedding_function)
+
+    def get_collection(
+        self, name: str, embedding_function: Any = None, **_: Any
+    ) -> FlatVectorStore:
+        """
+        Open an existing collection.
+
+        Raises:
+            ValueError: If the collection does not exist.
+        """
+        if self.path is None:
+            if name not in _EPHEMERAL:
+                raise ValueError(f"Collection {name} does not exist.")
+            return self.get_or_create_collection(name, embedding_function)
+        store = self._open(name, embedding_function)
+        if not store.exists():
+            raise ValueError(f"Collection {name} does not exist.")
+        return store
+
+    def delete_collection(self, name: str) -> None:
+        if self.path is None:
+            _EPHEMERAL.pop(name, None)
+            return
+        shutil.rmtree(self._collection_path(name), ignore_errors=True)
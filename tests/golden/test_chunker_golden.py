@@ -10,7 +10,9 @@ To update golden files (with human approval):
 import json
 from datetime import date, datetime
 
-from scripts.rag.chunker import chunk_document
+import pytest
+
+from scripts.rag.chunker import chunk_document, chunk_markdown, chunk_markdown_native
 from scripts.rag.loader import load_governance_document
 
 
@@ -29,7 +31,49 @@ def test_gov_0017_chunks_match_golden(assert_matches_golden):
     doc = load_governance_document(input_path)
     chunks = chunk_document(doc)
 
+    assert_matches_golden(_serialize(chunks), "chunks/GOV-0017/chunks.json")
+
+
+def _serialize(chunks):
     payload = [{"text": c.text, "metadata": c.metadata} for c in chunks]
-    actual = json.dumps(payload, indent=2, sort_keys=True, cls=DateTimeEncoder)
+    return json.dumps(payload, indent=2, sort_keys=True, cls=DateTimeEncoder)
+
+
+def test_gov_0017_native_chunks_match_golden(assert_matches_golden):
+    """The native chunker should reproduce the same golden snapshot."""
+    input_path = "tests/golden/fixtures/inputs/GOV-0017-sample.md"
+    doc = load_governance_document(input_path)
+    chunks = chunk_document(doc, chunker="native")
+
+    assert_matches_golden(_serialize(chunks), "chunks/GOV-0017/chunks.json")
+
+
+# Edge cases where a hand-written splitter typically drifts from
+# MarkdownNodeParser: preamble text, skipped and deep header levels,
+# fenced code, tab-separated headers, blank sections and trailing spaces.
+PARITY_CASES = {
+    "preamble": "Intro line.\n\n# Title\nBody\n",
+    "skipped_levels": "# A\n### A.1.1\ntext\n## A.2\n#### deep\nmore\n# B\n",
+    "code_fence": "## Setup\n```bash\n# not a header\n## nor this\n```\nafter\n",
+    "indented_fence": "## S\n  ```\n# inside\n  ```\n# Out\n",
+    "tab_header": "#\tTabbed\nbody\n##\tSub\n",
+    "empty_sections": "# A\n\n# B\n\n\n## C\n   \n",
+    "hash_without_space": "#hashtag\n# Real\n#!shebang\n",
+    "trailing_space": "## Title  \ntext  \n\n",
+    "crlf": "# A\r\nline\r\n## B\r\n",
+    "empty_header_text": "# \nbody\n## child\n",
+}
+
+
+@pytest.mark.parametrize("name", sorted(PARITY_CASES))
+def test_native_chunker_matches_llamaindex(name):
+    """Native chunks must equal MarkdownNodeParser chunks, metadata included."""
+    content = PARITY_CASES[name]
+    base = {"doc_id": "DOC-1", "doc_type": "policy"}
+
+    expected = chunk_markdown(content, base)
+    actual = chunk_markdown_native(content, base)
 
-    assert_matches_golden(actual, "chunks/GOV-0017/chunks.json")
+    assert [(c.text, c.metadata) for c in actual] == [
+        (c.text, c.metadata) for c in expected
+    ]
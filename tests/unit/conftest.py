@@ -18,19 +18,33 @@ HAS_RAG_DEPS = (
 
 # RAG test files that require ML dependencies
 RAG_TEST_FILES = {
+    "test_answer_cache.py",
+    "test_benchmark.py",
     "test_chunker.py",
+    "test_context_packer.py",
+    "test_context_window.py",
+    "test_eval_runner.py",
     "test_indexer.py",
     "test_retriever.py",
+    "test_timing.py",
+    "test_usage_log.py",
+    "test_vector_store.py",
     "test_hybrid_retriever.py",
     "test_loader.py",
     "test_scope.py",
     "test_index_build.py",
     "test_index_metadata.py",
     "test_graph_ingest.py",
+    "test_graph_client.py",
+    "test_graph_store.py",
+    "test_lexical_index.py",
+    "test_metadata_index.py",
     "test_llm_synthesis.py",
     "test_ragas_evaluate.py",
     "test_ragas_baseline.py",
     "test_query_cli.py",
+    "test_query_cache.py",
+    "test_query_server.py",
 }
 
 
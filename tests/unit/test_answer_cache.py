@@ -0,0 +1,143 @@
+"""
+Unit tests for the synthesized-answer cache.
+"""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from scripts.rag.answer_cache import AnswerCache, answer_key
+from scripts.rag.llm_synthesis import RAGSynthesizer
+from scripts.rag.retriever import RetrievalResult
+
+
+def _result(chunk_id: str = "GOV-0017_0", text: str = "Tests first."):
+    return RetrievalResult(
+        id=chunk_id,
+        text=text,
+        metadata={"doc_id": "GOV-0017", "file_path": "docs/GOV-0017.md"},
+        score=0.1,
+    )
+
+
+ANSWER = {
+    "answer": "Write tests first.",
+    "citations": ["GOV-0017"],
+    "model": "llama3.2",
+    "context_chunks": 1,
+    "source_docs": ["GOV-0017"],
+}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestAnswerKey:
+    def test_normalizes_question(self):
+        results = [_result()]
+
+        assert answer_key("What is TDD?", results, "ollama", "m", 0.1) == answer_key(
+            "  what is   tdd? ", results, "ollama", "m", 0.1
+        )
+
+    def test_context_content_and_model_settings_change_key(self):
+        base = answer_key("q", [_result()], "ollama", "m", 0.1)
+
+        assert base != answer_key("q", [_result(text="Edited.")], "ollama", "m", 0.1)
+        assert base != answer_key("q", [_result("other")], "ollama", "m", 0.1)
+        assert base != answer_key("q", [_result()], "claude", "m", 0.1)
+        assert base != answer_key("q", [_result()], "ollama", "m2", 0.1)
+        assert base != answer_key("q", [_result()], "ollama", "m", 0.7)
+
+
+class TestAnswerCache:
+    def test_put_and_get(self):
+        cache = AnswerCache(path=None)
+
+        assert cache.get("k") is None
+        cache.put("k", ANSWER)
+
+        assert cache.get("k") == ANSWER
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_entries_expire(self):
+        clock = FakeClock()
+        cache = AnswerCache(path=None, ttl_seconds=10, clock=clock)
+        cache.put("k", ANSWER)
+
+        clock.now += 11
+
+        assert cache.get("k") is None
+        assert cache.stats()["entries"] == 0
+
+    def test_least_recently_used_is_evicted(self):
+        clock = FakeClock()
+        cache = AnswerCache(path=None, max_entries=2, clock=clock)
+        cache.put("a", ANSWER)
+        clock.now += 1
+        cache.put("b", ANSWER)
+        clock.now += 1
+        cache.get("a")
+        clock.now += 1
+        cache.put("c", ANSWER)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == ANSWER
+        assert cache.stats()["evictions"] == 1
+
+    def test_persists_across_instances(self, tmp_path: Path):
+        path = tmp_path / "answers.db"
+        cache = AnswerCache(path)
+        cache.put("k", ANSWER)
+        cache.close()
+
+        assert AnswerCache(path).get("k") == ANSWER
+
+
+class TestSynthesizerCache:
+    def _synth(self, chain: MagicMock) -> RAGSynthesizer:
+        with patch("scripts.rag.llm_synthesis._create_llm", return_value=MagicMock()):
+            synth = RAGSynthesizer(
+                provider="claude", retriever=MagicMock(), cache=AnswerCache(path=None)
+            )
+        synth._build_chain = MagicMock(return_value=chain)
+        return synth
+
+    def test_repeat_question_skips_llm(self):
+        chain = MagicMock()
+        chain.invoke.return_value = MagicMock(content="Write tests first.")
+        synth = self._synth(chain)
+
+        first = synth.synthesize("What is TDD?", results=[_result()])
+        second = synth.synthesize("what is TDD?", results=[_result()])
+
+        assert second == first
+        chain.invoke.assert_called_once()
+
+    def test_stream_uses_and_fills_cache(self):
+        chain = MagicMock()
+        chain.stream.return_value = iter([MagicMock(content="Cached.")])
+        synth = self._synth(chain)
+
+        list(synth.synthesize_stream("q", results=[_result()]))
+        events = list(synth.synthesize_stream("q", results=[_result()]))
+
+        assert events[0] == "Cached."
+        assert events[-1].answer == "Cached."
+        chain.stream.assert_called_once()
+
+    def test_failures_are_not_cached(self):
+        chain = MagicMock()
+        chain.invoke.side_effect = RuntimeError("timeout")
+        synth = self._synth(chain)
+
+        synth.synthesize("q", results=[_result()])
+        synth.synthesize("q", results=[_result()])
+
+        assert chain.invoke.call_count == 2
+        assert synth.cache.stats()["entries"] == 0
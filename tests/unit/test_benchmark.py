@@ -0,0 +1,84 @@
+"""
+Unit tests for the retrieval benchmark harness.
+"""
+
+from pathlib import Path
+
+from scripts.rag.benchmark import (
+    benchmark_size,
+    compare_reports,
+    generate_corpus,
+    latency_stats,
+    percentile,
+)
+
+
+def _report(build=1.0, p95=10.0, hybrid_p95=20.0, recall=0.9):
+    return {
+        "sizes": {
+            "1000": {
+                "build": {"seconds": build},
+                "query": {"p95_ms": p95, "recall_at_k": recall},
+                "hybrid_query": {"p95_ms": hybrid_p95, "recall_at_k": recall},
+            }
+        }
+    }
+
+
+class TestGenerateCorpus:
+    def test_is_deterministic(self, tmp_path: Path):
+        first = generate_corpus(tmp_path / "a", chunks=30, query_count=5, seed=7)
+        second = generate_corpus(tmp_path / "b", chunks=30, query_count=5, seed=7)
+
+        assert first.queries == second.queries
+        assert first.documents == 3
+        assert first.chunks == 30
+        docs = sorted((tmp_path / "a" / "docs" / "synthetic").glob("*.md"))
+        assert [p.read_text() for p in docs] == [
+            (tmp_path / "b" / "docs" / "synthetic" / p.name).read_text() for p in docs
+        ]
+
+    def test_docs_have_ids_and_relationships(self, tmp_path: Path):
+        generate_corpus(tmp_path, chunks=50, seed=1)
+
+        text = (tmp_path / "docs" / "synthetic" / "GOV-00000.md").read_text()
+        assert text.startswith("---\nid: GOV-00000\n")
+        assert "relates_to:" in text
+        assert text.count("\n## ") == 10
+
+
+class TestLatencyStats:
+    def test_nearest_rank_percentiles(self):
+        values = [i / 1000 for i in range(1, 101)]
+
+        assert percentile(values, 50) == 0.05
+        assert percentile(values, 95) == 0.095
+        assert percentile([], 95) == 0.0
+        assert latency_stats(values)["p95_ms"] == 95.0
+
+
+class TestCompareReports:
+    def test_within_tolerance_passes(self):
+        assert compare_reports(_report(), _report(build=1.2, p95=12.0)) == []
+
+    def test_flags_latency_and_recall_regressions(self):
+        regressions = compare_reports(
+            _report(), _report(hybrid_p95=40.0, recall=0.5), max_regression=0.25
+        )
+
+        assert any("hybrid_query.p95_ms" in r for r in regressions)
+        assert any("query.recall_at_k" in r for r in regressions)
+
+    def test_ignores_sizes_missing_from_baseline(self):
+        assert compare_reports({"sizes": {}}, _report(build=100.0)) == []
+
+
+class TestBenchmarkSize:
+    def test_builds_and_queries_small_corpus(self, tmp_path: Path):
+        section = benchmark_size(40, tmp_path, query_count=5, top_k=3)
+
+        assert section["chunks_indexed"] == 40
+        assert section["query"]["count"] == 5
+        assert section["hybrid_query"]["count"] == 5
+        assert 0.0 <= section["query"]["recall_at_k"] <= 1.0
+        assert section["memory"]["store_mb"] > 0
@@ -331,6 +331,49 @@ class TestChunkDataclass:
             assert chunk.text is not None
 
 
+# ---------------------------------------------------------------------------
+# Tests: Native Chunker
+# ---------------------------------------------------------------------------
+
+
+class TestNativeChunker:
+    """Tests for the dependency-free chunker (parity lives in tests/golden)."""
+
+    def test_chunk_document_native_matches_default(
+        self, governance_doc: GovernanceDocument
+    ):
+        """chunker="native" should produce the same chunks as LlamaIndex."""
+        expected = chunk_document(governance_doc)
+        actual = chunk_document(governance_doc, chunker="native")
+        assert [(c.text, c.metadata) for c in actual] == [
+            (c.text, c.metadata) for c in expected
+        ]
+
+    def test_native_chunker_works_without_llama_index(
+        self, governance_doc: GovernanceDocument, monkeypatch
+    ):
+        """The native chunker must not need llama-index."""
+        import scripts.rag.chunker as chunker
+
+        monkeypatch.setattr(chunker, "LLAMA_INDEX_AVAILABLE", False)
+        with pytest.raises(ImportError):
+            chunk_document(governance_doc)
+        chunks = chunk_document(governance_doc, chunker="native")
+        assert chunks and chunks[0].metadata["doc_id"]
+
+    def test_native_chunker_empty_content(self):
+        """Empty content should produce no chunks."""
+        from scripts.rag.chunker import chunk_markdown_native
+
+        assert chunk_markdown_native("", {}) == []
+        assert chunk_markdown_native("  \n\n", {}) == []
+
+    def test_unknown_chunker_raises(self, governance_doc: GovernanceDocument):
+        """An unknown chunker name should raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown chunker"):
+            chunk_document(governance_doc, chunker="regex")
+
+
 # ---------------------------------------------------------------------------
 # Tests: SentenceWindowNodeParser
 # ---------------------------------------------------------------------------
@@ -0,0 +1,135 @@
+"""
+Unit tests for token-budgeted context packing.
+"""
+
+from unittest.mock import MagicMock, patch
+
+from scripts.rag.context_packer import (
+    context_budget,
+    deduplicate,
+    estimate_tokens,
+    pack_context,
+    split_sentences,
+    trim_to_relevant,
+)
+from scripts.rag.hybrid_retriever import HybridResult
+from scripts.rag.llm_synthesis import RAGSynthesizer, _format_context
+from scripts.rag.retriever import RetrievalResult
+
+
+FILLER = "Unrelated operational detail about dashboards and alert routing. "
+
+
+def _result(chunk_id, text, score=0.1, doc_id="GOV-0017", section="Rules"):
+    return RetrievalResult(
+        id=chunk_id,
+        text=text,
+        metadata={"doc_id": doc_id, "section": section, "file_path": "docs/x.md"},
+        score=score,
+    )
+
+
+class TestEstimateAndBudget:
+    def test_estimate_is_about_four_chars_per_token(self):
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("abcd" * 10) == 10
+
+    def test_provider_budgets_and_env_override(self, monkeypatch):
+        monkeypatch.delenv("RAG_CONTEXT_TOKENS", raising=False)
+        assert context_budget("ollama") < context_budget("claude")
+        assert context_budget("unknown") > 0
+
+        monkeypatch.setenv("RAG_CONTEXT_TOKENS", "123")
+        assert context_budget("claude") == 123
+
+
+class TestTrimming:
+    def test_split_keeps_code_fences_whole(self):
+        text = "First sentence. Second one.\n```\ncode line\n```\n- item"
+
+        assert split_sentences(text) == [
+            "First sentence.",
+            "Second one.",
+            "```\ncode line\n```",
+            "- item",
+        ]
+
+    def test_keeps_query_relevant_sentences(self):
+        text = FILLER * 10 + "Coverage target is 60 percent for TDD. " + FILLER * 10
+
+        trimmed = trim_to_relevant(text, "What is the TDD coverage target?", 40)
+
+        assert "Coverage target is 60 percent for TDD." in trimmed
+        assert "\n...\n" in trimmed
+        assert estimate_tokens(trimmed) <= 40
+
+    def test_short_text_is_unchanged(self):
+        assert trim_to_relevant("Short.", "anything", 100) == "Short."
+
+
+class TestDeduplicate:
+    def test_drops_repeated_ids_and_overlapping_section_text(self):
+        text = "TDD requires tests before implementation in every script."
+        results = [
+            _result("a", text),
+            _result("a", text),
+            _result("b", text + " Also."),
+            _result("c", text, doc_id="ADR-0182"),
+        ]
+
+        assert [r.id for r in deduplicate(results)] == ["a", "c"]
+
+
+class TestPackContext:
+    def test_fills_budget_in_score_order(self):
+        results = [
+            _result("late", FILLER * 20, score=0.9, section="B"),
+            _result("best", "TDD first. " * 5, score=0.1, section="A"),
+            _result("mid", FILLER * 20, score=0.5, section="C"),
+        ]
+
+        packed = pack_context(results, "TDD", max_tokens=400)
+
+        assert [r.id for r in packed.results][:2] == ["best", "mid"]
+        assert packed.tokens <= 400
+        assert estimate_tokens(_format_context(packed.results)) <= 400
+
+    def test_trimmed_results_keep_their_type(self):
+        hybrid = HybridResult(
+            id="h",
+            text="TDD matters. " + FILLER * 50,
+            metadata={"doc_id": "GOV-0017"},
+            score=0.2,
+            source="graph",
+        )
+
+        packed = pack_context([hybrid], "TDD", max_tokens=100)
+
+        assert packed.trimmed == ["h"]
+        assert isinstance(packed.results[0], HybridResult)
+        assert packed.results[0].source == "graph"
+
+    def test_chunks_that_do_not_fit_are_dropped(self):
+        results = [
+            _result(str(i), FILLER * 4, score=i, section=str(i)) for i in range(20)
+        ]
+
+        packed = pack_context(results, "dashboards", max_tokens=300)
+
+        assert packed.dropped
+        assert len(packed.results) + len(packed.dropped) == 20
+
+
+class TestSynthesizerPacking:
+    def test_synthesize_uses_packed_context(self):
+        retriever = MagicMock()
+        results = [
+            _result(str(i), FILLER * 40, score=i, section=str(i)) for i in range(10)
+        ]
+        with patch("scripts.rag.llm_synthesis._create_llm", return_value=None):
+            synth = RAGSynthesizer(retriever=retriever, context_tokens=500)
+
+        result = synth.synthesize("dashboards", results=results)
+
+        assert result.context_chunks < 10
+        assert len(result.citations) == result.context_chunks
@@ -0,0 +1,211 @@
+"""
+Unit tests for query-time context expansion over linked chunks.
+"""
+
+from unittest.mock import MagicMock, patch
+
+from scripts.rag.chunker import (
+    DEFAULT_WINDOW_METADATA_KEY,
+    Chunk,
+    chunk_document_with_context,
+    link_chunks,
+)
+from scripts.rag.context_window import collection_fetcher, expand_context
+from scripts.rag.indexer import _generate_chunk_id
+from scripts.rag.llm_synthesis import RAGSynthesizer
+from scripts.rag.loader import GovernanceDocument
+from scripts.rag.retriever import RetrievalResult
+
+
+PROSE = """# Policy
+
+First rule applies. Second rule applies. Third rule applies.
+Fourth rule applies. Fifth rule applies. Sixth rule applies.
+
+## Details
+
+Seventh rule applies. Eighth rule applies.
+"""
+
+
+def _doc():
+    return GovernanceDocument(
+        content=PROSE,
+        metadata={"id": "GOV-0100", "title": "Rules", "type": "policy"},
+        source_path="docs/GOV-0100.md",
+    )
+
+
+def _store(chunks):
+    """id -> (text, metadata) for chunks, as the index would hold them."""
+    return {
+        _generate_chunk_id(c, i): (c.text, c.metadata) for i, c in enumerate(chunks)
+    }
+
+
+def _fetcher(store, calls=None):
+    def fetch(ids):
+        if calls is not None:
+            calls.append(list(ids))
+        return {i: store[i] for i in ids if i in store}
+
+    return fetch
+
+
+def _hit(store, chunk_id, score=0.1):
+    text, metadata = store[chunk_id]
+    return RetrievalResult(id=chunk_id, text=text, metadata=metadata, score=score)
+
+
+def _section_chunks():
+    levels = [(1, "Intro"), (2, "Scope"), (3, "Detail"), (2, "Rules"), (0, "Rules")]
+    chunks = [
+        Chunk(
+            text=f"{name} text {i}",
+            metadata={
+                "doc_id": "DOC",
+                "chunk_index": i,
+                "header_level": level,
+                "section": name,
+            },
+        )
+        for i, (level, name) in enumerate(levels)
+    ]
+    return link_chunks(chunks)
+
+
+class TestLinkChunks:
+    def test_prev_next_and_parent_ids(self):
+        chunks = _section_chunks()
+        meta = [c.metadata for c in chunks]
+
+        assert meta[0]["prev_chunk_id"] == "" and meta[0]["next_chunk_id"] == "DOC_1"
+        assert meta[4]["next_chunk_id"] == "" and meta[4]["prev_chunk_id"] == "DOC_3"
+        assert [m["parent_chunk_id"] for m in meta] == [
+            "",
+            "DOC_0",
+            "DOC_1",
+            "DOC_0",
+            "DOC_3",
+        ]
+
+    def test_ids_match_indexer_ids(self):
+        chunks = _section_chunks()
+        ids = [_generate_chunk_id(c, i) for i, c in enumerate(chunks)]
+        assert [c.metadata["next_chunk_id"] for c in chunks[:-1]] == ids[1:]
+
+
+class TestCompactSentenceWindow:
+    def test_compact_chunks_drop_window_text(self):
+        chunks = chunk_document_with_context(
+            _doc(), window_size=2, inline_context=False
+        )
+
+        for chunk in chunks:
+            assert DEFAULT_WINDOW_METADATA_KEY not in chunk.metadata
+            assert "original_text" not in chunk.metadata
+            assert chunk.metadata["context_window"] == 2
+            assert "prev_chunk_id" in chunk.metadata
+
+    def test_expansion_rebuilds_inline_window(self):
+        inline = chunk_document_with_context(_doc(), window_size=2)
+        compact = chunk_document_with_context(
+            _doc(), window_size=2, inline_context=False
+        )
+        store = _store(compact)
+
+        hits = [_hit(store, chunk_id) for chunk_id in store]
+        expanded = expand_context(hits, _fetcher(store))
+
+        assert [r.text for r in expanded] == [
+            c.metadata[DEFAULT_WINDOW_METADATA_KEY] for c in inline
+        ]
+
+    def test_one_fetch_per_step_outward(self):
+        compact = chunk_document_with_context(
+            _doc(), window_size=2, inline_context=False
+        )
+        store = _store(compact)
+        ids = list(store)
+        calls = []
+
+        hits = [_hit(store, ids[3]), _hit(store, ids[5])]
+        expand_context(hits, _fetcher(store, calls))
+
+        assert len(calls) == 2
+
+
+class TestExpandContext:
+    def test_section_chunks_unchanged_without_window(self):
+        store = _store(_section_chunks())
+        calls = []
+        hits = [_hit(store, "DOC_2")]
+
+        assert expand_context(hits, _fetcher(store, calls)) == hits
+        assert calls == []
+
+    def test_explicit_window_and_parent(self):
+        store = _store(_section_chunks())
+
+        [result] = expand_context(
+            [_hit(store, "DOC_4")], _fetcher(store), window=1, include_parent=True
+        )
+
+        # DOC_3 is both the parent and the previous chunk
+        assert result.metadata["context_ids"] == ["DOC_3", "DOC_4"]
+        assert result.text == "Rules text 3\n\nRules text 4"
+        assert result.score == 0.1
+
+    def test_parent_prefixed_when_outside_window(self):
+        store = _store(_section_chunks())
+
+        [result] = expand_context(
+            [_hit(store, "DOC_2")], _fetcher(store), include_parent=True
+        )
+
+        assert result.metadata["context_ids"] == ["DOC_1", "DOC_2"]
+
+    def test_missing_neighbours_and_already_expanded(self):
+        store = _store(_section_chunks())
+        partial = {k: v for k, v in store.items() if k != "DOC_3"}
+
+        [result] = expand_context([_hit(store, "DOC_2")], _fetcher(partial), window=2)
+        assert result.metadata["context_ids"] == ["DOC_0", "DOC_1", "DOC_2"]
+
+        calls = []
+        again = expand_context([result], _fetcher(store, calls), window=2)
+        assert again == [result] and calls == []
+
+    def test_collection_fetcher(self):
+        collection = MagicMock()
+        collection.get.return_value = {
+            "ids": ["a"],
+            "documents": ["text a"],
+            "metadatas": [None],
+        }
+
+        fetch = collection_fetcher(collection)
+
+        assert fetch(["a", "b"]) == {"a": ("text a", {})}
+        collection.get.assert_called_once_with(
+            ids=["a", "b"], include=["documents", "metadatas"]
+        )
+        assert fetch([]) == {}
+
+
+class TestSynthesizerExpansion:
+    def test_synthesize_expands_hits_from_index(self):
+        store = _store(_section_chunks())
+        retriever = MagicMock()
+        retriever.vector_retriever.collection.get.side_effect = lambda ids, include: {
+            "ids": [i for i in ids if i in store],
+            "documents": [store[i][0] for i in ids if i in store],
+            "metadatas": [store[i][1] for i in ids if i in store],
+        }
+        with patch("scripts.rag.llm_synthesis._create_llm", return_value=None):
+            synth = RAGSynthesizer(retriever=retriever, context_window=1)
+
+        result = synth.synthesize("rules", results=[_hit(store, "DOC_2")])
+
+        for text in ("Scope text 1", "Detail text 2", "Rules text 3"):
+            assert text in result.answer
@@ -0,0 +1,148 @@
+"""
+Unit tests for the persistent embedding cache.
+"""
+
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from scripts.rag.embedding_cache import (  # noqa: E402
+    CachedEmbeddingFunction,
+    EmbeddingCache,
+    cache_stats,
+)
+from scripts.rag.indexer import _MockEmbeddingFunction  # noqa: E402
+
+
+class CountingEmbeddingFunction(_MockEmbeddingFunction):
+    """Mock embedding function that records how many texts it embedded."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def __call__(self, input):
+        self.calls.append(list(input))
+        return super().__call__(input)
+
+
+class TestEmbeddingCache:
+    """Tests for EmbeddingCache storage."""
+
+    def test_round_trip_persists_across_instances(self, tmp_path: Path):
+        cache = EmbeddingCache(tmp_path, "mock")
+        cache.put_many(["alpha", "beta"], [[1.0, 2.0], [3.0, 4.0]])
+        cache.save()
+
+        reopened = EmbeddingCache(tmp_path, "mock")
+        found = reopened.get_many(["beta", "gamma", "alpha"])
+
+        assert found[0].tolist() == [3.0, 4.0]
+        assert found[1] is None
+        assert found[2].tolist() == [1.0, 2.0]
+        assert reopened.hits == 2
+        assert reopened.misses == 1
+
+    def test_keys_are_scoped_by_model(self, tmp_path: Path):
+        cache = EmbeddingCache(tmp_path, "model-a")
+        cache.put_many(["alpha"], [[1.0, 2.0]])
+        cache.save()
+
+        assert EmbeddingCache(tmp_path, "model-b").get_many(["alpha"]) == [None]
+
+    def test_grows_past_initial_capacity(self, tmp_path: Path):
+        cache = EmbeddingCache(tmp_path, "mock")
+        texts = [f"text-{i}" for i in range(1500)]
+        cache.put_many(texts, [[float(i), 0.0] for i in range(1500)])
+        cache.save()
+
+        reopened = EmbeddingCache(tmp_path, "mock")
+        assert reopened.stats()["entries"] == 1500
+        assert reopened.get_many(["text-1499"])[0].tolist() == [1499.0, 0.0]
+
+    def test_evict_keeps_most_recently_used(self, tmp_path: Path):
+        cache = EmbeddingCache(tmp_path, "mock")
+        cache.put_many(["a", "b", "c"], [[1.0], [2.0], [3.0]])
+        cache.get_many(["a"])
+
+        evicted = cache.evict(2)
+
+        assert evicted == 1
+        found = cache.get_many(["a", "b", "c"])
+        assert found[0].tolist() == [1.0]
+        assert found[1] is None
+        assert found[2].tolist() == [3.0]
+
+    def test_evict_never_rewrites_vectors_the_saved_index_uses(self, tmp_path: Path):
+        cache = EmbeddingCache(tmp_path, "mock")
+        cache.put_many(["a", "b", "c"], [[1.0], [2.0], [3.0]])
+        cache.save()
+        cache.get_many(["c"])
+
+        cache.evict(1)  # crash before save: the old index must stay valid
+
+        reopened = EmbeddingCache(tmp_path, "mock")
+        found = reopened.get_many(["a", "b", "c"])
+        assert [f.tolist() for f in found] == [[1.0], [2.0], [3.0]]
+
+        cache.save()
+        vector_files = sorted(p.name for p in (tmp_path / "mock").glob("*.f32"))
+        assert vector_files == ["vectors.1.f32"]
+        reopened = EmbeddingCache(tmp_path, "mock")
+        assert reopened.get_many(["a", "c"])[1].tolist() == [3.0]
+        assert reopened.get_many(["a"]) == [None]
+
+    def test_lookups_do_not_rewrite_the_index(self, tmp_path: Path):
+        cache = EmbeddingCache(tmp_path, "mock")
+        cache.put_many(["a"], [[1.0]])
+        cache.save()
+        index_path = tmp_path / "mock" / "index.json"
+        before = index_path.read_text()
+
+        cache.get_many(["a", "missing"])
+        cache.save()
+
+        assert index_path.read_text() == before
+
+    def test_save_enforces_max_entries(self, tmp_path: Path):
+        cache = EmbeddingCache(tmp_path, "mock", max_entries=2)
+        cache.put_many(["a", "b", "c"], [[1.0], [2.0], [3.0]])
+        cache.save()
+
+        stats = cache_stats(tmp_path)
+        assert len(stats) == 1
+        assert stats[0]["entries"] == 2
+
+
+class TestCachedEmbeddingFunction:
+    """Tests for the ChromaDB embedding function wrapper."""
+
+    def test_only_misses_reach_the_model(self, tmp_path: Path):
+        inner = CountingEmbeddingFunction()
+        wrapped = CachedEmbeddingFunction(inner, EmbeddingCache(tmp_path, "mock"))
+
+        first = wrapped(["alpha", "beta"])
+        second = wrapped(["beta", "gamma", "alpha"])
+
+        assert inner.calls == [["alpha", "beta"], ["gamma"]]
+        assert np.allclose(first[0], second[2])
+        assert np.allclose(first[1], second[0])
+
+    def test_cache_survives_restart(self, tmp_path: Path):
+        CachedEmbeddingFunction(
+            CountingEmbeddingFunction(), EmbeddingCache(tmp_path, "mock")
+        )(["alpha"])
+
+        inner = CountingEmbeddingFunction()
+        CachedEmbeddingFunction(inner, EmbeddingCache(tmp_path, "mock"))(["alpha"])
+
+        assert inner.calls == []
+
+    def test_delegates_identity_to_inner(self, tmp_path: Path):
+        inner = CountingEmbeddingFunction()
+        wrapped = CachedEmbeddingFunction(inner, EmbeddingCache(tmp_path, "mock"))
+
+        assert wrapped.name() == inner.name()
+        assert wrapped.get_config() == inner.get_config()
@@ -0,0 +1,196 @@
+"""
+Unit tests for the concurrent RAGAS evaluation runner.
+"""
+
+from pathlib import Path
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from scripts.rag.eval_runner import (
+    Checkpoint,
+    EvalConfig,
+    EvaluationRunner,
+    QuestionResult,
+    RateLimiter,
+    _metric_value,
+    summarize,
+)
+
+
+QUESTIONS = [f"Question {i}?" for i in range(6)]
+
+
+class Stages:
+    """Fake pipeline stages that record calls and peak concurrency."""
+
+    def __init__(self, delay: float = 0.0, fail_on: str = ""):
+        self.delay = delay
+        self.fail_on = fail_on
+        self.answered = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def retrieve(self, question):
+        return [], [f"context for {question}"]
+
+    def answer(self, question, results, contexts):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.answered.append(question)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        if question == self.fail_on:
+            raise RuntimeError("provider timeout")
+        return f"answer to {question}"
+
+    def score(self, question, answer, contexts):
+        return {"faithfulness": 1.0, "answer_relevancy": 0.5}
+
+
+def _runner(stages, checkpoint_path=None, config=None, concurrency=4):
+    return EvaluationRunner(
+        config or EvalConfig(),
+        concurrency=concurrency,
+        checkpoint_path=checkpoint_path,
+        retrieve=stages.retrieve,
+        answer=stages.answer,
+        score=stages.score,
+    )
+
+
+class TestEvaluationRunner:
+    def test_runs_questions_concurrently_in_order(self):
+        stages = Stages(delay=0.05)
+
+        results = _runner(stages, concurrency=3).run(QUESTIONS)
+
+        assert [r.question for r in results] == QUESTIONS
+        assert stages.peak == 3
+        assert results[0].answer == "answer to Question 0?"
+        assert results[0].scores["faithfulness"] == 1.0
+
+    def test_errors_are_recorded_per_question(self):
+        results = _runner(Stages(fail_on="Question 2?")).run(QUESTIONS)
+
+        assert "provider timeout" in results[2].error
+        assert all(r.error is None for r in results if r.question != "Question 2?")
+
+    def test_resume_skips_checkpointed_questions(self, tmp_path: Path):
+        path = tmp_path / "checkpoint.jsonl"
+        _runner(Stages(fail_on="Question 1?"), path).run(QUESTIONS[:3])
+
+        stages = Stages()
+        results = _runner(stages, path).run(QUESTIONS)
+
+        # Failed questions are retried; finished ones are not
+        assert sorted(stages.answered) == ["Question 1?"] + QUESTIONS[3:]
+        assert len(results) == len(QUESTIONS)
+        assert all(r.error is None for r in results)
+
+    def test_changed_settings_or_fresh_ignore_checkpoint(self, tmp_path: Path):
+        path = tmp_path / "checkpoint.jsonl"
+        _runner(Stages(), path).run(QUESTIONS)
+
+        stages = Stages()
+        _runner(stages, path, config=EvalConfig(top_k=10)).run(QUESTIONS)
+        assert len(stages.answered) == len(QUESTIONS)
+
+        stages = Stages()
+        _runner(stages, path).run(QUESTIONS, resume=False)
+        assert len(stages.answered) == len(QUESTIONS)
+
+
+class TestCheckpoint:
+    def test_skips_torn_lines(self, tmp_path: Path):
+        path = tmp_path / "checkpoint.jsonl"
+        checkpoint = Checkpoint(path, "sig")
+        checkpoint.append(QuestionResult(question="q", answer="a"))
+        with path.open("a") as handle:
+            handle.write('{"signature": "sig", "quest')
+
+        assert list(checkpoint.load()) == ["q"]
+
+
+class TestDefaultStages:
+    def test_retrieval_without_answer_provider_skips_synthesizer(self):
+        runner = EvaluationRunner(EvalConfig(top_k=3), checkpoint_path=None)
+        with (
+            patch("scripts.rag.hybrid_retriever.HybridRetriever") as MockRetriever,
+            patch("scripts.rag.llm_synthesis.RAGSynthesizer") as MockSynthesizer,
+        ):
+            MockRetriever.return_value.query.return_value = [MagicMock(text="ctx")]
+            results, contexts = runner._default_retrieve("q")
+            runner.close()
+
+        assert contexts == ["ctx"]
+        MockRetriever.return_value.query.assert_called_once_with("q", top_k=3)
+        MockSynthesizer.assert_not_called()
+        MockRetriever.return_value.close.assert_called_once()
+
+    def test_answer_reuses_packed_context(self):
+        runner = EvaluationRunner(
+            EvalConfig(answer_provider="claude"), checkpoint_path=None
+        )
+        packed = [MagicMock(text="ctx")]
+        runner._synthesizer = MagicMock()
+        runner._synthesizer.retrieve_context.return_value = packed
+
+        results, _ = runner._default_retrieve("q")
+        runner._default_answer("q", results, [])
+
+        runner._synthesizer.synthesize.assert_called_once_with(
+            "q", results=packed, packed=True
+        )
+
+
+class TestRateLimiter:
+    def test_spaces_acquisitions(self):
+        clock = [0.0]
+        waits = []
+        limiter = RateLimiter(per_minute=60, clock=lambda: clock[0], sleep=waits.append)
+
+        limiter.acquire()
+        limiter.acquire()
+        limiter.acquire()
+
+        assert waits == [pytest.approx(1.0), pytest.approx(2.0)]
+
+    def test_unlimited_never_waits(self):
+        limiter = RateLimiter(sleep=lambda _: pytest.fail("slept"))
+
+        assert limiter.acquire() == 0.0
+
+
+class TestSummarize:
+    def test_metric_value_handles_row_lists(self):
+        assert _metric_value({"faithfulness": [0.25]}, "faithfulness") == 0.25
+        assert _metric_value({"faithfulness": 0.5}, "faithfulness") == 0.5
+        assert _metric_value({}, "faithfulness") is None
+
+    def test_averages_scores_and_counts_errors(self):
+        results = [
+            QuestionResult("q1", "a", ["c"], {"faithfulness": 1.0}),
+            QuestionResult("q2", "a", ["c"], {"faithfulness": 0.5}),
+            QuestionResult("q3", error="RuntimeError: boom"),
+        ]
+
+        report = summarize(results, EvalConfig(), elapsed=1.5)
+
+        assert report["ragas_metrics"]["faithfulness"] == 0.75
+        assert report["ragas_metrics"]["answer_relevancy"] is None
+        assert report["runner"]["errors"] == 1
+        assert report["status"] == "partial"
+
+    def test_skip_llm_has_no_ragas_metrics(self):
+        results = [QuestionResult("q1", "a", ["c"])]
+
+        report = summarize(results, EvalConfig(score=False), elapsed=0.1)
+
+        assert report["ragas_metrics"] == {}
+        assert report["status"] == "completed"
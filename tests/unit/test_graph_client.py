@@ -0,0 +1,116 @@
+"""
+Unit tests for the Neo4j graph client read helpers.
+
+The driver is never created; read() is mocked so tests run without Neo4j.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from scripts.rag.graph_client import (
+    GraphClientConfig,
+    Neo4jGraphClient,
+    _rel_type_filter,
+)
+
+
+def _client() -> Neo4jGraphClient:
+    client = Neo4jGraphClient.__new__(Neo4jGraphClient)
+    client._config = GraphClientConfig(uri="bolt://test", user="neo4j", password="x")
+    client._driver = MagicMock()
+    client.read = MagicMock(return_value=[])
+    return client
+
+
+def _write_calls(client: Neo4jGraphClient):
+    """Return (query, rows) for each execute_write on the mocked session."""
+    session = client._driver.session.return_value.__enter__.return_value
+    return [(c[0][1], c[0][2]) for c in session.execute_write.call_args_list]
+
+
+class TestRelTypeFilter:
+    def test_empty_means_all_types(self):
+        assert _rel_type_filter(None) == ""
+
+    def test_joins_types(self):
+        rel_filter = _rel_type_filter(["RELATES_TO", "SUPERSEDES"])
+        assert rel_filter == ":RELATES_TO|SUPERSEDES"
+
+    def test_rejects_unsafe_names(self):
+        with pytest.raises(ValueError):
+            _rel_type_filter(["RELATES_TO]-() DETACH DELETE (n"])
+
+
+class TestNeighbors:
+    def test_single_query_for_all_sources(self):
+        client = _client()
+
+        client.neighbors(["B", "A", "A"], limit_per_source=3, exclude=["C"])
+
+        client.read.assert_called_once()
+        query, params = client.read.call_args[0]
+        assert "UNWIND $doc_ids" in query
+        assert params["doc_ids"] == ["A", "B"]
+        assert params["limit"] == 3
+        assert params["exclude"] == ["C"]
+
+    def test_parses_records(self):
+        client = _client()
+        client.read.return_value = [
+            {"source": "A", "related": [{"id": "B", "type": "RELATES_TO"}]}
+        ]
+
+        assert client.neighbors(["A"]) == {"A": [("B", "RELATES_TO")]}
+
+    def test_empty_input_skips_query(self):
+        client = _client()
+
+        assert client.neighbors([]) == {}
+        client.read.assert_not_called()
+
+
+class TestBulkWrites:
+    def test_upsert_documents_batches_rows(self):
+        client = _client()
+        docs = [{"id": f"DOC-{i}", "title": "t"} for i in range(5)] + [{"id": None}]
+
+        sent = client.upsert_documents(docs, batch_size=2)
+
+        calls = _write_calls(client)
+        assert sent == 5
+        assert [len(rows) for _, rows in calls] == [2, 2, 1]
+        assert all("UNWIND $rows" in query for query, _ in calls)
+        client._driver.session.assert_called_once()
+
+    def test_relate_documents_bulk_groups_by_type(self):
+        client = _client()
+        edges = [
+            ("A", "B", "RELATES_TO"),
+            ("A", "C", "SUPERSEDES"),
+            ("A", "B", "RELATES_TO"),
+            ("B", "C", "RELATES_TO"),
+            ("A", None, "RELATES_TO"),
+        ]
+
+        counts = client.relate_documents_bulk(edges)
+
+        calls = _write_calls(client)
+        assert counts == {"RELATES_TO": 2, "SUPERSEDES": 1}
+        assert len(calls) == 2
+        assert ":RELATES_TO]" in calls[0][0]
+        assert calls[0][1] == [{"src": "A", "dst": "B"}, {"src": "B", "dst": "C"}]
+
+    def test_relate_documents_bulk_rejects_unsafe_type(self):
+        client = _client()
+
+        with pytest.raises(ValueError):
+            client.relate_documents_bulk([("A", "B", "X]->() DELETE (n")])
+
+    def test_empty_input_opens_no_session(self):
+        client = _client()
+
+        client.upsert_documents([])
+        client.relate_documents_bulk([])
+
+        client._driver.session.assert_not_called()
@@ -35,7 +35,9 @@ class TestGraphIngest:
         counts = ingest_documents(docs, client)
 
         assert counts["documents"] == 2
-        assert client.upsert_document.call_count == 2
+        client.upsert_documents.assert_called_once()
+        nodes = client.upsert_documents.call_args[0][0]
+        assert [node["id"] for node in nodes] == ["DOC-001", "DOC-002"]
 
     def test_ingest_creates_relationships(self):
         client = MagicMock()
@@ -43,9 +45,12 @@ class TestGraphIngest:
 
         ingest_documents(docs, client)
 
-        assert client.relate_documents.call_count == 2
-        client.relate_documents.assert_any_call("DOC-001", "DOC-002", "RELATES_TO")
-        client.relate_documents.assert_any_call("DOC-001", "DOC-003", "RELATES_TO")
+        client.relate_documents_bulk.assert_called_once_with(
+            [
+                ("DOC-001", "DOC-002", "RELATES_TO"),
+                ("DOC-001", "DOC-003", "RELATES_TO"),
+            ]
+        )
 
     def test_ingest_handles_string_relates_to(self):
         client = MagicMock()
@@ -53,8 +58,8 @@ class TestGraphIngest:
 
         ingest_documents(docs, client)
 
-        client.relate_documents.assert_called_once_with(
-            "DOC-001", "DOC-002", "RELATES_TO"
+        client.relate_documents_bulk.assert_called_once_with(
+            [("DOC-001", "DOC-002", "RELATES_TO")]
         )
 
     def test_ingest_skips_missing_id(self):
@@ -64,4 +69,19 @@ class TestGraphIngest:
         counts = ingest_documents(docs, client)
 
         assert counts["documents"] == 1
-        client.upsert_document.assert_called_once()
+        assert len(client.upsert_documents.call_args[0][0]) == 1
+
+    def test_ingest_uses_one_bulk_call_per_kind(self):
+        client = MagicMock()
+        docs = [
+            _make_doc(f"DOC-{i:03d}", relates_to=[f"DOC-{i + 1:03d}"])
+            for i in range(50)
+        ]
+
+        counts = ingest_documents(docs, client)
+
+        assert counts["RELATES_TO"] == 50
+        assert client.upsert_documents.call_count == 1
+        assert client.relate_documents_bulk.call_count == 1
+        client.upsert_document.assert_not_called()
+        client.relate_documents.assert_not_called()
@@ -0,0 +1,79 @@
+"""
+Unit tests for the in-process graph store.
+"""
+
+from pathlib import Path
+
+from scripts.rag.graph_ingest import ingest_documents
+from scripts.rag.graph_store import LocalGraphStore, load_graph_store
+from scripts.rag.hybrid_retriever import expand_via_graph
+from scripts.rag.loader import GovernanceDocument
+
+
+def _doc(doc_id: str, **relations) -> GovernanceDocument:
+    metadata = {"id": doc_id, "title": doc_id, "file_path": f"docs/{doc_id}.md"}
+    metadata.update(relations)
+    return GovernanceDocument(content="# Title", metadata=metadata, source_path="")
+
+
+class TestLocalGraphStore:
+    def test_neighbors_are_undirected_and_weighted(self):
+        store = LocalGraphStore()
+        store.relate_documents("A", "B", "SUPERSEDES")
+        store.relate_documents("A", "C", "RELATES_TO")
+        store.relate_documents("D", "A", "DEPENDS_ON")
+
+        result = store.neighbors(["A"], weights={"SUPERSEDES": 0.5}, limit_per_source=2)
+
+        assert result == {"A": [("C", "RELATES_TO"), ("D", "DEPENDS_ON")]}
+        assert store.neighbors(["B"]) == {"B": [("A", "SUPERSEDES")]}
+
+    def test_neighbors_filters_types_and_excludes(self):
+        store = LocalGraphStore()
+        store.relate_documents_bulk(
+            [("A", "B", "RELATES_TO"), ("A", "C", "SUPERSEDES")]
+        )
+
+        assert store.neighbors(["A"], rel_types=["SUPERSEDES"]) == {
+            "A": [("C", "SUPERSEDES")]
+        }
+        assert store.neighbors(["A"], exclude=["B", "C"]) == {}
+
+    def test_round_trip(self, tmp_path: Path):
+        path = tmp_path / "graph.json"
+        store = LocalGraphStore(path)
+        store.upsert_document("A", {"id": "A", "title": "Doc A"})
+        store.relate_documents("A", "B", "RELATES_TO")
+        store.save()
+
+        reopened = load_graph_store(path)
+
+        assert reopened.neighbors(["A"]) == {"A": [("B", "RELATES_TO")]}
+        assert reopened.relationship_counts() == {"RELATES_TO": 1}
+        assert load_graph_store(tmp_path / "missing.json") is None
+
+    def test_remove_document_keeps_incoming_edges(self):
+        store = LocalGraphStore()
+        store.relate_documents("A", "B", "RELATES_TO")
+        store.relate_documents("C", "A", "RELATES_TO")
+        store.relate_documents("A", "C", "RELATES_TO")
+
+        store.remove_document("A")
+
+        assert store.neighbors(["A"]) == {"A": [("C", "RELATES_TO")]}
+        assert store.neighbors(["B"]) == {}
+
+    def test_ingest_and_expand_without_neo4j(self):
+        store = LocalGraphStore()
+        docs = [
+            _doc("GOV-0017", relates_to=["ADR-0182"]),
+            _doc("ADR-0182", depends_on="ADR-0001"),
+        ]
+
+        counts = ingest_documents(docs, store)
+
+        assert counts["documents"] == 2
+        assert store.health_check()["status"] == "healthy"
+        assert expand_via_graph({"GOV-0017"}, store, max_depth=2) == {
+            "GOV-0017": ["ADR-0182", "ADR-0001"]
+        }
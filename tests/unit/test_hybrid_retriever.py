@@ -12,6 +12,7 @@ from scripts.rag.hybrid_retriever import (
     HybridResult,
     HybridRetriever,
     expand_via_graph,
+    expand_via_graph_weighted,
     fetch_chunks_for_docs,
 )
 from scripts.rag.retriever import RetrievalResult
@@ -35,14 +36,31 @@ def mock_vector_retriever():
 def mock_graph_client():
     """Create a mock Neo4j graph client."""
     client = MagicMock()
-    # Mock session context manager
-    session = MagicMock()
-    client._driver.session.return_value.__enter__ = MagicMock(return_value=session)
-    client._driver.session.return_value.__exit__ = MagicMock(return_value=None)
-    session.run.return_value = []
+    client.neighbors.return_value = {}
     return client
 
 
+def _graph(edges):
+    """Build a neighbors() side effect from {source: [(id, type), ...]}."""
+
+    def neighbors(
+        doc_ids,
+        rel_types=None,
+        limit_per_source=None,
+        exclude=None,
+        weights=None,
+        timeout=None,
+    ):
+        result = {}
+        for doc_id in doc_ids:
+            related = [e for e in edges.get(doc_id, []) if e[0] not in (exclude or [])]
+            if related:
+                result[doc_id] = related[:limit_per_source]
+        return result
+
+    return neighbors
+
+
 @pytest.fixture
 def sample_vector_results():
     """Sample RetrievalResult objects from vector search."""
@@ -142,65 +160,120 @@ class TestExpandViaGraph:
         result = expand_via_graph({"DOC-001"}, None)
         assert result == {}
 
-    def test_expand_via_graph_queries_neo4j(self, mock_graph_client):
-        """expand_via_graph must query Neo4j with document IDs."""
-        session = MagicMock()
-        mock_graph_client._driver.session.return_value.__enter__.return_value = session
-        session.run.return_value = []
+    def test_expand_via_graph_batches_frontier_per_hop(self, mock_graph_client):
+        """expand_via_graph must issue one neighbours query for all seeds."""
+        expand_via_graph({"DOC-001", "DOC-002"}, mock_graph_client, max_fanout=4)
 
-        expand_via_graph({"DOC-001", "DOC-002"}, mock_graph_client)
-
-        session.run.assert_called_once()
-        call_args = session.run.call_args
-        assert "MATCH" in call_args[0][0]
-        # Parameters passed as second positional arg
-        assert "doc_ids" in call_args[0][1]
+        mock_graph_client.neighbors.assert_called_once()
+        args, kwargs = mock_graph_client.neighbors.call_args
+        assert args[0] == ["DOC-001", "DOC-002"]
+        assert kwargs["limit_per_source"] == 4
 
     def test_expand_via_graph_returns_related_docs(self, mock_graph_client):
         """expand_via_graph must return mapping of source to related docs."""
-        session = MagicMock()
-        mock_graph_client._driver.session.return_value.__enter__.return_value = session
-
-        # Mock Neo4j result
-        mock_record = MagicMock()
-        mock_record.__getitem__ = lambda self, key: {
-            "source": "GOV-0017",
-            "related": ["ADR-0182", "ADR-0162"],
-        }[key]
-        session.run.return_value = [mock_record]
+        mock_graph_client.neighbors.side_effect = _graph(
+            {"GOV-0017": [("ADR-0182", "RELATES_TO"), ("ADR-0162", "RELATES_TO")]}
+        )
 
         result = expand_via_graph({"GOV-0017"}, mock_graph_client)
 
-        assert "GOV-0017" in result
-        assert "ADR-0182" in result["GOV-0017"]
-        assert "ADR-0162" in result["GOV-0017"]
+        assert result == {"GOV-0017": ["ADR-0182", "ADR-0162"]}
 
-    def test_expand_via_graph_filters_by_rel_types(self, mock_graph_client):
+    def test_expand_via_graph_passes_rel_types(self, mock_graph_client):
         """expand_via_graph must filter by relationship types when provided."""
-        session = MagicMock()
-        mock_graph_client._driver.session.return_value.__enter__.return_value = session
-        session.run.return_value = []
-
         expand_via_graph(
             {"DOC-001"},
             mock_graph_client,
             rel_types=["RELATES_TO", "SUPERSEDES"],
         )
 
-        call_args = session.run.call_args
-        query = call_args[0][0]
-        assert "RELATES_TO" in query or "|" in query
+        kwargs = mock_graph_client.neighbors.call_args[1]
+        assert kwargs["rel_types"] == ["RELATES_TO", "SUPERSEDES"]
 
     def test_expand_via_graph_handles_exceptions_gracefully(self, mock_graph_client):
         """expand_via_graph must return empty dict on exception."""
-        session = MagicMock()
-        mock_graph_client._driver.session.return_value.__enter__.return_value = session
-        session.run.side_effect = Exception("Connection failed")
+        mock_graph_client.neighbors.side_effect = Exception("Connection failed")
 
         result = expand_via_graph({"DOC-001"}, mock_graph_client)
 
         assert result == {}
 
+    def test_expand_via_graph_follows_multiple_hops(self, mock_graph_client):
+        """expand_via_graph must reach documents beyond one hop up to max_depth."""
+        mock_graph_client.neighbors.side_effect = _graph(
+            {
+                "A": [("B", "RELATES_TO")],
+                "B": [("A", "RELATES_TO"), ("C", "DEPENDS_ON")],
+                "C": [("D", "RELATES_TO")],
+            }
+        )
+
+        assert expand_via_graph({"A"}, mock_graph_client, max_depth=2) == {
+            "A": ["B", "C"]
+        }
+        assert mock_graph_client.neighbors.call_count == 2
+
+    def test_expand_via_graph_excludes_visited_after_first_hop(self, mock_graph_client):
+        """Later hops must exclude documents that were already reached."""
+        mock_graph_client.neighbors.side_effect = _graph(
+            {"A": [("B", "RELATES_TO")], "B": [("C", "RELATES_TO")]}
+        )
+
+        expand_via_graph({"A"}, mock_graph_client, max_depth=3)
+
+        second_hop = mock_graph_client.neighbors.call_args_list[1][1]
+        assert second_hop["exclude"] == ["A", "B"]
+
+    def test_expand_via_graph_caps_expanded_documents(self, mock_graph_client):
+        """expand_via_graph must stop discovering documents at max_expanded."""
+        mock_graph_client.neighbors.side_effect = _graph(
+            {"A": [(f"D{i}", "RELATES_TO") for i in range(5)]}
+        )
+
+        result = expand_via_graph({"A"}, mock_graph_client, max_expanded=2)
+
+        assert result == {"A": ["D0", "D1"]}
+
+    def test_expand_via_graph_keeps_earlier_hops_on_failure(self, mock_graph_client):
+        """A failing later hop must not discard documents already found."""
+        mock_graph_client.neighbors.side_effect = [
+            {"A": [("B", "RELATES_TO")]},
+            Exception("timeout"),
+        ]
+
+        result = expand_via_graph({"A"}, mock_graph_client, max_depth=2)
+
+        assert result == {"A": ["B"]}
+
+
+class TestExpandViaGraphWeighted:
+    """Tests for path weights from expand_via_graph_weighted."""
+
+    def test_weights_decay_per_hop_and_relationship(self, mock_graph_client):
+        """Path weight must multiply relationship weights and decay per hop."""
+        mock_graph_client.neighbors.side_effect = _graph(
+            {"A": [("B", "SUPERSEDES")], "B": [("C", "RELATES_TO")]}
+        )
+
+        expansion = expand_via_graph_weighted({"A"}, mock_graph_client, max_depth=2)
+
+        assert expansion.weights == {"B": 0.8, "C": pytest.approx(0.4)}
+
+    def test_zero_weight_disables_relationship(self, mock_graph_client):
+        """Relationships weighted zero must not be followed."""
+        mock_graph_client.neighbors.side_effect = _graph(
+            {"A": [("B", "SUPERSEDES"), ("C", "RELATES_TO")]}
+        )
+
+        expansion = expand_via_graph_weighted(
+            {"A"}, mock_graph_client, rel_weights={"SUPERSEDES": 0.0}
+        )
+
+        assert expansion.related == {"A": ["C"]}
+        assert mock_graph_client.neighbors.call_args[1]["weights"] == {
+            "SUPERSEDES": 0.0
+        }
+
 
 # ---------------------------------------------------------------------------
 # Tests: fetch_chunks_for_docs
@@ -215,35 +288,117 @@ class TestFetchChunksForDocs:
         result = fetch_chunks_for_docs([], mock_vector_retriever)
         assert result == []
 
-    def test_fetch_chunks_queries_each_doc_id(
-        self, mock_vector_retriever, sample_vector_results
-    ):
-        """fetch_chunks_for_docs must query for each document ID."""
-        mock_vector_retriever.query.return_value = [sample_vector_results[0]]
-
-        fetch_chunks_for_docs(["DOC-001", "DOC-002"], mock_vector_retriever)
+    def test_fetch_chunks_uses_single_get_with_embedding(self, mock_vector_retriever):
+        """fetch_chunks_for_docs must load all docs with one collection.get."""
+        collection = mock_vector_retriever.collection
+        collection.metadata = None
+        collection.get.return_value = {
+            "ids": ["DOC-001_0", "DOC-001_1", "DOC-002_0"],
+            "documents": ["far", "near", "other"],
+            "metadatas": [
+                {"doc_id": "DOC-001"},
+                {"doc_id": "DOC-001"},
+                {"doc_id": "DOC-002"},
+            ],
+            "embeddings": [[0.0, 1.0], [1.0, 0.0], [0.5, 0.5]],
+        }
+
+        result = fetch_chunks_for_docs(
+            ["DOC-001", "DOC-002"],
+            mock_vector_retriever,
+            top_k_per_doc=1,
+            query_text="q",
+            query_embedding=[1.0, 0.0],
+        )
 
-        assert mock_vector_retriever.query.call_count == 2
+        collection.get.assert_called_once()
+        assert collection.get.call_args[1]["where"] == {
+            "doc_id": {"$in": ["DOC-001", "DOC-002"]}
+        }
+        collection.query.assert_not_called()
+        mock_vector_retriever.query.assert_not_called()
+        assert [r.id for r in result] == ["DOC-001_1", "DOC-002_0"]
+        assert result[0].score == pytest.approx(0.0)
+
+    def test_fetch_chunks_respects_cosine_space(self, mock_vector_retriever):
+        """fetch_chunks_for_docs must score with the collection distance space."""
+        collection = mock_vector_retriever.collection
+        collection.metadata = {"hnsw:space": "cosine"}
+        collection.get.return_value = {
+            "ids": ["DOC-001_0"],
+            "documents": ["text"],
+            "metadatas": [{"doc_id": "DOC-001"}],
+            "embeddings": [[2.0, 0.0]],
+        }
+
+        result = fetch_chunks_for_docs(
+            ["DOC-001"], mock_vector_retriever, query_embedding=[1.0, 0.0]
+        )
 
-    def test_fetch_chunks_deduplicates_by_chunk_id(self, mock_vector_retriever):
-        """fetch_chunks_for_docs must deduplicate by chunk ID."""
-        same_chunk = RetrievalResult(
-            id="same-chunk",
-            text="same content",
-            metadata={"doc_id": "DOC-001"},
-            score=0.1,
+        assert result[0].score == pytest.approx(0.0)
+
+    def test_fetch_chunks_embeds_with_collection_function(self, mock_vector_retriever):
+        """Without a local embedding, the collection's function embeds once."""
+        mock_vector_retriever.embed_queries.return_value = None
+        collection = mock_vector_retriever.collection
+        collection.metadata = {"hnsw:space": "cosine"}
+        collection._embedding_function = MagicMock(return_value=[[1.0, 0.0]])
+        collection.get.return_value = {
+            "ids": ["DOC-001_0", "DOC-001_1", "DOC-002_0"],
+            "documents": ["a", "b", "c"],
+            "metadatas": [
+                {"doc_id": "DOC-001"},
+                {"doc_id": "DOC-001"},
+                {"doc_id": "DOC-002"},
+            ],
+            # DOC-001 chunks are all closer than DOC-002's
+            "embeddings": [[1.0, 0.0], [1.0, 0.1], [0.0, 1.0]],
+        }
+
+        result = fetch_chunks_for_docs(
+            ["DOC-001", "DOC-002"],
+            mock_vector_retriever,
+            top_k_per_doc=1,
+            query_text="q",
         )
-        mock_vector_retriever.query.return_value = [same_chunk]
 
-        result = fetch_chunks_for_docs(["DOC-001", "DOC-002"], mock_vector_retriever)
+        collection._embedding_function.assert_called_once_with(["q"])
+        collection.query.assert_not_called()
+        assert [r.id for r in result] == ["DOC-001_0", "DOC-002_0"]
+
+    def test_fetch_chunks_falls_back_to_per_doc_queries(self, mock_vector_retriever):
+        """Without any embedding function, each document keeps its quota."""
+        mock_vector_retriever.embed_queries.return_value = None
+        collection = mock_vector_retriever.collection
+        collection._embedding_function = None
+        collection.embedding_function = None
+        rows = {
+            "DOC-001": (["DOC-001_0", "DOC-001_1"], [0.1, 0.2]),
+            "DOC-002": (["DOC-002_0"], [0.9]),
+        }
+
+        def query(query_texts, n_results, where):
+            ids, distances = rows[where["doc_id"]]
+            return {
+                "ids": [ids[:n_results]],
+                "documents": [["text"] * len(ids[:n_results])],
+                "metadatas": [[{"doc_id": where["doc_id"]}] * len(ids[:n_results])],
+                "distances": [distances[:n_results]],
+            }
+
+        collection.query.side_effect = query
+
+        result = fetch_chunks_for_docs(
+            ["DOC-001", "DOC-002"], mock_vector_retriever, query_text="q"
+        )
 
-        # Should only include the chunk once despite two queries
-        assert len(result) == 1
-        assert result[0].id == "same-chunk"
+        assert collection.query.call_count == 2
+        assert collection.query.call_args_list[0][1]["query_texts"] == ["q"]
+        assert [r.id for r in result] == ["DOC-001_0", "DOC-001_1", "DOC-002_0"]
 
     def test_fetch_chunks_handles_query_exceptions(self, mock_vector_retriever):
-        """fetch_chunks_for_docs must skip doc_ids that raise exceptions."""
-        mock_vector_retriever.query.side_effect = Exception("Query failed")
+        """fetch_chunks_for_docs must return empty results when the store fails."""
+        mock_vector_retriever.collection.query.side_effect = Exception("Query failed")
 
         result = fetch_chunks_for_docs(["DOC-001"], mock_vector_retriever)
 
@@ -284,6 +439,44 @@ class TestHybridRetrieverInit:
         )
         assert retriever.expand_depth == 1
 
+    def test_hybrid_retriever_falls_back_to_local_graph_store(
+        self, mock_vector_retriever, tmp_path, monkeypatch
+    ):
+        """Without Neo4j credentials, a persisted local graph store is used."""
+        from scripts.rag.graph_store import LocalGraphStore
+
+        path = tmp_path / "graph.json"
+        store = LocalGraphStore(path)
+        store.relate_documents("A", "B", "RELATES_TO")
+        store.save()
+        monkeypatch.delenv("NEO4J_URI", raising=False)
+        monkeypatch.delenv("NEO4J_PASSWORD", raising=False)
+        monkeypatch.setenv("RAG_GRAPH_STORE_PATH", str(path))
+
+        retriever = HybridRetriever(vector_retriever=mock_vector_retriever)
+
+        assert isinstance(retriever.graph_client, LocalGraphStore)
+        assert retriever.graph_client.neighbors(["A"]) == {"A": [("B", "RELATES_TO")]}
+
+    def test_local_graph_store_is_read_from_persist_dir(
+        self, mock_vector_retriever, tmp_path, monkeypatch
+    ):
+        """The default graph path follows the vector retriever's persist_dir."""
+        from scripts.rag.graph_store import LocalGraphStore
+
+        store = LocalGraphStore(tmp_path / "graph.json")
+        store.relate_documents("A", "B", "RELATES_TO")
+        store.save()
+        monkeypatch.delenv("NEO4J_URI", raising=False)
+        monkeypatch.delenv("NEO4J_PASSWORD", raising=False)
+        monkeypatch.delenv("RAG_GRAPH_STORE_PATH", raising=False)
+        monkeypatch.chdir(tmp_path.parent)
+        mock_vector_retriever.persist_dir = str(tmp_path)
+
+        retriever = HybridRetriever(vector_retriever=mock_vector_retriever)
+
+        assert retriever.graph_client.neighbors(["A"]) == {"A": [("B", "RELATES_TO")]}
+
     def test_hybrid_retriever_close_closes_auto_created_client(
         self, mock_vector_retriever, mock_graph_client
     ):
@@ -386,7 +579,7 @@ class TestHybridRetrieverQuery:
         retriever.query("test query", expand_graph=False)
 
         # Graph client should not be used
-        mock_graph_client._driver.session.assert_not_called()
+        mock_graph_client.neighbors.assert_not_called()
 
     def test_query_expands_via_graph_when_enabled(
         self, mock_vector_retriever, mock_graph_client, sample_vector_results
@@ -394,10 +587,6 @@ class TestHybridRetrieverQuery:
         """query must expand via graph when expand_graph=True and client available."""
         mock_vector_retriever.query.return_value = sample_vector_results
 
-        session = MagicMock()
-        mock_graph_client._driver.session.return_value.__enter__.return_value = session
-        session.run.return_value = []
-
         retriever = HybridRetriever(
             vector_retriever=mock_vector_retriever,
             graph_client=mock_graph_client,
@@ -405,7 +594,47 @@ class TestHybridRetrieverQuery:
         retriever.query("test query", expand_graph=True)
 
         # Graph client should be used
-        mock_graph_client._driver.session.assert_called()
+        mock_graph_client.neighbors.assert_called()
+
+    def test_query_penalises_graph_chunks_by_path_weight(
+        self,
+        mock_vector_retriever,
+        mock_graph_client,
+        sample_vector_results,
+        monkeypatch,
+    ):
+        """Graph-only chunks must be penalised more for weaker graph paths."""
+        mock_vector_retriever.query.return_value = sample_vector_results[:1]
+        mock_graph_client.neighbors.side_effect = _graph(
+            {
+                "GOV-0017": [
+                    ("ADR-0001", "RELATES_TO"),
+                    ("ADR-0002", "SUPERSEDES"),
+                ]
+            }
+        )
+        fetched = {}
+
+        def fake_fetch(doc_ids, retriever, top_k_per_doc=2, **kwargs):
+            fetched["doc_ids"] = doc_ids
+            return [
+                RetrievalResult(id=f"{d}_0", text=d, metadata={"doc_id": d}, score=0.2)
+                for d in doc_ids
+            ]
+
+        monkeypatch.setattr(
+            "scripts.rag.hybrid_retriever.fetch_chunks_for_docs", fake_fetch
+        )
+
+        retriever = HybridRetriever(
+            vector_retriever=mock_vector_retriever,
+            graph_client=mock_graph_client,
+        )
+        results = {r.id: r for r in retriever.query("test query")}
+
+        assert fetched["doc_ids"] == ["ADR-0001", "ADR-0002"]
+        assert results["ADR-0001_0"].score == pytest.approx(0.7)
+        assert results["ADR-0002_0"].score == pytest.approx(0.825)
 
     def test_query_sorts_results_by_score(self, mock_vector_retriever):
         """query must return results sorted by score (ascending for distance)."""
@@ -425,6 +654,26 @@ class TestHybridRetrieverQuery:
         scores = [r.score for r in results]
         assert scores == sorted(scores)
 
+    def test_query_many_batches_vector_search(
+        self, mock_vector_retriever, sample_vector_results
+    ):
+        """query_many must run one batched vector search for all queries."""
+        mock_vector_retriever.query_many.return_value = [sample_vector_results, []]
+
+        retriever = HybridRetriever(
+            vector_retriever=mock_vector_retriever,
+            graph_client=None,
+        )
+        batches = retriever.query_many(["first", "second"], top_k=2)
+
+        mock_vector_retriever.query_many.assert_called_once_with(
+            ["first", "second"], top_k=2, filters=None
+        )
+        mock_vector_retriever.query.assert_not_called()
+        assert len(batches) == 2
+        assert all(r.source == "vector" for r in batches[0])
+        assert batches[1] == []
+
 
 # ---------------------------------------------------------------------------
 # Tests: HybridRetriever.query_with_citations
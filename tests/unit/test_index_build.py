@@ -2,32 +2,24 @@
 Unit tests for index build flow.
 """
 
+import json
 from pathlib import Path
+from typing import Any, Dict
 from unittest.mock import patch
 
-from scripts.rag.index_build import build_index
-from scripts.rag.loader import GovernanceDocument
+import pytest
 
+from scripts.rag import index_build
 
-def test_build_index_writes_metadata(tmp_path: Path):
-    doc = GovernanceDocument(
-        content="# Title", metadata={"id": "DOC-1"}, source_path=""
-    )
 
-    with (
-        patch("scripts.rag.index_build.collect_markdown_paths") as mock_collect,
-        patch("scripts.rag.index_build.load_documents") as mock_load,
-        patch("scripts.rag.index_build.GovernanceIndex") as mock_index,
-        patch("scripts.rag.index_build.ingest_documents") as mock_ingest,
-        patch("scripts.rag.index_build.write_index_metadata") as mock_write,
-    ):
-        mock_collect.return_value = [tmp_path / "docs/test.md"]
-        mock_load.return_value = ([doc], [])
-        mock_index.return_value.add.return_value = 1
+def test_build_index_writes_metadata(tmp_path: Path, build):
+    _write_doc(tmp_path / "docs" / "test.md", "DOC-1", "## Section\n\nBody.")
 
-        build_index(root=tmp_path, metadata_path=tmp_path / "meta.json")
+    assert build.run()["chunks"] == len(build.index.ids) > 0
 
-        assert mock_write.called
+    meta = json.loads((tmp_path / "meta.json").read_text())
+    assert meta["document_count"] == 1
+    assert meta["incremental"] is False
 
 
 def test_collect_and_build_index_respects_scope(tmp_path: Path):
@@ -55,8 +47,6 @@ def test_collect_and_build_index_respects_scope(tmp_path: Path):
     )
     denied_path.write_text("# Ignored")
 
-    from scripts.rag import index_build
-
     # Use real collection of paths, but replace indexer to avoid heavy deps
     class FakeIndex:
         def add(self, chunks):
@@ -75,8 +65,6 @@ def test_collect_and_build_index_respects_scope(tmp_path: Path):
 
 
 def test_build_index_writes_error_report(tmp_path: Path):
-    from scripts.rag import index_build
-
     error_path = tmp_path / "bad.md"
     error_path.write_text("# bad")
     error_entry = {"path": str(error_path), "error": "boom"}
@@ -96,3 +84,243 @@ def test_build_index_writes_error_report(tmp_path: Path):
 
     report_path = tmp_path / "reports/index_errors.json"
     assert report_path.exists()
+
+
+class RecordingIndex:
+    """In-memory stand-in for GovernanceIndex that records writes."""
+
+    def __init__(self):
+        self.ids = set()
+        self.added = []
+        self.deleted = []
+
+    def add(self, chunks):
+        for chunk in chunks:
+            chunk_id = f"{chunk.metadata['doc_id']}_{chunk.metadata['chunk_index']}"
+            self.ids.add(chunk_id)
+            self.added.append(chunk_id)
+        return len(chunks)
+
+    def delete(self, ids):
+        self.deleted.extend(ids)
+        self.ids.difference_update(ids)
+        return len(ids)
+
+    def count(self):
+        return len(self.ids)
+
+    def clear(self):
+        self.ids.clear()
+
+
+class FakeBuild:
+    """Runs build_index_report over a tmp root against a RecordingIndex."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.index = RecordingIndex()
+
+    def run(self, **kwargs) -> Dict[str, Any]:
+        """Build once; index.added / index.deleted record only this run."""
+        self.index.added.clear()
+        self.index.deleted.clear()
+        with (
+            patch.object(index_build, "GovernanceIndex", return_value=self.index),
+            patch.object(index_build, "_graph_client_from_env", return_value=None),
+        ):
+            return index_build.build_index_report(
+                root=self.root, metadata_path=self.root / "meta.json", **kwargs
+            )
+
+
+@pytest.fixture
+def build(tmp_path: Path) -> FakeBuild:
+    return FakeBuild(tmp_path)
+
+
+def _write_doc(path: Path, doc_id: str, body: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        f"---\nid: {doc_id}\ntitle: {doc_id}\n---\n\n# {doc_id}\n\n{body}\n"
+    )
+
+
+def test_build_index_is_incremental(tmp_path: Path, build):
+    docs_dir = tmp_path / "docs"
+    _write_doc(docs_dir / "a.md", "DOC-A", "## One\n\nAlpha.\n\n## Two\n\nBeta.")
+    _write_doc(docs_dir / "b.md", "DOC-B", "## One\n\nGamma.")
+
+    first = build.run()
+    assert first["incremental"] is False
+    assert first["changed_files"] == 2
+    initial_ids = set(build.index.ids)
+
+    second = build.run()
+    assert second["incremental"] is True
+    assert second["chunks"] == 0
+    assert build.index.added == []
+    assert build.index.deleted == []
+
+    _write_doc(docs_dir / "a.md", "DOC-A", "## One\n\nAlpha.\n\n## Two\n\nBeta edited.")
+    third = build.run()
+    assert third["changed_files"] == 1
+    # Only the edited section is re-embedded; untouched sections are skipped.
+    assert build.index.added == ["DOC-A_2"]
+    assert build.index.deleted == []
+    assert build.index.ids == initial_ids
+
+    (docs_dir / "b.md").unlink()
+    fourth = build.run()
+    assert fourth["removed_files"] == 1
+    assert build.index.deleted and all(
+        cid.startswith("DOC-B_") for cid in build.index.deleted
+    )
+    assert not any(cid.startswith("DOC-B_") for cid in build.index.ids)
+
+    meta = json.loads((tmp_path / "meta.json").read_text())
+    assert meta["removed_files"] == ["docs/b.md"]
+    assert meta["incremental"] is True
+
+
+def test_switching_chunker_rebuilds_every_file(tmp_path: Path, build):
+    docs_dir = tmp_path / "docs"
+    _write_doc(docs_dir / "a.md", "DOC-A", "## One\n\nAlpha.\n\n## Two\n\nBeta.")
+    _write_doc(docs_dir / "b.md", "DOC-B", "## One\n\nGamma.")
+    build.run()
+
+    report = build.run(chunker="sentence-window")
+
+    assert report["incremental"] is False
+    assert report["changed_files"] == 2
+    # The store was cleared, so only sentence-window chunks remain.
+    assert build.index.ids == set(build.index.added)
+    manifest = json.loads((tmp_path / ".chroma" / "index_manifest.json").read_text())
+    assert manifest["chunker"] == "sentence-window"
+
+
+def test_parallel_chunking_matches_serial_order(tmp_path: Path):
+    from scripts.rag.index_build import iter_document_chunks
+
+    paths = []
+    for i in range(6):
+        path = tmp_path / "docs" / f"doc{i}.md"
+        _write_doc(path, f"DOC-{i}", f"## Section\n\nBody {i}.")
+        paths.append(path)
+
+    def flatten(items):
+        return [
+            (doc.metadata["id"], [c.text for c in chunks]) for doc, chunks, _ in items
+        ]
+
+    serial = flatten(iter_document_chunks(paths, workers=1))
+    parallel = flatten(iter_document_chunks(paths, workers=2))
+
+    assert parallel == serial
+    assert [doc_id for doc_id, _ in parallel] == [f"DOC-{i}" for i in range(6)]
+
+
+def test_native_chunker_matches_default_across_workers(tmp_path: Path):
+    from scripts.rag.index_build import iter_document_chunks
+
+    paths = []
+    for i in range(4):
+        path = tmp_path / "docs" / f"doc{i}.md"
+        _write_doc(path, f"DOC-{i}", f"# Title\n\n## Section\n\nBody {i}.")
+        paths.append(path)
+
+    def flatten(items):
+        return [[(c.text, c.metadata) for c in chunks] for _, chunks, _ in items]
+
+    expected = flatten(iter_document_chunks(paths, workers=1))
+    assert flatten(iter_document_chunks(paths, 1, "native")) == expected
+    assert flatten(iter_document_chunks(paths, 2, "native")) == expected
+
+
+def test_parallel_chunking_reports_errors(tmp_path: Path):
+    from scripts.rag.index_build import iter_document_chunks
+
+    good = tmp_path / "docs" / "good.md"
+    _write_doc(good, "DOC-1", "Body.")
+    missing = tmp_path / "docs" / "missing.md"
+
+    items = list(iter_document_chunks([missing, good], workers=2))
+
+    assert items[0][0] is None and items[0][2]["path"] == str(missing)
+    assert items[1][0].metadata["id"] == "DOC-1"
+
+
+def test_build_index_maintains_local_graph(tmp_path: Path, build):
+    from scripts.rag.graph_store import LocalGraphStore
+
+    docs_dir = tmp_path / "docs"
+    docs_dir.mkdir(parents=True)
+    (docs_dir / "a.md").write_text(
+        "---\nid: DOC-A\nrelates_to:\n  - DOC-B\n---\n\n# DOC-A\n\nAlpha.\n"
+    )
+    _write_doc(docs_dir / "b.md", "DOC-B", "Beta.")
+    graph_path = tmp_path / ".chroma" / "graph.json"
+
+    report = build.run()
+    assert report["graph_store"]["relationships"] == 1
+    assert LocalGraphStore(graph_path).neighbors(["DOC-B"]) == {
+        "DOC-B": [("DOC-A", "RELATES_TO")]
+    }
+
+    (docs_dir / "a.md").write_text("---\nid: DOC-A\n---\n\n# DOC-A\n\nAlpha.\n")
+    build.run()
+    assert LocalGraphStore(graph_path).neighbors(["DOC-B"]) == {}
+
+    graph_path.unlink()
+    report = build.run()
+    # A missing graph is rebuilt from unchanged documents too.
+    assert report["graph_store"]["documents"] == 2
+
+
+def test_build_index_maintains_lexical_index(tmp_path: Path, build):
+    from scripts.rag.lexical_index import LexicalIndex
+
+    docs_dir = tmp_path / "docs"
+    _write_doc(docs_dir / "a.md", "DOC-A", "## One\n\nMentions ADR-0186.")
+    _write_doc(docs_dir / "b.md", "DOC-B", "## One\n\nGamma.")
+    lexical_path = tmp_path / ".chroma" / "lexical_index.json.gz"
+
+    build.run()
+    assert LexicalIndex(lexical_path).search("ADR-0186")[0][0].startswith("DOC-A_")
+
+    _write_doc(docs_dir / "a.md", "DOC-A", "## One\n\nNo identifiers here.")
+    _write_doc(docs_dir / "b.md", "DOC-B", "## One\n\nNow cites ADR-0186.")
+    build.run()
+    hits = LexicalIndex(lexical_path).search("ADR-0186")
+    assert [chunk_id.split("_")[0] for chunk_id, _ in hits] == ["DOC-B"]
+
+    lexical_path.unlink()
+    report = build.run()
+    assert report["lexical_index"]["chunks"] == len(build.index.ids)
+
+
+def test_build_index_maintains_metadata_index(tmp_path: Path, build):
+    from scripts.rag.metadata_index import MetadataIndex
+
+    docs_dir = tmp_path / "docs"
+    docs_dir.mkdir()
+    (docs_dir / "a.md").write_text(
+        "---\nid: DOC-A\nrelates_to:\n  - ADR-0186-retrieval\n---\n\n"
+        "# DOC-A\n\nAlpha.\n"
+    )
+    _write_doc(docs_dir / "b.md", "DOC-B", "## One\n\nGamma.")
+    index_path = tmp_path / ".chroma" / "metadata_index.json.gz"
+
+    build.run()
+    index = MetadataIndex(index_path)
+    assert index.match("relates_to", "$eq", "ADR-0186") == {"DOC-A"}
+    assert index.chunk_ids({"DOC-A"}) == {
+        i for i in build.index.ids if i.startswith("DOC-A_")
+    }
+
+    (docs_dir / "a.md").write_text("---\nid: DOC-A\n---\n\n# DOC-A\n\nAlpha.\n")
+    build.run()
+    assert MetadataIndex(index_path).match("relates_to", "$eq", "ADR-0186") == set()
+
+    index_path.unlink()
+    report = build.run()
+    assert report["metadata_index"]["documents"] == 2
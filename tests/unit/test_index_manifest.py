@@ -0,0 +1,81 @@
+"""
+Unit tests for the incremental index manifest.
+"""
+
+from pathlib import Path
+
+from scripts.rag.chunker import Chunk
+from scripts.rag.index_manifest import (
+    FileRecord,
+    IndexManifest,
+    diff_manifest,
+    hash_chunk,
+    hash_paths,
+    load_manifest,
+    write_manifest,
+)
+
+
+def test_diff_manifest_classifies_paths():
+    manifest = IndexManifest(
+        files={
+            "docs/a.md": FileRecord(content_hash="1"),
+            "docs/b.md": FileRecord(content_hash="2"),
+            "docs/gone.md": FileRecord(content_hash="3"),
+        }
+    )
+    diff = diff_manifest(
+        manifest, {"docs/a.md": "1", "docs/b.md": "changed", "docs/new.md": "4"}
+    )
+
+    assert diff.unchanged == ["docs/a.md"]
+    assert diff.modified == ["docs/b.md"]
+    assert diff.added == ["docs/new.md"]
+    assert diff.removed == ["docs/gone.md"]
+    assert diff.changed == ["docs/b.md", "docs/new.md"]
+
+
+def test_manifest_round_trip(tmp_path: Path):
+    path = tmp_path / "index_manifest.json"
+    manifest = IndexManifest(
+        embedding_model="mock",
+        chunker="native",
+        files={"docs/a.md": FileRecord("abc", "DOC-1", {"DOC-1_0": "h0"})},
+    )
+    write_manifest(path, manifest)
+
+    loaded = load_manifest(path)
+
+    assert loaded.embedding_model == "mock"
+    assert loaded.chunker == "native"
+    assert loaded.files["docs/a.md"].chunks == {"DOC-1_0": "h0"}
+
+
+def test_load_manifest_missing_or_corrupt_is_empty(tmp_path: Path):
+    assert load_manifest(tmp_path / "missing.json").files == {}
+    corrupt = tmp_path / "corrupt.json"
+    corrupt.write_text("{not json")
+    assert load_manifest(corrupt).files == {}
+
+
+def test_hash_chunk_changes_with_metadata():
+    base = Chunk(text="## A\nBody", metadata={"doc_id": "DOC-1", "chunk_index": 0})
+    retitled = Chunk(
+        text="## A\nBody",
+        metadata={"doc_id": "DOC-1", "chunk_index": 0, "title": "New"},
+    )
+    assert hash_chunk(base) == hash_chunk(
+        Chunk(text="## A\nBody", metadata=dict(base.metadata))
+    )
+    assert hash_chunk(base) != hash_chunk(retitled)
+
+
+def test_hash_paths_reports_unreadable_files(tmp_path: Path):
+    present = tmp_path / "docs" / "a.md"
+    present.parent.mkdir()
+    present.write_text("# A")
+
+    hashes, errors = hash_paths([present, tmp_path / "docs" / "missing.md"], tmp_path)
+
+    assert list(hashes) == ["docs/a.md"]
+    assert len(errors) == 1
@@ -4,7 +4,11 @@ Unit tests for index metadata artifact.
 
 from pathlib import Path
 
-from scripts.rag.index_metadata import build_index_metadata, write_index_metadata
+from scripts.rag.index_metadata import (
+    build_index_metadata,
+    read_index_metadata,
+    write_index_metadata,
+)
 
 
 def test_build_index_metadata_sets_fields():
@@ -20,3 +24,11 @@ def test_write_index_metadata_writes_json(tmp_path: Path):
     write_index_metadata(out, meta)
     content = out.read_text()
     assert "deadbeef" in content
+
+
+def test_read_index_metadata_round_trip(tmp_path: Path):
+    out = tmp_path / "index_metadata.json"
+    write_index_metadata(out, build_index_metadata(document_count=3, source_sha="cafe"))
+
+    assert read_index_metadata(out)["source_sha"] == "cafe"
+    assert read_index_metadata(tmp_path / "missing.json") is None
@@ -26,6 +26,7 @@ from scripts.rag.indexer import (
     get_collection,
     delete_collection,
     GovernanceIndex,
+    IndexBatchError,
     DEFAULT_EMBEDDING_MODEL,
 )
 from scripts.rag.chunker import Chunk
@@ -174,15 +175,15 @@ class TestCollectionManagement:
 class TestIndexingChunks:
     """Tests for indexing chunks into ChromaDB."""
 
-    def test_index_chunks_adds_to_collection(
+    def test_index_chunks_upserts_into_collection(
         self, mock_chroma_client, mock_collection, sample_chunks
     ):
-        """index_chunks must add chunks to the collection."""
+        """index_chunks must upsert chunks into the collection."""
         mock_chroma_client.get_or_create_collection.return_value = mock_collection
 
         index_chunks(sample_chunks, collection=mock_collection)
 
-        mock_collection.add.assert_called_once()
+        mock_collection.upsert.assert_called_once()
 
     def test_index_chunks_includes_text(
         self, mock_chroma_client, mock_collection, sample_chunks
@@ -192,7 +193,7 @@ class TestIndexingChunks:
 
         index_chunks(sample_chunks, collection=mock_collection)
 
-        call_args = mock_collection.add.call_args
+        call_args = mock_collection.upsert.call_args
         documents = call_args[1]["documents"]
         assert len(documents) == 3
         assert "## Purpose" in documents[0]
@@ -205,7 +206,7 @@ class TestIndexingChunks:
 
         index_chunks(sample_chunks, collection=mock_collection)
 
-        call_args = mock_collection.add.call_args
+        call_args = mock_collection.upsert.call_args
         metadatas = call_args[1]["metadatas"]
         assert len(metadatas) == 3
         assert metadatas[0]["doc_id"] == "GOV-0017"
@@ -219,7 +220,7 @@ class TestIndexingChunks:
 
         index_chunks(sample_chunks, collection=mock_collection)
 
-        call_args = mock_collection.add.call_args
+        call_args = mock_collection.upsert.call_args
         ids = call_args[1]["ids"]
         assert len(ids) == 3
         assert len(set(ids)) == 3  # All IDs are unique
@@ -232,7 +233,7 @@ class TestIndexingChunks:
 
         index_chunks(sample_chunks, collection=mock_collection)
 
-        call_args = mock_collection.add.call_args
+        call_args = mock_collection.upsert.call_args
         ids = call_args[1]["ids"]
         # IDs should follow pattern: {doc_id}_{chunk_index}
         assert "GOV-0017_0" in ids[0] or "GOV-0017" in ids[0]
@@ -252,7 +253,85 @@ class TestIndexingChunks:
         result = index_chunks([], collection=mock_collection)
 
         assert result == 0
-        mock_collection.add.assert_not_called()
+        mock_collection.upsert.assert_not_called()
+
+
+class TestBatchedUpserts:
+    """Tests for streaming, size-bounded upserts."""
+
+    @staticmethod
+    def _chunks(n: int, text: str = "body"):
+        return (
+            Chunk(text=text, metadata={"doc_id": "DOC", "chunk_index": i})
+            for i in range(n)
+        )
+
+    def test_flushes_by_count(self, mock_collection):
+        """index_chunks must split the stream into batch_size batches."""
+        count = index_chunks(self._chunks(5), collection=mock_collection, batch_size=2)
+
+        assert count == 5
+        sizes = [len(c[1]["ids"]) for c in mock_collection.upsert.call_args_list]
+        assert sizes == [2, 2, 1]
+
+    def test_flushes_by_bytes(self, mock_collection):
+        """index_chunks must flush before a batch exceeds max_batch_bytes."""
+        index_chunks(
+            self._chunks(3, text="x" * 100),
+            collection=mock_collection,
+            max_batch_bytes=200,
+        )
+
+        sizes = [len(c[1]["ids"]) for c in mock_collection.upsert.call_args_list]
+        assert sizes == [1, 1, 1]
+
+    def test_duplicate_ids_split_batches(self, mock_collection):
+        """Repeated ids must not appear twice in one upsert call."""
+        chunks = [
+            Chunk(text="old", metadata={"doc_id": "DOC", "chunk_index": 0}),
+            Chunk(text="new", metadata={"doc_id": "DOC", "chunk_index": 0}),
+        ]
+
+        index_chunks(chunks, collection=mock_collection)
+
+        assert mock_collection.upsert.call_count == 2
+        assert mock_collection.upsert.call_args[1]["documents"] == ["new"]
+
+    def test_reports_batch_stats(self, mock_collection):
+        """index_chunks must report timing and size per batch."""
+        stats = []
+
+        index_chunks(
+            self._chunks(3),
+            collection=mock_collection,
+            batch_size=2,
+            on_batch=stats.append,
+        )
+
+        assert [s.count for s in stats] == [2, 1]
+        assert [s.indexed for s in stats] == [2, 3]
+        assert all(s.seconds >= 0 and s.bytes > 0 for s in stats)
+
+    def test_failure_reports_resume_offset(self, mock_collection):
+        """A failed batch must raise IndexBatchError with the resume offset."""
+        mock_collection.upsert.side_effect = [None, RuntimeError("boom")]
+
+        with pytest.raises(IndexBatchError) as excinfo:
+            index_chunks(self._chunks(4), collection=mock_collection, batch_size=2)
+
+        assert excinfo.value.indexed == 2
+        mock_collection.upsert.side_effect = None
+        mock_collection.upsert.reset_mock()
+
+        resumed = index_chunks(
+            list(self._chunks(4)),
+            collection=mock_collection,
+            batch_size=2,
+            start_at=excinfo.value.indexed,
+        )
+
+        assert resumed == 2
+        assert mock_collection.upsert.call_args[1]["ids"] == ["DOC_2", "DOC_3"]
 
 
 # ---------------------------------------------------------------------------
@@ -294,6 +373,19 @@ class TestGovernanceIndex:
         call_args = mock_chroma_client.get_or_create_collection.call_args
         assert "embedding_function" in call_args[1]
 
+    def test_governance_index_wraps_embedding_cache(self, mock_chroma_client, tmp_path):
+        """GovernanceIndex should wrap the model when a cache dir is set."""
+        pytest.importorskip("numpy")
+        from scripts.rag.embedding_cache import CachedEmbeddingFunction
+
+        index = GovernanceIndex(
+            embedding_model="mock", embedding_cache_dir=str(tmp_path)
+        )
+
+        call_args = mock_chroma_client.get_or_create_collection.call_args
+        assert isinstance(call_args[1]["embedding_function"], CachedEmbeddingFunction)
+        assert index.embedding_function is call_args[1]["embedding_function"]
+
     def test_governance_index_add_chunks(
         self, mock_chroma_client, mock_collection, sample_chunks
     ):
@@ -304,7 +396,7 @@ class TestGovernanceIndex:
         count = index.add(sample_chunks)
 
         assert count == 3
-        mock_collection.add.assert_called_once()
+        mock_collection.upsert.assert_called_once()
 
     def test_governance_index_count(self, mock_chroma_client, mock_collection):
         """GovernanceIndex.count must return collection size."""
@@ -349,7 +441,7 @@ class TestMetadataHandling:
 
         index_chunks(chunks, collection=mock_collection)
 
-        call_args = mock_collection.add.call_args
+        call_args = mock_collection.upsert.call_args
         metadatas = call_args[1]["metadatas"]
         # ChromaDB doesn't support lists, so they should be stringified
         relates_to = metadatas[0].get("relates_to")
@@ -372,7 +464,7 @@ class TestMetadataHandling:
 
         index_chunks(chunks, collection=mock_collection)
 
-        call_args = mock_collection.add.call_args
+        call_args = mock_collection.upsert.call_args
         metadatas = call_args[1]["metadatas"]
         assert metadatas[0]["section"] == "Introduction"
 
@@ -392,7 +484,7 @@ class TestMetadataHandling:
 
         index_chunks(chunks, collection=mock_collection)
 
-        call_args = mock_collection.add.call_args
+        call_args = mock_collection.upsert.call_args
         metadatas = call_args[1]["metadatas"]
         assert metadatas[0]["chunk_index"] == 5
         assert metadatas[0]["header_level"] == 2
@@ -415,6 +507,6 @@ class TestMetadataHandling:
 
         index_chunks(chunks, collection=mock_collection)
 
-        call_args = mock_collection.add.call_args
+        call_args = mock_collection.upsert.call_args
         metadatas = call_args[1]["metadatas"]
         assert metadatas[0]["effective_date"] == "2028-01-01"
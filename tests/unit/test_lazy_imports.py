@@ -0,0 +1,140 @@
+"""
+Unit tests for lazy dependency imports and the import-time budget.
+
+TestImportBudgets runs each entry point in a fresh interpreter with
+`python -X importtime`, so a module that starts importing chromadb,
+llama-index, langchain or neo4j at load time fails here. The millisecond
+budgets depend on the machine, so that check is marked slow (run with
+--runslow); CI enforces it in the retrieval-benchmark job.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from scripts.rag.lazy_imports import (
+    IMPORT_BUDGETS_MS,
+    ImportProfile,
+    LazyModule,
+    measure_import_time,
+    module_available,
+    parse_importtime,
+)
+
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   yaml.error
+import time:      2000 |       2500 | yaml
+import time:      3000 |       5500 | scripts.rag.loader
+import time:        50 |         50 | yaml
+"""
+
+
+class TestLazyModule:
+    def test_imports_on_first_attribute_access(self):
+        lazy = LazyModule("json")
+
+        assert not lazy.loaded
+        assert lazy.dumps([1]) == "[1]"
+        assert lazy.loaded
+
+    def test_missing_module_is_falsy_and_raises_on_use(self):
+        lazy = LazyModule("scripts_rag_missing_dependency", "Install it")
+
+        assert not lazy
+        with pytest.raises(ImportError, match="Install it"):
+            lazy.anything
+
+    def test_truthiness_does_not_import(self):
+        lazy = LazyModule("json")
+
+        assert lazy
+        assert not lazy.loaded
+
+    def test_module_available_handles_missing_parent(self):
+        assert module_available("json")
+        assert not module_available("scripts_rag_missing_dependency.sub")
+
+
+class TestPatchedModules:
+    def test_retriever_client_uses_patched_chromadb(self):
+        from scripts.rag import retriever
+
+        with patch("scripts.rag.retriever.chromadb") as mock_chromadb:
+            retriever._get_client(in_memory=True)
+
+        mock_chromadb.Client.assert_called_once()
+
+    def test_retriever_client_without_chromadb(self):
+        from scripts.rag import retriever
+
+        with patch("scripts.rag.retriever.chromadb", None):
+            with pytest.raises(ImportError):
+                retriever._get_client()
+
+    def test_graph_client_requires_neo4j(self):
+        from scripts.rag.graph_client import GraphClientConfig, Neo4jGraphClient
+
+        config = GraphClientConfig(uri="bolt://test", user="neo4j", password="x")
+        with patch("scripts.rag.graph_client.neo4j", None):
+            with pytest.raises(ImportError):
+                Neo4jGraphClient(config)
+
+    def test_graph_client_uses_patched_driver(self):
+        from scripts.rag.graph_client import GraphClientConfig, Neo4jGraphClient
+
+        config = GraphClientConfig(uri="bolt://test", user="neo4j", password="x")
+        mock_neo4j = MagicMock()
+        with patch("scripts.rag.graph_client.neo4j", mock_neo4j):
+            client = Neo4jGraphClient(config)
+
+        assert client._driver is mock_neo4j.GraphDatabase.driver.return_value
+
+
+class TestParseImporttime:
+    def test_cumulative_milliseconds_per_module(self):
+        modules = parse_importtime(IMPORTTIME_OUTPUT)
+
+        assert modules["scripts.rag.loader"] == 5.5
+        assert modules["yaml.error"] == 0.12
+
+    def test_repeated_module_keeps_largest(self):
+        assert parse_importtime(IMPORTTIME_OUTPUT)["yaml"] == 2.5
+
+    def test_profile_flags_heavy_imports_and_budget(self):
+        profile = ImportProfile(
+            module="scripts.rag.cli",
+            total_ms=50.0,
+            modules={"scripts.rag.cli": 50.0, "chromadb": 40.0},
+            budget_ms=100,
+        )
+
+        assert profile.heavy_imports == ["chromadb"]
+        assert not profile.ok
+        assert profile.slowest(1) == [("chromadb", 40.0)]
+
+    def test_profile_over_budget(self):
+        profile = ImportProfile("scripts.rag.cli", 150.0, budget_ms=100)
+
+        assert not profile.ok
+
+
+class TestImportBudgets:
+    @pytest.mark.parametrize("module", sorted(IMPORT_BUDGETS_MS))
+    def test_entry_point_has_no_heavy_imports(self, module):
+        profile = measure_import_time(module, runs=1)
+
+        assert (
+            not profile.heavy_imports
+        ), f"{module} imports {profile.heavy_imports} at load time"
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize("module", sorted(IMPORT_BUDGETS_MS))
+    def test_entry_point_within_budget(self, module):
+        profile = measure_import_time(module, runs=2)
+
+        assert profile.total_ms <= profile.budget_ms, (
+            f"{module} took {profile.total_ms:.1f}ms "
+            f"(budget {profile.budget_ms}ms); slowest: {profile.slowest()}"
+        )
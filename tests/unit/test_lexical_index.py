@@ -0,0 +1,167 @@
+"""
+Unit tests for the BM25 lexical index and rank fusion.
+"""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from scripts.rag.lexical_index import (
+    LexicalIndex,
+    load_lexical_index,
+    reciprocal_rank_fusion,
+    tokenize,
+)
+from scripts.rag.retriever import GovernanceRetriever
+
+
+def _index() -> LexicalIndex:
+    index = LexicalIndex()
+    index.add(
+        {
+            "GOV-0017_0": "GOV-0017 defines TDD requirements for scripts.",
+            "ADR-0186_0": "ADR-0186 selects LlamaIndex; see GOV-0017 for tests.",
+            "DOC-0001_0": "Terraform module creates an aws_s3_bucket resource.",
+        }
+    )
+    return index
+
+
+class TestTokenize:
+    def test_keeps_identifiers_whole_and_splits_parts(self):
+        assert tokenize("See GOV-0017.") == ["see", "gov-0017", "gov", "0017"]
+
+    def test_snake_case_resource_names(self):
+        assert "aws_s3_bucket" in tokenize("resource aws_s3_bucket logs")
+
+
+class TestLexicalIndex:
+    def test_exact_identifier_ranks_first(self):
+        hits = _index().search("What does gov-0017 require?")
+
+        assert hits[0][0] == "GOV-0017_0"
+        assert [chunk_id for chunk_id, _ in hits] == ["GOV-0017_0", "ADR-0186_0"]
+
+    def test_resource_name_match(self):
+        assert _index().search("aws_s3_bucket")[0][0] == "DOC-0001_0"
+
+    def test_remove_and_replace(self):
+        index = _index()
+        index.remove(["GOV-0017_0"])
+        index.add({"ADR-0186_0": "unrelated"})
+
+        assert index.search("GOV-0017") == []
+        assert len(index) == 2
+
+    def test_round_trip(self, tmp_path: Path):
+        path = tmp_path / "lexical_index.json.gz"
+        index = _index()
+        index.path = path
+        index.save()
+
+        reopened = load_lexical_index(path)
+
+        assert reopened.search("ADR-0186") == index.search("ADR-0186")
+        assert reopened.stats() == index.stats()
+        assert load_lexical_index(tmp_path / "missing.json.gz") is None
+
+
+class TestReciprocalRankFusion:
+    def test_agreement_beats_single_list(self):
+        fused = reciprocal_rank_fusion([["a", "b"], ["b", "c"]])
+
+        assert [item for item, _ in fused] == ["b", "a", "c"]
+
+    def test_scores_are_normalized_rank_scores(self):
+        fused = dict(reciprocal_rank_fusion([["a"], ["a", "b"]]))
+
+        assert fused["a"] == 1.0
+        assert 0.0 < fused["b"] < fused["a"]
+
+
+class TestRetrieverFusion:
+    def test_lexical_only_hit_is_fetched_and_fused(self, tmp_path: Path):
+        path = tmp_path / "lexical_index.json.gz"
+        index = _index()
+        index.path = path
+        index.save()
+
+        collection = MagicMock()
+        collection.query.return_value = {
+            "ids": [["DOC-0001_0"]],
+            "documents": [["Terraform module"]],
+            "metadatas": [[{"doc_id": "DOC-0001"}]],
+            "distances": [[0.4]],
+        }
+        collection.metadata = {"hnsw:space": "cosine"}
+        collection.get.return_value = {
+            "ids": ["GOV-0017_0"],
+            "documents": ["GOV-0017 defines TDD requirements for scripts."],
+            "metadatas": [{"doc_id": "GOV-0017"}],
+            "embeddings": [[0.8, 0.6]],
+        }
+        retriever = GovernanceRetriever(
+            collection=collection, usage_log_path=None, lexical_index_path=path
+        )
+        retriever.embedding_function = MagicMock(return_value=[[1.0, 0.0]])
+
+        results = retriever.query("GOV-0017", top_k=2, filters={"doc_type": "policy"})
+
+        assert [r.id for r in results] == ["DOC-0001_0", "GOV-0017_0"]
+        assert collection.get.call_args[1]["ids"] == ["GOV-0017_0", "ADR-0186_0"]
+        assert collection.get.call_args[1]["where"] == {"doc_type": "policy"}
+        # Vector distances are kept; the fused order is in metadata
+        assert [r.score for r in results] == pytest.approx([0.4, 0.2])
+        assert [r.metadata["fused_rank"] for r in results] == [1, 2]
+
+    def test_query_many_fetches_lexical_hits_once(self, tmp_path: Path):
+        path = tmp_path / "lexical_index.json.gz"
+        index = _index()
+        index.path = path
+        index.save()
+
+        collection = MagicMock()
+        collection.query.return_value = {
+            "ids": [["DOC-0001_0"], ["DOC-0001_0"]],
+            "documents": [["Terraform module"], ["Terraform module"]],
+            "metadatas": [[{"doc_id": "DOC-0001"}], [{"doc_id": "DOC-0001"}]],
+            "distances": [[0.4], [0.5]],
+        }
+        collection.metadata = {"hnsw:space": "cosine"}
+        collection.get.return_value = {
+            "ids": ["GOV-0017_0", "ADR-0186_0"],
+            "documents": ["GOV-0017 defines TDD.", "ADR-0186 selects LlamaIndex."],
+            "metadatas": [{"doc_id": "GOV-0017"}, {"doc_id": "ADR-0186"}],
+            "embeddings": [[0.8, 0.6], [0.0, 1.0]],
+        }
+        retriever = GovernanceRetriever(
+            collection=collection, usage_log_path=None, lexical_index_path=path
+        )
+        retriever.embedding_function = MagicMock(return_value=[[1.0, 0.0], [0.0, 1.0]])
+
+        batches = retriever.query_many(["GOV-0017", "ADR-0186"], top_k=2)
+
+        collection.get.assert_called_once()
+        assert collection.get.call_args[1]["ids"] == ["GOV-0017_0", "ADR-0186_0"]
+        # The vector-search embeddings are reused to score lexical-only hits
+        retriever.embedding_function.assert_called_once()
+        assert batches[0][1].id == "GOV-0017_0"
+        assert batches[0][1].score == pytest.approx(0.2)
+        assert batches[1][0].id == "ADR-0186_0"
+        assert batches[1][0].score == pytest.approx(0.0)
+
+    def test_disabled_without_index(self):
+        collection = MagicMock()
+        collection.query.return_value = {
+            "ids": [["A_0"]],
+            "documents": [["text"]],
+            "metadatas": [[{}]],
+            "distances": [[0.4]],
+        }
+        retriever = GovernanceRetriever(collection=collection, usage_log_path=None)
+
+        results = retriever.query("GOV-0017")
+
+        assert results[0].score == 0.4
+        collection.get.assert_not_called()
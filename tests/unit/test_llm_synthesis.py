@@ -431,6 +431,87 @@ class TestRAGSynthesizerSynthesize:
 
         mock_retriever.query.assert_called_once()
 
+    def test_packed_results_are_not_expanded_again(
+        self, mock_retriever, mock_hybrid_results
+    ):
+        """synthesize(packed=True) must use retrieve_context output as is."""
+        with patch("scripts.rag.llm_synthesis._create_llm", return_value=None):
+            synth = RAGSynthesizer(provider="ollama", retriever=mock_retriever)
+        synth._expand = MagicMock(side_effect=AssertionError("expanded twice"))
+
+        result = synth.synthesize("q", results=mock_hybrid_results, packed=True)
+
+        assert result.context_chunks == len(mock_hybrid_results)
+        mock_retriever.query.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Tests: RAGSynthesizer.synthesize_stream
+# ---------------------------------------------------------------------------
+
+
+def _streaming_synth(mock_retriever, chunks):
+    """Synthesizer whose chain streams the given message chunks."""
+    with patch("scripts.rag.llm_synthesis._create_llm", return_value=MagicMock()):
+        synth = RAGSynthesizer(provider="claude", retriever=mock_retriever)
+    chain = MagicMock()
+    chain.stream.return_value = iter(chunks)
+    synth._build_chain = MagicMock(return_value=chain)
+    return synth
+
+
+class TestRAGSynthesizerSynthesizeStream:
+    """Tests for RAGSynthesizer.synthesize_stream method."""
+
+    def test_yields_tokens_then_final_result(self, mock_retriever, mock_hybrid_results):
+        """Text fragments arrive before one final SynthesisResult."""
+        chunks = [MagicMock(content=text) for text in ("TDD ", "", "first.")]
+        synth = _streaming_synth(mock_retriever, chunks)
+
+        events = list(synth.synthesize_stream("q", results=mock_hybrid_results))
+
+        assert events[:2] == ["TDD ", "first."]
+        final = events[-1]
+        assert isinstance(final, SynthesisResult)
+        assert final.answer == "TDD first."
+        assert final.source_docs == ["GOV-0017"]
+        assert len(final.citations) == 2
+
+    def test_content_blocks_are_joined(self, mock_retriever, mock_hybrid_results):
+        """Anthropic-style list content yields its text blocks."""
+        chunks = [MagicMock(content=[{"type": "text", "text": "Hi"}])]
+        synth = _streaming_synth(mock_retriever, chunks)
+
+        events = list(synth.synthesize_stream("q", results=mock_hybrid_results))
+
+        assert events[0] == "Hi"
+
+    def test_error_mid_stream_is_reported(self, mock_retriever, mock_hybrid_results):
+        """A provider error ends the stream with a final result."""
+
+        def failing():
+            yield MagicMock(content="Partial")
+            raise RuntimeError("connection reset")
+
+        synth = _streaming_synth(mock_retriever, failing())
+
+        events = list(synth.synthesize_stream("q", results=mock_hybrid_results))
+
+        assert events[0] == "Partial"
+        assert "connection reset" in events[-1].answer
+        assert events[-1].answer.startswith("Partial")
+
+    def test_unavailable_llm_yields_fallback(self, mock_retriever, mock_hybrid_results):
+        """Without an LLM the raw-context answer is one fragment."""
+        with patch("scripts.rag.llm_synthesis._create_llm", return_value=None):
+            synth = RAGSynthesizer(provider="ollama", retriever=mock_retriever)
+
+        events = list(synth.synthesize_stream("q", results=mock_hybrid_results))
+
+        assert len(events) == 2
+        assert events[0] == events[1].answer
+        assert events[1].model == "none"
+
 
 # ---------------------------------------------------------------------------
 # Tests: RAGSynthesizer.close
@@ -0,0 +1,237 @@
+"""
+Unit tests for the metadata index and filter compiler.
+"""
+
+from datetime import date
+from unittest.mock import MagicMock
+
+import pytest
+
+from scripts.rag.cli import parse_filter_string
+from scripts.rag.loader import GovernanceDocument
+from scripts.rag.metadata_index import (
+    MetadataIndex,
+    compile_filter,
+    document_fields,
+    load_metadata_index,
+    parse_filters,
+)
+from scripts.rag.retriever import GovernanceRetriever
+
+
+DOCS = {
+    "GOV-0017-tdd": {
+        "id": "GOV-0017-tdd",
+        "title": "TDD",
+        "type": "governance",
+        "relates_to": ["ADR-0182-tdd-philosophy", "ADR-0186-retrieval"],
+        "effective_date": date(2026, 1, 26),
+        "reliability": {"maturity": 2},
+    },
+    "ADR-0186-retrieval": {
+        "id": "ADR-0186-retrieval",
+        "title": "Retrieval layer",
+        "type": "adr",
+        "relates_to": ["PRD-0008-rag"],
+        "effective_date": "2025-11-02",
+        "reliability": {"maturity": 10},
+    },
+    "PRD-0008-rag": {
+        "id": "PRD-0008-rag",
+        "title": "RAG pipeline",
+        "type": "prd",
+        "tags": ["rag", "search"],
+    },
+}
+
+
+def _doc(metadata):
+    return GovernanceDocument(content="", metadata=metadata, source_path="")
+
+
+def _index(path=None):
+    index = MetadataIndex(path)
+    for doc_id, metadata in DOCS.items():
+        chunk_ids = [f"{doc_id}_0", f"{doc_id}_1"]
+        index.add(doc_id, document_fields(_doc(metadata)), chunk_ids)
+    return index
+
+
+class TestDocumentFields:
+    def test_lists_dates_and_nested_fields(self):
+        fields = document_fields(_doc(DOCS["GOV-0017-tdd"]))
+
+        assert fields["relates_to"] == [
+            "ADR-0182-tdd-philosophy",
+            "ADR-0182",
+            "ADR-0186-retrieval",
+            "ADR-0186",
+        ]
+        assert fields["effective_date"] == ["2026-01-26"]
+        assert fields["reliability.maturity"] == ["2"]
+        assert fields["doc_id"] == ["GOV-0017-tdd", "GOV-0017"]
+        assert fields["doc_type"] == ["governance"]
+
+    def test_empty_values_are_skipped(self):
+        fields = document_fields(_doc({"id": "X", "owner": None, "tags": []}))
+        assert "owner" not in fields and "tags" not in fields
+
+
+class TestMetadataIndex:
+    def test_membership_and_negation(self):
+        index = _index()
+
+        assert index.match("relates_to", "$eq", "ADR-0186") == {"GOV-0017-tdd"}
+        assert index.match("relates_to", "$contains", "PRD-0008") == {
+            "ADR-0186-retrieval"
+        }
+        assert index.match("type", "$in", ["adr", "prd"]) == {
+            "ADR-0186-retrieval",
+            "PRD-0008-rag",
+        }
+        # Documents without the field never match $ne / $nin
+        assert index.match("relates_to", "$ne", "ADR-0186") == {"ADR-0186-retrieval"}
+        assert index.match("type", "$nin", ["adr"]) == {"GOV-0017-tdd", "PRD-0008-rag"}
+
+    def test_ranges(self):
+        index = _index()
+
+        assert index.match("effective_date", "$gte", "2026-01-01") == {"GOV-0017-tdd"}
+        assert index.match("effective_date", "$lt", "2026-01-01") == {
+            "ADR-0186-retrieval"
+        }
+        # Numeric values compare as numbers, not text ("10" > "2")
+        assert index.match("reliability.maturity", "$gt", 2) == {"ADR-0186-retrieval"}
+
+    def test_unknown_operator(self):
+        with pytest.raises(ValueError, match="Unknown filter operator"):
+            _index().match("type", "$like", "adr")
+
+    def test_replace_and_remove(self):
+        index = _index()
+        index.add("PRD-0008-rag", {"type": ["prd"]}, ["PRD-0008-rag_0"])
+
+        assert index.match("tags", "$eq", "rag") == set()
+        assert index.chunk_ids({"PRD-0008-rag"}) == {"PRD-0008-rag_0"}
+        assert index.remove(["PRD-0008-rag", "missing"]) == 1
+        assert not index.has_field("tags")
+        assert index.stats() == {"documents": 2, "chunks": 4, "fields": 9}
+
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "metadata_index.json.gz"
+        assert load_metadata_index(path) is None
+        _index(path).save()
+
+        reopened = load_metadata_index(path)
+        assert reopened.stats() == _index().stats()
+        assert reopened.match("relates_to", "$eq", "ADR-0182") == {"GOV-0017-tdd"}
+
+
+class TestCompileFilter:
+    def test_without_index_passes_through(self):
+        filters = {"doc_type": "governance"}
+        assert compile_filter(filters).where is filters
+
+        with pytest.raises(ValueError, match="needs the metadata index"):
+            compile_filter({"effective_date": {"$gte": "2026-01-01"}})
+        with pytest.raises(ValueError, match="needs the metadata index"):
+            compile_filter({"relates_to": {"$contains": "ADR-0186"}})
+
+    def test_indexed_fields_become_doc_candidates(self):
+        compiled = compile_filter(
+            {
+                "$and": [
+                    {"relates_to": "ADR-0186"},
+                    {"effective_date": {"$gte": "2026-01-01"}},
+                    {"header_level": {"$lte": 2}},
+                ]
+            },
+            _index(),
+        )
+
+        assert compiled.doc_ids == {"GOV-0017-tdd"}
+        assert compiled.chunk_ids == {"GOV-0017-tdd_0", "GOV-0017-tdd_1"}
+        assert compiled.where == {
+            "$and": [{"doc_id": "GOV-0017-tdd"}, {"header_level": {"$lte": 2}}]
+        }
+
+    def test_or_and_unrestricted_results(self):
+        index = _index()
+        compiled = compile_filter(
+            {"$or": [{"type": "adr"}, {"tags": {"$in": ["rag"]}}]}, index
+        )
+        assert compiled.where == {
+            "doc_id": {"$in": ["ADR-0186-retrieval", "PRD-0008-rag"]}
+        }
+
+        # A filter every document passes adds no doc_id condition
+        everything = compile_filter({"doc_title": {"$ne": "nothing"}}, index)
+        assert everything.where is None and not everything.empty
+
+    def test_no_matching_documents(self):
+        compiled = compile_filter({"relates_to": "ADR-9999"}, _index())
+        assert compiled.empty and compiled.where is None
+
+
+class TestParseFilters:
+    def test_single_equality_is_unchanged(self):
+        assert parse_filters(" doc_id = GOV-0017 ") == {"doc_id": "GOV-0017"}
+        assert parse_filter_string("doc_type=governance") == {"doc_type": "governance"}
+        assert parse_filters("no operator") is None
+        assert parse_filters(None) is None
+
+    def test_invalid_expression_raises(self):
+        with pytest.raises(ValueError, match="owner~x"):
+            parse_filters("type=policy; owner~x")
+        with pytest.raises(ValueError, match="Invalid filter expression"):
+            parse_filters("a b=c")
+
+    def test_multiple_predicates(self):
+        parsed = parse_filters(
+            "relates_to=ADR-0186; effective_date>=2026-01-01; "
+            "type in policy, adr; status not in draft; chunk_index<2"
+        )
+
+        assert parsed == {
+            "$and": [
+                {"relates_to": "ADR-0186"},
+                {"effective_date": {"$gte": "2026-01-01"}},
+                {"type": {"$in": ["policy", "adr"]}},
+                {"status": {"$nin": ["draft"]}},
+                {"chunk_index": {"$lt": 2}},
+            ]
+        }
+
+
+class TestRetrieverFilters:
+    def _retriever(self, tmp_path):
+        path = tmp_path / "metadata_index.json.gz"
+        _index(path).save()
+        collection = MagicMock()
+        collection.query.return_value = {
+            "ids": [["GOV-0017-tdd_0"]],
+            "documents": [["TDD text"]],
+            "metadatas": [[{"doc_id": "GOV-0017-tdd"}]],
+            "distances": [[0.1]],
+        }
+        retriever = GovernanceRetriever(
+            collection=collection,
+            usage_log_path=None,
+            metadata_index_path=path,
+        )
+        return retriever, collection
+
+    def test_query_narrows_to_candidate_documents(self, tmp_path):
+        retriever, collection = self._retriever(tmp_path)
+
+        results = retriever.query("tests", filters={"relates_to": "ADR-0186"})
+
+        assert [r.id for r in results] == ["GOV-0017-tdd_0"]
+        assert collection.query.call_args.kwargs["where"] == {"doc_id": "GOV-0017-tdd"}
+
+    def test_no_candidates_skips_vector_search(self, tmp_path):
+        retriever, collection = self._retriever(tmp_path)
+
+        assert retriever.query("tests", filters={"relates_to": "ADR-9999"}) == []
+        assert retriever.query_many(["a", "b"], filters={"type": "none"}) == [[], []]
+        collection.query.assert_not_called()
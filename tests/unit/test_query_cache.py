@@ -0,0 +1,187 @@
+"""
+Unit tests for the retrieval query cache.
+"""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from scripts.rag.index_manifest import MANIFEST_FILENAME
+from scripts.rag.index_metadata import build_index_metadata, write_index_metadata
+from scripts.rag.query_cache import QueryCache, normalize_query
+from scripts.rag.retriever import GovernanceRetriever, RetrievalResult
+
+
+class FakeClock:
+    """Manually advanced clock for TTL tests."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _result(chunk_id: str = "GOV-0017_0") -> RetrievalResult:
+    return RetrievalResult(
+        id=chunk_id,
+        text="Tests are contracts.",
+        metadata={"doc_id": "GOV-0017"},
+        score=0.1,
+    )
+
+
+def _write_metadata(path: Path, sha: str) -> None:
+    write_index_metadata(path, build_index_metadata(document_count=1, source_sha=sha))
+
+
+def _write_index(index_dir: Path, content: str = "{}") -> Path:
+    index_dir.mkdir(parents=True, exist_ok=True)
+    (index_dir / MANIFEST_FILENAME).write_text(content)
+    return index_dir
+
+
+@pytest.fixture
+def mock_collection():
+    collection = MagicMock()
+    collection.query.return_value = {
+        "ids": [["GOV-0017_0"]],
+        "documents": [["Tests are contracts."]],
+        "metadatas": [[{"doc_id": "GOV-0017"}]],
+        "distances": [[0.1]],
+    }
+    return collection
+
+
+class TestQueryCache:
+    """Tests for QueryCache keys, TTL and invalidation."""
+
+    def test_normalize_query_collapses_case_and_whitespace(self):
+        assert normalize_query("  What is\tTDD? ") == normalize_query("what is tdd?")
+
+    def test_hit_and_miss_counters(self, tmp_path: Path):
+        cache = QueryCache(index_dir=_write_index(tmp_path))
+
+        assert cache.get("What is TDD?", 5) is None
+        cache.put("What is TDD?", 5, None, [_result()])
+        assert cache.get("what is  tdd?", 5) == [_result()]
+
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_key_includes_top_k_and_filters(self, tmp_path: Path):
+        cache = QueryCache(index_dir=_write_index(tmp_path))
+        cache.put("q", 5, {"doc_id": "GOV-0017"}, [_result()])
+
+        assert cache.get("q", 3, {"doc_id": "GOV-0017"}) is None
+        assert cache.get("q", 5, None) is None
+        assert cache.get("q", 5, {"doc_id": "GOV-0017"}) is not None
+
+    def test_entries_expire_after_ttl(self, tmp_path: Path):
+        clock = FakeClock()
+        cache = QueryCache(
+            ttl_seconds=10, index_dir=_write_index(tmp_path), clock=clock
+        )
+        cache.put("q", 5, None, [_result()])
+
+        clock.now += 11
+
+        assert cache.get("q", 5) is None
+
+    def test_lru_eviction(self, tmp_path: Path):
+        cache = QueryCache(max_entries=2, index_dir=_write_index(tmp_path))
+        cache.put("a", 5, None, [_result("a")])
+        cache.put("b", 5, None, [_result("b")])
+        cache.get("a", 5)
+        cache.put("c", 5, None, [_result("c")])
+
+        assert cache.get("b", 5) is None
+        assert cache.get("a", 5) is not None
+        assert cache.stats()["evictions"] == 1
+
+    def test_index_rebuild_invalidates(self, tmp_path: Path):
+        meta = tmp_path / "index_metadata.json"
+        _write_metadata(meta, "aaa")
+        index_dir = _write_index(tmp_path / ".chroma")
+        cache = QueryCache(index_dir=index_dir, metadata_path=meta)
+        cache.put("q", 5, None, [_result()])
+        assert cache.source_sha == "aaa"
+
+        _write_metadata(meta, "bbbb")
+        _write_index(index_dir, '{"files": {}}')
+
+        assert cache.get("q", 5) is None
+        assert cache.source_sha == "bbbb"
+        assert cache.stats()["invalidations"] == 1
+
+    def test_bypassed_without_index_artifacts(self, tmp_path: Path):
+        cache = QueryCache(index_dir=tmp_path / "missing")
+        embed = MagicMock(side_effect=lambda texts: [[1.0] for _ in texts])
+
+        cache.put("q", 5, None, [_result()])
+        assert cache.get("q", 5) is None
+        assert cache.embed_many(["a", " ", "a"], embed) == [[1.0], None, [1.0]]
+        cache.embed("a", embed)
+
+        assert embed.call_count == 2
+        assert cache.stats()["enabled"] is False
+
+    def test_persisted_entries_survive_restart(self, tmp_path: Path):
+        index_dir = _write_index(tmp_path / ".chroma")
+        store = index_dir / "query_cache.json"
+        QueryCache(index_dir=index_dir, persist_path=store).put(
+            "q", 5, None, [_result()]
+        )
+
+        assert QueryCache(index_dir=index_dir, persist_path=store).get("q", 5) == [
+            _result()
+        ]
+
+        _write_index(index_dir, '{"files": {}}')
+        assert QueryCache(index_dir=index_dir, persist_path=store).get("q", 5) is None
+
+    def test_retriever_watches_persist_dir(self, tmp_path: Path):
+        chromadb = pytest.importorskip("chromadb")
+        client = chromadb.PersistentClient(path=str(tmp_path))
+        client.get_or_create_collection("governance_docs").add(
+            ids=["GOV-0017_0"], embeddings=[[1.0, 0.0]], documents=["TDD"]
+        )
+        cache = QueryCache()
+
+        GovernanceRetriever(persist_dir=str(tmp_path), cache=cache, usage_log_path=None)
+
+        assert cache.index_dir == tmp_path
+        assert cache.enabled
+
+
+class TestRetrieverCache:
+    """Tests for GovernanceRetriever cache integration."""
+
+    def test_repeat_query_skips_collection(self, mock_collection, tmp_path: Path):
+        retriever = GovernanceRetriever(
+            collection=mock_collection,
+            usage_log_path=None,
+            cache=QueryCache(index_dir=_write_index(tmp_path)),
+        )
+
+        first = retriever.query("What is TDD?")
+        second = retriever.query("what is TDD?")
+
+        assert first == second
+        mock_collection.query.assert_called_once()
+
+    def test_query_embedding_is_cached(self, mock_collection, tmp_path: Path):
+        retriever = GovernanceRetriever(
+            collection=mock_collection,
+            usage_log_path=None,
+            cache=QueryCache(index_dir=_write_index(tmp_path)),
+        )
+        retriever.embedding_function = MagicMock(return_value=[[0.5, 0.25]])
+
+        retriever.query("What is TDD?", top_k=3)
+        retriever.query("What is TDD?", top_k=5)
+
+        retriever.embedding_function.assert_called_once()
+        call_args = mock_collection.query.call_args
+        assert call_args[1]["query_embeddings"] == [[0.5, 0.25]]
@@ -26,6 +26,7 @@ from scripts.rag.cli import (
     parse_filter_string,
     run_query,
     format_results,
+    load_batch_queries,
     main,
     OutputFormat,
 )
@@ -380,6 +381,116 @@ class TestMainEntryPoint:
         # Verbose should include query info or timing
         assert len(captured.out) > 0
 
+    def test_main_timings_prints_stage_breakdown(
+        self, mock_retriever, sample_results, capsys, monkeypatch
+    ):
+        """--timings must report stage timings on stderr without the server."""
+        from scripts.rag import timing
+
+        monkeypatch.setattr(timing, "_enabled", False)
+        mock_retriever.query.return_value = sample_results
+
+        with patch("scripts.rag.cli.GovernanceRetriever", return_value=mock_retriever):
+            with patch("scripts.rag.cli._run_via_server") as via_server:
+                exit_code = main(["query", "test", "--timings"])
+
+        assert exit_code == 0
+        via_server.assert_not_called()
+        assert "Timings (cli_query)" in capsys.readouterr().err
+
+
+class TestBatchMode:
+    """Tests for --batch-file batched queries."""
+
+    def test_load_batch_queries_text_and_json(self, tmp_path):
+        """load_batch_queries must read line files and questions JSON."""
+        lines = tmp_path / "queries.txt"
+        lines.write_text("# comment\nWhat is TDD?\n\nWho owns ADRs?\n")
+        questions = tmp_path / "questions.json"
+        questions.write_text(json.dumps({"questions": ["What is TDD?"]}))
+
+        assert load_batch_queries(str(lines)) == ["What is TDD?", "Who owns ADRs?"]
+        assert load_batch_queries(str(questions)) == ["What is TDD?"]
+
+    def test_main_batch_file_uses_query_many(
+        self, mock_retriever, sample_results, tmp_path, capsys
+    ):
+        """main must send all batch queries through query_many."""
+        batch = tmp_path / "queries.txt"
+        batch.write_text("What is TDD?\nWho owns ADRs?\n")
+        mock_retriever.query_many.return_value = [sample_results, []]
+
+        exit_code = main(
+            ["query", "--batch-file", str(batch), "--format", "json", "--no-cache"]
+        )
+
+        assert exit_code == 0
+        mock_retriever.query_many.assert_called_once()
+        mock_retriever.query.assert_not_called()
+        output = json.loads(capsys.readouterr().out)
+        assert [q["count"] for q in output["queries"]] == [2, 0]
+
+
+# ---------------------------------------------------------------------------
+# Tests: Synthesize Mode
+# ---------------------------------------------------------------------------
+
+
+class TestSynthesizeMode:
+    """Tests for --synthesize output."""
+
+    @pytest.fixture
+    def mock_synthesizer(self):
+        from scripts.rag.llm_synthesis import SynthesisResult
+
+        result = SynthesisResult(
+            answer="Write tests first.",
+            citations=["GOV-0017 (docs/GOV-0017.md)"],
+            model="llama3.2",
+            context_chunks=1,
+            source_docs=["GOV-0017"],
+        )
+        synthesizer = MagicMock()
+        synthesizer.synthesize.return_value = result
+        synthesizer.synthesize_stream.return_value = iter(
+            ["Write ", "tests first.", result]
+        )
+        status = {"providers": {"ollama": {"available": True}}}
+        with (
+            patch(
+                "scripts.rag.llm_synthesis.check_provider_status", return_value=status
+            ),
+            patch(
+                "scripts.rag.llm_synthesis.RAGSynthesizer", return_value=synthesizer
+            ) as MockSynthesizer,
+            patch("scripts.rag.answer_cache.AnswerCache"),
+        ):
+            synthesizer.factory = MockSynthesizer
+            yield synthesizer
+
+    def test_text_output_is_streamed(self, mock_synthesizer, capsys):
+        """Text format prints fragments as they arrive, then sources."""
+        exit_code = main(["query", "q", "--synthesize", "--no-server"])
+
+        out = capsys.readouterr().out
+        assert exit_code == 0
+        mock_synthesizer.synthesize.assert_not_called()
+        assert out.startswith("Write tests first.\n\n---\nSources")
+        mock_synthesizer.close.assert_called_once()
+
+    def test_no_stream_waits_for_full_answer(self, mock_synthesizer, capsys):
+        """--no-stream uses the blocking synthesize call."""
+        main(["query", "q", "--synthesize", "--no-server", "--no-stream"])
+
+        mock_synthesizer.synthesize_stream.assert_not_called()
+        assert "Write tests first." in capsys.readouterr().out
+
+    def test_no_cache_disables_answer_cache(self, mock_synthesizer):
+        """--no-cache also bypasses the synthesized-answer cache."""
+        main(["query", "q", "--synthesize", "--no-server", "--no-cache"])
+
+        assert mock_synthesizer.factory.call_args.kwargs["cache"] is None
+
 
 # ---------------------------------------------------------------------------
 # Tests: Error Handling
@@ -413,6 +524,40 @@ class TestErrorHandling:
         captured = capsys.readouterr()
         assert "error" in captured.err.lower() or "failed" in captured.err.lower()
 
+    def test_main_rejects_invalid_filter_expression(self, mock_retriever, capsys):
+        """main must not run unfiltered when one filter predicate is invalid."""
+        with patch("scripts.rag.cli.GovernanceRetriever", return_value=mock_retriever):
+            exit_code = main(["query", "test", "--filter", "type=policy; owner~x"])
+
+        assert exit_code == 1
+        assert "owner~x" in capsys.readouterr().err
+        mock_retriever.query.assert_not_called()
+
+    def test_main_reports_hybrid_filter_errors(self, capsys):
+        """main must report filters the hybrid retriever cannot evaluate."""
+        hybrid = MagicMock()
+        hybrid.query.side_effect = ValueError("needs the metadata index")
+
+        with (
+            patch("scripts.rag.cli.GovernanceRetriever"),
+            patch("scripts.rag.hybrid_retriever.HybridRetriever", return_value=hybrid),
+        ):
+            exit_code = main(
+                [
+                    "query",
+                    "test",
+                    "--hybrid",
+                    "--no-server",
+                    "--filter",
+                    "effective_date>=2026-01-01",
+                ]
+            )
+
+        assert exit_code == 1
+        assert "Error: Query failed: needs the metadata index" in (
+            capsys.readouterr().err
+        )
+
 
 # ---------------------------------------------------------------------------
 # Tests: OutputFormat Enum
@@ -0,0 +1,249 @@
+"""
+Unit tests for the RAG query server and the CLI's use of it.
+"""
+
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from scripts.rag.cli import main
+from scripts.rag.llm_synthesis import SynthesisResult
+from scripts.rag.query_server import (
+    QueryService,
+    _WarmSynthesizer,
+    create_server,
+    request_server,
+    stream_server,
+)
+from scripts.rag.retriever import RetrievalResult
+
+
+def _result(chunk_id: str = "GOV-0017_0") -> RetrievalResult:
+    return RetrievalResult(
+        id=chunk_id,
+        text="Tests are contracts.",
+        metadata={"doc_id": "GOV-0017", "file_path": "docs/GOV-0017.md"},
+        score=0.1,
+    )
+
+
+@pytest.fixture
+def warm_service():
+    """QueryService with a pre-warmed mock retriever."""
+    service = QueryService(metadata_path=None)
+    retriever = MagicMock()
+    retriever.query_many.side_effect = lambda queries, top_k=5, filters=None: [
+        [_result()] for _ in queries
+    ]
+    service._retrievers[(None, True)] = retriever
+    synthesizer = MagicMock()
+    synthesizer.synthesize_stream.side_effect = lambda **kwargs: iter(
+        ["Tests ", "first.", _synthesis("Tests first.")]
+    )
+    synthesizer.synthesize.return_value = _synthesis("Tests first.")
+    service._synthesizers[("ollama", None, True)] = _WarmSynthesizer(synthesizer)
+    return service
+
+
+def _synthesis(answer: str) -> SynthesisResult:
+    return SynthesisResult(
+        answer=answer,
+        citations=["GOV-0017"],
+        model="llama3.2",
+        context_chunks=1,
+        source_docs=["GOV-0017"],
+    )
+
+
+@pytest.fixture
+def running_server(tmp_path: Path, warm_service):
+    socket_path = tmp_path / "q.sock"
+    server = create_server(socket_path, warm_service)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield socket_path
+    server.shutdown()
+    server.server_close()
+    thread.join(timeout=5)
+
+
+class TestQueryService:
+    def test_query_uses_warm_retriever(self, warm_service):
+        response = warm_service.handle({"op": "query", "query": "What is TDD?"})
+
+        assert response["ok"] is True
+        assert response["results"][0]["id"] == "GOV-0017_0"
+
+    def test_batch_returns_one_list_per_query(self, warm_service):
+        response = warm_service.handle({"op": "batch", "queries": ["a", "b"]})
+
+        assert len(response["batches"]) == 2
+        warm_service._retrievers[(None, True)].query_many.assert_called_once()
+
+    def test_errors_are_returned(self, warm_service):
+        warm_service._retrievers[(None, True)].query_many.side_effect = RuntimeError(
+            "boom"
+        )
+
+        assert warm_service.handle({"op": "query", "query": "q"}) == {
+            "ok": False,
+            "error": "boom",
+        }
+
+    def test_index_rebuild_drops_warm_objects(self, tmp_path: Path):
+        meta = tmp_path / "index_metadata.json"
+        meta.write_text("{}")
+        service = QueryService(metadata_path=meta)
+        service._retrievers[(None, True)] = MagicMock()
+
+        meta.write_text('{"source_sha": "new"}')
+        service.handle({"op": "noop"})
+
+        assert service._retrievers == {}
+        assert service.reloads == 1
+
+    def test_queries_answered_while_a_stream_is_open(self, warm_service):
+        stream = warm_service.handle_stream({"op": "synthesize", "query": "q"})
+        assert next(stream)["token"] == "Tests "
+
+        responses = []
+        worker = threading.Thread(
+            target=lambda: responses.append(
+                warm_service.handle({"op": "query", "query": "What is TDD?"})
+            )
+        )
+        worker.start()
+        worker.join(timeout=5)
+
+        assert responses and responses[0]["ok"] is True
+        assert list(stream)[-1]["synthesis"]["answer"] == "Tests first."
+        assert not warm_service._synthesizers[("ollama", None, True)].lock.locked()
+
+    def test_queued_synthesis_does_not_block_queries(self, warm_service):
+        warm = warm_service._synthesizers[("ollama", None, True)]
+        started, finish = threading.Event(), threading.Event()
+
+        def slow_synthesize(**kwargs):
+            started.set()
+            finish.wait(timeout=5)
+            return _synthesis("Tests first.")
+
+        warm.synthesizer.synthesize.side_effect = slow_synthesize
+        request = {"op": "synthesize", "query": "q"}
+        synth_responses = []
+        synths = [
+            threading.Thread(
+                target=lambda: synth_responses.append(warm_service.handle(request))
+            )
+            for _ in range(2)
+        ]
+        synths[0].start()
+        assert started.wait(timeout=5)
+        synths[1].start()
+        for _ in range(500):  # wait until the second synthesize is queued
+            if warm.users == 2:
+                break
+            synths[1].join(timeout=0.01)
+        assert warm.users == 2
+
+        responses = []
+        worker = threading.Thread(
+            target=lambda: responses.append(
+                warm_service.handle({"op": "query", "query": "What is TDD?"})
+            )
+        )
+        worker.start()
+        worker.join(timeout=5)
+
+        assert responses and responses[0]["ok"] is True
+        assert not synth_responses  # first synthesis still running
+        finish.set()
+        for thread in synths:
+            thread.join(timeout=5)
+        assert [r["ok"] for r in synth_responses] == [True, True]
+        assert warm.users == 0
+
+    def test_reset_closes_in_use_synthesizer_after_release(self, warm_service):
+        stream = warm_service.handle_stream({"op": "synthesize", "query": "q"})
+        next(stream)
+        warm = warm_service._synthesizers[("ollama", None, True)]
+
+        warm_service.reset()
+        warm.synthesizer.close.assert_not_called()
+
+        list(stream)
+        warm.synthesizer.close.assert_called_once()
+
+
+class TestServerRoundTrip:
+    def test_no_server_returns_none(self, tmp_path: Path):
+        assert request_server({"op": "ping"}, tmp_path / "missing.sock") is None
+
+    def test_query_over_socket(self, running_server):
+        assert request_server({"op": "ping"}, running_server)["ok"] is True
+
+        response = request_server(
+            {"op": "query", "query": "What is TDD?", "top_k": 3}, running_server
+        )
+
+        assert response["results"][0]["metadata"]["doc_id"] == "GOV-0017"
+
+    def test_streamed_synthesis(self, running_server):
+        request = {"op": "synthesize", "query": "q", "stream": True}
+
+        responses = list(stream_server(request, running_server))
+
+        assert [r.get("token") for r in responses[:2]] == ["Tests ", "first."]
+        assert responses[-1]["synthesis"]["answer"] == "Tests first."
+        # The connection stays usable for the next request
+        assert request_server({"op": "ping"}, running_server)["ok"] is True
+
+    def test_socket_is_owner_only(self, running_server):
+        assert running_server.stat().st_mode & 0o777 == 0o600
+
+    def test_second_server_refuses_to_start(self, running_server):
+        with pytest.raises(RuntimeError):
+            create_server(running_server)
+
+
+class TestCliUsesServer:
+    def test_main_prefers_running_server(self, running_server, capsys):
+        with patch("scripts.rag.cli.GovernanceRetriever") as MockRetriever:
+            code = main(["query", "What is TDD?", "--socket", str(running_server)])
+
+        assert code == 0
+        MockRetriever.assert_not_called()
+        assert "Tests are contracts." in capsys.readouterr().out
+
+    def test_no_server_flag_runs_locally(self, running_server, capsys):
+        with patch("scripts.rag.cli.GovernanceRetriever") as MockRetriever:
+            MockRetriever.return_value.query.return_value = []
+            code = main(["query", "q", "--socket", str(running_server), "--no-server"])
+
+        assert code == 0
+        MockRetriever.assert_called_once()
+
+    def test_synthesis_streams_through_server(self, running_server, capsys):
+        code = main(["query", "q", "--synthesize", "--socket", str(running_server)])
+
+        out = capsys.readouterr().out
+        assert code == 0
+        assert out.startswith("Tests first.\n\n---\nSources (1 chunks from 1 docs)")
+
+    def test_json_synthesis_is_not_streamed(self, running_server, capsys):
+        code = main(
+            [
+                "query",
+                "q",
+                "--synthesize",
+                "--format",
+                "json",
+                "--socket",
+                str(running_server),
+            ]
+        )
+
+        assert code == 0
+        assert '"answer": "Tests first."' in capsys.readouterr().out
@@ -33,6 +33,9 @@ def mock_retriever():
     result = MagicMock()
     result.text = "Sample context about TDD requirements."
     retriever.query.return_value = [result]
+    retriever.query_many.side_effect = lambda questions, top_k=5: [
+        retriever.query.return_value for _ in questions
+    ]
     return retriever
 
 
@@ -103,12 +106,13 @@ class TestLoadQuestions:
 class TestRetrieveContexts:
     """Tests for retrieve_contexts function."""
 
-    def test_retrieve_contexts_calls_retriever_for_each_question(
+    def test_retrieve_contexts_batches_all_questions(
         self, mock_retriever, sample_questions
     ):
-        """retrieve_contexts must call retriever for each question."""
+        """retrieve_contexts must retrieve all questions in one batched call."""
         retrieve_contexts(sample_questions, mock_retriever, top_k=5)
-        assert mock_retriever.query.call_count == len(sample_questions)
+        mock_retriever.query_many.assert_called_once_with(sample_questions, top_k=5)
+        mock_retriever.query.assert_not_called()
 
     def test_retrieve_contexts_returns_list_of_context_lists(
         self, mock_retriever, sample_questions
@@ -124,7 +128,9 @@ class TestRetrieveContexts:
         """retrieve_contexts must extract text from retrieval results."""
         mock_result = MagicMock()
         mock_result.text = "Expected text content"
-        mock_retriever.query.return_value = [mock_result]
+        mock_retriever.query_many.side_effect = lambda qs, top_k=5: [
+            [mock_result] for _ in qs
+        ]
 
         contexts = retrieve_contexts(sample_questions, mock_retriever, top_k=5)
         assert contexts[0][0] == "Expected text content"
@@ -287,7 +293,9 @@ class TestRunEvaluation:
             mock_retriever = MagicMock()
             mock_result = MagicMock()
             mock_result.text = "Sample context"
-            mock_retriever.query.return_value = [mock_result]
+            mock_retriever.query_many.side_effect = lambda qs, top_k=5: [
+                [mock_result] for _ in qs
+            ]
             MockRetriever.return_value = mock_retriever
 
             result = run_evaluation(
@@ -307,7 +315,9 @@ class TestRunEvaluation:
             mock_retriever = MagicMock()
             mock_result = MagicMock()
             mock_result.text = "Sample context"
-            mock_retriever.query.return_value = [mock_result]
+            mock_retriever.query_many.side_effect = lambda qs, top_k=5: [
+                [mock_result] for _ in qs
+            ]
             MockRetriever.return_value = mock_retriever
 
             run_evaluation(
@@ -333,7 +343,9 @@ class TestRunEvaluation:
                 mock_retriever = MagicMock()
                 mock_result = MagicMock()
                 mock_result.text = "Sample context"
-                mock_retriever.query.return_value = [mock_result]
+                mock_retriever.query_many.side_effect = lambda qs, top_k=5: [
+                    [mock_result] for _ in qs
+                ]
                 MockRetriever.return_value = mock_retriever
 
                 MockEval.return_value = {"faithfulness": 0.8, "answer_relevancy": 0.9}
@@ -24,11 +24,13 @@ from unittest.mock import MagicMock, patch
 # Import will fail until retriever.py is implemented (RED phase)
 from scripts.rag.retriever import (
     retrieve,
+    retrieve_batch,
     RetrievalResult,
     format_citation,
     GovernanceRetriever,
     log_usage,
 )
+from scripts.rag.usage_log import flush_all
 
 
 # ---------------------------------------------------------------------------
@@ -153,6 +155,38 @@ class TestBasicRetrieval:
         call_args = mock_collection.query.call_args
         assert call_args[1]["query_texts"] == [sample_query]
 
+    def test_retrieve_embeds_query_with_embedding_function(
+        self, mock_collection, sample_query
+    ):
+        """retrieve must send query embeddings when given an embedding function."""
+        embed = MagicMock(return_value=[[0.5, 0.25]])
+
+        retrieve(sample_query, collection=mock_collection, embedding_function=embed)
+
+        embed.assert_called_once_with([sample_query])
+        call_args = mock_collection.query.call_args
+        assert call_args[1]["query_embeddings"] == [[0.5, 0.25]]
+        assert "query_texts" not in call_args[1]
+
+    def test_retriever_uses_embedding_cache(
+        self, mock_collection, sample_query, tmp_path
+    ):
+        """GovernanceRetriever must embed repeated queries from the cache."""
+        pytest.importorskip("numpy")
+        retriever = GovernanceRetriever(
+            collection=mock_collection,
+            usage_log_path=None,
+            embedding_model="mock",
+            embedding_cache_dir=str(tmp_path),
+        )
+
+        retriever.query(sample_query)
+        retriever.query(sample_query)
+
+        stats = retriever.embedding_function.cache.stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 1
+
 
 # ---------------------------------------------------------------------------
 # Tests: RetrievalResult Dataclass
@@ -431,6 +465,83 @@ class TestGovernanceRetriever:
             assert "citation" in result or hasattr(result, "citation")
 
 
+class TestBatchRetrieval:
+    """Tests for retrieve_batch and GovernanceRetriever.query_many."""
+
+    @pytest.fixture
+    def batch_collection(self):
+        collection = MagicMock()
+
+        def fake_query(**kwargs):
+            rows = kwargs.get("query_texts") or kwargs.get("query_embeddings")
+            return {
+                "ids": [[f"q{i}_0"] for i in range(len(rows))],
+                "documents": [[f"text {i}"] for i in range(len(rows))],
+                "metadatas": [[{"doc_id": f"DOC-{i}"}] for i in range(len(rows))],
+                "distances": [[0.1 * i] for i in range(len(rows))],
+            }
+
+        collection.query.side_effect = fake_query
+        return collection
+
+    def test_retrieve_batch_issues_one_query_per_batch(self, batch_collection):
+        """retrieve_batch must send queries as multi-query requests."""
+        queries = ["a", "b", "c", "d", "e"]
+
+        batches = retrieve_batch(queries, collection=batch_collection, batch_size=2)
+
+        assert batch_collection.query.call_count == 3
+        assert [b[0].id for b in batches] == ["q0_0", "q1_0", "q0_0", "q1_0", "q0_0"]
+
+    def test_retrieve_batch_skips_blank_queries(self, batch_collection):
+        """retrieve_batch must return empty results for blank queries."""
+        batches = retrieve_batch(["a", "  ", "b"], collection=batch_collection)
+
+        assert batches[1] == []
+        call_args = batch_collection.query.call_args
+        assert call_args[1]["query_texts"] == ["a", "b"]
+
+    def test_retrieve_batch_embeds_once_per_batch(self, batch_collection):
+        """retrieve_batch must embed all queries of a batch in one call."""
+        embed = MagicMock(side_effect=lambda texts: [[1.0, 0.0] for _ in texts])
+
+        retrieve_batch(
+            ["a", "b", "c"], collection=batch_collection, embedding_function=embed
+        )
+
+        embed.assert_called_once_with(["a", "b", "c"])
+        call_args = batch_collection.query.call_args
+        assert len(call_args[1]["query_embeddings"]) == 3
+
+    def test_embed_queries_uses_cache(self, batch_collection, tmp_path):
+        """embed_queries must reuse cached query embeddings."""
+        from scripts.rag.query_cache import QueryCache
+
+        (tmp_path / "index_manifest.json").write_text("{}")
+        retriever = GovernanceRetriever(
+            collection=batch_collection,
+            usage_log_path=None,
+            cache=QueryCache(index_dir=tmp_path),
+        )
+        assert retriever.embed_queries(["a"]) is None
+
+        retriever.embedding_function = MagicMock(return_value=[[1.0, 2.0]])
+        retriever.embed_queries(["a"])
+        assert retriever.embed_queries(["a"]) == [[1.0, 2.0]]
+        retriever.embedding_function.assert_called_once()
+
+    def test_query_many_returns_results_in_order(self, batch_collection):
+        """GovernanceRetriever.query_many must fan results back out in order."""
+        retriever = GovernanceRetriever(
+            collection=batch_collection, usage_log_path=None
+        )
+
+        batches = retriever.query_many(["a", "b"], top_k=1)
+
+        assert [b[0].metadata["doc_id"] for b in batches] == ["DOC-0", "DOC-1"]
+        batch_collection.query.assert_called_once()
+
+
 # ---------------------------------------------------------------------------
 # Tests: Edge Cases
 # ---------------------------------------------------------------------------
@@ -503,6 +614,7 @@ class TestUsageLogging:
             timestamp="2026-01-28T22:45:00Z",
         )
 
+        flush_all()
         content = log_path.read_text().strip()
         assert "test query" in content
         assert "2026-01-28T22:45:00Z" in content
@@ -524,6 +636,7 @@ class TestUsageLogging:
             timestamp="2026-01-28T22:46:00Z",
         )
 
+        flush_all()
         lines = log_path.read_text().strip().split("\n")
         assert len(lines) == 2
         assert "first query" in lines[0]
@@ -540,6 +653,7 @@ class TestUsageLogging:
             timestamp="2026-01-28T22:45:00Z",
         )
 
+        flush_all()
         assert log_path.exists()
         assert "test query" in log_path.read_text()
 
@@ -564,6 +678,7 @@ class TestUsageLogging:
             timestamp="2026-01-28T22:45:00Z",
         )
 
+        flush_all()
         import json
 
         entry = json.loads(log_path.read_text().strip())
@@ -582,6 +697,7 @@ class TestUsageLogging:
             timestamp="2026-01-28T22:45:00Z",
         )
 
+        flush_all()
         import json
 
         entry = json.loads(log_path.read_text().strip())
@@ -599,6 +715,7 @@ class TestUsageLogging:
             timestamp="2026-01-28T22:45:00Z",
         )
 
+        flush_all()
         import json
 
         entry = json.loads(log_path.read_text().strip())
@@ -617,6 +734,7 @@ class TestUsageLogging:
             timestamp="2026-01-28T22:45:00Z",
         )
 
+        flush_all()
         content = log_path.read_text().strip()
         # Keys should be sorted: filters, query, top_k, ts, use_graph
         assert content.index('"filters"') < content.index('"query"')
@@ -2,7 +2,10 @@
 Unit tests for scope filtering.
 """
 
-from scripts.rag.scope import is_allowed_path, filter_paths
+import os
+from pathlib import Path
+
+from scripts.rag.scope import ScopeRules, filter_paths, is_allowed_path, walk_allowed
 
 
 def test_allows_docs_tree():
@@ -55,3 +58,89 @@ def test_filter_paths_only_returns_allowed():
     ]
     allowed = filter_paths(paths)
     assert len(allowed) == 2
+
+
+def _touch(root, relative):
+    path = root / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("# doc\n", encoding="utf-8")
+    return path
+
+
+def _make_tree(root):
+    for relative in [
+        "docs/a.md",
+        "docs/changelog/entries/2026-01-01-change.md",
+        "docs/node_modules/pkg/README.md",
+        "docs/notes.txt",
+        "session_capture/s.md",
+        "PLATFORM_HEALTH.md",
+        "README.md",
+        "scripts/index.md",
+        "scripts/other.md",
+        "scripts/rag/index.md",
+        "apps/foo/README.md",
+        "apps/foo/docs/nested.md",
+        ".git/objects/x.md",
+        "logs/docs/run.md",
+    ]:
+        _touch(root, relative)
+
+
+def test_walk_allowed_finds_in_scope_markdown(tmp_path):
+    _make_tree(tmp_path)
+    found = sorted(p.relative_to(tmp_path).as_posix() for p in walk_allowed(tmp_path))
+    assert found == [
+        "PLATFORM_HEALTH.md",
+        "docs/a.md",
+        "docs/changelog/entries/2026-01-01-change.md",
+        "scripts/index.md",
+        "session_capture/s.md",
+    ]
+
+
+def test_walk_allowed_anchors_rules_at_root(tmp_path):
+    _make_tree(tmp_path)
+    # is_allowed_path matches prefixes at any depth; the walker only at root
+    expected = set(filter_paths(tmp_path.rglob("*.md")))
+    expected.discard(tmp_path / "apps/foo/docs/nested.md")
+    assert set(walk_allowed(tmp_path)) == expected
+
+
+def test_walk_allowed_never_opens_pruned_directories(tmp_path, monkeypatch):
+    _make_tree(tmp_path)
+    opened = []
+    real_scandir = os.scandir
+
+    def recording_scandir(path):
+        opened.append(Path(path).relative_to(tmp_path).as_posix())
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", recording_scandir)
+    list(walk_allowed(tmp_path))
+
+    assert "docs" in opened
+    assert "scripts" in opened
+    for pruned in (".git", "apps", "logs", "docs/node_modules", "scripts/rag"):
+        assert pruned not in opened
+
+
+def test_walk_allowed_is_lazy(tmp_path):
+    _make_tree(tmp_path)
+    walker = walk_allowed(tmp_path)
+    assert next(walker).suffix == ".md"
+
+
+def test_walk_allowed_skips_symlinked_directories(tmp_path):
+    _touch(tmp_path, "docs/a.md")
+    (tmp_path / "docs" / "loop").symlink_to(tmp_path / "docs")
+    found = [p.relative_to(tmp_path).as_posix() for p in walk_allowed(tmp_path)]
+    assert found == ["docs/a.md"]
+
+
+def test_scope_rules_custom_allowlist():
+    rules = ScopeRules(prefixes=[Path("runbooks")], files=[], deny=["drafts"])
+    assert rules.allows("runbooks/restore.md")
+    assert rules.allows("/repo/runbooks/restore.md")
+    assert not rules.allows("runbooks/drafts/restore.md")
+    assert not rules.allows("docs/a.md")
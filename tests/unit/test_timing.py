@@ -0,0 +1,192 @@
+"""
+Unit tests for per-stage timing spans.
+"""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+import json
+
+import pytest
+
+from scripts.rag import timing
+from scripts.rag.hybrid_retriever import HybridRetriever
+from scripts.rag.llm_synthesis import RAGSynthesizer
+from scripts.rag.retriever import GovernanceRetriever, RetrievalResult, log_usage
+from scripts.rag.usage_log import flush_all
+
+
+@pytest.fixture
+def enabled(monkeypatch):
+    monkeypatch.setattr(timing, "_enabled", True)
+    monkeypatch.setattr(timing, "_otel", False)
+
+
+def _collection():
+    collection = MagicMock()
+    collection.query.return_value = {
+        "ids": [["GOV-0017_0"]],
+        "documents": [["Tests first."]],
+        "metadatas": [[{"doc_id": "GOV-0017", "section": "Rules"}]],
+        "distances": [[0.1]],
+    }
+    return collection
+
+
+def _usage(path: Path):
+    flush_all()
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestDisabled:
+    def test_trace_and_span_are_shared_noops(self):
+        assert timing.trace("query") is timing.span("vector_search")
+        with timing.trace("query") as run:
+            assert run is None
+            assert timing.current() is None
+
+    def test_log_usage_has_no_timings(self, tmp_path: Path):
+        path = tmp_path / "usage.jsonl"
+
+        log_usage("q", 5, path=path)
+
+        assert "timings" not in _usage(path)[0]
+
+
+class TestTrace:
+    def test_spans_nest_and_sum_by_stage(self, enabled):
+        with timing.trace("query") as run:
+            with timing.span("graph_expand"):
+                with timing.span("vector_search"):
+                    pass
+            with timing.span("vector_search"):
+                pass
+
+        assert [s.name for s in run.spans] == [
+            "graph_expand",
+            "vector_search",
+            "vector_search",
+        ]
+        assert run.spans[1].parent == 0
+        assert run.spans[2].parent is None
+        assert set(run.summary()["stages"]) == {"graph_expand", "vector_search"}
+        assert timing.current() is None
+
+    def test_nested_entry_point_joins_outer_trace(self, enabled):
+        with timing.trace("synthesize") as outer:
+            with timing.trace("hybrid_query") as inner:
+                assert inner is outer
+
+        assert [s.name for s in outer.spans] == ["hybrid_query"]
+
+    def test_usage_log_is_deferred_until_trace_finishes(self, enabled, tmp_path):
+        path = tmp_path / "usage.jsonl"
+
+        with timing.trace("query"):
+            log_usage("q", 5, path=path)
+            flush_all()
+            assert not path.exists()
+            with timing.span("llm"):
+                pass
+
+        entry = _usage(path)[0]
+        assert entry["query"] == "q"
+        assert "llm" in entry["timings"]["stages"]
+        assert entry["timings"]["total_ms"] >= entry["timings"]["stages"]["llm"]
+
+    def test_format_summary_lists_slowest_first(self, enabled):
+        run = timing.Trace("query")
+        run.record("fast", run.elapsed())
+        run.spans.append(timing.Span("slow", 0.0, 1.0))
+        run.finish()
+
+        lines = timing.format_summary(run).splitlines()
+        assert "slow" in lines[1]
+        assert "fast" in lines[2]
+
+    def test_otel_export_without_opentelemetry_is_skipped(self, enabled):
+        run = timing.Trace("query")
+        run.finish()
+
+        with patch.object(timing, "otel_trace", MagicMock(__bool__=lambda _: False)):
+            assert timing.export_otel(run) == 0
+
+    def test_otel_export_creates_child_spans(self, enabled):
+        otel = MagicMock()
+        run = timing.Trace("query")
+        with timing.activate(run):
+            with timing.span("retrieve"):
+                with timing.span("vector_search"):
+                    pass
+        run.finish()
+
+        with patch.object(timing, "otel_trace", otel):
+            assert timing.export_otel(run) == 3
+
+        tracer = otel.get_tracer.return_value
+        names = [c.args[0] for c in tracer.start_span.call_args_list]
+        assert names == ["query", "retrieve", "vector_search"]
+
+
+class TestInstrumentedStages:
+    def test_retriever_query_records_search_stages(self, enabled, tmp_path):
+        path = tmp_path / "usage.jsonl"
+        retriever = GovernanceRetriever(collection=_collection(), usage_log_path=path)
+
+        retriever.query("What is TDD?")
+
+        stages = _usage(path)[0]["timings"]["stages"]
+        assert {"vector_search", "lexical_fusion"} <= set(stages)
+
+    def test_hybrid_query_records_graph_stages(self, enabled, tmp_path):
+        path = tmp_path / "usage.jsonl"
+        graph = MagicMock()
+        graph.neighbors.return_value = {}
+        retriever = HybridRetriever(
+            vector_retriever=GovernanceRetriever(
+                collection=_collection(), usage_log_path=path
+            ),
+            graph_client=graph,
+        )
+
+        retriever.query("What is TDD?")
+
+        entries = _usage(path)
+        assert len(entries) == 2
+        assert all("graph_expand" in e["timings"]["stages"] for e in entries)
+
+    def test_synthesize_records_llm_stage(self, enabled):
+        result = RetrievalResult(
+            id="GOV-0017_0",
+            text="Tests first.",
+            metadata={"doc_id": "GOV-0017"},
+            score=0.1,
+        )
+        retriever = MagicMock()
+        retriever.query.return_value = [result]
+        with patch("scripts.rag.llm_synthesis._create_llm", return_value=MagicMock()):
+            synth = RAGSynthesizer(provider="claude", retriever=retriever)
+        chain = MagicMock()
+        chain.invoke.return_value = MagicMock(content="Write tests first.")
+        chain.stream.return_value = iter([MagicMock(content="Write tests.")])
+        synth._build_chain = MagicMock(return_value=chain)
+
+        with timing.trace("cli_query") as run:
+            synth.synthesize("What is TDD?")
+        stages = run.summary()["stages"]
+        assert {"synthesize", "retrieve", "pack_context", "llm"} <= set(stages)
+
+        with timing.trace("cli_query") as run:
+            list(synth.synthesize_stream("What is TDD?"))
+        assert {"retrieve", "llm_first_token", "llm"} <= set(run.summary()["stages"])
+
+    def test_stream_opens_its_own_trace(self, enabled):
+        retriever = MagicMock()
+        retriever.query.return_value = []
+        with patch("scripts.rag.llm_synthesis._create_llm", return_value=None):
+            synth = RAGSynthesizer(retriever=retriever)
+
+        with patch.object(timing.Trace, "finish", autospec=True) as finish:
+            list(synth.synthesize_stream("q"))
+
+        assert finish.call_args.args[0].name == "synthesize_stream"
+        assert timing.current() is None
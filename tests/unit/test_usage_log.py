@@ -0,0 +1,203 @@
+"""
+Unit tests for the buffered, rotating usage log.
+"""
+
+from pathlib import Path
+import gzip
+import json
+import multiprocessing
+import os
+import time
+
+import pytest
+
+from scripts.rag.usage_log import (
+    UsageLogWriter,
+    get_writer,
+    iter_records,
+    rotated_segments,
+    summarize,
+)
+
+
+def _entry(query="What is TDD?", ts="2026-10-18T10:00:00+00:00", **extra):
+    return {
+        "ts": ts,
+        "query": query,
+        "top_k": 5,
+        "filters": {},
+        "use_graph": False,
+        **extra,
+    }
+
+
+def _append_many(path: str, worker: int, count: int) -> None:
+    writer = UsageLogWriter(path, flush_interval=0.01, max_buffer=7)
+    for i in range(count):
+        writer.write(_entry(query=f"worker {worker} query {i} " + "x" * 200))
+    writer.close()
+
+
+class TestUsageLogWriter:
+    def test_buffers_until_flush(self, tmp_path: Path):
+        path = tmp_path / "logs" / "usage.jsonl"
+        writer = UsageLogWriter(path, flush_interval=60)
+
+        writer.write(_entry())
+        assert not path.exists()
+
+        assert writer.flush() == 1
+        assert json.loads(path.read_text())["query"] == "What is TDD?"
+        writer.close()
+
+    def test_background_thread_flushes(self, tmp_path: Path):
+        path = tmp_path / "usage.jsonl"
+        writer = UsageLogWriter(path, flush_interval=0.01)
+
+        writer.write(_entry())
+        deadline = time.monotonic() + 5
+        while not path.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert path.exists()
+        writer.close()
+
+    def test_failed_flush_keeps_records(self, tmp_path: Path):
+        blocker = tmp_path / "logs"
+        blocker.write_text("not a directory")
+        path = blocker / "usage.jsonl"
+        writer = UsageLogWriter(path, flush_interval=60)
+        writer.write(_entry(query="first"))
+
+        with pytest.raises(OSError):
+            writer.flush()
+
+        blocker.unlink()
+        writer.write(_entry(query="second"))
+        assert writer.flush() == 2
+        queries = [json.loads(line)["query"] for line in path.read_text().splitlines()]
+        assert queries == ["first", "second"]
+        writer.close()
+
+    def test_close_flushes_pending_records(self, tmp_path: Path):
+        path = tmp_path / "usage.jsonl"
+        writer = UsageLogWriter(path, flush_interval=60)
+        writer.write(_entry())
+
+        writer.close()
+
+        assert len(path.read_text().splitlines()) == 1
+
+    def test_rotates_by_size_and_compresses(self, tmp_path: Path):
+        path = tmp_path / "usage.jsonl"
+        writer = UsageLogWriter(path, max_bytes=200, background=False)
+
+        for i in range(6):
+            writer.write(_entry(query=f"query {i}"))
+
+        segments = rotated_segments(path)
+        assert segments and all(p.suffix == ".gz" for p in segments)
+        with gzip.open(segments[0], "rt") as handle:
+            assert "query 0" in handle.read()
+        assert [r["query"] for r in iter_records(path)] == [
+            f"query {i}" for i in range(6)
+        ]
+
+    def test_rotates_by_age_of_first_record(self, tmp_path: Path):
+        path = tmp_path / "usage.jsonl"
+        writer = UsageLogWriter(
+            path, max_age_seconds=3600, compress=False, background=False
+        )
+
+        writer.write(_entry(ts="2020-01-01T00:00:00+00:00"))
+        writer.write(_entry(query="today"))
+
+        assert len(rotated_segments(path)) == 1
+        assert json.loads(path.read_text())["query"] == "today"
+
+    def test_prunes_old_segments(self, tmp_path: Path):
+        path = tmp_path / "usage.jsonl"
+        writer = UsageLogWriter(path, max_segments=2, background=False)
+
+        for _ in range(4):
+            writer.write(_entry())
+            writer.rotate()
+
+        assert len(rotated_segments(path)) == 2
+
+    def test_concurrent_processes_never_interleave_lines(self, tmp_path: Path):
+        path = tmp_path / "usage.jsonl"
+        context = multiprocessing.get_context("fork" if os.name == "posix" else None)
+        workers = [
+            context.Process(target=_append_many, args=(str(path), worker, 50))
+            for worker in range(4)
+        ]
+        for process in workers:
+            process.start()
+        for process in workers:
+            process.join(timeout=30)
+
+        records = list(iter_records(path))
+        assert len(records) == 200
+        assert all(r["query"].endswith("x" * 200) for r in records)
+
+    def test_shared_writer_per_path(self, tmp_path: Path):
+        assert get_writer(tmp_path / "a.jsonl") is get_writer(str(tmp_path / "a.jsonl"))
+
+
+class TestSummarize:
+    def test_aggregates_queries_filters_and_graph(self, tmp_path: Path):
+        path = tmp_path / "usage.jsonl"
+        writer = UsageLogWriter(path, compress=True, background=False)
+        writer.write(_entry(query="What is TDD?"))
+        writer.rotate()
+        writer.write(_entry(query="what is  tdd?", use_graph=True))
+        writer.write(
+            _entry(
+                query="Coverage?",
+                filters={"doc_type": "governance"},
+                timings={"total_ms": 12.0, "stages": {}},
+            )
+        )
+
+        report = summarize(path, top=5)
+
+        assert report["records"] == 3
+        assert report["top_queries"][0] == {"query": "what is tdd?", "count": 2}
+        assert report["graph"] == {"records": 1, "pct": 33.33}
+        assert report["filters"]["records"] == 1
+        assert report["filters"]["values"] == {"doc_type=governance": 1}
+        assert report["latency_ms"]["p95"] == 12.0
+
+    def test_structured_filters_count_each_clause(self, tmp_path: Path):
+        path = tmp_path / "usage.jsonl"
+        writer = UsageLogWriter(path, background=False)
+        writer.write(
+            _entry(
+                filters={
+                    "$and": [
+                        {"type": {"$in": ["policy", "adr"]}},
+                        {"effective_date": {"$gte": "2026-01-01"}},
+                        {"effective_date": {"$lt": "2027-01-01"}},
+                    ]
+                }
+            )
+        )
+        writer.write(_entry(filters={"type": {"$eq": "policy"}}))
+
+        report = summarize(path)["filters"]
+
+        assert report["records"] == 2
+        assert report["keys"] == {"type": 2, "effective_date": 1}
+        assert report["values"]["type=policy"] == 1
+        assert report["values"]["effective_date $gte 2026-01-01"] == 1
+        assert "$and" not in report["keys"]
+
+    def test_since_filters_old_records(self, tmp_path: Path):
+        path = tmp_path / "usage.jsonl"
+        writer = UsageLogWriter(path, max_age_seconds=None, background=False)
+        writer.write(_entry(ts="2026-01-01T00:00:00+00:00"))
+        writer.write(_entry(ts="2026-10-01T00:00:00+00:00"))
+        path.open("a").write("{torn")
+
+        assert summarize(path, since="2026-06-01")["records"] == 1
@@ -0,0 +1,246 @@
+"""
+Unit tests for the flat NumPy vector store.
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from scripts.rag.chunker import Chunk
+from scripts.rag.indexer import GovernanceIndex, _MockEmbeddingFunction
+from scripts.rag.retriever import GovernanceRetriever
+from scripts.rag.vector_store import (
+    BACKEND_CHROMA,
+    BACKEND_FLAT,
+    FlatVectorClient,
+    FlatVectorStore,
+    resolve_backend,
+    where_mask,
+)
+
+
+TEXTS = [
+    "TDD policy requires tests before merge",
+    "Determinism rules for builds",
+    "Cost governance for cloud spend",
+    "Tests must be deterministic and fast",
+    "ADR process for architecture decisions",
+]
+METADATAS = [
+    {"doc_id": "GOV-0017", "type": "policy", "chunk_index": 0},
+    {"doc_id": "GOV-0017", "type": "policy", "chunk_index": 1},
+    {"doc_id": "GOV-0020", "type": "governance", "chunk_index": 0},
+    {"doc_id": "GOV-0017", "type": "policy", "chunk_index": 2},
+    {"doc_id": "ADR-0001", "type": "adr", "chunk_index": 0, "draft": True},
+]
+IDS = ["GOV-0017_0", "GOV-0017_1", "GOV-0020_0", "GOV-0017_2", "ADR-0001_0"]
+
+
+def _store(dtype="float32", path=None):
+    store = FlatVectorStore("docs", path, _MockEmbeddingFunction(), dtype)
+    store.upsert(ids=IDS, documents=TEXTS, metadatas=METADATAS)
+    return store
+
+
+def _brute_force(query, where_ids=IDS):
+    ef = _MockEmbeddingFunction()
+    matrix = np.asarray(ef([TEXTS[IDS.index(i)] for i in where_ids]))
+    q = np.asarray(ef([query])[0])
+    sims = matrix @ q / (np.linalg.norm(matrix, axis=1) * np.linalg.norm(q))
+    return [where_ids[i] for i in np.argsort(-sims, kind="stable")]
+
+
+class TestResolveBackend:
+    def test_default_and_env(self, monkeypatch):
+        monkeypatch.delenv("RAG_VECTOR_BACKEND", raising=False)
+        assert resolve_backend() == BACKEND_CHROMA
+        monkeypatch.setenv("RAG_VECTOR_BACKEND", "flat")
+        assert resolve_backend() == BACKEND_FLAT
+        assert resolve_backend("chroma") == BACKEND_CHROMA
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError, match="Unknown vector backend"):
+            resolve_backend("faiss")
+
+
+class TestWhereMask:
+    columns = {"type": ["policy", "adr", None], "count": [1, 2, 3]}
+
+    def _ids(self, where):
+        return list(np.flatnonzero(where_mask(where, self.columns, 3)))
+
+    def test_operators(self):
+        assert self._ids({"type": "policy"}) == [0]
+        assert self._ids({"type": {"$ne": "policy"}}) == [1]
+        assert self._ids({"count": {"$gte": 2}}) == [1, 2]
+        assert self._ids({"type": {"$in": ["adr", "policy"]}}) == [0, 1]
+        assert self._ids({"type": {"$nin": ["adr"]}}) == [0]
+        assert self._ids({"$or": [{"type": "adr"}, {"count": 3}]}) == [1, 2]
+        both = {"$and": [{"count": {"$gt": 1}}, {"count": {"$lt": 3}}]}
+        assert self._ids(both) == [1]
+
+    def test_missing_key_and_typed_equality(self):
+        assert self._ids({"owner": "platform"}) == []
+        assert self._ids({"count": "1"}) == []
+
+
+class TestFlatVectorStore:
+    def test_query_matches_brute_force(self):
+        store = _store()
+        result = store.query(query_texts=["deterministic tests"], n_results=5)
+
+        assert result["ids"] == [_brute_force("deterministic tests")]
+        distances = result["distances"][0]
+        assert distances == sorted(distances)
+        assert result["metadatas"][0][0] == METADATAS[IDS.index(result["ids"][0][0])]
+
+    def test_query_with_where(self):
+        store = _store()
+        result = store.query(
+            query_texts=["tests"], n_results=10, where={"doc_id": "GOV-0017"}
+        )
+
+        policy_ids = [i for i, m in zip(IDS, METADATAS) if m["doc_id"] == "GOV-0017"]
+        assert result["ids"] == [_brute_force("tests", policy_ids)]
+
+    def test_matches_chromadb(self):
+        chromadb = pytest.importorskip("chromadb")
+        client = chromadb.EphemeralClient()
+        collection = client.get_or_create_collection(
+            "flat_parity",
+            embedding_function=_MockEmbeddingFunction(),
+            metadata={"hnsw:space": "cosine"},
+        )
+        collection.upsert(ids=IDS, documents=TEXTS, metadatas=METADATAS)
+        try:
+            for where in (None, {"type": "policy"}):
+                expected = collection.query(
+                    query_texts=["cloud cost"], n_results=3, where=where
+                )
+                actual = _store().query(
+                    query_texts=["cloud cost"], n_results=3, where=where
+                )
+                assert actual["ids"] == expected["ids"]
+                assert actual["distances"][0] == pytest.approx(
+                    expected["distances"][0], abs=1e-5
+                )
+        finally:
+            client.delete_collection("flat_parity")
+
+    def test_upsert_replaces_and_get(self):
+        store = _store()
+        store.upsert(
+            ids=["GOV-0020_0", "NEW_0"],
+            documents=["replaced", "new"],
+            metadatas=[{"doc_id": "GOV-0020"}, {"doc_id": "NEW"}],
+        )
+
+        assert store.count() == 6
+        got = store.get(ids=["NEW_0", "GOV-0020_0", "missing"])
+        assert got["ids"] == ["NEW_0", "GOV-0020_0"]
+        assert got["documents"] == ["new", "replaced"]
+        assert got["metadatas"][1] == {"doc_id": "GOV-0020"}
+
+    def test_get_where_limit_offset_embeddings(self):
+        store = _store()
+        got = store.get(
+            where={"type": "policy"},
+            limit=2,
+            offset=1,
+            include=["embeddings"],
+        )
+
+        assert got["ids"] == ["GOV-0017_1", "GOV-0017_2"]
+        assert got["documents"] is None
+        assert np.linalg.norm(got["embeddings"][0]) == pytest.approx(1.0)
+
+    def test_delete_by_ids_and_where(self):
+        store = _store()
+        store.delete(ids=["GOV-0020_0"])
+        store.delete(where={"type": "adr"})
+
+        assert store.get()["ids"] == ["GOV-0017_0", "GOV-0017_1", "GOV-0017_2"]
+        assert "draft" not in store._columns
+
+    def test_requires_embeddings_without_function(self):
+        store = FlatVectorStore("docs")
+        with pytest.raises(ValueError, match="embedding_function"):
+            store.upsert(ids=["a"], documents=["text"])
+
+    @pytest.mark.parametrize("dtype", ["float16", "int8"])
+    def test_compact_dtypes_keep_ranking(self, dtype):
+        exact = _store().query(query_texts=["architecture"], n_results=5)
+        compact = _store(dtype).query(query_texts=["architecture"], n_results=5)
+
+        assert compact["ids"][0][0] == exact["ids"][0][0]
+        assert compact["distances"][0] == pytest.approx(exact["distances"][0], abs=0.02)
+
+
+class TestPersistence:
+    def test_round_trip_is_memory_mapped(self, tmp_path):
+        _store("int8", tmp_path / "docs")
+
+        reopened = FlatVectorStore("docs", tmp_path / "docs", _MockEmbeddingFunction())
+
+        assert reopened.dtype == "int8"
+        assert isinstance(reopened._vectors, np.memmap)
+        assert reopened._documents is None  # texts load on first use
+        top = reopened.query(query_texts=["cloud"], n_results=1)["ids"]
+        assert top == [_brute_force("cloud")[:1]]
+
+    def test_write_after_reopen(self, tmp_path):
+        _store(path=tmp_path / "docs")
+        reopened = FlatVectorStore("docs", tmp_path / "docs")
+        reopened.delete(ids=["GOV-0017_0"])
+
+        again = FlatVectorStore("docs", tmp_path / "docs")
+        assert again.count() == 4
+        assert again.get(ids=["GOV-0020_0"])["documents"] == [TEXTS[2]]
+
+    def test_deferred_save_writes_once(self, tmp_path):
+        store = FlatVectorStore("docs", tmp_path / "docs", _MockEmbeddingFunction())
+        with store.deferred_save():
+            store.upsert(ids=IDS[:2], documents=TEXTS[:2], metadatas=METADATAS[:2])
+            assert not store.exists()
+        info = json.loads((tmp_path / "docs" / "store.json").read_text())
+        assert info["count"] == 2
+
+    def test_client_collections(self, tmp_path):
+        client = FlatVectorClient(tmp_path)
+        with pytest.raises(ValueError, match="does not exist"):
+            client.get_collection("docs")
+
+        collection = client.get_or_create_collection(
+            "docs", embedding_function=_MockEmbeddingFunction()
+        )
+        collection.upsert(ids=IDS, documents=TEXTS, metadatas=METADATAS)
+        assert (tmp_path / "flat" / "docs" / "vectors.npy").exists()
+        assert client.get_collection("docs").count() == 5
+
+        client.delete_collection("docs")
+        assert not (tmp_path / "flat" / "docs").exists()
+
+
+class TestPipelineBackend:
+    def test_index_then_retrieve(self, tmp_path):
+        index = GovernanceIndex(
+            persist_dir=str(tmp_path),
+            embedding_model="mock",
+            backend="flat",
+        )
+        chunks = [Chunk(text=t, metadata=m) for t, m in zip(TEXTS, METADATAS)]
+        assert index.add(chunks) == 5
+
+        # Query model comes from the store
+        retriever = GovernanceRetriever(
+            persist_dir=str(tmp_path),
+            backend="flat",
+            usage_log_path=None,
+            use_lexical=False,
+        )
+        results = retriever.query("cloud cost", top_k=2, filters={"type": "governance"})
+
+        assert retriever.collection.embedding_model == "mock"
+        assert [r.id for r in results] == ["GOV-0020_0"]
+        assert [r.text for r in results] == [TEXTS[2]]